@@ -0,0 +1,60 @@
+import logging
+import sys
+from pathlib import Path
+
+from llmedit.config.predefined_gguf_models import PREDEFINED_GGUF_MODELS
+from llmedit.context import DATA_DIR, DATA_MODELS_SUBDIR
+from llmedit.infra.services.llama_cpp_worker_pool_benchmark import BENCHMARK_POOL_DECODE_TOKENS, BENCHMARK_POOL_REQUESTS, LlamaCppWorkerPoolBenchmark
+
+MODELS_PATH = Path(DATA_DIR) / DATA_MODELS_SUBDIR
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    # Only downloaded models can be benchmarked; models sharing a file are benchmarked once
+    models = list({model.fileName: model for model in reversed(PREDEFINED_GGUF_MODELS) if (MODELS_PATH / model.fileName).exists()}.values())
+    models.sort(key=lambda model: model.fileName)
+    if not models:
+        print(f"No downloaded models found in {MODELS_PATH}. Run scripts/download_models.py first.")
+        sys.exit(1)
+
+    print("Downloaded models available for benchmarking:")
+    for idx, model in enumerate(models, 1):
+        print(f"{idx}. {model.fileName}")
+
+    # Get user selection
+    while True:
+        try:
+            choice = int(input(f"\nEnter model number (1-{len(models)}): "))
+            if 1 <= choice <= len(models):
+                break
+            print(f"Invalid number. Please enter a number between 1 and {len(models)}.")
+        except ValueError:
+            print("Please enter a valid number.")
+
+    selected_model = models[choice - 1]
+    benchmark = LlamaCppWorkerPoolBenchmark(model_folder_path=MODELS_PATH, model_information=selected_model)
+    print(
+        f"\nBenchmarking {selected_model.fileName} with {BENCHMARK_POOL_REQUESTS} requests of up to "
+        f"{BENCHMARK_POOL_DECODE_TOKENS} generated tokens for worker counts {benchmark.worker_counts()}..."
+    )
+    results = benchmark.run()
+
+    baseline = next((result.tokens_per_second for result in results if not result.error), 0.0)
+    print(f"\n{'workers':>7} {'threads':>7} {'load s':>7} {'total s':>8} {'tokens':>7} {'tok/s':>8} {'speedup':>8}")
+    for result in results:
+        prefix = f"{result.worker_count:>7} {result.threads_per_worker:>7}"
+        if result.error:
+            print(f"{prefix} ✗ {result.error}")
+            continue
+        speedup = result.tokens_per_second / baseline if baseline > 0 else 0.0
+        print(
+            f"{prefix} {result.load_seconds:>7.1f} {result.elapsed_seconds:>8.1f} {result.generated_tokens:>7} "
+            f"{result.tokens_per_second:>8.1f} {speedup:>7.2f}x"
+        )
+    print("\nSet INFERENCE_WORKERS in src/llmedit/config/inference_pool.py to use a pool in the application.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import logging
+import sys
+from pathlib import Path
+
+from llmedit.config.predefined_gguf_models import PREDEFINED_GGUF_MODELS
+from llmedit.context import DATA_DIR, DATA_MODELS_SUBDIR, DATA_TUNING_PROFILES_FILE
+from llmedit.infra.services.llama_cpp_kv_cache_benchmark import BENCHMARK_DECODE_TOKENS, BENCHMARK_N_CTX, BENCHMARK_PREFILL_TOKENS, LlamaCppKvCacheBenchmark
+from llmedit.infra.services.llama_cpp_tuning_profile_store import LlamaCppTuningProfileStore
+
+MODELS_PATH = Path(DATA_DIR) / DATA_MODELS_SUBDIR
+PROFILES_PATH = Path(DATA_DIR) / DATA_TUNING_PROFILES_FILE
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    # Only downloaded models can be benchmarked; models sharing a file are benchmarked once
+    model_files = sorted({model.fileName for model in PREDEFINED_GGUF_MODELS if (MODELS_PATH / model.fileName).exists()})
+    if not model_files:
+        print(f"No downloaded models found in {MODELS_PATH}. Run scripts/download_models.py first.")
+        sys.exit(1)
+
+    print("Downloaded models available for benchmarking:")
+    for idx, file_name in enumerate(model_files, 1):
+        print(f"{idx}. {file_name}")
+
+    # Get user selection
+    while True:
+        try:
+            choice = int(input(f"\nEnter model number (1-{len(model_files)}): "))
+            if 1 <= choice <= len(model_files):
+                break
+            print(f"Invalid number. Please enter a number between 1 and {len(model_files)}.")
+        except ValueError:
+            print("Please enter a valid number.")
+
+    selected_file = model_files[choice - 1]
+    profile = LlamaCppTuningProfileStore(file_path=PROFILES_PATH).get_profile(selected_file)
+    print(
+        f"\nBenchmarking {selected_file} with n_ctx={BENCHMARK_N_CTX}, {BENCHMARK_PREFILL_TOKENS} prompt tokens "
+        f"and {BENCHMARK_DECODE_TOKENS} generated tokens per configuration..."
+    )
+    results = LlamaCppKvCacheBenchmark(profile=profile).run(MODELS_PATH / selected_file)
+
+    print(f"\n{'K':<6} {'V':<6} {'flash':<6} {'KV MiB':>8} {'prefill tok/s':>14} {'decode tok/s':>13} {'same as f16':>12}")
+    for result in results:
+        config = result.config
+        prefix = f"{config.type_k.value:<6} {config.type_v.value:<6} {str(config.flash_attention):<6}"
+        if result.error:
+            print(f"{prefix} ✗ {result.error}")
+            continue
+        print(
+            f"{prefix} {result.kv_cache_bytes / (1024 * 1024):>8.1f} {result.prefill_tokens_per_second:>14.1f} "
+            f"{result.decode_tokens_per_second:>13.1f} {result.matching_tokens:>8}/{BENCHMARK_DECODE_TOKENS}"
+        )
+    print("\nSet KV_CACHE_TYPE and FLASH_ATTENTION in src/llmedit/config/kv_cache.py to apply a configuration.")
+
+
+if __name__ == "__main__":
+    main()
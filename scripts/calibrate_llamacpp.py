@@ -0,0 +1,53 @@
+import logging
+import sys
+from pathlib import Path
+
+from llmedit.config.predefined_gguf_models import PREDEFINED_GGUF_MODELS
+from llmedit.context import DATA_DIR, DATA_MODELS_SUBDIR, DATA_TUNING_PROFILES_FILE
+from llmedit.infra.services.llama_cpp_auto_tuner import LlamaCppAutoTuner
+from llmedit.infra.services.llama_cpp_tuning_profile_store import LlamaCppTuningProfileStore
+
+MODELS_PATH = Path(DATA_DIR) / DATA_MODELS_SUBDIR
+PROFILES_PATH = Path(DATA_DIR) / DATA_TUNING_PROFILES_FILE
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    # Only models that are downloaded can be calibrated; models sharing a file are calibrated once
+    model_files = sorted({model.fileName for model in PREDEFINED_GGUF_MODELS if (MODELS_PATH / model.fileName).exists()})
+    if not model_files:
+        print(f"No downloaded models found in {MODELS_PATH}. Run scripts/download_models.py first.")
+        sys.exit(1)
+
+    print("Downloaded models available for calibration:")
+    for idx, file_name in enumerate(model_files, 1):
+        print(f"{idx}. {file_name}")
+
+    # Get user selection
+    while True:
+        try:
+            choice = int(input(f"\nEnter model number (1-{len(model_files)}): "))
+            if 1 <= choice <= len(model_files):
+                break
+            print(f"Invalid number. Please enter a number between 1 and {len(model_files)}.")
+        except ValueError:
+            print("Please enter a valid number.")
+
+    selected_file = model_files[choice - 1]
+    print(f"\nCalibrating {selected_file}. This can take a few minutes; keep other heavy programs closed...")
+    try:
+        profile = LlamaCppAutoTuner().calibrate(MODELS_PATH / selected_file)
+        LlamaCppTuningProfileStore(file_path=PROFILES_PATH).save_profile(selected_file, profile)
+    except Exception as e:
+        print(f"✗ Calibration failed: {str(e)}")
+        sys.exit(1)
+
+    print(f"\n✓ Saved profile to {PROFILES_PATH}:")
+    print(f"  n_threads={profile.n_threads}, n_threads_batch={profile.n_threads_batch}")
+    print(f"  n_batch={profile.n_batch}, n_ubatch={profile.n_ubatch}")
+    print(f"  prefill {profile.prefill_tokens_per_second:.1f} tok/s, decode {profile.decode_tokens_per_second:.1f} tok/s")
+
+
+if __name__ == "__main__":
+    main()
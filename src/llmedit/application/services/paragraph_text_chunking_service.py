@@ -0,0 +1,192 @@
+import logging
+import re
+from typing import List, Tuple, override
+
+from llmedit.core.interfaces.processing.text_chunking_service import TextChunkingService
+from llmedit.core.models.data_types import TextChunk, TokenCounter
+
+logger = logging.getLogger(__name__)
+
+
+class ParagraphTextChunkingService(TextChunkingService):
+    # Blank lines separate paragraphs; the captured whitespace is kept for stitching
+    PARAGRAPH_BREAK_PATTERN = re.compile(r"(\n[ \t]*\n\s*)")
+    # Whitespace after sentence-ending punctuation
+    SENTENCE_BREAK_PATTERN = re.compile(r"(?<=[.!?…。！？])(\s+)")
+    WORD_BREAK_PATTERN = re.compile(r"(\s+)")
+
+    @override
+    def split_text(
+        self,
+        text: str,
+        max_tokens: int,
+        overlap_tokens: int,
+        count_tokens: TokenCounter,
+    ) -> List[TextChunk]:
+        """
+        Split a text into chunks on paragraph boundaries, falling back to sentences and words.
+
+        Args:
+            text: The user text to split.
+            max_tokens: Target maximum number of tokens per chunk.
+            overlap_tokens: Maximum number of tokens of preceding text attached to each chunk
+                after the first as context.
+            count_tokens: Function counting the tokens of a piece of text.
+
+        Returns:
+            Chunks in text order; a single chunk holding the whole text if it fits max_tokens.
+
+        Notes:
+            Paragraphs are packed greedily into chunks. A paragraph larger than max_tokens is
+            split into sentences, and a sentence larger than max_tokens into words. The context
+            of a chunk is made of the last whole sentences of the previous chunk, or its last
+            words if even one sentence is too long.
+        """
+        if count_tokens(text) <= max_tokens:
+            return [TextChunk(text=text)]
+
+        pieces = self._split_pieces(text, max_tokens, count_tokens)
+
+        groups: List[List[Tuple[str, str]]] = []
+        group_tokens = 0
+        for separator, segment, tokens in pieces:
+            if groups and group_tokens + tokens <= max_tokens:
+                groups[-1].append((separator, segment))
+                group_tokens += tokens
+            else:
+                groups.append([(separator, segment)])
+                group_tokens = tokens
+
+        chunks: List[TextChunk] = []
+        for index, group in enumerate(groups):
+            chunk_text = group[0][1] + "".join(separator + segment for separator, segment in group[1:])
+            context = self._tail(chunks[-1].text, overlap_tokens, count_tokens) if chunks and overlap_tokens > 0 else ""
+            chunks.append(TextChunk(text=chunk_text, separator=group[0][0] if index > 0 else "", context=context))
+
+        logger.debug(
+            "split_text: Split %d characters into %d chunks (max_tokens=%d, overlap_tokens=%d)",
+            len(text),
+            len(chunks),
+            max_tokens,
+            overlap_tokens,
+        )
+        return chunks
+
+    @override
+    def split_paragraphs(
+        self,
+        text: str,
+        overlap_tokens: int,
+        count_tokens: TokenCounter,
+    ) -> List[TextChunk]:
+        """
+        Split a text into its paragraphs at blank lines.
+
+        Args:
+            text: The text to split.
+            overlap_tokens: Maximum number of tokens of the preceding paragraph attached to each
+                paragraph after the first as context; zero attaches none.
+            count_tokens: Function counting the tokens of a piece of text.
+
+        Returns:
+            One chunk per paragraph, in text order; empty if the text is blank.
+
+        Notes:
+            The context of a paragraph is made of the last whole sentences of the previous
+            paragraph, like the context of a chunk.
+        """
+        paragraphs: List[TextChunk] = []
+        for separator, paragraph in self._split_keeping_separators(text, self.PARAGRAPH_BREAK_PATTERN):
+            if not paragraph.strip():
+                continue
+            context = ""
+            if paragraphs and overlap_tokens > 0:
+                context = self._tail(paragraphs[-1].text, overlap_tokens, count_tokens)
+            paragraphs.append(TextChunk(text=paragraph, separator=separator if paragraphs else "", context=context))
+        return paragraphs
+
+    def _split_pieces(self, text: str, max_tokens: int, count_tokens: TokenCounter) -> List[Tuple[str, str, int]]:
+        """
+        Split a text into the smallest boundary level that keeps each piece within max_tokens.
+
+        Args:
+            text: Text to split.
+            max_tokens: Maximum number of tokens per piece.
+            count_tokens: Function counting the tokens of a piece of text.
+
+        Returns:
+            List of (separator, segment, tokens) tuples, where separator is the whitespace
+            preceding the segment.
+        """
+        pieces: List[Tuple[str, str, int]] = []
+        for paragraph_separator, paragraph in self._split_keeping_separators(text, self.PARAGRAPH_BREAK_PATTERN):
+            paragraph_tokens = count_tokens(paragraph)
+            if paragraph_tokens <= max_tokens:
+                pieces.append((paragraph_separator, paragraph, paragraph_tokens))
+                continue
+
+            sentences = self._split_keeping_separators(paragraph, self.SENTENCE_BREAK_PATTERN)
+            for index, (sentence_separator, sentence) in enumerate(sentences):
+                separator = paragraph_separator if index == 0 else sentence_separator
+                sentence_tokens = count_tokens(sentence)
+                if sentence_tokens <= max_tokens:
+                    pieces.append((separator, sentence, sentence_tokens))
+                    continue
+
+                logger.debug("_split_pieces: Sentence of %d tokens split into words", sentence_tokens)
+                words = self._split_keeping_separators(sentence, self.WORD_BREAK_PATTERN)
+                for word_index, (word_separator, word) in enumerate(words):
+                    pieces.append((separator if word_index == 0 else word_separator, word, count_tokens(word)))
+        return pieces
+
+    def _tail(self, text: str, max_tokens: int, count_tokens: TokenCounter) -> str:
+        """
+        Get the end of a text, made of whole sentences or, failing that, whole words.
+
+        Args:
+            text: Text to take the end of.
+            max_tokens: Maximum number of tokens of the result.
+            count_tokens: Function counting the tokens of a piece of text.
+
+        Returns:
+            The longest run of trailing sentences (or words) within max_tokens; empty string
+            if not even the last word fits.
+        """
+        for pattern in (self.SENTENCE_BREAK_PATTERN, self.WORD_BREAK_PATTERN):
+            tail = ""
+            tail_separator = ""
+            tail_tokens = 0
+            for separator, segment in reversed(self._split_keeping_separators(text, pattern)):
+                segment_tokens = count_tokens(segment)
+                if tail_tokens + segment_tokens > max_tokens:
+                    break
+                tail = segment + tail_separator + tail
+                tail_separator = separator
+                tail_tokens += segment_tokens
+            if tail:
+                return tail
+        return ""
+
+    @staticmethod
+    def _split_keeping_separators(text: str, pattern: re.Pattern) -> List[Tuple[str, str]]:
+        """
+        Split a text at a separator pattern, keeping each separator with the segment after it.
+
+        Args:
+            text: Text to split.
+            pattern: Compiled pattern with one capturing group matching the separator.
+
+        Returns:
+            List of (separator, segment) tuples with non-empty segments. The first separator
+            holds any whitespace the text starts with.
+        """
+        parts = pattern.split(text)
+        result: List[Tuple[str, str]] = []
+        pending_separator = ""
+        for index, part in enumerate(parts):
+            if index % 2 == 1:
+                pending_separator += part
+            elif part:
+                result.append((pending_separator, part))
+                pending_separator = ""
+        return result
@@ -10,6 +10,8 @@ logger = logging.getLogger(__name__)
 class ReasoningTextSanitizationService(TextSanitizationService):
     # Compile a regex pattern for better performance and readability
     REASONING_TAG_PATTERN = re.compile(r"(<think>.*?</think>)", re.DOTALL)
+    # Reasoning opened by the chat template's generation prompt only has the closing tag in the output
+    UNOPENED_REASONING_PATTERN = re.compile(r"^((?:(?!<think>).)*?</think>)", re.DOTALL)
 
     @override
     def sanitize_text(self, text: str) -> str:
@@ -24,7 +26,8 @@ class ReasoningTextSanitizationService(TextSanitizationService):
 
         Notes:
             Uses a compiled regex pattern to remove all occurrences of <think>...</think>,
-            including multiline content. Returns empty string for empty input.
+            including multiline content, and a leading reasoning block whose opening tag was part
+            of the prompt. Returns empty string for empty input.
             Falls back to basic stripping if an error occurs during processing.
         """
         if not text:
@@ -35,7 +38,8 @@ class ReasoningTextSanitizationService(TextSanitizationService):
         self._log_text_sample("Input", text)
 
         try:
-            cleaned_text = self.REASONING_TAG_PATTERN.sub("", text)
+            cleaned_text = self.UNOPENED_REASONING_PATTERN.sub("", text)
+            cleaned_text = self.REASONING_TAG_PATTERN.sub("", cleaned_text)
             logger.debug(f"sanitize_text: Removed reasoning tags - new length={len(cleaned_text)}")
 
             result = cleaned_text.strip()
@@ -1,31 +1,62 @@
+import dataclasses
+import hashlib
+import json
 import logging
-from typing import Tuple
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple
 
 from typing_extensions import override
 
-from llmedit.config.application_prompts import ID_PROMPT_SYSTEM
-from llmedit.config.prompts_raw import COMMON_SUFFIX
+from llmedit.config.application_prompts import ID_PROMPT_SYSTEM, PROMPT_PARAM_USER_TEXT
+from llmedit.config.chunking import (CATEGORY_CHUNK_INPUT_TOKENS, CHUNK_OVERLAP_TOKENS, DEFAULT_CHUNK_INPUT_TOKENS,
+                                     ESTIMATED_CHARS_PER_TOKEN, PROMPT_CHUNK_INPUT_TOKENS)
+from llmedit.config.output_budgets import CATEGORY_OUTPUT_BUDGETS, DEFAULT_OUTPUT_BUDGET, PROMPT_OUTPUT_BUDGETS
+from llmedit.config.response_cache import DETERMINISTIC_SEED
+from llmedit.config.speculative_decoding import CATEGORY_DRAFT_TOKENS, DEFAULT_DRAFT_TOKENS
+from llmedit.config.prompts_raw import CHUNK_CONTEXT, COMMON_SUFFIX
+from llmedit.core.interfaces.llm_model.model_service import GenerationCancelledError
 from llmedit.core.interfaces.processing.text_processing_service import TextProcessingService
-from llmedit.core.models.data_types import (GenerationRequest, GenerationResponse, ProcessingContext, Prompt)
+from llmedit.core.models.data_types import (CancellationToken, ChunkFinishedCallback, GenerationRequest, GenerationResponse,
+                                            OutputBudget, ProcessingContext, Prompt, TextChunk, TextDeltaCallback,
+                                            VariantTextDeltaCallback)
 
 logger = logging.getLogger(__name__)
 
 
 class TextProcessingServiceBase(TextProcessingService):
     @override
-    def process(self, processing_context: ProcessingContext) -> str:
+    def process(
+        self,
+        processing_context: ProcessingContext,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        on_chunk_finished: Optional[ChunkFinishedCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> str:
         """
         Process text through the generation pipeline.
 
         Args:
             processing_context: Context containing prompt information and parameters.
+            on_text_delta: Optional callback receiving raw text fragments as they are generated.
+            on_chunk_finished: Optional callback receiving the sanitized partial result after each
+                chunk when the user text is processed in chunks.
+            cancellation_token: Optional token forwarded to the model service.
 
         Returns:
             Sanitized generated text or empty string if processing fails.
 
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled before processing finished.
+
         Notes:
-            Ensures model is loaded, validates context, prepares request, executes generation,
-            and sanitizes the response. Returns empty string on any failure.
+            Ensures model is loaded, validates context, and splits a user text longer than the
+            prompt's chunk size into chunks. Each chunk (or the whole text) is prepared as a request,
+            checked against the model's context, generated, and sanitized.
+            With a paragraph result store, prompts processed in chunks are processed incrementally:
+            paragraphs processed before are reused and only the changed ones are generated.
+            Returns empty string on any failure other than cancellation.
+            Streamed fragments are not sanitized; the returned text is the authoritative result.
         """
         logger.debug("process: Starting text processing")
         logger.debug(
@@ -43,16 +74,356 @@ class TextProcessingServiceBase(TextProcessingService):
             return ''
 
         try:
-            request = self._prepare_generation_request(processing_context)
+            paragraphs = self._split_paragraphs(processing_context)
+            chunks = self._split_user_text(processing_context) if not paragraphs else []
+        except Exception:
+            logger.error("process: Failed to split user text", exc_info=True)
+            return ''
+
+        if paragraphs:
+            return self._process_incrementally(
+                processing_context,
+                paragraphs,
+                on_text_delta,
+                on_chunk_finished,
+                cancellation_token,
+            )
+
+        if len(chunks) > 1:
+            return self._process_chunks(processing_context, chunks, on_text_delta, on_chunk_finished, cancellation_token)
+
+        return self._process_request(processing_context, on_text_delta, cancellation_token=cancellation_token) or ''
+
+    def _process_chunks(
+        self,
+        processing_context: ProcessingContext,
+        chunks: List[TextChunk],
+        on_text_delta: Optional[TextDeltaCallback],
+        on_chunk_finished: Optional[ChunkFinishedCallback],
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> str:
+        """
+        Process the chunks of a user text and join the results in text order.
+
+        Args:
+            processing_context: Context of the whole request.
+            chunks: Chunks of the user text, in text order.
+            on_text_delta: Optional callback receiving raw text fragments as they are generated.
+            on_chunk_finished: Optional callback receiving the sanitized partial result after each chunk.
+            cancellation_token: Optional token forwarded to the model service.
+
+        Returns:
+            Sanitized results of all chunks joined with the original separators, or empty string
+            if any chunk fails.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled; chunks not started
+                yet are skipped.
+        """
+        chunk_results = self._generate_chunk_results(processing_context, chunks, on_text_delta, cancellation_token)
+        try:
+            return self._join_chunk_results(chunks, chunk_results, on_chunk_finished) or ''
+        finally:
+            chunk_results.close()
+
+    def _generate_chunk_results(
+        self,
+        processing_context: ProcessingContext,
+        chunks: List[TextChunk],
+        on_text_delta: Optional[TextDeltaCallback],
+        cancellation_token: Optional[CancellationToken] = None,
+        known_results: Optional[List[Optional[str]]] = None,
+        on_chunk_truncated: Optional[Callable[[int], None]] = None,
+    ) -> Iterator[Optional[str]]:
+        """
+        Process the chunks of a user text, yielding their results in text order.
+
+        Args:
+            processing_context: Context of the whole request.
+            chunks: Chunks of the user text, in text order.
+            on_text_delta: Optional callback receiving raw text fragments as they are generated.
+            cancellation_token: Optional token forwarded to the model service.
+            known_results: Optional results known in advance, one per chunk; chunks with a known
+                result are not generated.
+            on_chunk_truncated: Optional callback receiving the index of a chunk whose response
+                was truncated; called before the chunk's result is yielded.
+
+        Returns:
+            Iterator over the sanitized result of each chunk, None for a failed chunk. Closing it
+            before the end skips the chunks not started yet.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled; chunks not started
+                yet are skipped.
+
+        Notes:
+            Each chunk is sent with the end of the previous chunk's text as context, so chunks do
+            not depend on each other's results. If the model service generates several requests at
+            once, the chunks are processed in parallel; fragments are then not streamed, and the
+            results are yielded whenever the next chunk in text order is done. Otherwise chunks
+            are processed in order and the separator of a chunk is streamed before its fragments,
+            so the streamed text keeps the layout; known results are streamed at once.
+        """
+        if known_results is None:
+            known_results = [None] * len(chunks)
+        pending_chunks = sum(1 for known_result in known_results if known_result is None)
+        parallel_requests = min(
+            pending_chunks,
+            self._model_service_provider.get_model_service().max_parallel_requests(),
+        )
+        logger.debug(
+            "process: Processing %d of %d chunks of user text (%d in parallel)",
+            pending_chunks,
+            len(chunks),
+            parallel_requests,
+        )
+
+        if parallel_requests > 1:
+            with ThreadPoolExecutor(max_workers=parallel_requests) as executor:
+                futures = [
+                    executor.submit(
+                        self._process_request,
+                        self._build_chunk_processing_context(processing_context, chunk),
+                        None,
+                        chunk.context,
+                        cancellation_token,
+                        self._bind_chunk_index(on_chunk_truncated, index),
+                    ) if known_result is None else None
+                    for index, (chunk, known_result) in enumerate(zip(chunks, known_results))
+                ]
+                try:
+                    for future, known_result in zip(futures, known_results):
+                        yield known_result if future is None else future.result()
+                finally:
+                    for future in futures:
+                        if future is not None:
+                            future.cancel()
+            return
+
+        for index, (chunk, known_result) in enumerate(zip(chunks, known_results)):
+            if index > 0 and on_text_delta is not None:
+                on_text_delta(chunk.separator)
+            if known_result is not None:
+                if on_text_delta is not None:
+                    on_text_delta(known_result)
+                yield known_result
+                continue
+
+            logger.debug(
+                "process: Processing chunk %d/%d - text_len=%d, context_len=%d",
+                index + 1,
+                len(chunks),
+                len(chunk.text),
+                len(chunk.context),
+            )
+            yield self._process_request(
+                self._build_chunk_processing_context(processing_context, chunk),
+                on_text_delta,
+                chunk.context,
+                cancellation_token,
+                self._bind_chunk_index(on_chunk_truncated, index),
+            )
+
+    @staticmethod
+    def _bind_chunk_index(
+        on_chunk_truncated: Optional[Callable[[int], None]],
+        index: int,
+    ) -> Optional[Callable[[], None]]:
+        """
+        Bind a chunk index to a truncation callback.
+
+        Args:
+            on_chunk_truncated: Optional callback receiving the index of a truncated chunk.
+            index: Index of the chunk.
+
+        Returns:
+            Callback without arguments for _process_request, or None if there is no callback.
+        """
+        if on_chunk_truncated is None:
+            return None
+        return lambda: on_chunk_truncated(index)
+
+    def _process_incrementally(
+        self,
+        processing_context: ProcessingContext,
+        paragraphs: List[Tuple[TextChunk, int]],
+        on_text_delta: Optional[TextDeltaCallback],
+        on_chunk_finished: Optional[ChunkFinishedCallback],
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> str:
+        """
+        Process a user text paragraph by paragraph, reusing the stored results of unchanged paragraphs.
+
+        Args:
+            processing_context: Context of the whole request.
+            paragraphs: Paragraphs of the user text in text order, with their token counts.
+            on_text_delta: Optional callback receiving raw text fragments as they are generated.
+            on_chunk_finished: Optional callback receiving the sanitized partial result after each
+                stored paragraph or generated chunk.
+            cancellation_token: Optional token forwarded to the model service.
+
+        Returns:
+            Sanitized results of all paragraphs joined with the original separators, or empty
+            string if any chunk fails.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled.
+
+        Notes:
+            Consecutive paragraphs without a stored result are packed into chunks of up to the
+            prompt's chunk size, so the first request costs about as much as a chunked one and a
+            re-run only generates the chunks around the edits. A generated chunk's result is split
+            at paragraph breaks and stored per paragraph; if the model merged or split paragraphs,
+            or the response was truncated, the chunk is not stored and will be generated again
+            next time.
+        """
+        max_tokens = self._get_chunk_input_tokens(processing_context)
+        keys = [self._paragraph_result_key(processing_context, paragraph.text) for paragraph, _ in paragraphs]
+        stored_results = [self._paragraph_result_store.get(key) for key in keys]
+
+        chunks: List[TextChunk] = []
+        known_results: List[Optional[str]] = []
+        chunk_keys: List[List[str]] = []
+        index = 0
+        while index < len(paragraphs):
+            first_index = index
+            chunk_tokens = paragraphs[index][1]
+            index += 1
+            if stored_results[first_index] is None:
+                while (
+                    index < len(paragraphs)
+                    and stored_results[index] is None
+                    and chunk_tokens + paragraphs[index][1] <= max_tokens
+                ):
+                    chunk_tokens += paragraphs[index][1]
+                    index += 1
+
+            first_paragraph = paragraphs[first_index][0]
+            chunks.append(
+                TextChunk(
+                    text=first_paragraph.text + "".join(
+                        paragraph.separator + paragraph.text for paragraph, _ in paragraphs[first_index + 1:index]
+                    ),
+                    separator=first_paragraph.separator,
+                    context=first_paragraph.context,
+                )
+            )
+            known_results.append(stored_results[first_index])
+            chunk_keys.append(keys[first_index:index])
+
+        logger.info(
+            "process: Reusing %d of %d paragraphs - generating %d chunks",
+            sum(1 for result in stored_results if result is not None),
+            len(paragraphs),
+            sum(1 for result in known_results if result is None),
+        )
+
+        truncated_chunks: Set[int] = set()
+
+        def store_chunk_results(chunk_results: Iterator[Optional[str]]) -> Iterator[Optional[str]]:
+            for chunk_index, chunk_result in enumerate(chunk_results):
+                if (
+                    chunk_result is not None
+                    and known_results[chunk_index] is None
+                    and chunk_index not in truncated_chunks
+                ):
+                    self._store_paragraph_results(chunk_keys[chunk_index], chunk_result)
+                yield chunk_result
+
+        chunk_results = self._generate_chunk_results(
+            processing_context,
+            chunks,
+            on_text_delta,
+            cancellation_token,
+            known_results,
+            truncated_chunks.add,
+        )
+        try:
+            return self._join_chunk_results(chunks, store_chunk_results(chunk_results), on_chunk_finished) or ''
+        finally:
+            chunk_results.close()
+
+    @staticmethod
+    def _join_chunk_results(
+        chunks: List[TextChunk],
+        chunk_results: Iterable[Optional[str]],
+        on_chunk_finished: Optional[ChunkFinishedCallback],
+    ) -> Optional[str]:
+        """
+        Join chunk results in text order as they become available.
+
+        Args:
+            chunks: Chunks of the user text, in text order.
+            chunk_results: Sanitized result of each chunk in text order, None for a failed chunk.
+                Consumed lazily, so results computed on demand stop at the first failure.
+            on_chunk_finished: Optional callback receiving the partial result after each chunk.
+
+        Returns:
+            Results joined with the original separators, or None if any chunk failed.
+        """
+        result = ""
+        for index, (chunk, chunk_result) in enumerate(zip(chunks, chunk_results)):
+            if chunk_result is None:
+                logger.warning("process: Chunk %d/%d failed - discarding partial result", index + 1, len(chunks))
+                return None
+
+            result = result + chunk.separator + chunk_result if index > 0 else chunk_result
+            if on_chunk_finished is not None:
+                on_chunk_finished(index, len(chunks), result)
+        return result
+
+    def _process_request(
+        self,
+        processing_context: ProcessingContext,
+        on_text_delta: Optional[TextDeltaCallback],
+        preceding_text: str = "",
+        cancellation_token: Optional[CancellationToken] = None,
+        on_truncated: Optional[Callable[[], None]] = None,
+    ) -> Optional[str]:
+        """
+        Generate and sanitize the response to one request.
+
+        Args:
+            processing_context: Validated context of the request.
+            on_text_delta: Optional callback receiving raw text fragments as they are generated.
+            preceding_text: Text preceding the user text, passed to the model as context.
+            cancellation_token: Optional token forwarded to the model service.
+            on_truncated: Optional callback invoked if the response was truncated (output limit
+                reached or looping aborted); the truncated text is still returned.
+
+        Returns:
+            Sanitized generated text, or None if the request fails or is rejected.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled.
+        """
+        try:
+            request = self._prepare_generation_request(processing_context, preceding_text)
         except Exception as e:
             logger.error("process: Failed to prepare generation request", exc_info=True)
-            return ''
+            return None
+
+        request, error_message = self._count_request_tokens(request)
+        if error_message:
+            logger.warning("process: Request rejected before submission - %s", error_message)
+            return None
 
         try:
-            generated_response = self._execute_task(request)
+            generated_response = self._execute_task(request, on_text_delta, cancellation_token)
+        except GenerationCancelledError:
+            logger.info("process: Generation request cancelled")
+            raise
         except Exception as e:
             logger.error("process: Generation request failed", exc_info=True)
-            return ''
+            return None
+
+        if generated_response.metadata.get("truncated") == "true":
+            logger.warning(
+                "process: Response was truncated (finish_reason=%s)",
+                generated_response.metadata.get("finish_reason"),
+            )
+            if on_truncated is not None:
+                on_truncated()
 
         sanitized_text = self._sanitizer_service.sanitize_text(generated_response.text_content)
         logger.debug(
@@ -63,6 +434,268 @@ class TextProcessingServiceBase(TextProcessingService):
 
         return sanitized_text
 
+    @override
+    def process_variants(
+        self,
+        processing_contexts: List[ProcessingContext],
+        on_text_delta: Optional[VariantTextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[str]:
+        """
+        Process several variants of one task through the generation pipeline as one fan-out job.
+
+        Args:
+            processing_contexts: One context per variant (e.g. per tone prompt or target language).
+            on_text_delta: Optional callback receiving the variant index and raw text fragments.
+            cancellation_token: Optional token forwarded to the model service.
+
+        Returns:
+            Sanitized generated text per variant, or empty strings for all variants if processing fails.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled before processing finished.
+
+        Notes:
+            All requests are handed to the model service at once, which evaluates the prompt part
+            they share (system prompt and, for translations, the user text) only once. Variants
+            found in the response cache are not generated again.
+        """
+        logger.debug("process_variants: Starting fan-out processing of %d variants", len(processing_contexts))
+        failed = [''] * len(processing_contexts)
+
+        if not processing_contexts or not self._ensure_model_loaded():
+            return failed
+
+        for processing_context in processing_contexts:
+            validation_result, error_message = self._validate_processing_context(processing_context)
+            if not validation_result:
+                logger.warning("process_variants: Invalid processing context - %s", error_message)
+                return failed
+
+        try:
+            requests = [self._prepare_generation_request(processing_context) for processing_context in processing_contexts]
+        except Exception:
+            logger.error("process_variants: Failed to prepare generation requests", exc_info=True)
+            return failed
+
+        for index, request in enumerate(requests):
+            requests[index], error_message = self._count_request_tokens(request)
+            if error_message:
+                logger.warning("process_variants: Request rejected before submission - %s", error_message)
+                return failed
+
+        try:
+            responses = self._execute_variant_tasks(requests, on_text_delta, cancellation_token)
+        except GenerationCancelledError:
+            logger.info("process_variants: Generation requests cancelled")
+            raise
+        except Exception:
+            logger.error("process_variants: Generation requests failed", exc_info=True)
+            return failed
+
+        results = [self._sanitizer_service.sanitize_text(response.text_content) for response in responses]
+        logger.debug(
+            "process_variants: Fan-out finished - result_lengths=%s",
+            [len(result) for result in results],
+        )
+        return results
+
+    @override
+    def preflight(self, processing_context: ProcessingContext) -> Tuple[bool, str]:
+        """
+        Check whether a request fits the selected model before it is submitted.
+
+        Args:
+            processing_context: Context of the request to check.
+
+        Returns:
+            Tuple of (fits, error_message). If the request fits or its size cannot be determined,
+            returns (True, ""). Otherwise, returns (False, error_message).
+
+        Notes:
+            Splits the user text and builds the requests exactly as process() does, and counts
+            them with the tokenizer service; the model weights are not loaded.
+        """
+        validation_result, error_message = self._validate_processing_context(processing_context)
+        if not validation_result:
+            return False, error_message
+
+        try:
+            requests = [
+                self._prepare_generation_request(
+                    self._build_chunk_processing_context(processing_context, chunk),
+                    chunk.context,
+                )
+                for chunk in self._split_user_text(processing_context)
+            ]
+        except Exception as e:
+            logger.error("preflight: Failed to prepare generation request", exc_info=True)
+            return False, f"Failed to prepare request: {str(e)}"
+
+        for request in requests:
+            _, error_message = self._count_request_tokens(request)
+            if error_message:
+                return False, error_message
+        return True, ""
+
+    def _split_user_text(self, processing_context: ProcessingContext) -> List[TextChunk]:
+        """
+        Split the user text of a request into chunks if it exceeds the prompt's chunk size.
+
+        Args:
+            processing_context: Context holding the user text and prompt id.
+
+        Returns:
+            Chunks in text order; a single chunk with the whole user text if chunking is
+            disabled for the prompt or the text is short enough.
+        """
+        user_text = processing_context.prompt_parameters.get(PROMPT_PARAM_USER_TEXT, "")
+        if self._chunking_service is None or not user_text:
+            return [TextChunk(text=user_text)]
+
+        max_tokens = self._get_chunk_input_tokens(processing_context)
+        if max_tokens is None:
+            return [TextChunk(text=user_text)]
+
+        return self._chunking_service.split_text(user_text, max_tokens, CHUNK_OVERLAP_TOKENS, self._count_text_tokens)
+
+    def _split_paragraphs(self, processing_context: ProcessingContext) -> List[Tuple[TextChunk, int]]:
+        """
+        Split the user text of a request into paragraphs for incremental processing.
+
+        Args:
+            processing_context: Context holding the user text and prompt id.
+
+        Returns:
+            Paragraphs in text order with their token counts, or an empty list if the request is
+            not processed incrementally: no paragraph result store, chunking disabled for the
+            prompt, an empty user text, or a paragraph longer than the prompt's chunk size.
+        """
+        user_text = processing_context.prompt_parameters.get(PROMPT_PARAM_USER_TEXT, "")
+        if self._paragraph_result_store is None or self._chunking_service is None or not user_text:
+            return []
+
+        max_tokens = self._get_chunk_input_tokens(processing_context)
+        if max_tokens is None:
+            return []
+
+        paragraphs = [
+            (paragraph, self._count_text_tokens(paragraph.text))
+            for paragraph in self._chunking_service.split_paragraphs(
+                user_text,
+                CHUNK_OVERLAP_TOKENS,
+                self._count_text_tokens,
+            )
+        ]
+        if any(tokens > max_tokens for _, tokens in paragraphs):
+            logger.debug("_split_paragraphs: Paragraph longer than %d tokens - processing in chunks", max_tokens)
+            return []
+        return paragraphs
+
+    def _get_chunk_input_tokens(self, processing_context: ProcessingContext) -> Optional[int]:
+        """
+        Get the chunk size of the request's prompt.
+
+        Args:
+            processing_context: Context holding the prompt id.
+
+        Returns:
+            Largest user input in tokens processed in one request, or None if chunking is
+            disabled for the prompt.
+        """
+        user_prompt = self._prompt_service.get_prompt(processing_context.user_prompt_id)
+        if user_prompt.id in PROMPT_CHUNK_INPUT_TOKENS:
+            return PROMPT_CHUNK_INPUT_TOKENS[user_prompt.id]
+        return CATEGORY_CHUNK_INPUT_TOKENS.get(user_prompt.category, DEFAULT_CHUNK_INPUT_TOKENS)
+
+    @staticmethod
+    def _build_chunk_processing_context(processing_context: ProcessingContext, chunk: TextChunk) -> ProcessingContext:
+        """
+        Build the processing context of one chunk.
+
+        Args:
+            processing_context: Context of the whole request.
+            chunk: Chunk whose text replaces the user text.
+
+        Returns:
+            Copy of the context with the chunk text as user text.
+        """
+        return ProcessingContext(
+            user_prompt_id=processing_context.user_prompt_id,
+            prompt_parameters={**processing_context.prompt_parameters, PROMPT_PARAM_USER_TEXT: chunk.text},
+        )
+
+    def _count_text_tokens(self, text: str) -> int:
+        """
+        Count the tokens of a text with the selected model's tokenizer, or estimate them.
+
+        Args:
+            text: Text to count.
+
+        Returns:
+            Exact token count if a tokenizer is available, otherwise ESTIMATED_CHARS_PER_TOKEN
+            characters per token.
+        """
+        if self._tokenizer_service is not None:
+            try:
+                tokens = self._tokenizer_service.count_text_tokens(text)
+            except Exception:
+                logger.debug("_count_text_tokens: Tokenizer failed - estimating", exc_info=True)
+                tokens = None
+            if tokens is not None:
+                return tokens
+
+        return math.ceil(len(text) / ESTIMATED_CHARS_PER_TOKEN)
+
+    def _count_request_tokens(self, request: GenerationRequest) -> Tuple[GenerationRequest, str]:
+        """
+        Count the tokens of a request and check that it fits the model's context.
+
+        Args:
+            request: Prepared generation request.
+
+        Returns:
+            Tuple of (request, error_message). The request carries the exact input and prompt token
+            counts if a tokenizer is available for the model. The error message is empty unless the
+            prompt plus the output budget exceeds the model's context.
+
+        Notes:
+            Counting failures are logged and do not block the request; the backend then counts
+            or estimates on its own.
+        """
+        if self._tokenizer_service is None:
+            return request, ""
+
+        try:
+            prompt_tokens = self._tokenizer_service.count_request_tokens(request)
+            input_tokens = self._tokenizer_service.count_text_tokens(request.user_input_text)
+            context_limit = self._tokenizer_service.get_context_limit()
+        except Exception:
+            logger.warning("process: Failed to count request tokens - skipping size check", exc_info=True)
+            return request, ""
+
+        if prompt_tokens is None or input_tokens is None:
+            logger.debug("process: No tokenizer for the selected model - skipping size check")
+            return request, ""
+
+        request = dataclasses.replace(request, input_tokens=input_tokens, prompt_tokens=prompt_tokens)
+        output_length = self._model_service_provider.get_model_service().get_model_information().output_length
+        output_tokens = request.output_budget.resolve(input_tokens, output_length) if request.output_budget else 0
+        logger.debug(
+            "process: Request needs %d prompt tokens (%d input) + %d output tokens, context limit %s",
+            prompt_tokens,
+            input_tokens,
+            output_tokens,
+            context_limit,
+        )
+
+        if context_limit is not None and prompt_tokens + output_tokens > context_limit:
+            return request, (
+                f"The input is too long for the selected model: the prompt needs {prompt_tokens:,} tokens "
+                f"and the answer up to {output_tokens:,} more, but the model supports {context_limit:,} tokens."
+            )
+        return request, ""
+
     def _ensure_model_loaded(self) -> bool:
         """
         Ensure the model is loaded, loading it if necessary.
@@ -72,6 +705,8 @@ class TextProcessingServiceBase(TextProcessingService):
 
         Notes:
             Uses the model service provider to get the model service.
+            Usually the model has already been preloaded in the background; if that load is
+            still running, load_model() waits for it instead of starting another one.
             Logs warnings on load failure.
         """
         model_service = self._model_service_provider.get_model_service()
@@ -113,12 +748,14 @@ class TextProcessingServiceBase(TextProcessingService):
 
         return is_valid_params, err
 
-    def _prepare_generation_request(self, processing_context: ProcessingContext) -> GenerationRequest:
+    def _prepare_generation_request(self, processing_context: ProcessingContext, preceding_text: str = "") -> GenerationRequest:
         """
         Prepare the generation request from processing context.
 
         Args:
             processing_context: The context used to build the request.
+            preceding_text: Text preceding the user text when it is a chunk of a longer text;
+                appended to the user prompt as context.
 
         Returns:
             A fully constructed GenerationRequest object.
@@ -150,6 +787,9 @@ class TextProcessingServiceBase(TextProcessingService):
 
         system_prompt_template = self._build_system_prompt(model_info, system_prompt)
         user_prompt_template = self._build_user_prompt(model_info, user_prompt, processing_context)
+        if preceding_text:
+            chunk_context = CHUNK_CONTEXT.replace("{{preceding_text}}", preceding_text)
+            user_prompt_template = f"{user_prompt_template}\n{chunk_context}"
         user_prompt_template = f"{user_prompt_template}\n{COMMON_SUFFIX}"
 
         logger.debug(
@@ -165,6 +805,14 @@ class TextProcessingServiceBase(TextProcessingService):
             top_k=model_info.top_k,
             top_p=model_info.top_p,
             min_p=model_info.min_p,
+            user_prompt_static_prefix=self._build_user_prompt_static_prefix(model_info, user_prompt),
+            user_input_text=processing_context.prompt_parameters.get(PROMPT_PARAM_USER_TEXT, ""),
+            output_budget=self._build_output_budget(model_info, user_prompt),
+            draft_tokens=CATEGORY_DRAFT_TOKENS.get(model_info.speculative_decoding, {}).get(
+                user_prompt.category,
+                DEFAULT_DRAFT_TOKENS,
+            ),
+            seed=DETERMINISTIC_SEED,
         )
 
     @staticmethod
@@ -210,13 +858,62 @@ class TextProcessingServiceBase(TextProcessingService):
 
         return formatted_prompt
 
+    @staticmethod
+    def _build_output_budget(model_info, user_prompt: Prompt) -> OutputBudget:
+        """
+        Select the output budget for a prompt.
+
+        Args:
+            model_info: Object containing the model's thinking budget.
+            user_prompt: The user prompt whose id and category select the budget.
+
+        Returns:
+            Prompt-specific budget if defined, otherwise the category budget, with the model's
+            thinking budget added as reasoning allowance.
+        """
+        budget = PROMPT_OUTPUT_BUDGETS.get(
+            user_prompt.id,
+            CATEGORY_OUTPUT_BUDGETS.get(user_prompt.category, DEFAULT_OUTPUT_BUDGET),
+        )
+        return dataclasses.replace(budget, reasoning_tokens=model_info.thinking_budget)
+
+    @staticmethod
+    def _build_user_prompt_static_prefix(model_info, user_prompt: Prompt) -> str:
+        """
+        Build the part of the user prompt that precedes the first template placeholder.
+
+        Args:
+            model_info: Object containing model-specific prefixes.
+            user_prompt: The base user prompt template.
+
+        Returns:
+            Model prefix joined with the template header, or empty string if the template has no
+            placeholders.
+
+        Notes:
+            Mirrors the joining done in _build_user_prompt, so the result is always a prefix
+            of the formatted user prompt.
+        """
+        placeholder_index = user_prompt.template.find("{{")
+        if placeholder_index < 0:
+            return ""
+
+        return "\n".join([model_info.user_prompt_prefix, user_prompt.template[:placeholder_index]])
+
     @override
-    def _execute_task(self, request: GenerationRequest) -> GenerationResponse:
+    def _execute_task(
+        self,
+        request: GenerationRequest,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> GenerationResponse:
         """
         Execute generation task with model service.
 
         Args:
             request: The generation request containing prompts and sampling parameters.
+            on_text_delta: Optional callback forwarded to the model service for streaming.
+            cancellation_token: Optional token forwarded to the model service.
 
         Returns:
             GenerationResponse object containing the generated text.
@@ -225,8 +922,18 @@ class TextProcessingServiceBase(TextProcessingService):
             Exception: If generation fails due to model or execution error.
 
         Notes:
-            Logs request and response details at debug level.
+            Logs request and response details at debug level. A request identical to an earlier
+            one is answered from the response cache; its text is passed to on_text_delta at once.
         """
+        cache_key = self._response_cache_key(request)
+        if cache_key is not None:
+            cached_response = self._response_cache.get(cache_key, request)
+            if cached_response is not None:
+                logger.info("_execute_task: Response cache hit - content_len=%d", len(cached_response.text_content))
+                if on_text_delta is not None:
+                    on_text_delta(cached_response.text_content)
+                return cached_response
+
         logger.debug("_execute_task: Starting generation request")
         logger.debug(
             "_execute_task: Request params - temp=%.2f, top_k=%d, top_p=%.2f, min_p=%.2f",
@@ -237,10 +944,181 @@ class TextProcessingServiceBase(TextProcessingService):
         )
 
         model_service = self._model_service_provider.get_model_service()
-        response = model_service.generate_response(request)
+        response = model_service.generate_response(request, on_text_delta, cancellation_token)
 
         logger.debug(
             "_execute_task: Response received - content_len=%d",
             len(response.text_content),
         )
+        self._store_response(cache_key, response)
         return response
+
+    def _execute_variant_tasks(
+        self,
+        requests: List[GenerationRequest],
+        on_text_delta: Optional[VariantTextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[GenerationResponse]:
+        """
+        Execute the generation requests of several variants, generating only uncached ones.
+
+        Args:
+            requests: One request per variant.
+            on_text_delta: Optional callback receiving the variant index and raw text fragments.
+            cancellation_token: Optional token forwarded to the model service.
+
+        Returns:
+            One GenerationResponse per request, in request order.
+
+        Raises:
+            Exception: If generation fails due to model or execution error.
+
+        Notes:
+            Cached variants are passed to on_text_delta at once; the others are handed to the
+            model service together, as one fan-out job.
+        """
+        cache_keys = [self._response_cache_key(request) for request in requests]
+        responses: List[Optional[GenerationResponse]] = [
+            self._response_cache.get(cache_key, request) if cache_key is not None else None
+            for cache_key, request in zip(cache_keys, requests)
+        ]
+        for index, response in enumerate(responses):
+            if response is not None and on_text_delta is not None:
+                on_text_delta(index, response.text_content)
+
+        missing = [index for index, response in enumerate(responses) if response is None]
+        logger.debug("_execute_variant_tasks: %d of %d variants cached", len(requests) - len(missing), len(requests))
+        if missing:
+            variant_callback = None
+            if on_text_delta is not None:
+                variant_callback = lambda variant_index, delta: on_text_delta(missing[variant_index], delta)
+
+            model_service = self._model_service_provider.get_model_service()
+            generated = model_service.generate_variant_responses(
+                [requests[index] for index in missing],
+                variant_callback,
+                cancellation_token,
+            )
+            for index, response in zip(missing, generated):
+                responses[index] = response
+                self._store_response(cache_keys[index], response)
+
+        return responses
+
+    def _response_cache_key(self, request: GenerationRequest) -> Optional[str]:
+        """
+        Compute the response cache key of a request.
+
+        Args:
+            request: Fully prepared generation request.
+
+        Returns:
+            Hex digest over the selected model's configuration (provider, model file and profile),
+            the version of its weights and every field of the request, or None if there is no
+            response cache or the response is not reproducible (sampled without a fixed seed).
+
+        Notes:
+            The version changes when the model file is replaced under the same name (e.g. a
+            re-quantized download), so its cached responses are no longer returned.
+        """
+        if self._response_cache is None:
+            return None
+        if request.temperature > 0 and request.seed is None:
+            return None
+
+        model_service = self._model_service_provider.get_model_service()
+        key_source = json.dumps(
+            {
+                "model": dataclasses.asdict(model_service.get_model_information()),
+                "model_version": model_service.get_model_version(),
+                "request": dataclasses.asdict(request),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def _store_response(self, cache_key: Optional[str], response: GenerationResponse) -> None:
+        """
+        Store a generated response in the response cache.
+
+        Args:
+            cache_key: Key computed by _response_cache_key, or None if the request is not cacheable.
+            response: Generated response.
+
+        Notes:
+            Truncated responses (output limit reached or looping aborted) are not stored, so
+            repeating the request generates again.
+        """
+        if cache_key is None or response.metadata.get("truncated") == "true":
+            return
+        self._response_cache.put(cache_key, response)
+
+    def _paragraph_result_key(self, processing_context: ProcessingContext, paragraph_text: str) -> str:
+        """
+        Compute the paragraph result store key of a paragraph.
+
+        Args:
+            processing_context: Context of the whole request.
+            paragraph_text: Text of the paragraph.
+
+        Returns:
+            Hex digest over the selected model's configuration and weights version, the effective
+            temperature, the prompt id, the prompt parameters other than the user text, and the
+            paragraph text.
+
+        Notes:
+            The surrounding paragraphs are left out, so editing a paragraph does not invalidate
+            its neighbours; they are only passed to the model as context.
+        """
+        model_service = self._model_service_provider.get_model_service()
+        model_info = model_service.get_model_information()
+        if self._settings_service.get_llm_temperature_enabled():
+            temperature = self._settings_service.get_llm_temperature()
+        else:
+            temperature = model_info.temperature
+
+        key_source = json.dumps(
+            {
+                "model": dataclasses.asdict(model_info),
+                "model_version": model_service.get_model_version(),
+                "temperature": temperature,
+                "prompt_id": processing_context.user_prompt_id,
+                "parameters": {
+                    name: value
+                    for name, value in processing_context.prompt_parameters.items()
+                    if name != PROMPT_PARAM_USER_TEXT
+                },
+                "paragraph": paragraph_text,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def _store_paragraph_results(self, keys: List[str], chunk_result: str) -> None:
+        """
+        Store the result of a generated chunk paragraph by paragraph.
+
+        Args:
+            keys: Keys of the chunk's paragraphs, in text order.
+            chunk_result: Sanitized result of the chunk.
+
+        Notes:
+            A chunk of several paragraphs is only stored if its result has as many paragraphs.
+        """
+        if len(keys) == 1:
+            self._paragraph_result_store.put(keys[0], chunk_result)
+            return
+
+        result_paragraphs = self._chunking_service.split_paragraphs(chunk_result, 0, self._count_text_tokens)
+        if len(result_paragraphs) != len(keys):
+            logger.debug(
+                "_store_paragraph_results: Result has %d paragraphs instead of %d - not stored",
+                len(result_paragraphs),
+                len(keys),
+            )
+            return
+
+        for key, result_paragraph in zip(keys, result_paragraphs):
+            self._paragraph_result_store.put(key, result_paragraph.text)
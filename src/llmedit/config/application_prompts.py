@@ -196,3 +196,16 @@ APPLICATION_PROMPTS = [
         parameters=[PROMPT_PARAM_USER_TEXT, PROMPT_PARAM_INPUT_LANGUAGE, PROMPT_PARAM_OUTPUT_LANGUAGE],
     ),
 ]
+
+TONE_VARIANT_PROMPT_IDS = [
+    ID_PROMPT_PROOFREAD_CASUAL,
+    ID_PROMPT_PROOFREAD_SEMI_FORMAL,
+    ID_PROMPT_PROOFREAD_FORMAL,
+    ID_PROMPT_PROOFREAD_FRIENDLY,
+]
+"""
+Proofreading prompts generated side by side by the Compare Tones action.
+
+All variants are submitted as one fan-out task, so the model evaluates the shared system
+prompt only once; each variant is streamed to its own output tab.
+"""
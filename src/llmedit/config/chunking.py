@@ -0,0 +1,50 @@
+from typing import Optional
+
+from llmedit.config.application_prompts import (ID_PROMPT_FORMAT_PLAIN_DOCUMENT, ID_PROMPT_FORMAT_WIKI_MARKDOWN,
+                                                 ID_PROMPT_TRANSLATE_DICTIONARY)
+from llmedit.core.models.enums.prompt_category import PromptCategory
+
+CHUNK_OVERLAP_TOKENS = 64
+"""
+Maximum number of tokens of the preceding chunk passed along with each later chunk as context.
+"""
+
+ESTIMATED_CHARS_PER_TOKEN = 4
+"""
+Characters per token assumed when sizing chunks for a model without a local tokenizer (Ollama).
+"""
+
+DEFAULT_CHUNK_INPUT_TOKENS: Optional[int] = 1536
+"""
+Largest user input processed in one request; longer inputs are split into chunks of about this size.
+
+Keeps long documents within the context and avoids the slowdown of attending over a long prompt
+while decoding. None disables chunking.
+"""
+
+CATEGORY_CHUNK_INPUT_TOKENS: dict[PromptCategory, Optional[int]] = {
+    # Corrections are local to a sentence, so paragraphs can be proofread independently
+    PromptCategory.PROOFREAD: 1536,
+    # Formatting rearranges the text as a whole (greetings, closings, post length)
+    PromptCategory.FORMAT: None,
+    PromptCategory.TRANSLATE: 1536,
+}
+
+PROMPT_CHUNK_INPUT_TOKENS: dict[str, Optional[int]] = {
+    # Documents keep their structure section by section
+    ID_PROMPT_FORMAT_PLAIN_DOCUMENT: 1536,
+    ID_PROMPT_FORMAT_WIKI_MARKDOWN: 1536,
+    # Each chunk would produce a table of its own
+    ID_PROMPT_TRANSLATE_DICTIONARY: None,
+}
+
+INCREMENTAL_PROCESSING_ENABLED = True
+"""
+Whether the results of chunked prompts are remembered paragraph by paragraph, so processing an
+edited text again only sends the changed paragraphs to the model.
+"""
+
+PARAGRAPH_RESULT_ENTRIES = 4096
+"""
+Number of most recently used paragraph results kept for incremental processing.
+"""
@@ -34,18 +34,28 @@ class InMemorySettingsService(SettingsService):
     All settings are kept in a single immutable LlmSettings instance that is replaced on update.
     """
 
-    def __init__(self, llama_provider: SettingsLLMProvider, ollama_provider: SettingsLLMProvider):
+    def __init__(
+        self,
+        llama_provider: SettingsLLMProvider,
+        ollama_provider: SettingsLLMProvider,
+        llama_server_provider: Optional[SettingsLLMProvider] = None,
+    ):
         """
         Initialize service with model providers for each LLM backend.
 
         Args:
             llama_provider: Provider for llama.cpp-compatible models.
             ollama_provider: Provider for Ollama-compatible models.
+            llama_server_provider: Optional provider for models of an OpenAI-compatible server.
 
         Notes:
             Initializes with default settings and maps providers to their model retrieval functions.
         """
-        super().__init__(llama_provider=llama_provider, ollama_provider=ollama_provider)
+        super().__init__(
+            llama_provider=llama_provider,
+            ollama_provider=ollama_provider,
+            llama_server_provider=llama_server_provider,
+        )
 
         self._settings = LlmSettings(
             provider=LlmProviderType.LLAMA_CPP,
@@ -59,6 +69,8 @@ class InMemorySettingsService(SettingsService):
             LlmProviderType.LLAMA_CPP: self._llama_provider.get_model_list,
             LlmProviderType.OLLAMA: self._ollama_provider.get_model_list
         }
+        if self._llama_server_provider is not None:
+            self._provider_model_getters[LlmProviderType.LLAMA_SERVER] = self._llama_server_provider.get_model_list
 
         logger.debug(
             "InMemorySettingsService: Initialized with provider=%s, model=%s, temperature=%.1f",
@@ -108,7 +120,7 @@ class InMemorySettingsService(SettingsService):
         Retrieve available LLM providers.
 
         Returns:
-            List of all supported LLM providers (e.g., LLAMA_CPP, OLLAMA).
+            List of all supported LLM providers (e.g., LLAMA_CPP, OLLAMA, LLAMA_SERVER).
 
         Notes:
             Derived from initialized provider getters; reflects runtime capabilities.
@@ -0,0 +1,26 @@
+from typing import Optional
+
+INFERENCE_IN_PROCESS = False
+"""
+Run llama.cpp inside the application process instead of in worker processes.
+
+By default the model is loaded by a supervised worker process: a crash in native code only
+takes down the worker, which is restarted, and a running generation can be interrupted without
+blocking the application. In-process inference avoids the process start-up and the pipe
+round-trips and is mainly useful for debugging.
+"""
+
+INFERENCE_WORKERS = 1
+"""
+Number of llama.cpp worker processes that generate in parallel.
+
+Ignored if INFERENCE_IN_PROCESS is set. With more than one, each worker process loads
+the model (the memory-mapped weights are shared through the page cache, each worker has its own
+context) and the chunks of a long document or the variants of a task are generated in parallel.
+Worth it on machines with many cores, where one generation does not scale to all of them.
+"""
+
+INFERENCE_WORKER_THREADS: Optional[int] = None
+"""
+Threads each worker process may use; None divides the CPUs evenly between the workers.
+"""
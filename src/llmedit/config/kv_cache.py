@@ -0,0 +1,18 @@
+from llmedit.core.models.enums.kv_cache_type import KvCacheType
+
+KV_CACHE_TYPE = KvCacheType.F16
+"""
+Element type of the llama.cpp KV cache, unless a model overrides it.
+
+On CPU the KV cache, not the weights, limits how long a document fits into one request:
+Q8_0 fits about twice the context of F16 into the same memory, Q4_0 about three and a half
+times. Run scripts/benchmark_kv_cache.py to compare the options on the local machine.
+"""
+
+FLASH_ATTENTION = False
+"""
+Whether llama.cpp uses flash attention, unless a model overrides it.
+
+llama.cpp can only quantize the value half of the KV cache with flash attention enabled;
+without it, a quantized KV_CACHE_TYPE applies to the keys only.
+"""
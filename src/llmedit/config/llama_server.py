@@ -0,0 +1,24 @@
+LLAMA_SERVER_URL = "http://127.0.0.1:8080"
+"""
+Base URL of the llama-server (or other OpenAI-compatible server) used by the llama-server provider.
+
+The chat API is expected under /v1 (e.g. http://127.0.0.1:8080/v1/chat/completions).
+"""
+
+LLAMA_SERVER_API_KEY = ""
+"""
+Bearer token sent with every request; empty sends no Authorization header.
+"""
+
+LLAMA_SERVER_MAX_CONNECTIONS = 4
+"""
+Number of keep-alive connections to the server, and so the number of requests sent at once.
+
+Should match the number of slots of the server (llama-server --parallel), so the chunks of a
+long document and the variants of a task are batched by the server instead of queuing.
+"""
+
+LLAMA_SERVER_TIMEOUT_SECONDS = 600.0
+"""
+Socket timeout of a request; must cover evaluating the longest prompt before the first token.
+"""
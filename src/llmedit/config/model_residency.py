@@ -0,0 +1,34 @@
+from typing import Optional
+
+from llmedit.core.models.enums.memory_policy import MemoryPolicy
+
+MODEL_POOL_MEMORY_BUDGET_BYTES: Optional[int] = None
+"""
+RAM that loaded llama.cpp models may occupy together.
+
+Recently used models stay loaded while they fit, so switching back to them does not reload
+the weights. The least recently used models are unloaded once the budget is exceeded; the
+model in use is always kept, even if it alone exceeds the budget.
+None derives the budget from the RAM available at startup (see MODEL_POOL_MEMORY_BUDGET_FRACTION).
+"""
+
+MODEL_POOL_MEMORY_BUDGET_FRACTION = 0.75
+"""
+Share of the RAM available at startup that loaded models may occupy together.
+
+Only used if MODEL_POOL_MEMORY_BUDGET_BYTES is None. The rest is left for the application,
+the KV caches and other programs.
+"""
+
+MODEL_POOL_MEMORY_BUDGET_FALLBACK_BYTES = 8 * 1024 * 1024 * 1024
+"""
+Budget used if MODEL_POOL_MEMORY_BUDGET_BYTES is None and the available RAM is unknown.
+"""
+
+MODEL_MEMORY_POLICY: Optional[MemoryPolicy] = None
+"""
+How llama.cpp model weights are kept in memory, unless a model overrides it.
+
+None selects a policy per model from the RAM available when it is loaded (see
+select_memory_policy in infra/services/system_memory.py).
+"""
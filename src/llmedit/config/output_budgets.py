@@ -0,0 +1,19 @@
+from llmedit.config.application_prompts import ID_PROMPT_TRANSLATE_DICTIONARY
+from llmedit.core.models.data_types import OutputBudget
+from llmedit.core.models.enums.prompt_category import PromptCategory
+
+DEFAULT_OUTPUT_BUDGET = OutputBudget(input_ratio=2.0, min_tokens=512)
+
+CATEGORY_OUTPUT_BUDGETS: dict[PromptCategory, OutputBudget] = {
+    # Corrected text is about as long as the input
+    PromptCategory.PROOFREAD: OutputBudget(input_ratio=1.3, min_tokens=256),
+    # Formatting adds structure (headings, lists, greetings) on top of the input
+    PromptCategory.FORMAT: OutputBudget(input_ratio=1.8, min_tokens=384),
+    # Target languages can need noticeably more tokens than the source
+    PromptCategory.TRANSLATE: OutputBudget(input_ratio=2.0, min_tokens=256),
+}
+
+PROMPT_OUTPUT_BUDGETS: dict[str, OutputBudget] = {
+    # Short input; the table adds a definition and an example per entry
+    ID_PROMPT_TRANSLATE_DICTIONARY: OutputBudget(input_ratio=4.0, min_tokens=512),
+}
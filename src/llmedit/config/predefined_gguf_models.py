@@ -6,6 +6,7 @@ PREDEFINED_GGUF_MODELS = [
         repositoryId='unsloth/DeepSeek-R1-Distill-Llama-8B-GGUF',
         fileName='DeepSeek-R1-Distill-Llama-8B-Q4_K_M.gguf',
         output_length=32768,
+        thinking_budget=4096,
         temperature=0.6,
         top_k=40,
         top_p=0.95,
@@ -19,6 +20,7 @@ PREDEFINED_GGUF_MODELS = [
         repositoryId='unsloth/Qwen3-8B-GGUF',
         fileName='Qwen3-8B-Q4_K_M.gguf',
         output_length=32768,
+        thinking_budget=4096,
         temperature=0.6,
         top_k=20,
         top_p=0.95,
@@ -33,17 +35,18 @@ PREDEFINED_GGUF_MODELS = [
         top_k=20,
         top_p=0.8,
         user_prompt_suffix='/no_think',
+        suppress_thinking=True,
     ),
     ModelInformation(
         name='Qwen3-14B (Reasoning)',
         repositoryId='unsloth/Qwen3-14B-GGUF',
         fileName='Qwen3-14B-Q4_K_M.gguf',
         output_length=32768,
+        thinking_budget=4096,
         temperature=0.6,
         top_k=20,
         top_p=0.95,
         user_prompt_suffix='/think',
-
     ),
     ModelInformation(
         name='Qwen3-14B (Non-Reasoning)',
@@ -54,6 +57,7 @@ PREDEFINED_GGUF_MODELS = [
         top_k=20,
         top_p=0.8,
         user_prompt_suffix='/no_think',
+        suppress_thinking=True,
     ),
     ModelInformation(
         name='Qwen3-30B-A3B-Instruct-2507',
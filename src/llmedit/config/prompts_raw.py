@@ -746,4 +746,14 @@ Output: Please address this as soon as possible.
 
 Only return the output content in the expected format—do not include any introductory text, summaries, or instructions.
 Only output the final result. Do not include the original input, delimiters (e.g., <<<UserText Start>>>), or any other explanation.
-"""
\ No newline at end of file
+"""
+CHUNK_CONTEXT = """
+# Preceding Text
+
+The UserText above is a part of a longer text and continues directly after the text below, which has already been processed.
+Use it only to keep terminology, tone, and references consistent. Do not transform, repeat, or include it in the output.
+
+<<<PrecedingText Start>>>
+{{preceding_text}}
+<<<PrecedingText End>>>
+"""
@@ -0,0 +1,27 @@
+from typing import Optional
+
+RESPONSE_CACHE_ENABLED = True
+"""
+Whether identical generation requests are answered from the response cache.
+"""
+
+RESPONSE_CACHE_MEMORY_ENTRIES = 64
+"""
+Number of most recently used responses kept in memory in front of the SQLite store.
+"""
+
+RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+"""
+Maximum size of the cached responses in the SQLite store; least recently used responses are
+evicted beyond it.
+"""
+
+DETERMINISTIC_SEED: Optional[int] = None
+"""
+Sampling seed sent with every generation request.
+
+With a seed, the same request generates the same output, so sampled responses (temperature above
+zero) can be cached and repeating an action returns the previous result instantly. None samples
+randomly: repeating an action gives a fresh response, and only greedy responses (temperature
+zero) are cached.
+"""
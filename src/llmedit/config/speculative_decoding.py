@@ -0,0 +1,24 @@
+from llmedit.core.models.enums.prompt_category import PromptCategory
+from llmedit.core.models.enums.speculative_decoding_mode import SpeculativeDecodingMode
+
+PROMPT_LOOKUP_MAX_NGRAM_SIZE = 3
+"""Longest n-gram of recent tokens searched for in the prompt when drafting by lookup."""
+
+DEFAULT_DRAFT_TOKENS = 0
+
+CATEGORY_DRAFT_TOKENS: dict[SpeculativeDecodingMode, dict[PromptCategory, int]] = {
+    SpeculativeDecodingMode.PROMPT_LOOKUP: {
+        # Corrected text copies long spans of the input verbatim
+        PromptCategory.PROOFREAD: 10,
+        # Formatting reuses the input wording but rearranges it
+        PromptCategory.FORMAT: 6,
+        # Translated output shares few token sequences with the source text
+        PromptCategory.TRANSLATE: 0,
+    },
+    SpeculativeDecodingMode.DRAFT_MODEL: {
+        # Each drafted token costs a forward pass of the draft model, so drafts stay short
+        PromptCategory.PROOFREAD: 8,
+        PromptCategory.FORMAT: 6,
+        PromptCategory.TRANSLATE: 4,
+    },
+}
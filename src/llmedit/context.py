@@ -1,29 +1,53 @@
 import logging
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
 
 from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal
 
 from llmedit.application.services.default_supported_translation_languages_service import \
     DefaultSupportedTranslationLanguagesService
 from llmedit.application.services.app_prompt_service import AppPromptService
+from llmedit.application.services.paragraph_text_chunking_service import ParagraphTextChunkingService
 from llmedit.application.services.text_processing_service_base import TextProcessingServiceBase
 from llmedit.application.services.reasoning_text_sanitization_service import ReasoningTextSanitizationService
 from llmedit.config.in_memory_settings_service import InMemorySettingsService
+from llmedit.config.chunking import INCREMENTAL_PROCESSING_ENABLED
+from llmedit.config.response_cache import RESPONSE_CACHE_ENABLED
+from llmedit.config.llama_server import (LLAMA_SERVER_API_KEY, LLAMA_SERVER_MAX_CONNECTIONS, LLAMA_SERVER_TIMEOUT_SECONDS,
+                                         LLAMA_SERVER_URL)
 from llmedit.core.interfaces.background.task_service import TaskService
+from llmedit.core.interfaces.llm_model.model_directory_watcher import ModelDirectoryWatcher
+from llmedit.core.interfaces.llm_model.model_preloader import ModelPreloader
+from llmedit.core.interfaces.llm_model.tokenizer_service import TokenizerService
 from llmedit.core.interfaces.processing.supported_translation_languages_service import SupportedTranslationLanguagesService
 from llmedit.core.interfaces.processing.text_processing_service import TextProcessingService
 from llmedit.core.interfaces.prompt.prompt_service import PromptService
 from llmedit.core.interfaces.settings.settings_service import SettingsService
+from llmedit.infra.providers.settings_llama_server_provider import SettingsLlamaServerProvider
 from llmedit.infra.providers.settings_llamacpp_provider import SettingsLlamaCppProvider
 from llmedit.infra.providers.settings_ollama_provider import SettingsOllamaProvider
 from llmedit.infra.providers.standard_model_service_provider import StandardModelServiceProvider
+from llmedit.infra.services.gguf_metadata_index import GgufMetadataIndex
+from llmedit.infra.services.gguf_model_catalog import GgufModelCatalog
+from llmedit.infra.services.http_connection_pool import HttpConnectionPool
+from llmedit.infra.services.in_memory_paragraph_result_store import InMemoryParagraphResultStore
+from llmedit.infra.services.llama_cpp_tokenizer_service import LlamaCppTokenizerService
+from llmedit.infra.services.llama_cpp_tuning_profile_store import LlamaCppTuningProfileStore
+from llmedit.infra.services.prompt_prefix_cache import PromptPrefixCache
+from llmedit.infra.services.prompt_state_snapshot_store import PromptStateSnapshotStore
+from llmedit.infra.services.sqlite_response_cache import SqliteResponseCache
+from llmedit.qt_based.model_directory_watcher_impl import ModelDirectoryWatcherImpl
+from llmedit.qt_based.model_preloader_impl import ModelPreloaderImpl
 from llmedit.qt_based.task_service_impl import TaskServiceImpl
 
 logger = logging.getLogger(__name__)
 
 DATA_DIR = "data"
 DATA_MODELS_SUBDIR = "models"
+DATA_PROMPT_CACHE_SUBDIR = "prompt_cache"
+DATA_TUNING_PROFILES_FILE = "llama_cpp_tuning.json"
+DATA_GGUF_METADATA_INDEX_FILE = "gguf_metadata.json"
+DATA_RESPONSE_CACHE_FILE = "response_cache.sqlite3"
 
 
 class AppContext(QObject):
@@ -42,6 +66,9 @@ class AppContext(QObject):
                  text_processing_service: TextProcessingService,
                  supported_languages_service: SupportedTranslationLanguagesService,
                  task_service: TaskService,
+                 model_preloader: ModelPreloader,
+                 tokenizer_service: TokenizerService,
+                 model_directory_watcher: ModelDirectoryWatcher,
                  ):
         """
         Initialize the application context with required services.
@@ -52,6 +79,9 @@ class AppContext(QObject):
             text_processing_service: Service for generating and processing text.
             supported_languages_service: Service providing available translation languages.
             task_service: Service for managing background task execution.
+            model_preloader: Service loading the selected model in the background.
+            tokenizer_service: Service counting tokens with the selected model's tokenizer.
+            model_directory_watcher: Service keeping the local model list up to date.
 
         Notes:
             Stores references to all core services for easy access by UI components.
@@ -68,6 +98,9 @@ class AppContext(QObject):
         self._text_processing_service = text_processing_service
         self._supported_languages_service = supported_languages_service
         self._task_service = task_service
+        self._model_preloader = model_preloader
+        self._tokenizer_service = tokenizer_service
+        self._model_directory_watcher = model_directory_watcher
 
     @property
     def settings_service(self) -> SettingsService:
@@ -124,6 +157,39 @@ class AppContext(QObject):
         logger.debug("task_service: Accessing task service")
         return self._task_service
 
+    @property
+    def model_preloader(self) -> ModelPreloader:
+        """
+        Get the model preloader instance.
+
+        Returns:
+            The configured ModelPreloader reporting the model loading state.
+        """
+        logger.debug("model_preloader: Accessing model preloader")
+        return self._model_preloader
+
+    @property
+    def tokenizer_service(self) -> TokenizerService:
+        """
+        Get the tokenizer service instance.
+
+        Returns:
+            The configured TokenizerService counting tokens for the selected model.
+        """
+        logger.debug("tokenizer_service: Accessing tokenizer service")
+        return self._tokenizer_service
+
+    @property
+    def model_directory_watcher(self) -> ModelDirectoryWatcher:
+        """
+        Get the model directory watcher instance.
+
+        Returns:
+            The configured ModelDirectoryWatcher reporting changes of the local model list.
+        """
+        logger.debug("model_directory_watcher: Accessing model directory watcher")
+        return self._model_directory_watcher
+
     def subscribe_settings_updated(self, listener: Callable[[], None]):
         """
         Subscribe to settings update events.
@@ -172,12 +238,38 @@ class AppContext(QObject):
         return is_ready
 
 
-def create_settings_service(root_path: Path) -> SettingsService:
+def create_llama_server_connection_pool() -> HttpConnectionPool:
+    """
+    Create the keep-alive connection pool to the configured llama-server.
+
+    Returns:
+        Connection pool shared by the llama-server settings provider and model services.
+
+    Notes:
+        No connection is opened until the provider is used.
+    """
+    headers = { "Authorization": f"Bearer {LLAMA_SERVER_API_KEY}" } if LLAMA_SERVER_API_KEY else None
+    return HttpConnectionPool(
+        base_url=LLAMA_SERVER_URL,
+        max_connections=LLAMA_SERVER_MAX_CONNECTIONS,
+        timeout_seconds=LLAMA_SERVER_TIMEOUT_SECONDS,
+        headers=headers,
+    )
+
+
+def create_settings_service(
+    root_path: Path,
+    model_catalog: GgufModelCatalog,
+    llama_server_connection_pool: Optional[HttpConnectionPool] = None,
+) -> SettingsService:
     """
     Create and configure the settings service with model providers.
 
     Args:
         root_path: Base directory for application data.
+        model_catalog: Catalog of the model directory listed by the llama.cpp provider.
+        llama_server_connection_pool: Optional connections to the llama-server; the llama-server
+            provider is only offered with it.
 
     Returns:
         Configured SettingsService instance.
@@ -215,7 +307,10 @@ def create_settings_service(root_path: Path) -> SettingsService:
         raise
 
     ollama_settings_provider = SettingsOllamaProvider()
-    llamacpp_settings_provider = SettingsLlamaCppProvider(model_folder_path=models_path)
+    llamacpp_settings_provider = SettingsLlamaCppProvider(model_catalog=model_catalog)
+    llama_server_settings_provider = None
+    if llama_server_connection_pool is not None:
+        llama_server_settings_provider = SettingsLlamaServerProvider(connection_pool=llama_server_connection_pool)
 
     logger.debug(
         "create_settings_service: Settings providers initialized (%s, %s)",
@@ -226,6 +321,7 @@ def create_settings_service(root_path: Path) -> SettingsService:
     settings_service = InMemorySettingsService(
         ollama_provider=ollama_settings_provider,
         llama_provider=llamacpp_settings_provider,
+        llama_server_provider=llama_server_settings_provider,
     )
 
     logger.debug(
@@ -270,6 +366,12 @@ def create_context(root_path: Path) -> AppContext:
             type(text_sanitization_service).__name__,
         )
 
+        text_chunking_service = ParagraphTextChunkingService()
+        logger.debug(
+            "create_context: Text chunking service initialized (%s)",
+            type(text_chunking_service).__name__,
+        )
+
         supported_languages_service = DefaultSupportedTranslationLanguagesService()
         logger.debug(
             "create_context: Languages service initialized with %d supported languages",
@@ -282,26 +384,64 @@ def create_context(root_path: Path) -> AppContext:
             models_path,
         )
 
-        settings_service = create_settings_service(root_path)
+        model_catalog = GgufModelCatalog(
+            model_folder_path=models_path,
+            metadata_index=GgufMetadataIndex(file_path=root_path / DATA_DIR / DATA_GGUF_METADATA_INDEX_FILE),
+        )
+        llama_server_connection_pool = create_llama_server_connection_pool()
+        settings_service = create_settings_service(root_path, model_catalog, llama_server_connection_pool)
         logger.debug(
             "create_context: Settings service created with provider: %s",
             settings_service.get_llm_provider().value,
         )
 
+        prompt_snapshot_store = PromptStateSnapshotStore(directory=root_path / DATA_DIR / DATA_PROMPT_CACHE_SUBDIR)
+        prompt_prefix_cache = PromptPrefixCache(snapshot_store=prompt_snapshot_store)
+        logger.debug(
+            "create_context: Prompt prefix cache initialized (%s)",
+            type(prompt_prefix_cache).__name__,
+        )
+
+        tuning_profile_store = LlamaCppTuningProfileStore(file_path=root_path / DATA_DIR / DATA_TUNING_PROFILES_FILE)
+
         model_service_provider = StandardModelServiceProvider(
             settings_service=settings_service,
             model_folder_path=models_path,
+            prompt_prefix_cache=prompt_prefix_cache,
+            tuning_profile_store=tuning_profile_store,
+            llama_server_connection_pool=llama_server_connection_pool,
+            model_catalog=model_catalog,
         )
         logger.debug(
             "create_context: Model service provider initialized (%s)",
             type(model_service_provider).__name__,
         )
 
+        tokenizer_service = LlamaCppTokenizerService(
+            settings_service=settings_service,
+            model_folder_path=models_path,
+            model_catalog=model_catalog,
+        )
+        logger.debug(
+            "create_context: Tokenizer service initialized (%s)",
+            type(tokenizer_service).__name__,
+        )
+
+        response_cache = None
+        if RESPONSE_CACHE_ENABLED:
+            response_cache = SqliteResponseCache(file_path=root_path / DATA_DIR / DATA_RESPONSE_CACHE_FILE)
+
+        paragraph_result_store = InMemoryParagraphResultStore() if INCREMENTAL_PROCESSING_ENABLED else None
+
         text_processing_service = TextProcessingServiceBase(
             settings_service=settings_service,
             sanitizer_service=text_sanitization_service,
             model_service_provider=model_service_provider,
             prompt_service=prompt_service,
+            tokenizer_service=tokenizer_service,
+            chunking_service=text_chunking_service,
+            response_cache=response_cache,
+            paragraph_result_store=paragraph_result_store,
         )
         logger.debug(
             "create_context: Text processing service initialized (%s)",
@@ -316,17 +456,37 @@ def create_context(root_path: Path) -> AppContext:
             thread_pool.maxThreadCount(),
         )
 
+        model_preloader = ModelPreloaderImpl(
+            settings_service=settings_service,
+            model_service_provider=model_service_provider,
+        )
+        logger.debug(
+            "create_context: Model preloader initialized (%s)",
+            type(model_preloader).__name__,
+        )
+
+        model_directory_watcher = ModelDirectoryWatcherImpl(model_catalog=model_catalog)
+        logger.debug(
+            "create_context: Model directory watcher initialized (%s)",
+            type(model_directory_watcher).__name__,
+        )
+
         context = AppContext(
             settings_service=settings_service,
             prompt_service=prompt_service,
             text_processing_service=text_processing_service,
             supported_languages_service=supported_languages_service,
             task_service=task_service,
+            model_preloader=model_preloader,
+            tokenizer_service=tokenizer_service,
+            model_directory_watcher=model_directory_watcher,
         )
+        # Load the newly selected model as soon as settings are saved
+        context.subscribe_settings_updated(model_preloader.preload)
 
         logger.info(
             "create_context: Application context created successfully with %d services",
-            5,
+            8,
         )
         return context
 
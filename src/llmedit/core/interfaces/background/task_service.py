@@ -36,7 +36,8 @@ class TaskService(ABC):
             True if the task was found and cancellation was initiated, False otherwise.
 
         Notes:
-            Cancellation may not be immediate or guaranteed depending on task state.
+            Cancels the task's cancellation token. Cancellation may not be immediate or guaranteed;
+            it takes effect when the task function next checks the token.
         """
 
     @abstractmethod
@@ -45,7 +46,7 @@ class TaskService(ABC):
         Cancel all currently running tasks.
 
         Notes:
-            Iterates through active tasks and attempts to cancel each one.
+            Iterates through active tasks and cancels the cancellation token of each one.
             No guarantee that all tasks will stop immediately.
         """
 
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+
+class ModelDirectoryWatcher(ABC):
+    """
+    Abstract base class defining the interface for keeping the local model list up to date.
+
+    Implementations watch the model directory and update the model catalog when files are added,
+    removed or replaced, so model lists can be served from memory.
+    """
+
+    @abstractmethod
+    def start(self) -> None:
+        """
+        Scan the model directory and start watching it.
+
+        Notes:
+            Calling it again has no effect.
+        """
+
+    @abstractmethod
+    def subscribe_models_changed(self, listener: Callable[[], None]) -> None:
+        """
+        Subscribe to changes of the model list.
+
+        Args:
+            listener: Callback invoked after the catalog changed.
+        """
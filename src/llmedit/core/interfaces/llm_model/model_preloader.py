@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from llmedit.core.models.enums.model_load_state import ModelLoadState
+
+
+class ModelPreloader(ABC):
+    """
+    Abstract base class defining the interface for loading the selected model ahead of use.
+
+    Implementations load the model in the background so the first request does not wait for it,
+    and broadcast the loading state and progress to interested components.
+    """
+
+    @abstractmethod
+    def preload(self) -> None:
+        """
+        Start loading the currently selected model in the background.
+
+        Notes:
+            Returns immediately. If a load is already running, another one is started after it
+            finishes, so the latest model selection is always loaded in the end.
+        """
+
+    @abstractmethod
+    def get_state(self) -> ModelLoadState:
+        """
+        Get the loading state of the most recently preloaded model.
+
+        Returns:
+            Current ModelLoadState.
+        """
+
+    @abstractmethod
+    def subscribe_state_changed(self, listener: Callable[[ModelLoadState, str], None]) -> None:
+        """
+        Subscribe to loading state changes.
+
+        Args:
+            listener: Callback invoked with the new state and an error message (empty unless FAILED).
+        """
+
+    @abstractmethod
+    def subscribe_progress(self, listener: Callable[[float], None]) -> None:
+        """
+        Subscribe to loading progress updates.
+
+        Args:
+            listener: Callback invoked with the progress between 0.0 and 1.0.
+
+        Notes:
+            Only backends reporting progress (llama.cpp) emit updates.
+        """
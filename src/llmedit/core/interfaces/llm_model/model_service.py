@@ -1,15 +1,21 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional
 
-from llmedit.core.models.data_types import GenerationRequest, GenerationResponse
+from llmedit.core.models.data_types import (CancellationToken, GenerationRequest, GenerationResponse, LoadProgressCallback,
+                                            TextDeltaCallback, VariantTextDeltaCallback)
 from llmedit.core.models.settings import ModelInformation
 
 
+class GenerationCancelledError(RuntimeError):
+    """Raised by a generation that was cancelled before it finished."""
+
+
 class ModelService(ABC):
     """
     Abstract base class defining the interface for language model management and text generation.
 
     Implementations handle model loading, unloading, and response generation. Provides access
-    to model configuration and supports synchronous generation requests.
+    to model configuration and supports synchronous generation requests with optional token streaming.
     """
 
     @abstractmethod
@@ -22,15 +28,20 @@ class ModelService(ABC):
         """
 
     @abstractmethod
-    def load_model(self) -> None:
+    def load_model(self, on_progress: Optional[LoadProgressCallback] = None) -> None:
         """
         Load the configured language model into memory.
 
+        Args:
+            on_progress: Optional callback receiving the loading progress between 0.0 and 1.0.
+
         Raises:
             Exception: If model loading fails due to file not found, hardware constraints, or other errors.
 
         Notes:
-            This method blocks until loading is complete or fails.
+            This method blocks until loading is complete or fails. Implementations must be safe to
+            call from several threads; a caller arriving while a load is in progress waits for that
+            load instead of starting a second one.
         """
 
     @abstractmethod
@@ -55,19 +66,94 @@ class ModelService(ABC):
         """
 
     @abstractmethod
-    def generate_response(self, request: GenerationRequest) -> GenerationResponse:
+    def get_model_version(self) -> str:
+        """
+        Identify the weights the model currently generates with.
+
+        Returns:
+            Opaque string that changes whenever the weights change, e.g. when the model file is
+            replaced; empty if the version cannot be determined.
+
+        Notes:
+            Used to key cached results, so results of replaced weights are not reused.
+        """
+
+    @abstractmethod
+    def estimate_memory_bytes(self) -> int:
+        """
+        Estimate how much RAM the model occupies in this process when loaded.
+
+        Returns:
+            Estimated size in bytes; 0 for models hosted outside this process.
+
+        Notes:
+            Used to decide which models to keep resident. Before the first load the estimate may
+            leave out allocations that depend on the loaded model, such as the KV cache.
+        """
+
+    @abstractmethod
+    def max_parallel_requests(self) -> int:
+        """
+        Get how many requests the service can generate at the same time.
+
+        Returns:
+            Number of generate_response calls from different threads that run in parallel;
+            1 if calls are served one after another.
+        """
+
+    @abstractmethod
+    def generate_response(
+        self,
+        request: GenerationRequest,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> GenerationResponse:
         """
         Generate a response using the loaded model based on the provided request.
 
         Args:
             request: Contains system prompt, user prompt, and generation parameters.
+            on_text_delta: Optional callback invoked with each text fragment as soon as it is generated.
+            cancellation_token: Optional token; once cancelled, generation stops as soon as possible.
 
         Returns:
-            GenerationResponse with the generated text content.
+            GenerationResponse with the complete generated text content.
 
         Raises:
+            GenerationCancelledError: If the cancellation token was cancelled before generation finished.
             Exception: If generation fails due to model errors, timeouts, or invalid input.
 
         Notes:
-            This method blocks until generation is complete or an error occurs.
+            This method blocks until generation is complete, is cancelled, or an error occurs.
+            The callback is invoked on the calling thread; it must be cheap and must not raise.
+        """
+
+    @abstractmethod
+    def generate_variant_responses(
+        self,
+        requests: List[GenerationRequest],
+        on_text_delta: Optional[VariantTextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[GenerationResponse]:
+        """
+        Generate responses for several variants of one task, e.g. tones or target languages.
+
+        Args:
+            requests: One request per variant, typically sharing the system prompt and user text.
+            on_text_delta: Optional callback invoked with the variant index and each text fragment.
+            cancellation_token: Optional token; once cancelled, generation stops as soon as possible.
+
+        Returns:
+            One GenerationResponse per request, in request order.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled before all variants finished.
+            Exception: If generation fails for any variant.
+
+        Notes:
+            Implementations should evaluate the prompt part shared by all variants only once.
+            Unless max_parallel_requests() is greater than 1, variants are generated one after
+            another, so fragments of a variant are complete before the next variant starts.
+            Otherwise variants may generate in parallel and the callback is invoked from several
+            threads, with fragments of different variants interleaved.
         """
@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from llmedit.core.interfaces.settings.settings_service import SettingsService
+from llmedit.core.models.data_types import GenerationRequest
+
+
+class TokenizerService(ABC):
+    """
+    Abstract base class for counting tokens with the tokenizer of the selected model.
+
+    Lets the pipeline and the UI know the size of a request in model tokens before it is
+    submitted, without loading the model weights.
+    """
+
+    def __init__(self, settings_service: SettingsService):
+        """
+        Initialize the tokenizer service with access to application settings.
+
+        Args:
+            settings_service: Service providing the currently selected provider and model.
+        """
+        self._settings_service = settings_service
+
+    @abstractmethod
+    def count_text_tokens(self, text: str) -> Optional[int]:
+        """
+        Count the tokens of plain text for the selected model.
+
+        Args:
+            text: Text to count, e.g. the content of the input area.
+
+        Returns:
+            Number of tokens, or None if no tokenizer is available for the selected model.
+        """
+
+    @abstractmethod
+    def count_request_tokens(self, request: GenerationRequest) -> Optional[int]:
+        """
+        Count the tokens of a request's prompt as the selected model will receive it.
+
+        Args:
+            request: Generation request whose system and user prompts are rendered with the
+                model's chat template.
+
+        Returns:
+            Number of prompt tokens, or None if no tokenizer is available for the selected model.
+        """
+
+    @abstractmethod
+    def get_context_limit(self) -> Optional[int]:
+        """
+        Get the largest context the selected model supports.
+
+        Returns:
+            Context length in tokens (prompt plus output), or None if unknown.
+        """
@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ParagraphResultStore(ABC):
+    """
+    Abstract base class for stores of processed paragraphs, keyed by a digest of the paragraph.
+
+    Lets the text processing pipeline process an edited text incrementally: paragraphs whose
+    result is stored are reused, and only changed paragraphs are sent to the model. Keys are
+    computed by the caller and must cover everything that affects the output (model, prompt,
+    prompt parameters and paragraph text).
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up the result of a paragraph.
+
+        Args:
+            key: Digest of the paragraph and its processing settings.
+
+        Returns:
+            The sanitized result, or None if the key is not stored.
+        """
+
+    @abstractmethod
+    def put(self, key: str, result: str) -> None:
+        """
+        Store the result of a paragraph.
+
+        Args:
+            key: Digest of the paragraph and its processing settings.
+            result: Sanitized result of the paragraph.
+
+        Notes:
+            Implementations may evict other entries to stay within their size limits.
+        """
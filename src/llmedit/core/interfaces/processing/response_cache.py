@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from llmedit.core.models.data_types import GenerationRequest, GenerationResponse
+
+
+class ResponseCache(ABC):
+    """
+    Abstract base class for caches of generated responses, keyed by a digest of the request.
+
+    Lets the text processing pipeline answer a request identical to an earlier one without
+    generating again. Keys are computed by the caller and must cover everything that affects
+    the output (model, profile, rendered prompts and sampling parameters).
+    """
+
+    @abstractmethod
+    def get(self, key: str, request: GenerationRequest) -> Optional[GenerationResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Digest of the request.
+            request: The request the key was computed from; becomes the original request of the
+                returned response.
+
+        Returns:
+            The cached response, or None if the key is not cached.
+
+        Notes:
+            Implementations should return None rather than raise if the cache is unavailable.
+        """
+
+    @abstractmethod
+    def put(self, key: str, response: GenerationResponse) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Digest of the response's request.
+            response: Generated response.
+
+        Notes:
+            Implementations may evict other entries to stay within their size limits, and
+            should log rather than raise if the response cannot be stored.
+        """
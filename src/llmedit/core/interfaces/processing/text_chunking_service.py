@@ -0,0 +1,64 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from llmedit.core.models.data_types import TextChunk, TokenCounter
+
+
+class TextChunkingService(ABC):
+    """
+    Abstract base class for splitting long user texts into pieces that are processed one by one.
+
+    Keeps each piece small enough for the model's context and for fast decoding, while cutting
+    the text only where a piece can be processed without the rest of it.
+    """
+
+    @abstractmethod
+    def split_text(
+        self,
+        text: str,
+        max_tokens: int,
+        overlap_tokens: int,
+        count_tokens: TokenCounter,
+    ) -> List[TextChunk]:
+        """
+        Split a text into token-bounded chunks.
+
+        Args:
+            text: The user text to split.
+            max_tokens: Target maximum number of tokens per chunk.
+            overlap_tokens: Maximum number of tokens of preceding text attached to each chunk
+                after the first as context.
+            count_tokens: Function counting the tokens of a piece of text.
+
+        Returns:
+            Chunks in text order; a single chunk holding the whole text if it fits max_tokens.
+
+        Notes:
+            Joining the chunk texts with their separators must reproduce the original text,
+            apart from surrounding whitespace. A piece that cannot be split further may exceed
+            max_tokens.
+        """
+
+    @abstractmethod
+    def split_paragraphs(
+        self,
+        text: str,
+        overlap_tokens: int,
+        count_tokens: TokenCounter,
+    ) -> List[TextChunk]:
+        """
+        Split a text into its paragraphs.
+
+        Args:
+            text: The text to split, e.g. a user text or a generated result.
+            overlap_tokens: Maximum number of tokens of the preceding paragraph attached to each
+                paragraph after the first as context; zero attaches none.
+            count_tokens: Function counting the tokens of a piece of text.
+
+        Returns:
+            One chunk per paragraph, in text order; empty if the text is blank.
+
+        Notes:
+            Joining the chunk texts with their separators must reproduce the original text,
+            apart from surrounding whitespace. Paragraphs are not split further, whatever their size.
+        """
@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
 
 from llmedit.core.interfaces.llm_model.model_service_provider import ModelServiceProvider
+from llmedit.core.interfaces.llm_model.tokenizer_service import TokenizerService
+from llmedit.core.interfaces.processing.paragraph_result_store import ParagraphResultStore
+from llmedit.core.interfaces.processing.response_cache import ResponseCache
+from llmedit.core.interfaces.processing.text_chunking_service import TextChunkingService
 from llmedit.core.interfaces.processing.text_sanitization_service import TextSanitizationService
 from llmedit.core.interfaces.prompt.prompt_service import PromptService
 from llmedit.core.interfaces.settings.settings_service import SettingsService
-from llmedit.core.models.data_types import GenerationRequest, GenerationResponse, ProcessingContext
+from llmedit.core.models.data_types import (CancellationToken, ChunkFinishedCallback, GenerationRequest, GenerationResponse,
+                                            ProcessingContext, TextDeltaCallback, VariantTextDeltaCallback)
 
 
 class TextProcessingService(ABC):
@@ -21,6 +27,10 @@ class TextProcessingService(ABC):
         sanitizer_service: TextSanitizationService,
         model_service_provider: ModelServiceProvider,
         prompt_service: PromptService,
+        tokenizer_service: Optional[TokenizerService] = None,
+        chunking_service: Optional[TextChunkingService] = None,
+        response_cache: Optional[ResponseCache] = None,
+        paragraph_result_store: Optional[ParagraphResultStore] = None,
     ):
         """
         Initialize the text processing service with required dependencies.
@@ -30,35 +40,108 @@ class TextProcessingService(ABC):
             sanitizer_service: Used to clean and validate generated text.
             model_service_provider: Provides access to the active model service.
             prompt_service: Manages prompt retrieval and parameterization.
+            tokenizer_service: Optional tokenizer used to check request sizes before submission.
+            chunking_service: Optional service splitting long user texts into chunks processed one by one.
+            response_cache: Optional cache answering requests identical to earlier ones without generating.
+            paragraph_result_store: Optional store of paragraph results; with it, chunked prompts only
+                send the paragraphs changed since an earlier request to the model.
         """
         self._settings_service = settings_service
         self._sanitizer_service = sanitizer_service
         self._model_service_provider = model_service_provider
         self._prompt_service = prompt_service
+        self._tokenizer_service = tokenizer_service
+        self._chunking_service = chunking_service
+        self._response_cache = response_cache
+        self._paragraph_result_store = paragraph_result_store
 
     @abstractmethod
-    def process(self, processing_context: ProcessingContext) -> str:
+    def process(
+        self,
+        processing_context: ProcessingContext,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        on_chunk_finished: Optional[ChunkFinishedCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> str:
         """
         Process input context into final text output through the generation pipeline.
 
         Args:
             processing_context: Contains prompt ID and parameters for generation.
+            on_text_delta: Optional callback receiving raw (unsanitized) text fragments while generating.
+            on_chunk_finished: Optional callback receiving the sanitized partial result after each
+                chunk when the user text is processed in chunks.
+            cancellation_token: Optional token; once cancelled, generation stops as soon as possible.
 
         Returns:
             Sanitized generated text, or empty string if processing fails.
 
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled before processing finished.
+
         Notes:
             Implementations should handle model loading, prompt preparation, generation,
             and sanitization. Should return empty string on any error condition.
+            User texts too long for one request may be processed in chunks, in text order,
+            and the results joined with the original separators.
         """
 
     @abstractmethod
-    def _execute_task(self, request: GenerationRequest) -> GenerationResponse:
+    def process_variants(
+        self,
+        processing_contexts: List[ProcessingContext],
+        on_text_delta: Optional[VariantTextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[str]:
+        """
+        Process several variants of one task (e.g. tones or target languages) as one fan-out job.
+
+        Args:
+            processing_contexts: One context per variant, typically with the same user text.
+            on_text_delta: Optional callback receiving the variant index and raw text fragments.
+            cancellation_token: Optional token; once cancelled, generation stops as soon as possible.
+
+        Returns:
+            Sanitized generated text per variant, in context order; empty strings if processing fails.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled before processing finished.
+
+        Notes:
+            Implementations should let the model evaluate the prompt part shared by all
+            variants only once.
+        """
+
+    @abstractmethod
+    def preflight(self, processing_context: ProcessingContext) -> Tuple[bool, str]:
+        """
+        Check whether a request fits the selected model before it is submitted.
+
+        Args:
+            processing_context: Context of the request to check.
+
+        Returns:
+            Tuple of (fits, error_message). If the request fits or its size cannot be determined,
+            returns (True, ""). Otherwise, returns (False, error_message).
+
+        Notes:
+            Must not load the model, so it can be called on the UI thread.
+        """
+
+    @abstractmethod
+    def _execute_task(
+        self,
+        request: GenerationRequest,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> GenerationResponse:
         """
         Execute a generation request using the underlying model service.
 
         Args:
             request: Contains system prompt, user prompt, and sampling parameters.
+            on_text_delta: Optional callback forwarded to the model service for streaming.
+            cancellation_token: Optional token forwarded to the model service.
 
         Returns:
             GenerationResponse with the model-generated text content.
@@ -18,6 +18,7 @@ class SettingsService(ABC):
         self,
         llama_provider: SettingsLLMProvider,
         ollama_provider: SettingsLLMProvider,
+        llama_server_provider: Optional[SettingsLLMProvider] = None,
     ):
         """
         Initialize the settings service with model providers for each backend.
@@ -25,12 +26,15 @@ class SettingsService(ABC):
         Args:
             llama_provider: Provider for llama.cpp-compatible models.
             ollama_provider: Provider for Ollama-compatible models.
+            llama_server_provider: Optional provider for models of an OpenAI-compatible server
+                (llama-server); the provider is not offered without it.
 
         Notes:
             Providers are used to fetch available models based on the selected LLM provider.
         """
         self._llama_provider = llama_provider
         self._ollama_provider = ollama_provider
+        self._llama_server_provider = llama_server_provider
 
     @abstractmethod
     def get_settings_state(self) -> SettingsState:
@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+import math
+import threading
+from dataclasses import dataclass, field
 from typing import Any, Callable, List, Optional
 
 from llmedit.core.models.enums.prompt_category import PromptCategory
@@ -31,12 +33,48 @@ class ProcessingContext:
     prompt_parameters: dict[str, str]
 
 
+@dataclass(frozen=True)
+class OutputBudget:
+    """
+    Immutable data class describing how many tokens a response may use.
+
+    The budget scales with the size of the user input, never drops below a fixed minimum,
+    and reserves extra tokens for models that reason before answering.
+    """
+    input_ratio: float
+    min_tokens: int
+    reasoning_tokens: int = 0
+
+    def resolve(self, input_tokens: int, limit: int) -> int:
+        """
+        Compute the maximum number of tokens to generate.
+
+        Args:
+            input_tokens: Number of tokens in the user input.
+            limit: Upper bound, typically the model's configured output length.
+
+        Returns:
+            max(min_tokens, input_ratio * input_tokens) + reasoning_tokens, capped at limit.
+        """
+        answer_tokens = max(self.min_tokens, math.ceil(self.input_ratio * input_tokens))
+        return min(limit, answer_tokens + self.reasoning_tokens)
+
+
 @dataclass(frozen=True)
 class GenerationRequest:
     """
     Immutable data class representing a request for text generation.
 
     Contains prompts, sampling parameters, and other settings for model inference.
+    The optional static user prompt prefix is the leading part of user_prompt that does not
+    depend on user input; backends may use it to reuse already evaluated prompt state.
+    The user input text and output budget let backends limit the response length.
+    draft_tokens is the maximum number of tokens drafted per step by backends that support
+    speculative decoding; zero disables drafting. input_tokens and prompt_tokens are the exact
+    token counts of the user input and the rendered prompt when a tokenizer for the model is
+    available; None lets backends count or estimate them. seed fixes the sampling RNG so a
+    request with a temperature above zero generates the same output every time; None samples
+    randomly.
     """
     system_prompt: str
     user_prompt: str
@@ -44,6 +82,27 @@ class GenerationRequest:
     top_k: int
     top_p: float
     min_p: float
+    user_prompt_static_prefix: str = ""
+    user_input_text: str = ""
+    output_budget: Optional[OutputBudget] = None
+    draft_tokens: int = 0
+    input_tokens: Optional[int] = None
+    prompt_tokens: Optional[int] = None
+    seed: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class TextChunk:
+    """
+    Immutable data class representing one piece of a user text that is processed on its own.
+
+    separator is the whitespace that preceded the chunk in the original text and is used to
+    join the processed chunks back together; it is empty for the first chunk. context is the end
+    of the preceding chunk, passed along so terminology and tone stay consistent across chunks.
+    """
+    text: str
+    separator: str = ""
+    context: str = ""
 
 
 @dataclass(frozen=True)
@@ -58,6 +117,76 @@ class GenerationResponse:
     metadata: dict[str, str]
 
 
+TextDeltaCallback = Callable[[str], None]
+"""
+Callback receiving incremental text fragments while a response is being generated.
+
+Fragments are delivered in generation order; concatenating them yields the raw generated text.
+"""
+
+VariantTextDeltaCallback = Callable[[int, str], None]
+"""
+Callback receiving incremental text fragments of one variant of a fan-out generation.
+
+Invoked with the index of the variant in the request list and the fragment.
+"""
+
+ChunkFinishedCallback = Callable[[int, int, str], None]
+"""
+Callback receiving the partial result of a text processed in chunks.
+
+Invoked after each chunk with the index of the finished chunk, the number of chunks and the
+sanitized results of all chunks finished so far, joined as in the final result.
+"""
+
+TokenCounter = Callable[[str], int]
+"""
+Function returning the number of model tokens in a text, exact or estimated.
+"""
+
+LoadProgressCallback = Callable[[float], None]
+"""
+Callback receiving model loading progress as a value between 0.0 and 1.0.
+
+Invoked on the loading thread; it must be cheap and must not raise.
+"""
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag shared between the code requesting and the code doing the work.
+
+    The requesting side calls cancel(); long-running work polls is_cancelled() at points where it
+    can stop cheaply (e.g. after each generated token) and then raises GenerationCancelledError.
+    Safe to use from several threads.
+    """
+
+    def __init__(self, event: Optional[Any] = None) -> None:
+        """
+        Initialize an uncancelled token.
+
+        Args:
+            event: Optional event backing the token, e.g. a multiprocessing.Event shared with
+                another process; a new threading.Event if not given.
+        """
+        self._event = event if event is not None else threading.Event()
+
+    def cancel(self) -> None:
+        """
+        Request cancellation of the work the token was handed to.
+        """
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        """
+        Check whether cancellation was requested.
+
+        Returns:
+            True once cancel() was called, False otherwise.
+        """
+        return self._event.is_set()
+
+
 @dataclass(frozen=True)
 class TaskResult:
     """
@@ -77,8 +206,10 @@ class TaskInput:
     """
     Immutable data class representing an asynchronous task to be executed.
 
-    Contains the task function, completion callback, and identifier.
+    Contains the task function, completion callback, and identifier. The cancellation token is
+    cancelled when the task is cancelled; task functions hand it to the work they run.
     """
     id: str
     task_func: Callable[[], Any]
     on_task_finished: Callable[[TaskResult], None]
+    cancellation_token: CancellationToken = field(default_factory=CancellationToken)
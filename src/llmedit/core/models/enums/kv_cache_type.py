@@ -0,0 +1,13 @@
+from enum import StrEnum
+
+
+class KvCacheType(StrEnum):
+    """
+    Enumeration of element types the llama.cpp KV cache is stored in.
+
+    F16 keeps keys and values at half precision. Q8_0 halves the KV memory with hardly any
+    quality loss; Q4_0 quarters it at a noticeable quality cost on long contexts.
+    """
+    F16 = "f16"
+    Q8_0 = "q8_0"
+    Q4_0 = "q4_0"
@@ -9,3 +9,4 @@ class LlmProviderType(StrEnum):
     """
     LLAMA_CPP = "Llama.cpp"
     OLLAMA = "Ollama"
+    LLAMA_SERVER = "llama-server"
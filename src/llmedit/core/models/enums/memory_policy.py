@@ -0,0 +1,14 @@
+from enum import StrEnum
+
+
+class MemoryPolicy(StrEnum):
+    """
+    Enumeration of how llama.cpp model weights are kept in memory.
+
+    MMAP maps the file and lets the OS page weights in on first use and out under pressure.
+    MMAP_PREFAULT maps the file and reads it once after loading, so the first request does not
+    wait for disk reads. MLOCK additionally pins all weights in RAM.
+    """
+    MMAP = "mmap"
+    MMAP_PREFAULT = "mmap_prefault"
+    MLOCK = "mlock"
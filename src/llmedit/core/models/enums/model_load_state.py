@@ -0,0 +1,14 @@
+from enum import StrEnum
+
+
+class ModelLoadState(StrEnum):
+    """
+    Enumeration of model loading lifecycle states.
+
+    NOT_LOADED moves to LOADING when a load starts, which ends in LOADED or FAILED.
+    Selecting another model starts the cycle again.
+    """
+    NOT_LOADED = "Not loaded"
+    LOADING = "Loading"
+    LOADED = "Loaded"
+    FAILED = "Failed"
@@ -0,0 +1,12 @@
+from enum import StrEnum
+
+
+class SpeculativeDecodingMode(StrEnum):
+    """
+    Enumeration of speculative decoding strategies for local models.
+
+    Defines how draft tokens are proposed before the model verifies them in one batch.
+    """
+    NONE = "none"
+    PROMPT_LOOKUP = "prompt_lookup"
+    DRAFT_MODEL = "draft_model"
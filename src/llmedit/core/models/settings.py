@@ -1,7 +1,10 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from llmedit.core.models.enums.kv_cache_type import KvCacheType
 from llmedit.core.models.enums.llm_provider_type import LlmProviderType
+from llmedit.core.models.enums.memory_policy import MemoryPolicy
+from llmedit.core.models.enums.speculative_decoding_mode import SpeculativeDecodingMode
 
 
 @dataclass(frozen=True)
@@ -25,10 +28,13 @@ class LlmModel:
     Immutable data class representing a language model available in the system.
 
     Contains model identity and availability status. Used in UI selection components.
+    details is a short human-readable description (e.g. architecture, quantization and context
+    length, or why the model is unavailable); empty if the provider knows nothing more.
     """
     id: str
     name: str
     is_available: bool = False
+    details: str = ''
 
 
 @dataclass(frozen=True)
@@ -38,11 +44,21 @@ class ModelInformation:
 
     Includes model source, generation parameters, formatting rules, and provider information.
     Serves as a blueprint for model loading and prompt formatting.
+    thinking_budget is the number of extra output tokens reserved for models that reason
+    before answering; llama.cpp ends the reasoning block once it is spent. Zero for models that
+    answer directly. suppress_thinking bans the think tags for profiles of reasoning models
+    that should answer directly (e.g. Qwen3 with /no_think). speculative_decoding selects how
+    draft tokens are proposed for llama.cpp models; with DRAFT_MODEL, draft_model_file names a
+    smaller GGUF of the same tokenizer family used as the draft model. memory_policy overrides
+    the global llama.cpp memory policy for the model's file; None uses the global setting.
+    kv_cache_type and flash_attention likewise override the global KV cache options.
     """
     name: str
     repositoryId: str = ''
     fileName: str = ''
     output_length: int = 32768
+    thinking_budget: int = 0
+    suppress_thinking: bool = False
     temperature: float = 0.5
     top_k: int = 40
     top_p: float = 0.95
@@ -51,3 +67,8 @@ class ModelInformation:
     user_prompt_prefix: str = ''
     user_prompt_suffix: str = ''
     provider: LlmProviderType = LlmProviderType.LLAMA_CPP
+    speculative_decoding: SpeculativeDecodingMode = SpeculativeDecodingMode.NONE
+    draft_model_file: str = ''
+    memory_policy: Optional[MemoryPolicy] = None
+    kv_cache_type: Optional[KvCacheType] = None
+    flash_attention: Optional[bool] = None
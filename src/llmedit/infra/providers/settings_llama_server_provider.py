@@ -0,0 +1,52 @@
+import logging
+from typing import List, override
+
+from llmedit.core.interfaces.settings.settings_llm_provider import SettingsLLMProvider
+from llmedit.core.models.settings import LlmModel
+from llmedit.infra.services.http_connection_pool import HttpConnectionPool
+from llmedit.infra.services.openai_compatible_model_service import list_server_models
+
+logger = logging.getLogger(__name__)
+
+
+class SettingsLlamaServerProvider(SettingsLLMProvider):
+    """
+    Implementation of SettingsLLMProvider for llama-server and other OpenAI-compatible servers.
+
+    Retrieves the available models from the server's /v1/models endpoint.
+    """
+
+    def __init__(self, connection_pool: HttpConnectionPool) -> None:
+        """
+        Initialize provider with the server's connection pool.
+
+        Args:
+            connection_pool: Keep-alive connections to the server, shared with the model services.
+        """
+        self._connection_pool = connection_pool
+
+    @override
+    def get_model_list(self) -> List[LlmModel]:
+        """
+        Retrieve the models the server serves.
+
+        Returns:
+            List of LlmModel instances sorted alphabetically by name; empty if the server cannot
+            be reached.
+
+        Notes:
+            llama-server serves the single model it was started with.
+        """
+        logger.debug("get_model_list: Requesting models from '%s'", self._connection_pool.base_url)
+
+        try:
+            model_names = list_server_models(self._connection_pool)
+        except Exception:
+            logger.warning("get_model_list: Failed to connect to '%s'", self._connection_pool.base_url, exc_info=True)
+            return []
+
+        models = [LlmModel(id=name, name=name, is_available=True) for name in model_names]
+        models.sort(key=lambda x: x.name)
+
+        logger.debug("get_model_list: Found %d models", len(models))
+        return models
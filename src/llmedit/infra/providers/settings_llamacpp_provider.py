@@ -1,10 +1,9 @@
 import logging
-from pathlib import Path
 from typing import List, override
 
-from llmedit.config.predefined_gguf_models import PREDEFINED_GGUF_MODELS
 from llmedit.core.interfaces.settings.settings_llm_provider import SettingsLLMProvider
 from llmedit.core.models.settings import LlmModel
+from llmedit.infra.services.gguf_model_catalog import GgufModelCatalog
 
 logger = logging.getLogger(__name__)
 
@@ -13,24 +12,22 @@ class SettingsLlamaCppProvider(SettingsLLMProvider):
     """
     Implementation of SettingsLLMProvider for llama.cpp backend.
 
-    Discovers and manages GGUF-format models stored in a local directory.
-    Uses predefined model configurations to identify available models.
+    Lists the GGUF-format models stored in a local directory from an in-memory catalog, which
+    covers the predefined model configurations and any other GGUF file in the directory. The
+    catalog is kept up to date by watching the directory, so listing models does not rescan it.
     """
 
-    def __init__(self, model_folder_path: Path) -> None:
+    def __init__(self, model_catalog: GgufModelCatalog) -> None:
         """
-        Initialize provider with path to model storage directory.
+        Initialize provider with the catalog of the model storage directory.
 
         Args:
-            model_folder_path: Directory where GGUF model files are stored.
-
-        Notes:
-            The path is used to check file existence when determining model availability.
+            model_catalog: Catalog of the GGUF files in the model directory.
         """
-        self._model_folder_path = model_folder_path
+        self._model_catalog = model_catalog
         logger.debug(
             "__init__: Model folder path set to '%s'",
-            self._model_folder_path,
+            self._model_catalog.model_folder_path,
         )
 
     @override
@@ -42,66 +39,15 @@ class SettingsLlamaCppProvider(SettingsLLMProvider):
             List of LlmModel instances for available models, sorted alphabetically by name.
 
         Notes:
-            Only returns models whose files exist in the configured folder.
+            Served from the catalog as of its last scan. Models whose file is incomplete or
+            unreadable are returned as unavailable, with the reason in their details.
             Logs errors but returns empty list on failure.
         """
-        logger.debug(
-            "get_model_list: Scanning '%s' for %d predefined models",
-            self._model_folder_path,
-            len(PREDEFINED_GGUF_MODELS),
-        )
-
         try:
-            available_models = [
-                LlmModel(
-                    id=model.fileName,
-                    name=model.name,
-                    is_available=True,
-                )
-                for model in PREDEFINED_GGUF_MODELS
-                if self._is_model_available(model.fileName)
-            ]
-
+            models = self._model_catalog.get_models()
         except Exception as e:
-            logger.error("get_model_list: Error while scanning for models - %s", e, exc_info=True)
+            logger.error("get_model_list: Error while listing models - %s", e, exc_info=True)
             return []
 
-        logger.debug(
-            "get_model_list: Found %d/%d available models",
-            len(available_models),
-            len(PREDEFINED_GGUF_MODELS),
-        )
-
-        return sorted(available_models, key=lambda model: model.name)
-
-    def _is_model_available(self, file_name: str) -> bool:
-        """
-        Check if a model file exists and is accessible.
-
-        Args:
-            file_name: Name of the model file to check.
-
-        Returns:
-            True if the file exists and is a regular file, False otherwise.
-
-        Notes:
-            Performs filesystem check using pathlib. Logs detailed information about
-            file existence and type.
-        """
-        try:
-            model_path = self._model_folder_path / file_name
-            logger.debug("Checking model file: '%s'", model_path)
-
-            is_available = model_path.exists() and model_path.is_file()
-            if is_available:
-                logger.debug("Model file found: '%s'", model_path)
-            else:
-                logger.debug("Model file not found or not a regular file: '%s'", model_path)
-
-            return is_available
-        except OSError as e:
-            logger.warning("Error checking model file '%s' - %s", file_name, e)
-            return False
-        except Exception as e:
-            logger.error("Unexpected error checking model file '%s' - %s", file_name, e, exc_info=True)
-            return False
+        logger.debug("get_model_list: Returning %d cataloged models", len(models))
+        return models
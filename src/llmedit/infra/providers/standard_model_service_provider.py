@@ -1,48 +1,110 @@
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, override
+from typing import Any, Dict, List, Optional, Tuple, override
 
+from llmedit.config.inference_pool import INFERENCE_IN_PROCESS, INFERENCE_WORKER_THREADS, INFERENCE_WORKERS
+from llmedit.config.kv_cache import FLASH_ATTENTION, KV_CACHE_TYPE
+from llmedit.config.model_residency import (MODEL_MEMORY_POLICY, MODEL_POOL_MEMORY_BUDGET_BYTES,
+                                            MODEL_POOL_MEMORY_BUDGET_FALLBACK_BYTES, MODEL_POOL_MEMORY_BUDGET_FRACTION)
 from llmedit.config.predefined_gguf_models import PREDEFINED_GGUF_MODELS
 from llmedit.core.interfaces.llm_model.model_service import ModelService
 from llmedit.core.interfaces.llm_model.model_service_provider import ModelServiceProvider
 from llmedit.core.interfaces.settings.settings_service import SettingsService
 from llmedit.core.models.enums.llm_provider_type import LlmProviderType
+from llmedit.core.models.enums.speculative_decoding_mode import SpeculativeDecodingMode
 from llmedit.core.models.settings import ModelInformation
+from llmedit.infra.services.llama_cpp_loaded_model import LlamaCppLoadedModel
 from llmedit.infra.services.llama_cpp_model_service import LlamaCppModelService
+from llmedit.infra.services.llama_cpp_pool_model_service import LlamaCppPoolModelService
+from llmedit.infra.services.llama_cpp_tuning_profile_store import LlamaCppTuningProfileStore, available_cpu_count
+from llmedit.infra.services.gguf_model_catalog import GgufModelCatalog
+from llmedit.infra.services.http_connection_pool import HttpConnectionPool
+from llmedit.infra.services.llama_cpp_worker_pool import LlamaCppWorkerPool, LlamaCppWorkerSpec
 from llmedit.infra.services.ollama_model_service import OllamaModelService
+from llmedit.infra.services.openai_compatible_model_service import OpenAiCompatibleModelService
+from llmedit.infra.services.prompt_prefix_cache import PromptPrefixCache
+from llmedit.infra.services.system_memory import available_memory_share_bytes
 
 logger = logging.getLogger(__name__)
 
 
 class StandardModelServiceProvider(ModelServiceProvider):
     """
-    Concrete implementation of ModelServiceProvider that creates and caches ModelService instances.
-
-    Provides model services based on current settings, with caching to avoid unnecessary
-    model reloading. Supports both Llama.cpp and Ollama providers.
+    Concrete implementation of ModelServiceProvider that creates and pools ModelService instances.
+
+    Provides model services based on current settings. Llama.cpp profiles sharing a GGUF file
+    share one loaded model, so switching between them costs nothing; a profile enabling
+    speculative decoding gets a model of its own, since its context keeps logits for every
+    position. Recently used models stay
+    resident while their estimated memory fits the budget, so switching back to a model does not
+    reload it. Unless in-process inference is configured, llama.cpp models run in a pool of
+    supervised worker processes instead of the application process. Supports Llama.cpp, Ollama
+    and llama-server (OpenAI-compatible) providers.
     """
 
-    def __init__(self, settings_service: SettingsService, model_folder_path: Path):
+    def __init__(
+        self,
+        settings_service: SettingsService,
+        model_folder_path: Path,
+        prompt_prefix_cache: Optional[PromptPrefixCache] = None,
+        tuning_profile_store: Optional[LlamaCppTuningProfileStore] = None,
+        memory_budget_bytes: Optional[int] = MODEL_POOL_MEMORY_BUDGET_BYTES,
+        inference_workers: int = INFERENCE_WORKERS,
+        inference_in_process: bool = INFERENCE_IN_PROCESS,
+        llama_server_connection_pool: Optional[HttpConnectionPool] = None,
+        model_catalog: Optional[GgufModelCatalog] = None,
+    ):
         """
         Initialize provider with settings service and model storage path.
 
         Args:
             settings_service: Service providing current LLM configuration.
             model_folder_path: Directory where GGUF model files are stored.
+            prompt_prefix_cache: Optional prompt-prefix state cache passed to Llama.cpp services.
+            tuning_profile_store: Optional store of calibrated parameters passed to Llama.cpp services.
+            memory_budget_bytes: RAM that resident models may occupy together; None uses
+                MODEL_POOL_MEMORY_BUDGET_FRACTION of the RAM available now.
+            inference_workers: Number of llama.cpp worker processes per model.
+            inference_in_process: Whether llama.cpp runs in the application process instead of
+                in worker processes.
+            llama_server_connection_pool: Connections to the OpenAI-compatible server used by the
+                llama-server provider; the provider is unsupported without it.
+            model_catalog: Optional catalog of the model directory, used to resolve GGUF files
+                that are not predefined; without it only predefined models can be used.
 
         Notes:
-            Maintains a cache of the current model service to optimize performance
-            when repeatedly requesting the same model.
+            Keeps one service per model profile, one loaded model (or worker pool) per GGUF file
+            and speculative decoding configuration, and an LRU order of the resident weights used
+            for eviction. Residency is tracked locally: weights count as resident from the moment
+            their service is handed out until the provider evicts them, so handing out a service
+            never queries the backends.
         """
         super().__init__(settings_service)
         self._model_folder_path = model_folder_path
-        self._cached_service: Optional[ModelService] = None
-        self._cached_provider: Optional[LlmProviderType] = None
-        self._cached_model_name: Optional[str] = None
+        self._prompt_prefix_cache = prompt_prefix_cache
+        self._tuning_profile_store = tuning_profile_store
+        if memory_budget_bytes is None:
+            memory_budget_bytes = available_memory_share_bytes(
+                MODEL_POOL_MEMORY_BUDGET_FRACTION,
+                MODEL_POOL_MEMORY_BUDGET_FALLBACK_BYTES,
+            )
+        self._memory_budget_bytes = memory_budget_bytes
+        self._inference_workers = inference_workers
+        self._inference_in_process = inference_in_process
+        self._llama_server_connection_pool = llama_server_connection_pool
+        self._model_catalog = model_catalog
+        self._services: Dict[Tuple[LlmProviderType, Optional[str]], ModelService] = { }
+        self._loaded_models: Dict[str, LlamaCppLoadedModel] = { }
+        self._worker_pools: Dict[str, LlamaCppWorkerPool] = { }
+        self._resident: OrderedDict[Tuple[LlmProviderType, str], ModelService] = OrderedDict()
+        self._lock = threading.Lock()
 
         logger.debug(
-            "__init__: Initialized with model folder '%s'",
+            "__init__: Initialized with model folder '%s' (memory budget %.1f GiB)",
             self._model_folder_path,
+            self._memory_budget_bytes / (1024 ** 3),
         )
 
     @override
@@ -58,12 +120,41 @@ class StandardModelServiceProvider(ModelServiceProvider):
             Exception: If service creation fails for any reason.
 
         Notes:
-            Returns cached service if settings haven't changed. Otherwise, creates
-            new service and unloads previous one. Thread-safety is not guaranteed.
+            Returns the existing service if the profile was used before, otherwise creates it.
+            Then unloads least recently used models until the estimated memory of the resident
+            models fits the budget. Safe to call from the background preloader and the task
+            thread at the same time; evicted models are unloaded after the provider lock is
+            released, so waiting for a busy model does not block other callers.
+        """
+        with self._lock:
+            service, evicted_services = self._get_or_create_model_service()
+
+        for evicted_key, evicted_service in evicted_services:
+            with self._lock:
+                if evicted_key in self._resident:
+                    # Requested again by another caller in the meantime
+                    continue
+            try:
+                evicted_service.unload_model()
+            except Exception:
+                logger.warning("get_model_service: Failed to unload evicted model", exc_info=True)
+        return service
+
+    def _get_or_create_model_service(
+        self,
+    ) -> Tuple[ModelService, List[Tuple[Tuple[LlmProviderType, str], ModelService]]]:
+        """
+        Retrieve or create model service; the caller must hold the provider lock.
+
+        Returns:
+            ModelService instance configured for the currently selected provider and model, and
+            the weights keys and services whose models must be unloaded to stay within the memory
+            budget.
         """
         current_provider = self._settings_service.get_llm_provider()
         current_model = self._settings_service.get_llm_model()
         current_model_name = current_model.name if current_model else None
+        key = (current_provider, current_model_name)
 
         logger.debug(
             "get_model_service: Requesting service for provider=%s, model=%s",
@@ -71,90 +162,117 @@ class StandardModelServiceProvider(ModelServiceProvider):
             current_model_name or "None",
         )
 
-        if self._is_cache_valid(current_provider, current_model_name):
+        service = self._services.get(key)
+        if service is not None:
             logger.debug(
-                "get_model_service: Using cached service (provider=%s, model=%s)",
+                "get_model_service: Using existing service (provider=%s, model=%s)",
                 current_provider.value,
                 current_model_name,
             )
-            return self._cached_service
-
-        self._handle_cache_miss()
-
-        if self._cached_service is not None:
-            logger.debug(
-                "get_model_service: Unloading previous model (provider=%s, model=%s)",
-                self._cached_provider.value if self._cached_provider else "None",
-                self._cached_model_name or "None",
-            )
-            self._cached_service.unload_model()
-
-        try:
-            service = self._create_service_for_provider(current_provider, current_model)
-
-            self._cached_provider = current_provider
-            self._cached_model_name = current_model_name
-            self._cached_service = service
-
+        else:
+            logger.debug("get_model_service: No existing service for the selected model")
+            try:
+                service = self._create_service_for_provider(current_provider, current_model)
+            except Exception:
+                logger.error(
+                    "get_model_service: Failed to create model service",
+                    exc_info=True,
+                )
+                raise
+            self._services[key] = service
             logger.debug(
                 "get_model_service: Successfully created service for provider=%s, model=%s",
                 current_provider.value,
                 current_model_name,
             )
-            return service
 
-        except Exception:
-            logger.error(
-                "get_model_service: Failed to create model service",
-                exc_info=True,
-            )
-            raise
+        resident_key = self._resident_key(current_provider, service)
+        self._resident[resident_key] = service
+        self._resident.move_to_end(resident_key)
+        return service, self._evict_to_budget(resident_key)
 
-    def _is_cache_valid(self, current_provider: LlmProviderType, current_model_name: Optional[str]) -> bool:
+    @staticmethod
+    def _resident_key(provider: LlmProviderType, service: ModelService) -> Tuple[LlmProviderType, str]:
         """
-        Check if the cached service is valid for current settings.
+        Get the key identifying the weights a service uses.
 
         Args:
-            current_provider: The currently selected LLM provider.
-            current_model_name: The currently selected model name, or None.
+            provider: Provider of the service.
+            service: Model service.
 
         Returns:
-            True if cached service can be reused, False otherwise.
-
-        Notes:
-            Cache is invalid if provider or model name has changed since last service creation.
+            Provider and shared model key for llama.cpp services, provider and model name otherwise.
         """
-        if self._cached_service is None:
-            return False
+        model_info = service.get_model_information()
+        if not model_info.fileName:
+            return provider, model_info.name
+        return provider, StandardModelServiceProvider._shared_model_key(model_info)
 
-        if self._cached_provider != current_provider:
-            logger.debug(
-                "get_model_service: Cache miss - provider changed from %s to %s",
-                self._cached_provider.value,
-                current_provider.value,
-            )
-            return False
+    @staticmethod
+    def _shared_model_key(model_info: ModelInformation) -> str:
+        """
+        Get the key of the loaded model (or worker pool) a llama.cpp profile uses.
 
-        if self._cached_model_name != current_model_name:
-            logger.debug(
-                "get_model_service: Cache miss - model changed from '%s' to '%s'",
-                self._cached_model_name,
-                current_model_name,
-            )
-            return False
+        Args:
+            model_info: Llama.cpp model profile.
 
-        return True
+        Returns:
+            GGUF file name, followed by the speculative decoding mode and draft model file for
+            profiles enabling speculative decoding.
 
-    def _handle_cache_miss(self) -> None:
+        Notes:
+            Speculative decoding keeps logits for every evaluated position (vocabulary size * 4
+            bytes per token), so only the profiles enabling it pay for such a context. The
+            weights are memory-mapped, so models of the same file share its pages in RAM.
+        """
+        if model_info.speculative_decoding == SpeculativeDecodingMode.NONE:
+            return model_info.fileName
+        speculative_options = " ".join(filter(None, [model_info.speculative_decoding.value, model_info.draft_model_file]))
+        return f"{model_info.fileName} ({speculative_options})"
+
+    def _evict_to_budget(
+        self,
+        current_key: Tuple[LlmProviderType, str],
+    ) -> List[Tuple[Tuple[LlmProviderType, str], ModelService]]:
         """
-        Log cache miss information.
+        Pick least recently used models to unload until the resident ones fit the memory budget.
+
+        Args:
+            current_key: Weights key of the service being handed out; it is never evicted and
+                counts as resident, since it is about to be loaded.
+
+        Returns:
+            Weights keys and services of the models to unload; they are no longer tracked as
+            resident.
 
         Notes:
-            Currently only logs when no cached service exists. More detailed logging
-            is handled by the _is_cache_valid method.
+            Services of evicted models are kept and reload their model on next use.
         """
-        if self._cached_service is None:
-            logger.debug("get_model_service: No cached service available")
+        sizes = { key: service.estimate_memory_bytes() for key, service in self._resident.items() }
+        resident_bytes = sum(sizes.values())
+
+        evicted_services: List[Tuple[Tuple[LlmProviderType, str], ModelService]] = []
+        for key in list(sizes.keys()):
+            if resident_bytes <= self._memory_budget_bytes:
+                break
+            if key == current_key:
+                continue
+
+            evicted_services.append((key, self._resident.pop(key)))
+            logger.info(
+                "get_model_service: Unloading '%s' (%.1f GiB) to stay within the memory budget",
+                key[1],
+                sizes[key] / (1024 ** 3),
+            )
+            resident_bytes -= sizes[key]
+
+        logger.debug(
+            "get_model_service: %d model(s) resident, ~%.1f of %.1f GiB",
+            len(self._resident),
+            resident_bytes / (1024 ** 3),
+            self._memory_budget_bytes / (1024 ** 3),
+        )
+        return evicted_services
 
     def _create_service_for_provider(self, provider: LlmProviderType, model) -> ModelService:
         """
@@ -174,6 +292,8 @@ class StandardModelServiceProvider(ModelServiceProvider):
             return self._create_ollama_service(model)
         elif provider == LlmProviderType.LLAMA_CPP:
             return self._create_llama_cpp_service(model)
+        elif provider == LlmProviderType.LLAMA_SERVER and self._llama_server_connection_pool is not None:
+            return self._create_llama_server_service(model)
         else:
             logger.error(
                 "get_model_service: Unsupported provider '%s'",
@@ -209,6 +329,36 @@ class StandardModelServiceProvider(ModelServiceProvider):
         )
         return OllamaModelService(model_information=model_info)
 
+    def _create_llama_server_service(self, model) -> ModelService:
+        """
+        Create model service for a model of the OpenAI-compatible server.
+
+        Args:
+            model: The model configuration to use.
+
+        Returns:
+            OpenAiCompatibleModelService instance sharing the provider's connection pool.
+
+        Raises:
+            ValueError: If no model is selected.
+        """
+        if not model:
+            logger.error("get_model_service: No model selected for llama-server provider")
+            raise ValueError("No model selected for llama-server provider")
+
+        model_info = ModelInformation(
+            name=model.name,
+            provider=LlmProviderType.LLAMA_SERVER,
+        )
+        logger.debug(
+            "get_model_service: Creating llama-server service for model '%s'",
+            model.name,
+        )
+        return OpenAiCompatibleModelService(
+            model_information=model_info,
+            connection_pool=self._llama_server_connection_pool,
+        )
+
     def _create_llama_cpp_service(self, model) -> ModelService:
         """
         Create Llama.cpp model service for the given model.
@@ -217,24 +367,28 @@ class StandardModelServiceProvider(ModelServiceProvider):
             model: The model configuration to use.
 
         Returns:
-            LlamaCppModelService instance.
+            LlamaCppPoolModelService instance running the model in worker processes, or
+            LlamaCppModelService if in-process inference is configured.
 
         Raises:
-            ValueError: If no model is selected or model is not found in predefined list.
+            ValueError: If no model is selected or model is neither predefined nor a GGUF file
+                in the model directory.
         """
         if not model:
             logger.error("get_model_service: No model selected for Llama.cpp provider")
             raise ValueError("No model selected for Llama.cpp provider")
 
-        found_model_info = None
-        for model_info in PREDEFINED_GGUF_MODELS:
-            if model_info.name == model.name:
-                found_model_info = model_info
-                break
+        if self._model_catalog is not None:
+            found_model_info = self._model_catalog.find_model_information(model.name)
+        else:
+            found_model_info = next(
+                (model_info for model_info in PREDEFINED_GGUF_MODELS if model_info.name == model.name),
+                None,
+            )
 
         if not found_model_info:
             logger.error(
-                "get_model_service: Model '%s' not found in predefined GGUF models",
+                "get_model_service: Model '%s' not found in predefined GGUF models or model folder",
                 model.name,
             )
             raise ValueError(f"Model {model.name} not found in predefined GGUF models.")
@@ -244,7 +398,119 @@ class StandardModelServiceProvider(ModelServiceProvider):
             model.name,
             found_model_info.fileName,
         )
+        if not self._inference_in_process:
+            return LlamaCppPoolModelService(
+                model_information=found_model_info,
+                worker_pool=self._get_worker_pool(found_model_info),
+            )
         return LlamaCppModelService(
-            model_folder_path=self._model_folder_path,
             model_information=found_model_info,
+            loaded_model=self._get_loaded_model(found_model_info),
+        )
+
+    def _get_loaded_model(self, model_info: ModelInformation) -> LlamaCppLoadedModel:
+        """
+        Get the loaded model shared by the profiles using a GGUF file, creating it if needed.
+
+        Args:
+            model_info: Llama.cpp model profile.
+
+        Returns:
+            Shared LlamaCppLoadedModel instance.
+
+        Notes:
+            Profiles share the model if they use the same file and speculative decoding
+            configuration, see _shared_model_key. The loading options are resolved from the
+            profiles of the file, see _resolve_file_options.
+        """
+        model_key = self._shared_model_key(model_info)
+        loaded_model = self._loaded_models.get(model_key)
+        if loaded_model is not None:
+            return loaded_model
+
+        loaded_model = LlamaCppLoadedModel(
+            model_folder_path=self._model_folder_path,
+            file_name=model_info.fileName,
+            prompt_prefix_cache=self._prompt_prefix_cache,
+            tuning_profile_store=self._tuning_profile_store,
+            **self._resolve_file_options(model_info),
         )
+        self._loaded_models[model_key] = loaded_model
+        logger.debug("get_model_service: Created shared loaded model for '%s'", model_key)
+        return loaded_model
+
+    def _get_worker_pool(self, model_info: ModelInformation) -> LlamaCppWorkerPool:
+        """
+        Get the worker pool shared by the profiles using a GGUF file, creating it if needed.
+
+        Args:
+            model_info: Llama.cpp model profile.
+
+        Returns:
+            Shared LlamaCppWorkerPool instance.
+
+        Notes:
+            Profiles share the pool as they would share a loaded model, see _get_loaded_model.
+            Workers load the file with the same options as a loaded model in this process. The
+            CPUs are divided evenly between the workers unless INFERENCE_WORKER_THREADS is set, and
+            each worker keeps its share of the prompt prefix cache budget in memory, backed by the
+            same snapshot directory.
+        """
+        model_key = self._shared_model_key(model_info)
+        worker_pool = self._worker_pools.get(model_key)
+        if worker_pool is not None:
+            return worker_pool
+
+        snapshot_store = self._prompt_prefix_cache.snapshot_store if self._prompt_prefix_cache else None
+        spec = LlamaCppWorkerSpec(
+            model_folder_path=self._model_folder_path,
+            file_name=model_info.fileName,
+            n_threads=INFERENCE_WORKER_THREADS or max(1, available_cpu_count() // self._inference_workers),
+            tuning_profile_file=self._tuning_profile_store.file_path if self._tuning_profile_store else None,
+            prompt_cache_directory=snapshot_store.directory if snapshot_store else None,
+            prompt_cache_capacity_bytes=(
+                self._prompt_prefix_cache.capacity_bytes // self._inference_workers if self._prompt_prefix_cache else 0
+            ),
+            log_level=logging.getLogger().getEffectiveLevel(),
+            **self._resolve_file_options(model_info),
+        )
+        worker_pool = LlamaCppWorkerPool(spec=spec, worker_count=self._inference_workers)
+        self._worker_pools[model_key] = worker_pool
+        logger.debug("get_model_service: Created shared worker pool for '%s'", model_key)
+        return worker_pool
+
+    @staticmethod
+    def _resolve_file_options(model_info: ModelInformation) -> Dict[str, Any]:
+        """
+        Resolve the loading options of a profile's GGUF file.
+
+        Args:
+            model_info: Llama.cpp model profile.
+
+        Returns:
+            Keyword arguments speculative_decoding, draft_model_file, memory_policy, kv_cache_type
+            and flash_attention, as accepted by LlamaCppLoadedModel and LlamaCppWorkerSpec.
+
+        Notes:
+            The speculative decoding mode and draft model are the profile's own, so the context
+            keeps logits for every position only for profiles enabling speculative decoding.
+            The memory policy is the first one set by a profile of the file, or MODEL_MEMORY_POLICY;
+            the KV cache type and flash attention are resolved the same way.
+        """
+        file_profiles = [profile for profile in PREDEFINED_GGUF_MODELS if profile.fileName == model_info.fileName]
+        return {
+            "speculative_decoding": model_info.speculative_decoding,
+            "draft_model_file": model_info.draft_model_file,
+            "memory_policy": next(
+                (profile.memory_policy for profile in file_profiles if profile.memory_policy is not None),
+                MODEL_MEMORY_POLICY,
+            ),
+            "kv_cache_type": next(
+                (profile.kv_cache_type for profile in file_profiles if profile.kv_cache_type is not None),
+                KV_CACHE_TYPE,
+            ),
+            "flash_attention": next(
+                (profile.flash_attention for profile in file_profiles if profile.flash_attention is not None),
+                FLASH_ATTENTION,
+            ),
+        }
@@ -0,0 +1,123 @@
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Optional
+
+from llmedit.infra.services.gguf_metadata_reader import GgufMetadata, read_gguf_metadata
+
+logger = logging.getLogger(__name__)
+
+
+class GgufMetadataIndex:
+    """
+    JSON-file index of GGUF header metadata, keyed by file path.
+
+    Each entry records the file's size and modification time; an entry is used only while both
+    still match, so a replaced or still-growing file is read again. Reading a header takes a
+    fraction of a second, looking it up in the index only a stat call.
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        """
+        Initialize index backed by the given JSON file.
+
+        Args:
+            file_path: Location of the index file. Created on first save.
+
+        Notes:
+            The file is read lazily on first lookup and kept in memory afterwards.
+        """
+        self._file_path = file_path
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, dict]] = None
+
+        logger.debug("__init__: Initialized GGUF metadata index at '%s'", self._file_path)
+
+    def get_metadata(self, model_path: Path) -> GgufMetadata:
+        """
+        Get the metadata of a GGUF file, reading its header only if the index is stale.
+
+        Args:
+            model_path: Path of the GGUF file.
+
+        Returns:
+            Metadata of the file as it is on disk now.
+
+        Raises:
+            ValueError: If the file is not a supported GGUF file or its header is cut off.
+            OSError: If the file cannot be read.
+
+        Notes:
+            Newly read metadata is persisted immediately. A failure to write the index file is
+            logged and does not fail the lookup.
+        """
+        key = str(model_path.absolute())
+        stat = model_path.stat()
+
+        with self._lock:
+            entries = self._load_entries()
+            entry = entries.get(key)
+            if entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                try:
+                    return GgufMetadata(**entry["metadata"])
+                except TypeError:
+                    logger.debug("get_metadata: Ignoring outdated entry for '%s'", model_path.name)
+
+        metadata = read_gguf_metadata(model_path)
+
+        with self._lock:
+            entries = self._load_entries()
+            entries[key] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "metadata": asdict(metadata),
+            }
+            self._save_entries(entries)
+
+        logger.info("get_metadata: Indexed '%s'", model_path.name)
+        return metadata
+
+    def _load_entries(self) -> Dict[str, dict]:
+        """
+        Get the index entries, reading the index file on first use.
+
+        Returns:
+            Mapping of absolute file path to entry. Empty if the file is missing or invalid.
+
+        Notes:
+            Must be called with the lock held.
+        """
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = { }
+        if self._file_path.exists():
+            try:
+                self._entries = json.loads(self._file_path.read_text(encoding="utf-8"))
+            except Exception:
+                logger.warning("_load_entries: Ignoring unreadable index file '%s'", self._file_path, exc_info=True)
+        return self._entries
+
+    def _save_entries(self, entries: Dict[str, dict]) -> None:
+        """
+        Write the index entries to the index file.
+
+        Args:
+            entries: Mapping of absolute file path to entry.
+
+        Notes:
+            Must be called with the lock held. Entries of deleted files are dropped.
+        """
+        for key in [key for key in entries if not Path(key).exists()]:
+            del entries[key]
+
+        try:
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self._file_path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(entries), encoding="utf-8")
+            os.replace(temp_path, self._file_path)
+        except Exception:
+            logger.warning("_save_entries: Failed to write '%s'", self._file_path, exc_info=True)
@@ -0,0 +1,323 @@
+import logging
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+GGUF_MAGIC = b"GGUF"
+GGUF_MIN_VERSION = 2
+GGUF_DEFAULT_ALIGNMENT = 32
+READ_BUFFER_BYTES = 1024 * 1024
+
+VALUE_TYPE_STRING = 8
+VALUE_TYPE_ARRAY = 9
+
+_UINT64 = struct.Struct("<Q")
+
+_SCALAR_FORMATS: Dict[int, str] = {
+    0: "<B",
+    1: "<b",
+    2: "<H",
+    3: "<h",
+    4: "<I",
+    5: "<i",
+    6: "<f",
+    7: "<?",
+    10: "<Q",
+    11: "<q",
+    12: "<d",
+}
+"""
+struct formats of the fixed-size GGUF value types, keyed by value type.
+"""
+
+_GGML_TYPE_SIZES: Dict[int, Tuple[int, int]] = {
+    0: (1, 4),  # F32
+    1: (1, 2),  # F16
+    2: (32, 18),  # Q4_0
+    3: (32, 20),  # Q4_1
+    6: (32, 22),  # Q5_0
+    7: (32, 24),  # Q5_1
+    8: (32, 34),  # Q8_0
+    9: (32, 40),  # Q8_1
+    10: (256, 84),  # Q2_K
+    11: (256, 110),  # Q3_K
+    12: (256, 144),  # Q4_K
+    13: (256, 176),  # Q5_K
+    14: (256, 210),  # Q6_K
+    15: (256, 292),  # Q8_K
+    16: (256, 66),  # IQ2_XXS
+    17: (256, 74),  # IQ2_XS
+    18: (256, 98),  # IQ3_XXS
+    19: (256, 50),  # IQ1_S
+    20: (32, 18),  # IQ4_NL
+    21: (256, 110),  # IQ3_S
+    22: (256, 82),  # IQ2_S
+    23: (256, 136),  # IQ4_XS
+    24: (1, 1),  # I8
+    25: (1, 2),  # I16
+    26: (1, 4),  # I32
+    27: (1, 8),  # I64
+    28: (1, 8),  # F64
+    29: (256, 56),  # IQ1_M
+    30: (1, 2),  # BF16
+    34: (256, 54),  # TQ1_0
+    35: (256, 66),  # TQ2_0
+    39: (32, 17),  # MXFP4
+}
+"""
+Elements per block and bytes per block of the ggml tensor types, keyed by ggml type.
+"""
+
+_FILE_TYPE_NAMES: Dict[int, str] = {
+    0: "F32",
+    1: "F16",
+    2: "Q4_0",
+    3: "Q4_1",
+    7: "Q8_0",
+    8: "Q5_0",
+    9: "Q5_1",
+    10: "Q2_K",
+    11: "Q3_K_S",
+    12: "Q3_K_M",
+    13: "Q3_K_L",
+    14: "Q4_K_S",
+    15: "Q4_K_M",
+    16: "Q5_K_S",
+    17: "Q5_K_M",
+    18: "Q6_K",
+    19: "IQ2_XXS",
+    20: "IQ2_XS",
+    21: "Q2_K_S",
+    22: "IQ3_XS",
+    23: "IQ3_XXS",
+    24: "IQ1_S",
+    25: "IQ4_NL",
+    26: "IQ3_S",
+    27: "IQ3_M",
+    28: "IQ2_S",
+    29: "IQ2_M",
+    30: "IQ4_XS",
+    31: "IQ1_M",
+    32: "BF16",
+    36: "TQ1_0",
+    37: "TQ2_0",
+    38: "MXFP4_MOE",
+}
+"""
+Quantization names of the llama.cpp file types (general.file_type), keyed by file type.
+"""
+
+
+@dataclass(frozen=True)
+class GgufMetadata:
+    """
+    Immutable data class holding the header metadata of a GGUF file.
+
+    expected_file_size is the size the file must have to hold all tensors the header declares;
+    zero if it cannot be computed because a tensor uses a type unknown to the reader.
+    quantization is empty if the file does not declare its file type.
+    """
+    file_size: int
+    expected_file_size: int
+    architecture: str
+    name: str
+    context_length: int
+    quantization: str
+    parameter_count: int
+    tensor_count: int
+    chat_template: str
+
+    @property
+    def is_complete(self) -> bool:
+        """
+        Check whether the file holds all declared tensor data.
+
+        Returns:
+            False if the file is shorter than its tensors require (e.g. an interrupted
+            download), True otherwise or if the required size is unknown.
+        """
+        return self.file_size >= self.expected_file_size
+
+
+def read_gguf_metadata(file_path: Path) -> GgufMetadata:
+    """
+    Read the metadata of a GGUF file from its header.
+
+    Args:
+        file_path: Path of the GGUF file.
+
+    Returns:
+        Metadata of the file, including the chat template and the size its tensors require.
+
+    Raises:
+        ValueError: If the file is not a supported GGUF file or its header is cut off.
+        OSError: If the file cannot be read.
+
+    Notes:
+        Only the header is read; tensor data is neither read nor mapped. Large arrays (such as
+        the tokenizer vocabulary) are skipped without decoding their values.
+    """
+    file_size = file_path.stat().st_size
+    with open(file_path, "rb", buffering=READ_BUFFER_BYTES) as file:
+        if file.read(4) != GGUF_MAGIC:
+            raise ValueError(f"Not a GGUF file: {file_path.name}")
+
+        version = _read_scalar(file, "<I")
+        if version < GGUF_MIN_VERSION:
+            raise ValueError(f"Unsupported GGUF version {version}: {file_path.name}")
+
+        tensor_count = _read_scalar(file, "<Q")
+        kv_count = _read_scalar(file, "<Q")
+
+        values: Dict[str, Any] = { }
+        for _ in range(kv_count):
+            key = _read_string(file)
+            value_type = _read_scalar(file, "<I")
+            if value_type == VALUE_TYPE_ARRAY:
+                _skip_array(file)
+            else:
+                values[key] = _read_value(file, value_type)
+
+        parameter_count = 0
+        data_size = 0
+        size_known = True
+        for _ in range(tensor_count):
+            _skip_string(file)
+            dimension_count = _read_scalar(file, "<I")
+            element_count = 1
+            for _ in range(dimension_count):
+                element_count *= _read_scalar(file, "<Q")
+            ggml_type = _read_scalar(file, "<I")
+            offset = _read_scalar(file, "<Q")
+
+            parameter_count += element_count
+            type_size = _GGML_TYPE_SIZES.get(ggml_type)
+            if type_size is None:
+                size_known = False
+                continue
+            block_size, block_bytes = type_size
+            data_size = max(data_size, offset + element_count // block_size * block_bytes)
+
+        alignment = int(values.get("general.alignment", GGUF_DEFAULT_ALIGNMENT)) or GGUF_DEFAULT_ALIGNMENT
+        data_offset = -(-file.tell() // alignment) * alignment
+
+    architecture = str(values.get("general.architecture", ""))
+    file_type = values.get("general.file_type")
+    metadata = GgufMetadata(
+        file_size=file_size,
+        expected_file_size=data_offset + data_size if size_known else 0,
+        architecture=architecture,
+        name=str(values.get("general.name", "")),
+        context_length=int(values.get(f"{architecture}.context_length", 0)),
+        quantization=_FILE_TYPE_NAMES.get(file_type, str(file_type)) if file_type is not None else "",
+        parameter_count=parameter_count,
+        tensor_count=tensor_count,
+        chat_template=str(values.get("tokenizer.chat_template", "")),
+    )
+    logger.debug(
+        "read_gguf_metadata: Read '%s' (%s, %s, %d tensors, complete=%s)",
+        file_path.name,
+        metadata.architecture,
+        metadata.quantization,
+        metadata.tensor_count,
+        metadata.is_complete,
+    )
+    return metadata
+
+
+def _read_exact(file: BinaryIO, size: int) -> bytes:
+    """
+    Read exactly size bytes.
+
+    Raises:
+        ValueError: If the file ends before.
+    """
+    data = file.read(size)
+    if len(data) != size:
+        raise ValueError("GGUF header is truncated")
+    return data
+
+
+def _read_scalar(file: BinaryIO, fmt: str) -> Any:
+    """
+    Read one little-endian fixed-size value.
+    """
+    return struct.unpack(fmt, _read_exact(file, struct.calcsize(fmt)))[0]
+
+
+def _read_string(file: BinaryIO) -> str:
+    """
+    Read a length-prefixed UTF-8 string.
+    """
+    return _read_exact(file, _read_scalar(file, "<Q")).decode("utf-8", errors="replace")
+
+
+def _skip_string(file: BinaryIO) -> None:
+    """
+    Skip a length-prefixed string without decoding it.
+    """
+    _skip(file, _read_scalar(file, "<Q"))
+
+
+def _skip(file: BinaryIO, size: int) -> None:
+    """
+    Skip size bytes.
+
+    Raises:
+        ValueError: If the file ends before.
+    """
+    if size > READ_BUFFER_BYTES:
+        target = file.tell() + size
+        file.seek(target)
+        if len(file.read(1)) != 1:
+            raise ValueError("GGUF header is truncated")
+        file.seek(target)
+    else:
+        _read_exact(file, size)
+
+
+def _read_value(file: BinaryIO, value_type: int) -> Any:
+    """
+    Read a scalar or string value of the given GGUF value type.
+
+    Raises:
+        ValueError: If the value type is unknown.
+    """
+    if value_type == VALUE_TYPE_STRING:
+        return _read_string(file)
+    fmt = _SCALAR_FORMATS.get(value_type)
+    if fmt is None:
+        raise ValueError(f"Unknown GGUF value type {value_type}")
+    return _read_scalar(file, fmt)
+
+
+def _skip_array(file: BinaryIO) -> None:
+    """
+    Skip an array value, including nested arrays.
+
+    Raises:
+        ValueError: If the element type is unknown or the file ends inside the array.
+
+    Notes:
+        String arrays (the tokenizer vocabulary and merges, often 100k+ entries) are skipped
+        with a tight loop of relative seeks; a seek past the end is detected by the next read.
+    """
+    element_type = _read_scalar(file, "<I")
+    count = _read_scalar(file, "<Q")
+    if element_type == VALUE_TYPE_STRING:
+        read, seek, unpack = file.read, file.seek, _UINT64.unpack
+        try:
+            for _ in range(count):
+                seek(unpack(read(8))[0], 1)
+        except struct.error as e:
+            raise ValueError("GGUF header is truncated") from e
+    elif element_type == VALUE_TYPE_ARRAY:
+        for _ in range(count):
+            _skip_array(file)
+    elif element_type in _SCALAR_FORMATS:
+        _skip(file, count * struct.calcsize(_SCALAR_FORMATS[element_type]))
+    else:
+        raise ValueError(f"Unknown GGUF value type {element_type}")
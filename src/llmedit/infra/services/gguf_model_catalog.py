@@ -0,0 +1,281 @@
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from llmedit.config.predefined_gguf_models import PREDEFINED_GGUF_MODELS
+from llmedit.core.models.settings import LlmModel, ModelInformation
+from llmedit.infra.services.gguf_metadata_index import GgufMetadataIndex
+from llmedit.infra.services.gguf_metadata_reader import GgufMetadata
+
+logger = logging.getLogger(__name__)
+
+GGUF_SUFFIX = ".gguf"
+BYTES_PER_GIB = 1024 ** 3
+SPLIT_PART_PATTERN = re.compile(r"-(\d{5})-of-\d{5}$")
+
+
+@dataclass(frozen=True)
+class _CatalogFile:
+    """
+    Immutable data class holding the scanned state of one GGUF file in the model directory.
+    """
+    size: int
+    mtime_ns: int
+    is_available: bool
+    details: str
+
+
+class GgufModelCatalog:
+    """
+    In-memory catalog of the llama.cpp models in the model directory.
+
+    Lists the predefined model profiles whose files exist, plus every other GGUF file in the
+    directory as a model named after the file. The catalog is updated incrementally by rescan():
+    only files that are new or whose size or modification time changed are looked up in the
+    metadata index, so listing models never touches the disk.
+    """
+
+    def __init__(self, model_folder_path: Path, metadata_index: Optional[GgufMetadataIndex] = None) -> None:
+        """
+        Initialize catalog for a model directory; the directory is scanned on first use.
+
+        Args:
+            model_folder_path: Directory where GGUF model files are stored.
+            metadata_index: Optional index of GGUF header metadata; without it files are only
+                checked for existence.
+        """
+        self._model_folder_path = model_folder_path
+        self._metadata_index = metadata_index
+        self._lock = threading.Lock()
+        self._files: Optional[Dict[str, _CatalogFile]] = None
+        self._models: List[LlmModel] = []
+
+        logger.debug("__init__: Initialized model catalog for '%s'", self._model_folder_path)
+
+    @property
+    def model_folder_path(self) -> Path:
+        """
+        Get the model directory.
+
+        Returns:
+            Directory the catalog lists.
+        """
+        return self._model_folder_path
+
+    def get_models(self) -> List[LlmModel]:
+        """
+        Get the models of the directory as of the last scan.
+
+        Returns:
+            LlmModel instances sorted alphabetically by name; models whose file is incomplete or
+            unreadable are unavailable, with the reason in their details.
+
+        Notes:
+            Scans the directory on the first call only.
+        """
+        with self._lock:
+            if self._files is None:
+                self._scan()
+            return list(self._models)
+
+    def find_model_information(self, name: str) -> Optional[ModelInformation]:
+        """
+        Find the configuration of a model by name.
+
+        Args:
+            name: Model name as listed by get_models().
+
+        Returns:
+            The predefined profile of that name, a default configuration for a GGUF file of that
+            name in the directory, or None if neither exists.
+
+        Notes:
+            Files outside the predefined list use the default sampling parameters; their prompt
+            format comes from the chat template embedded in the file.
+        """
+        predefined = next((model_info for model_info in PREDEFINED_GGUF_MODELS if model_info.name == name), None)
+        if predefined is not None:
+            return predefined
+
+        with self._lock:
+            if self._files is None:
+                self._scan()
+            file_name = next((file_name for file_name in self._files if Path(file_name).stem == name), None)
+
+        if file_name is None:
+            return None
+        return ModelInformation(name=name, fileName=file_name)
+
+    def incomplete_file_paths(self) -> List[Path]:
+        """
+        Get the files that could not be listed as available models.
+
+        Returns:
+            Paths of incomplete or unreadable GGUF files, e.g. downloads in progress.
+        """
+        with self._lock:
+            return [
+                self._model_folder_path / file_name
+                for file_name, entry in (self._files or { }).items()
+                if not entry.is_available
+            ]
+
+    def rescan(self) -> bool:
+        """
+        Bring the catalog up to date with the model directory.
+
+        Returns:
+            True if the list of models changed.
+
+        Notes:
+            Costs one stat call per file; only new or changed files are described again.
+        """
+        with self._lock:
+            previous = self._models
+            self._scan()
+            changed = self._models != previous
+
+        if changed:
+            logger.info("rescan: Model list changed (%d models)", len(self._models))
+        return changed
+
+    def _scan(self) -> None:
+        """
+        Scan the model directory and rebuild the model list.
+
+        Notes:
+            Must be called with the lock held. Files that vanish during the scan are skipped.
+        """
+        previous_files = self._files or { }
+        files: Dict[str, _CatalogFile] = { }
+
+        try:
+            with os.scandir(self._model_folder_path) as entries:
+                for entry in entries:
+                    if not entry.name.lower().endswith(GGUF_SUFFIX):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+
+                    cached = previous_files.get(entry.name)
+                    if cached is not None and cached.size == stat.st_size and cached.mtime_ns == stat.st_mtime_ns:
+                        files[entry.name] = cached
+                    else:
+                        files[entry.name] = self._describe_file(entry.name, stat.st_size, stat.st_mtime_ns)
+        except OSError as e:
+            logger.warning("_scan: Failed to list '%s' - %s", self._model_folder_path, e)
+
+        self._files = files
+        self._models = self._build_models(files)
+        logger.debug("_scan: Found %d GGUF files, %d models", len(files), len(self._models))
+
+    def _build_models(self, files: Dict[str, _CatalogFile]) -> List[LlmModel]:
+        """
+        Build the model list from the scanned files.
+
+        Args:
+            files: Scanned GGUF files, keyed by file name.
+
+        Returns:
+            Predefined profiles whose files exist, plus a model per other GGUF file that is
+            neither used by a profile (as model or draft model) nor a continuation part of a
+            split model, sorted alphabetically by name.
+        """
+        models = [
+            LlmModel(
+                id=model_info.fileName,
+                name=model_info.name,
+                is_available=files[model_info.fileName].is_available,
+                details=files[model_info.fileName].details,
+            )
+            for model_info in PREDEFINED_GGUF_MODELS
+            if model_info.fileName in files
+        ]
+
+        known_files = { model_info.fileName for model_info in PREDEFINED_GGUF_MODELS }
+        known_files.update(model_info.draft_model_file for model_info in PREDEFINED_GGUF_MODELS)
+        for file_name, entry in files.items():
+            if file_name in known_files:
+                continue
+            split_part = SPLIT_PART_PATTERN.search(Path(file_name).stem)
+            if split_part is not None and int(split_part.group(1)) != 1:
+                continue
+            models.append(
+                LlmModel(
+                    id=file_name,
+                    name=Path(file_name).stem,
+                    is_available=entry.is_available,
+                    details=entry.details,
+                )
+            )
+
+        return sorted(models, key=lambda model: model.name)
+
+    def _describe_file(self, file_name: str, size: int, mtime_ns: int) -> _CatalogFile:
+        """
+        Describe a model file from its GGUF header metadata.
+
+        Args:
+            file_name: Name of the model file.
+            size: File size in bytes.
+            mtime_ns: Modification time in nanoseconds.
+
+        Returns:
+            Scanned state of the file; unavailable if the download is incomplete or the header
+            cannot be read. Available without details if there is no metadata index.
+        """
+        if self._metadata_index is None:
+            return _CatalogFile(size=size, mtime_ns=mtime_ns, is_available=True, details='')
+
+        try:
+            metadata = self._metadata_index.get_metadata(self._model_folder_path / file_name)
+        except Exception as e:
+            logger.warning("_describe_file: Failed to read GGUF header of '%s' - %s", file_name, e)
+            return _CatalogFile(size=size, mtime_ns=mtime_ns, is_available=False, details=f"Unreadable GGUF file: {e}")
+
+        if not metadata.is_complete:
+            logger.warning(
+                "_describe_file: '%s' is incomplete (%d of %d bytes)",
+                file_name,
+                metadata.file_size,
+                metadata.expected_file_size,
+            )
+            return _CatalogFile(
+                size=size,
+                mtime_ns=mtime_ns,
+                is_available=False,
+                details=(
+                    f"Incomplete download: {metadata.file_size / BYTES_PER_GIB:.2f} of "
+                    f"{metadata.expected_file_size / BYTES_PER_GIB:.2f} GiB"
+                ),
+            )
+
+        return _CatalogFile(size=size, mtime_ns=mtime_ns, is_available=True, details=_format_metadata(metadata))
+
+
+def _format_metadata(metadata: GgufMetadata) -> str:
+    """
+    Format GGUF metadata as a one-line model description.
+
+    Args:
+        metadata: Header metadata of a complete model file.
+
+    Returns:
+        Description such as "qwen3 · 8.2B · Q4_K_M · 40960 ctx · 4.68 GiB"; unknown parts are left out.
+    """
+    parts = [metadata.architecture]
+    if metadata.parameter_count:
+        parts.append(f"{metadata.parameter_count / 1e9:.1f}B")
+    parts.append(metadata.quantization)
+    if metadata.context_length:
+        parts.append(f"{metadata.context_length} ctx")
+    parts.append(f"{metadata.file_size / BYTES_PER_GIB:.2f} GiB")
+    return " · ".join(part for part in parts if part)
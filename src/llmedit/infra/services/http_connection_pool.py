@@ -0,0 +1,226 @@
+import http.client
+import json
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+ERROR_BODY_PREVIEW_CHARS = 500
+
+
+class HttpConnectionPool:
+    """
+    Bounded pool of keep-alive HTTP connections to one server.
+
+    Requests reuse idle connections, so a request does not pay for a new TCP (and TLS) handshake.
+    At most max_connections requests are in flight at once; further callers wait for a free
+    connection. A connection is returned to the pool only if its response was read completely,
+    so abandoning a streamed response (e.g. on cancellation) closes the connection, which tells
+    the server to stop generating.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        max_connections: int,
+        timeout_seconds: float,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """
+        Initialize pool; connections are opened on first use.
+
+        Args:
+            base_url: Server URL, e.g. http://127.0.0.1:8080; a path prefix is prepended to request paths.
+            max_connections: Maximum number of connections, and so of concurrent requests.
+            timeout_seconds: Socket timeout of connecting and of every read.
+            headers: Headers sent with every request, e.g. Authorization.
+
+        Raises:
+            ValueError: If the URL scheme is neither http nor https.
+        """
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {base_url}")
+
+        self._base_url = base_url
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self._path_prefix = parts.path.rstrip("/")
+        self._max_connections = max(1, max_connections)
+        self._timeout_seconds = timeout_seconds
+        self._headers = dict(headers or { })
+        self._slots = threading.BoundedSemaphore(self._max_connections)
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+
+        logger.debug(
+            "__init__: Initialized pool for '%s' (%d connections)",
+            base_url,
+            self._max_connections,
+        )
+
+    @property
+    def base_url(self) -> str:
+        """
+        Get the server URL.
+
+        Returns:
+            URL the pool was created with.
+        """
+        return self._base_url
+
+    @property
+    def max_connections(self) -> int:
+        """
+        Get the maximum number of concurrent requests.
+
+        Returns:
+            Number of connections the pool may open.
+        """
+        return self._max_connections
+
+    @contextmanager
+    def request(
+        self,
+        method: str,
+        path: str,
+        json_body: Optional[Any] = None,
+    ) -> Iterator[http.client.HTTPResponse]:
+        """
+        Send a request and yield its response for reading.
+
+        Args:
+            method: HTTP method, e.g. "GET" or "POST".
+            path: Request path below the base URL, e.g. "/v1/models".
+            json_body: Optional body, sent JSON-encoded.
+
+        Yields:
+            Response with a 2xx status; the caller reads (or streams) the body inside the block.
+
+        Raises:
+            RuntimeError: If the server answers with a non-2xx status.
+            OSError: If the server cannot be reached.
+
+        Notes:
+            Blocks while all connections are in use. A request that fails on a reused connection
+            because the server closed it while idle is retried once on a new connection; see _send.
+        """
+        body = json.dumps(json_body).encode("utf-8") if json_body is not None else None
+        headers = dict(self._headers)
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+
+        with self._slots:
+            connection, response = self._send(method, self._path_prefix + path, body, headers)
+            try:
+                if not 200 <= response.status < 300:
+                    error_body = response.read().decode("utf-8", errors="replace")
+                    raise RuntimeError(
+                        f"{method} {path} failed with HTTP {response.status}: {error_body[:ERROR_BODY_PREVIEW_CHARS]}"
+                    )
+                yield response
+            finally:
+                self._release(connection, response)
+
+    def close(self) -> None:
+        """
+        Close all idle connections.
+
+        Notes:
+            Connections in use are closed when their request finishes.
+        """
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            connection.close()
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """
+        Send a request on an idle connection, or on a new one.
+
+        Args:
+            method: HTTP method.
+            path: Full request path.
+            body: Encoded body or None.
+            headers: Request headers.
+
+        Returns:
+            Connection used and the response, whose headers have been read.
+
+        Notes:
+            A reused connection is retried on a new one only if it fails while the request is
+            sent, or if the server closes it before sending any part of the response; in both
+            cases the server has not processed the request. Other failures, in particular a
+            timeout while waiting for the response, are raised, since the server may already
+            run the request (e.g. a generation job) and a retry would run it twice.
+        """
+        try:
+            connection = self._idle.get_nowait()
+            reused = True
+        except queue.Empty:
+            connection = self._new_connection()
+            reused = False
+
+        try:
+            connection.request(method, path, body=body, headers=headers)
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            if not reused:
+                raise
+            logger.debug("_send: Sending on reused connection to '%s' failed - retrying on a new one", self._base_url)
+        else:
+            try:
+                return connection, connection.getresponse()
+            except ConnectionResetError:
+                # Includes http.client.RemoteDisconnected: closed before the status line
+                connection.close()
+                if not reused:
+                    raise
+                logger.debug("_send: Reused connection to '%s' was closed - retrying on a new one", self._base_url)
+            except Exception:
+                connection.close()
+                raise
+
+        connection = self._new_connection()
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            return connection, connection.getresponse()
+        except Exception:
+            connection.close()
+            raise
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """
+        Open a new connection object; the socket connects on the first request.
+
+        Returns:
+            HTTP or HTTPS connection to the server.
+        """
+        if self._https:
+            return http.client.HTTPSConnection(self._host, self._port, timeout=self._timeout_seconds)
+        return http.client.HTTPConnection(self._host, self._port, timeout=self._timeout_seconds)
+
+    def _release(self, connection: http.client.HTTPConnection, response: http.client.HTTPResponse) -> None:
+        """
+        Return a connection to the pool if it can carry another request, close it otherwise.
+
+        Args:
+            connection: Connection of a finished request.
+            response: Its response.
+        """
+        if response.isclosed() and not response.will_close:
+            self._idle.put(connection)
+        else:
+            connection.close()
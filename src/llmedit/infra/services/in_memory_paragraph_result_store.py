@@ -0,0 +1,63 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, override
+
+from llmedit.config.chunking import PARAGRAPH_RESULT_ENTRIES
+from llmedit.core.interfaces.processing.paragraph_result_store import ParagraphResultStore
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryParagraphResultStore(ParagraphResultStore):
+    """
+    Paragraph result store keeping the most recently used results in memory.
+
+    Results live for the session only; the response cache already answers a whole request
+    repeated after a restart.
+    """
+
+    def __init__(self, max_entries: int = PARAGRAPH_RESULT_ENTRIES) -> None:
+        """
+        Initialize an empty store.
+
+        Args:
+            max_entries: Number of results kept; the least recently used are dropped beyond it.
+        """
+        self._max_entries = max_entries
+        self._results: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+        logger.debug("__init__: Initialized paragraph result store (%d entries)", self._max_entries)
+
+    @override
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up the result of a paragraph and refresh its recency.
+
+        Args:
+            key: Digest of the paragraph and its processing settings.
+
+        Returns:
+            The sanitized result, or None if the key is not stored.
+        """
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+            return result
+
+    @override
+    def put(self, key: str, result: str) -> None:
+        """
+        Store the result of a paragraph, dropping the least recently used beyond the capacity.
+
+        Args:
+            key: Digest of the paragraph and its processing settings.
+            result: Sanitized result of the paragraph.
+        """
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self._max_entries:
+                self._results.popitem(last=False)
@@ -0,0 +1,249 @@
+import logging
+import time
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import llama_cpp
+from llama_cpp import Llama
+
+from llmedit.infra.services.llama_cpp_tuning_profile_store import LlamaCppTuningProfile, available_cpu_count
+
+logger = logging.getLogger(__name__)
+
+CALIBRATION_N_CTX = 4096
+CALIBRATION_DECODE_TOKENS = 32
+CALIBRATION_BATCH_SIZES: Sequence[Tuple[int, int]] = (
+    (256, 256),
+    (512, 512),
+    (1024, 512),
+    (2048, 512),
+    (2048, 1024),
+)
+# At least one full logical batch of the largest candidate, so larger batches are not truncated
+CALIBRATION_PREFILL_TOKENS = max(n_batch for n_batch, _ in CALIBRATION_BATCH_SIZES)
+CALIBRATION_TEXT = (
+    "The quick brown fox jumps over the lazy dog while the committee reviews the quarterly report, "
+    "noting that shipping delays, currency changes and a late supplier invoice affected the results. "
+)
+
+
+class LlamaCppAutoTuner:
+    """
+    Measures llama.cpp throughput on the local machine and picks the fastest parameters.
+
+    Sweeps the decode and prefill thread counts and the logical/physical batch sizes for one
+    model, measuring prompt prefill and single-token decode speed for each candidate.
+    """
+
+    def __init__(self, gpu_layers: int = -1) -> None:
+        """
+        Initialize tuner.
+
+        Args:
+            gpu_layers: Number of layers to offload, matching what the application uses.
+        """
+        self._gpu_layers = gpu_layers
+
+    def calibrate(self, model_path: Path) -> LlamaCppTuningProfile:
+        """
+        Run the calibration sweep for a model.
+
+        Args:
+            model_path: Path of the GGUF file to calibrate.
+
+        Returns:
+            Profile with the best thread counts and batch sizes, including measured throughput.
+
+        Raises:
+            RuntimeError: If the model cannot be loaded for calibration.
+
+        Notes:
+            Thread counts are swept first at the default batch size; the thread count with the
+            best decode speed becomes n_threads and the one with the best prefill speed becomes
+            n_threads_batch. Batch sizes are then swept with those thread counts, reloading the
+            model for each candidate. After each load one untimed prefill warms up the weights
+            and compute buffers, so the first candidate is not penalized. Takes from several seconds to a few minutes per model.
+        """
+        cpu_count = available_cpu_count()
+        thread_candidates = self._thread_candidates(cpu_count)
+        logger.info(
+            "calibrate: Calibrating '%s' - threads=%s, batch sizes=%s",
+            model_path.name,
+            thread_candidates,
+            list(CALIBRATION_BATCH_SIZES),
+        )
+
+        model = self._load(model_path, n_batch=512, n_ubatch=512)
+        try:
+            prefill_tokens = self._calibration_tokens(model, CALIBRATION_PREFILL_TOKENS)
+            self._warm_up(model, prefill_tokens)
+            best_decode = (0, 0.0)
+            best_prefill = (0, 0.0)
+            for threads in thread_candidates:
+                llama_cpp.llama_set_n_threads(model.ctx, threads, threads)
+                prefill_tps = self._measure_prefill(model, prefill_tokens)
+                decode_tps = self._measure_decode(model, prefill_tokens)
+                logger.info(
+                    "calibrate: threads=%d - prefill %.1f tok/s, decode %.1f tok/s",
+                    threads,
+                    prefill_tps,
+                    decode_tps,
+                )
+                if decode_tps > best_decode[1]:
+                    best_decode = (threads, decode_tps)
+                if prefill_tps > best_prefill[1]:
+                    best_prefill = (threads, prefill_tps)
+        finally:
+            del model
+
+        best_batch = (512, 512)
+        best_batch_prefill_tps = 0.0
+        best_batch_decode_tps = best_decode[1]
+        for n_batch, n_ubatch in CALIBRATION_BATCH_SIZES:
+            model = self._load(model_path, n_batch=n_batch, n_ubatch=n_ubatch)
+            try:
+                llama_cpp.llama_set_n_threads(model.ctx, best_decode[0], best_prefill[0])
+                self._warm_up(model, prefill_tokens)
+                prefill_tps = self._measure_prefill(model, prefill_tokens)
+                decode_tps = self._measure_decode(model, prefill_tokens)
+            finally:
+                del model
+            logger.info(
+                "calibrate: n_batch=%d, n_ubatch=%d - prefill %.1f tok/s, decode %.1f tok/s",
+                n_batch,
+                n_ubatch,
+                prefill_tps,
+                decode_tps,
+            )
+            if prefill_tps > best_batch_prefill_tps:
+                best_batch = (n_batch, n_ubatch)
+                best_batch_prefill_tps = prefill_tps
+                best_batch_decode_tps = decode_tps
+
+        profile = LlamaCppTuningProfile(
+            n_threads=best_decode[0],
+            n_threads_batch=best_prefill[0],
+            n_batch=best_batch[0],
+            n_ubatch=best_batch[1],
+            cpu_count=cpu_count,
+            prefill_tokens_per_second=round(best_batch_prefill_tps, 2),
+            decode_tokens_per_second=round(best_batch_decode_tps, 2),
+        )
+        logger.info("calibrate: Best profile for '%s': %s", model_path.name, profile)
+        return profile
+
+    def _load(self, model_path: Path, n_batch: int, n_ubatch: int) -> Llama:
+        """
+        Load the model with a calibration context.
+
+        Args:
+            model_path: Path of the GGUF file.
+            n_batch: Logical batch size.
+            n_ubatch: Physical batch size.
+
+        Returns:
+            Loaded model.
+
+        Raises:
+            RuntimeError: If loading fails.
+        """
+        try:
+            return Llama(
+                model_path=str(model_path.absolute()),
+                n_ctx=CALIBRATION_N_CTX,
+                n_batch=n_batch,
+                n_ubatch=n_ubatch,
+                n_gpu_layers=self._gpu_layers,
+                verbose=False,
+            )
+        except Exception as e:
+            logger.error("_load: Failed to load '%s' for calibration", model_path, exc_info=True)
+            raise RuntimeError(f"Failed to load model for calibration: {str(e)}") from e
+
+    @staticmethod
+    def _thread_candidates(cpu_count: int) -> List[int]:
+        """
+        Build the list of thread counts to try.
+
+        Args:
+            cpu_count: Number of logical CPUs available.
+
+        Returns:
+            Sorted, de-duplicated thread counts between 1 and cpu_count.
+        """
+        candidates = { cpu_count, max(1, cpu_count // 4), max(1, cpu_count // 2), max(1, (cpu_count * 3) // 4) }
+        candidates.update(count for count in (4, 6, 8, 12, 16) if count < cpu_count)
+        return sorted(candidates)
+
+    @staticmethod
+    def _calibration_tokens(model: Llama, count: int) -> List[int]:
+        """
+        Tokenize repeated calibration text up to the requested number of tokens.
+
+        Args:
+            model: Loaded model used for tokenization.
+            count: Number of tokens to return.
+
+        Returns:
+            Token sequence of exactly count tokens.
+        """
+        chunk = model.tokenize(CALIBRATION_TEXT.encode("utf-8"), add_bos=False)
+        tokens = [model.token_bos()] if model.token_bos() != -1 else []
+        while len(tokens) < count:
+            tokens.extend(chunk)
+        return tokens[:count]
+
+    @staticmethod
+    def _warm_up(model: Llama, tokens: List[int]) -> None:
+        """
+        Evaluate the prompt once without timing it.
+
+        Args:
+            model: Loaded model.
+            tokens: Prompt tokens evaluated in batches.
+        """
+        model.reset()
+        model.eval(tokens)
+
+    @staticmethod
+    def _measure_prefill(model: Llama, tokens: List[int]) -> float:
+        """
+        Measure prompt prefill throughput.
+
+        Args:
+            model: Loaded model.
+            tokens: Prompt tokens evaluated in batches.
+
+        Returns:
+            Tokens per second.
+        """
+        model.reset()
+        started = time.perf_counter()
+        model.eval(tokens)
+        elapsed = time.perf_counter() - started
+        return len(tokens) / elapsed if elapsed > 0 else 0.0
+
+    @staticmethod
+    def _measure_decode(model: Llama, tokens: List[int]) -> float:
+        """
+        Measure single-token decode throughput.
+
+        Args:
+            model: Loaded model.
+            tokens: Token source; a short prompt is evaluated first, then tokens are fed one at a time.
+
+        Returns:
+            Tokens per second.
+
+        Notes:
+            Feeding fixed tokens one by one performs the same per-token work as sampling-based
+            decoding while keeping the measurement deterministic.
+        """
+        model.reset()
+        model.eval(tokens[:CALIBRATION_DECODE_TOKENS])
+        decode_tokens = tokens[CALIBRATION_DECODE_TOKENS:CALIBRATION_DECODE_TOKENS * 2]
+        started = time.perf_counter()
+        for token in decode_tokens:
+            model.eval([token])
+        elapsed = time.perf_counter() - started
+        return len(decode_tokens) / elapsed if elapsed > 0 else 0.0
@@ -0,0 +1,160 @@
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Union
+
+from llama_cpp import Llama, StoppingCriteriaList
+from llama_cpp.llama_chat_format import CHATML_BOS_TOKEN, CHATML_CHAT_TEMPLATE, CHATML_EOS_TOKEN, Jinja2ChatFormatter
+
+from llmedit.infra.services.llama_cpp_vocabulary import LlamaCppVocabulary
+
+logger = logging.getLogger(__name__)
+
+CHAT_TEMPLATE_METADATA_KEY = "tokenizer.chat_template"
+
+
+@dataclass(frozen=True)
+class RenderedChatPrompt:
+    """
+    Immutable data class holding a chat conversation rendered into model tokens.
+
+    Contains the full prompt tokens, the static prefix tokens that precede the user message
+    content, and the stop conditions defined by the chat template.
+    """
+    tokens: List[int]
+    prefix_tokens: List[int]
+    stop: List[str]
+    stopping_criteria: Optional[StoppingCriteriaList]
+
+
+class LlamaCppChatPromptRenderer:
+    """
+    Renders system/user messages into prompt tokens using the GGUF chat template.
+
+    Mirrors the formatting llama.cpp applies in create_chat_completion, but exposes the token
+    sequence so callers can reason about reusable prefixes before submitting a completion.
+    """
+
+    def __init__(self, model: Union[Llama, LlamaCppVocabulary]) -> None:
+        """
+        Initialize renderer for a loaded model.
+
+        Args:
+            model: Loaded llama.cpp model, or the vocabulary of a model file, whose metadata and
+                tokenizer are used.
+
+        Notes:
+            Falls back to the ChatML template when the GGUF file does not embed a chat template.
+        """
+        self._model = model
+        self._formatter = self._create_formatter(model)
+
+    def render(self, system_prompt: str, user_prompt: str, user_prompt_static_prefix: str = "") -> RenderedChatPrompt:
+        """
+        Render a system and user message pair into prompt tokens.
+
+        Args:
+            system_prompt: Content of the system message.
+            user_prompt: Content of the user message.
+            user_prompt_static_prefix: Leading part of the user message that does not depend on
+                user input (e.g. the task template header). Included in the static prefix.
+
+        Returns:
+            RenderedChatPrompt with full prompt tokens and the static prefix tokens.
+
+        Notes:
+            The prefix covers everything the template emits before the user message content
+            (system block and user turn header), extended by the static user prompt prefix when the
+            user message starts with it. It is computed as the longest common token prefix
+            of the full prompt and the separately tokenized prefix text, so BPE merges across the
+            boundary never produce a prefix that diverges from the full prompt.
+        """
+        result = self._formatter(
+            messages=[
+                { "role": "system", "content": system_prompt },
+                { "role": "user", "content": user_prompt },
+            ],
+        )
+
+        prompt_text: str = result.prompt
+        tokens = self._tokenize(prompt_text, add_bos=not result.added_special)
+
+        prefix_tokens: List[int] = []
+        user_content = user_prompt.strip()
+        user_start = prompt_text.rfind(user_content)
+        if user_start > 0:
+            static_header = user_prompt_static_prefix.lstrip()
+            if static_header and user_content.startswith(static_header):
+                user_start += len(static_header)
+            candidate = self._tokenize(prompt_text[:user_start], add_bos=not result.added_special)
+            prefix_tokens = tokens[:Llama.longest_token_prefix(candidate, tokens)]
+        else:
+            logger.debug("render: User content not found in rendered prompt - no static prefix")
+
+        stop = result.stop if isinstance(result.stop, list) else [result.stop] if result.stop else []
+
+        logger.debug(
+            "render: Rendered prompt - total_tokens=%d, prefix_tokens=%d",
+            len(tokens),
+            len(prefix_tokens),
+        )
+        return RenderedChatPrompt(
+            tokens=tokens,
+            prefix_tokens=prefix_tokens,
+            stop=stop,
+            stopping_criteria=result.stopping_criteria,
+        )
+
+    def _tokenize(self, text: str, add_bos: bool) -> List[int]:
+        """
+        Tokenize rendered template text including special tokens.
+
+        Args:
+            text: Rendered prompt text.
+            add_bos: Whether the tokenizer should prepend the BOS token.
+
+        Returns:
+            List of token ids.
+        """
+        return self._model.tokenize(text.encode("utf-8"), add_bos=add_bos, special=True)
+
+    def _create_formatter(self, model: Union[Llama, LlamaCppVocabulary]) -> Jinja2ChatFormatter:
+        """
+        Build the Jinja2 chat formatter from model metadata.
+
+        Args:
+            model: Loaded llama.cpp model or model vocabulary.
+
+        Returns:
+            Chat formatter using the embedded template, or ChatML if none is present.
+        """
+        template = model.metadata.get(CHAT_TEMPLATE_METADATA_KEY)
+        if not template:
+            logger.warning("_create_formatter: No chat template in model metadata - falling back to ChatML")
+            return Jinja2ChatFormatter(
+                template=CHATML_CHAT_TEMPLATE,
+                eos_token=CHATML_EOS_TOKEN,
+                bos_token=CHATML_BOS_TOKEN,
+            )
+
+        eos_token_id = model.token_eos()
+        bos_token_id = model.token_bos()
+        return Jinja2ChatFormatter(
+            template=template,
+            eos_token=self._token_text(eos_token_id),
+            bos_token=self._token_text(bos_token_id),
+            stop_token_ids=[eos_token_id],
+        )
+
+    def _token_text(self, token_id: int) -> str:
+        """
+        Return the textual form of a special token.
+
+        Args:
+            token_id: Token id, or -1 if the model does not define the token.
+
+        Returns:
+            Token text, or empty string for undefined tokens.
+        """
+        if token_id == -1:
+            return ""
+        return self._model.detokenize([token_id], special=True).decode("utf-8", errors="ignore")
@@ -0,0 +1,88 @@
+import logging
+from typing import Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_TIERS: Sequence[int] = (4096, 8192, 16384, 32768, 65536, 131072)
+"""
+Context sizes the llama.cpp context is created with, smallest first.
+
+Using a few fixed tiers instead of exact sizes keeps context re-creation rare and makes
+prompt states cached for one tier reusable by later requests of similar size.
+"""
+
+F16_BYTES_PER_ELEMENT = 2.0
+
+
+def select_context_tier(required_tokens: int, n_ctx_train: int) -> int:
+    """
+    Select the smallest context tier that fits the required number of tokens.
+
+    Args:
+        required_tokens: Prompt tokens plus the expected output budget.
+        n_ctx_train: Context length the model was trained with.
+
+    Returns:
+        Context size to use, never larger than n_ctx_train.
+
+    Notes:
+        If the request does not fit even the trained context, the trained context is returned and
+        generation ends early once the context is full.
+    """
+    for tier in CONTEXT_TIERS:
+        if tier >= n_ctx_train:
+            return n_ctx_train
+        if tier >= required_tokens:
+            return tier
+    return n_ctx_train
+
+
+def estimate_kv_cache_bytes(metadata: Dict[str, str], n_ctx: int, bytes_per_element: float = F16_BYTES_PER_ELEMENT) -> int:
+    """
+    Estimate KV cache memory for a context size from GGUF metadata.
+
+    Args:
+        metadata: GGUF key/value metadata as exposed by Llama.metadata.
+        n_ctx: Context size in tokens.
+        bytes_per_element: Size of one cached K/V element (2 for f16).
+
+    Returns:
+        Estimated KV cache size in bytes, or 0 if the metadata lacks the required keys.
+
+    Notes:
+        Computed as n_ctx * layers * kv_heads * (key_length + value_length) * bytes_per_element.
+        Models using sliding-window attention on some layers need less than estimated.
+    """
+    architecture = metadata.get("general.architecture")
+    if not architecture:
+        return 0
+
+    try:
+        n_layer = int(metadata[f"{architecture}.block_count"])
+        n_head = int(metadata[f"{architecture}.attention.head_count"])
+        n_head_kv = int(metadata.get(f"{architecture}.attention.head_count_kv", n_head))
+        n_embd = int(metadata[f"{architecture}.embedding_length"])
+        key_length = int(metadata.get(f"{architecture}.attention.key_length", n_embd // n_head))
+        value_length = int(metadata.get(f"{architecture}.attention.value_length", n_embd // n_head))
+    except (KeyError, ValueError, ZeroDivisionError):
+        logger.debug("estimate_kv_cache_bytes: Incomplete attention metadata for '%s'", architecture)
+        return 0
+
+    return int(n_ctx * n_layer * n_head_kv * (key_length + value_length) * bytes_per_element)
+
+
+def describe_context_tiers(metadata: Dict[str, str], n_ctx_train: int, bytes_per_element: float = F16_BYTES_PER_ELEMENT) -> List[Tuple[int, int]]:
+    """
+    List the usable context tiers with their estimated KV cache cost.
+
+    Args:
+        metadata: GGUF key/value metadata as exposed by Llama.metadata.
+        n_ctx_train: Context length the model was trained with.
+        bytes_per_element: Size of one cached K/V element.
+
+    Returns:
+        List of (context size, estimated KV bytes) pairs, ending with the trained context if it
+        is smaller than the largest tier.
+    """
+    sizes = sorted({ min(tier, n_ctx_train) for tier in CONTEXT_TIERS })
+    return [(size, estimate_kv_cache_bytes(metadata, size, bytes_per_element)) for size in sizes]
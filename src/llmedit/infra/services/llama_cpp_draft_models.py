@@ -0,0 +1,208 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from llama_cpp import Llama
+from llama_cpp.llama_speculative import LlamaDraftModel
+
+logger = logging.getLogger(__name__)
+
+MAX_VOCAB_SIZE_DIFFERENCE = 128
+VOCAB_CHECK_STRIDE = 97
+VOCAB_CHECK_PROBE_TEXT = "Proofread: Die Straße ist naß, l'été est chaud, Дякую! ```print(x)``` 12345"
+
+
+@dataclass(frozen=True)
+class DraftAcceptanceStats:
+    """
+    Immutable data class with speculative decoding statistics for one generation.
+    """
+    proposed_tokens: int
+    accepted_tokens: int
+
+    @property
+    def acceptance_rate(self) -> float:
+        """
+        Get the share of proposed draft tokens the model accepted.
+
+        Returns:
+            Value between 0 and 1; 0 if nothing was proposed.
+        """
+        return self.accepted_tokens / self.proposed_tokens if self.proposed_tokens else 0.0
+
+
+class TrackedDraftModel(LlamaDraftModel):
+    """
+    Draft model wrapper that limits the draft length and records acceptance statistics.
+
+    llama.cpp calls the draft model once per verification step with all tokens so far.
+    The wrapper remembers where its last draft was placed and, on the next call, counts how
+    many of the drafted tokens the model actually produced.
+    """
+
+    def __init__(self, inner: LlamaDraftModel) -> None:
+        """
+        Initialize wrapper.
+
+        Args:
+            inner: Draft model proposing the candidate tokens.
+        """
+        self._inner = inner
+        self._max_draft_tokens = 0
+        self._pending: Optional[Tuple[int, npt.NDArray[np.intc]]] = None
+        self._proposed_tokens = 0
+        self._accepted_tokens = 0
+
+    @property
+    def inner(self) -> LlamaDraftModel:
+        """
+        Get the wrapped draft model.
+
+        Returns:
+            Draft model proposing the candidate tokens.
+        """
+        return self._inner
+
+    def begin(self, max_draft_tokens: int) -> None:
+        """
+        Prepare for a new generation.
+
+        Args:
+            max_draft_tokens: Maximum number of tokens to draft per step; 0 disables drafting.
+
+        Notes:
+            Resets the statistics of the previous generation. Both supported draft models expose
+            num_pred_tokens, which is lowered to the limit so no work is spent on discarded tokens.
+        """
+        self._max_draft_tokens = max_draft_tokens
+        self._inner.num_pred_tokens = max(max_draft_tokens, 1)
+        self._pending = None
+        self._proposed_tokens = 0
+        self._accepted_tokens = 0
+
+    def stats(self) -> DraftAcceptanceStats:
+        """
+        Get statistics of the current generation.
+
+        Returns:
+            Proposed and accepted token counts. The draft of the final step is not counted,
+            since its outcome is never observed.
+        """
+        return DraftAcceptanceStats(
+            proposed_tokens=self._proposed_tokens,
+            accepted_tokens=self._accepted_tokens,
+        )
+
+    def __call__(self, input_ids: npt.NDArray[np.intc], /, **kwargs: Any) -> npt.NDArray[np.intc]:
+        """
+        Propose draft tokens continuing the given sequence.
+
+        Args:
+            input_ids: All tokens evaluated or sampled so far.
+
+        Returns:
+            Up to max_draft_tokens candidate tokens.
+        """
+        if self._pending is not None:
+            start, draft = self._pending
+            actual = input_ids[start:start + len(draft)]
+            mismatches = np.nonzero(actual != draft[:len(actual)])[0]
+            self._accepted_tokens += int(mismatches[0]) if len(mismatches) else len(actual)
+            self._pending = None
+
+        if self._max_draft_tokens <= 0:
+            return np.array([], dtype=np.intc)
+
+        draft = np.asarray(self._inner(input_ids, **kwargs), dtype=np.intc)[:self._max_draft_tokens]
+        if len(draft):
+            self._proposed_tokens += len(draft)
+            self._pending = (len(input_ids), draft.copy())
+        return draft
+
+
+class SmallModelDraftModel(LlamaDraftModel):
+    """
+    Draft model backed by a smaller GGUF model of the same tokenizer family.
+
+    The small model greedily continues the target's token sequence. It keeps its own context
+    and only evaluates the tokens that differ from what it has already seen, so repeated
+    prompts and accepted drafts are not evaluated twice.
+    """
+
+    def __init__(self, model: Llama, num_pred_tokens: int = 8) -> None:
+        """
+        Initialize draft model.
+
+        Args:
+            model: Loaded small model used for drafting.
+            num_pred_tokens: Number of tokens to draft per step.
+        """
+        self.model = model
+        self.num_pred_tokens = num_pred_tokens
+
+    def __call__(self, input_ids: npt.NDArray[np.intc], /, **kwargs: Any) -> npt.NDArray[np.intc]:
+        """
+        Draft the most likely continuation of the given sequence.
+
+        Args:
+            input_ids: All tokens evaluated or sampled by the target model so far.
+
+        Returns:
+            Up to num_pred_tokens greedily decoded tokens; fewer if the draft ends the turn or
+            the draft context is full.
+        """
+        tokens = input_ids.tolist()
+        if not tokens or len(tokens) + self.num_pred_tokens >= self.model.n_ctx():
+            return np.array([], dtype=np.intc)
+
+        # Keep at least the last token to evaluate, so logits for the next position exist
+        common = Llama.longest_token_prefix(self.model.input_ids[:self.model.n_tokens].tolist(), tokens)
+        common = min(common, len(tokens) - 1)
+        self.model.n_tokens = common
+        self.model.eval(tokens[common:])
+
+        draft: list[int] = []
+        for _ in range(self.num_pred_tokens):
+            token = self.model.sample(temp=0.0)
+            if token == self.model.token_eos():
+                break
+            draft.append(token)
+            self.model.eval([token])
+
+        return np.array(draft, dtype=np.intc)
+
+
+def check_vocabulary_compatibility(target: Llama, draft: Llama) -> Tuple[bool, str]:
+    """
+    Check whether a draft model produces tokens the target model understands identically.
+
+    Args:
+        target: Loaded target model.
+        draft: Loaded draft model.
+
+    Returns:
+        Tuple of (is_compatible, reason). The reason is empty if compatible.
+
+    Notes:
+        Compares vocabulary sizes (allowing small padding differences), special tokens, the
+        tokenization of a multilingual probe text and the text of every VOCAB_CHECK_STRIDE-th token.
+    """
+    target_vocab = target.n_vocab()
+    draft_vocab = draft.n_vocab()
+    if abs(target_vocab - draft_vocab) > MAX_VOCAB_SIZE_DIFFERENCE:
+        return False, f"vocabulary sizes differ: target={target_vocab}, draft={draft_vocab}"
+
+    if target.token_bos() != draft.token_bos() or target.token_eos() != draft.token_eos():
+        return False, "special tokens differ"
+
+    probe = VOCAB_CHECK_PROBE_TEXT.encode("utf-8")
+    if target.tokenize(probe, add_bos=False) != draft.tokenize(probe, add_bos=False):
+        return False, "probe text tokenizes differently"
+
+    for token_id in range(0, min(target_vocab, draft_vocab), VOCAB_CHECK_STRIDE):
+        if target.detokenize([token_id], special=True) != draft.detokenize([token_id], special=True):
+            return False, f"token {token_id} differs"
+
+    return True, ""
@@ -0,0 +1,69 @@
+import logging
+from dataclasses import dataclass
+from typing import Dict
+
+import llama_cpp
+
+from llmedit.core.models.enums.kv_cache_type import KvCacheType
+
+logger = logging.getLogger(__name__)
+
+GGML_TYPES: Dict[KvCacheType, int] = {
+    KvCacheType.F16: llama_cpp.GGML_TYPE_F16,
+    KvCacheType.Q8_0: llama_cpp.GGML_TYPE_Q8_0,
+    KvCacheType.Q4_0: llama_cpp.GGML_TYPE_Q4_0,
+}
+
+BYTES_PER_ELEMENT: Dict[KvCacheType, float] = {
+    KvCacheType.F16: 2.0,
+    KvCacheType.Q8_0: 34 / 32,  # 32 int8 values and one f16 scale per block
+    KvCacheType.Q4_0: 18 / 32,  # 32 4-bit values and one f16 scale per block
+}
+
+
+@dataclass(frozen=True)
+class KvCacheConfig:
+    """
+    Immutable data class with the KV cache options a llama.cpp context is created with.
+    """
+    type_k: KvCacheType
+    type_v: KvCacheType
+    flash_attention: bool
+
+    @property
+    def bytes_per_element(self) -> float:
+        """
+        Get the average size of one cached K/V element.
+
+        Returns:
+            Mean of the key and value element sizes; exact for models whose keys and values
+            have the same head size, which holds for all predefined models.
+        """
+        return (BYTES_PER_ELEMENT[self.type_k] + BYTES_PER_ELEMENT[self.type_v]) / 2
+
+    def __str__(self) -> str:
+        return f"K={self.type_k.value}, V={self.type_v.value}, flash_attn={self.flash_attention}"
+
+
+def resolve_kv_cache_config(kv_cache_type: KvCacheType, flash_attention: bool) -> KvCacheConfig:
+    """
+    Build the KV cache options for a requested cache type.
+
+    Args:
+        kv_cache_type: Element type requested for keys and values.
+        flash_attention: Whether flash attention is enabled.
+
+    Returns:
+        KV cache options llama.cpp accepts.
+
+    Notes:
+        llama.cpp refuses to create a context with a quantized value cache unless flash attention
+        is enabled, so without it the values stay F16 and only the keys are quantized.
+    """
+    type_v = kv_cache_type
+    if kv_cache_type != KvCacheType.F16 and not flash_attention:
+        logger.warning(
+            "resolve_kv_cache_config: Quantized V cache requires flash attention - keeping values at f16",
+        )
+        type_v = KvCacheType.F16
+    return KvCacheConfig(type_k=kv_cache_type, type_v=type_v, flash_attention=flash_attention)
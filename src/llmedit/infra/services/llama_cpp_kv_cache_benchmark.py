@@ -0,0 +1,192 @@
+import logging
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from llama_cpp import Llama
+
+from llmedit.core.models.enums.kv_cache_type import KvCacheType
+from llmedit.infra.services.llama_cpp_context_sizing import estimate_kv_cache_bytes
+from llmedit.infra.services.llama_cpp_kv_cache import GGML_TYPES, KvCacheConfig, resolve_kv_cache_config
+from llmedit.infra.services.llama_cpp_tuning_profile_store import LlamaCppTuningProfile, default_tuning_profile
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_N_CTX = 8192
+BENCHMARK_PREFILL_TOKENS = 6144
+BENCHMARK_DECODE_TOKENS = 64
+BENCHMARK_CORPUS = (
+    "Minutes of the planning meeting. The team agreed to move the release of the reporting module to the "
+    "second week of the month, because the export to spreadsheets still loses formatting for merged cells. "
+    "Anna will contact the two customers who asked for the feature and explain the delay. Tom reported that "
+    "the nightly import job failed three times last week; the cause was a timeout while the database was "
+    "being backed up, so the job now starts an hour later. The budget for external translations is almost "
+    "used up, and the remaining documents will be translated in-house and proofread by a second person. "
+    "Finally, everyone is reminded to book holidays for the summer before the end of the month. "
+)
+
+
+@dataclass(frozen=True)
+class KvCacheBenchmarkResult:
+    """
+    Immutable data class with the measurements for one KV cache configuration.
+
+    matching_tokens counts how many greedily decoded tokens agree with the first configuration
+    of the run before the outputs diverge; error is set if the configuration could not be measured.
+    """
+    config: KvCacheConfig
+    kv_cache_bytes: int = 0
+    prefill_tokens_per_second: float = 0.0
+    decode_tokens_per_second: float = 0.0
+    matching_tokens: int = 0
+    error: str = ''
+
+
+class LlamaCppKvCacheBenchmark:
+    """
+    Measures KV cache memory and throughput of llama.cpp for each KV cache type and flash attention setting.
+
+    Every configuration loads the model with the same context, evaluates the same long prompt
+    built from a fixed corpus and greedily decodes a fixed number of tokens, so the results are
+    comparable between configurations and machines.
+    """
+
+    def __init__(self, profile: Optional[LlamaCppTuningProfile] = None, gpu_layers: int = -1) -> None:
+        """
+        Initialize benchmark.
+
+        Args:
+            profile: Thread and batch parameters; a CPU-count based default if not given.
+            gpu_layers: Number of layers to offload, matching what the application uses.
+        """
+        self._profile = profile or default_tuning_profile()
+        self._gpu_layers = gpu_layers
+
+    @staticmethod
+    def configurations() -> List[KvCacheConfig]:
+        """
+        List the KV cache configurations to measure.
+
+        Returns:
+            Every KV cache type with flash attention off and on, F16 without flash attention first,
+            so it serves as the reference for output agreement.
+        """
+        return [
+            resolve_kv_cache_config(kv_cache_type, flash_attention)
+            for kv_cache_type in KvCacheType
+            for flash_attention in (False, True)
+        ]
+
+    def run(self, model_path: Path, configs: Optional[Sequence[KvCacheConfig]] = None) -> List[KvCacheBenchmarkResult]:
+        """
+        Measure all configurations for a model.
+
+        Args:
+            model_path: Path of the GGUF file to benchmark.
+            configs: Configurations to measure; all of configurations() if not given.
+
+        Returns:
+            One result per configuration, in order. Configurations llama.cpp rejects (e.g. flash
+            attention on a backend without support) are reported with an error instead of failing the run.
+        """
+        results: List[KvCacheBenchmarkResult] = []
+        reference: Optional[List[int]] = None
+        for config in configs or self.configurations():
+            logger.info("run: Measuring '%s' with %s", model_path.name, config)
+            try:
+                result, output = self._measure(model_path, config, reference)
+            except Exception as e:
+                logger.warning("run: Failed to measure %s", config, exc_info=True)
+                results.append(KvCacheBenchmarkResult(config=config, error=str(e)))
+                continue
+
+            if reference is None:
+                reference = output
+            logger.info(
+                "run: %s - KV %.1f MiB, prefill %.1f tok/s, decode %.1f tok/s",
+                config,
+                result.kv_cache_bytes / (1024 * 1024),
+                result.prefill_tokens_per_second,
+                result.decode_tokens_per_second,
+            )
+            results.append(result)
+        return results
+
+    def _measure(
+        self,
+        model_path: Path,
+        config: KvCacheConfig,
+        reference: Optional[List[int]],
+    ) -> Tuple[KvCacheBenchmarkResult, List[int]]:
+        """
+        Load the model with one configuration and measure it.
+
+        Args:
+            model_path: Path of the GGUF file.
+            config: KV cache configuration.
+            reference: Greedy output of the reference configuration, or None if this is the reference.
+
+        Returns:
+            Tuple of the result and the greedily decoded tokens.
+        """
+        model = Llama(
+            model_path=str(model_path.absolute()),
+            n_ctx=BENCHMARK_N_CTX,
+            n_gpu_layers=self._gpu_layers,
+            n_threads=self._profile.n_threads,
+            n_threads_batch=self._profile.n_threads_batch,
+            n_batch=self._profile.n_batch,
+            n_ubatch=self._profile.n_ubatch,
+            type_k=GGML_TYPES[config.type_k],
+            type_v=GGML_TYPES[config.type_v],
+            flash_attn=config.flash_attention,
+            verbose=False,
+        )
+        try:
+            prompt = self._corpus_tokens(model, BENCHMARK_PREFILL_TOKENS)
+
+            started = time.perf_counter()
+            model.eval(prompt)
+            prefill_elapsed = time.perf_counter() - started
+
+            output: List[int] = []
+            started = time.perf_counter()
+            for _ in range(BENCHMARK_DECODE_TOKENS):
+                token = model.sample(temp=0.0)
+                output.append(token)
+                model.eval([token])
+            decode_elapsed = time.perf_counter() - started
+
+            if reference is None:
+                matching = len(output)
+            else:
+                matching = Llama.longest_token_prefix(reference, output)
+
+            return KvCacheBenchmarkResult(
+                config=config,
+                kv_cache_bytes=estimate_kv_cache_bytes(model.metadata, model.n_ctx(), config.bytes_per_element),
+                prefill_tokens_per_second=len(prompt) / prefill_elapsed if prefill_elapsed > 0 else 0.0,
+                decode_tokens_per_second=len(output) / decode_elapsed if decode_elapsed > 0 else 0.0,
+                matching_tokens=matching,
+            ), output
+        finally:
+            del model
+
+    @staticmethod
+    def _corpus_tokens(model: Llama, count: int) -> List[int]:
+        """
+        Tokenize the repeated benchmark corpus up to the requested number of tokens.
+
+        Args:
+            model: Loaded model used for tokenization.
+            count: Number of tokens to return.
+
+        Returns:
+            Token sequence of exactly count tokens, starting with BOS if the model uses one.
+        """
+        chunk = model.tokenize(BENCHMARK_CORPUS.encode("utf-8"), add_bos=False)
+        tokens = [model.token_bos()] if model.token_bos() != -1 else []
+        while len(tokens) < count:
+            tokens.extend(chunk)
+        return tokens[:count]
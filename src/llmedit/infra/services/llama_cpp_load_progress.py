@@ -0,0 +1,55 @@
+import ctypes
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import llama_cpp.llama_cpp as llama_cpp_lib
+
+from llmedit.core.models.data_types import LoadProgressCallback
+
+logger = logging.getLogger(__name__)
+
+_patch_lock = threading.Lock()
+
+
+@contextmanager
+def report_load_progress(on_progress: Optional[LoadProgressCallback]) -> Iterator[None]:
+    """
+    Forward llama.cpp model loading progress to a callback while the context is active.
+
+    Args:
+        on_progress: Callback receiving values between 0.0 and 1.0; None disables reporting.
+
+    Notes:
+        Llama() does not expose llama.cpp's progress callback, so the default model parameters
+        it starts from are temporarily replaced by parameters with the callback set. Loads using
+        this context are serialized, since the replacement is process-wide.
+        Exceptions raised by the callback are logged and do not abort loading.
+    """
+    if on_progress is None:
+        yield
+        return
+
+    def _progress(progress: float, _user_data: ctypes.c_void_p) -> bool:
+        try:
+            on_progress(progress)
+        except Exception:
+            logger.warning("report_load_progress: Progress callback failed", exc_info=True)
+        return True  # Returning False would abort the load
+
+    # The ctypes wrapper must outlive the load, otherwise llama.cpp calls freed memory
+    c_progress = llama_cpp_lib.llama_progress_callback(_progress)
+    default_params = llama_cpp_lib.llama_model_default_params
+
+    def _params_with_progress() -> llama_cpp_lib.llama_model_params:
+        params = default_params()
+        params.progress_callback = c_progress
+        return params
+
+    with _patch_lock:
+        llama_cpp_lib.llama_model_default_params = _params_with_progress
+        try:
+            yield
+        finally:
+            llama_cpp_lib.llama_model_default_params = default_params
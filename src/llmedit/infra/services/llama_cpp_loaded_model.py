@@ -0,0 +1,555 @@
+import dataclasses
+import logging
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from llama_cpp import Llama
+from llama_cpp.llama_speculative import LlamaPromptLookupDecoding
+
+from llmedit.config.kv_cache import FLASH_ATTENTION, KV_CACHE_TYPE
+from llmedit.config.speculative_decoding import PROMPT_LOOKUP_MAX_NGRAM_SIZE
+from llmedit.core.models.data_types import LoadProgressCallback
+from llmedit.core.models.enums.kv_cache_type import KvCacheType
+from llmedit.core.models.enums.memory_policy import MemoryPolicy
+from llmedit.core.models.enums.speculative_decoding_mode import SpeculativeDecodingMode
+from llmedit.infra.services.llama_cpp_chat_prompt_renderer import LlamaCppChatPromptRenderer
+from llmedit.infra.services.llama_cpp_context_sizing import CONTEXT_TIERS, describe_context_tiers, estimate_kv_cache_bytes, select_context_tier
+from llmedit.infra.services.llama_cpp_draft_models import SmallModelDraftModel, TrackedDraftModel, check_vocabulary_compatibility
+from llmedit.infra.services.llama_cpp_kv_cache import GGML_TYPES, resolve_kv_cache_config
+from llmedit.infra.services.llama_cpp_load_progress import report_load_progress
+from llmedit.infra.services.llama_cpp_tuning_profile_store import LlamaCppTuningProfile, LlamaCppTuningProfileStore, default_tuning_profile
+from llmedit.infra.services.prompt_prefix_cache import PromptPrefixCache
+from llmedit.infra.services.system_memory import available_memory_bytes, mapped_file_rss_bytes, prefault_file, process_rss_bytes, select_memory_policy
+
+logger = logging.getLogger(__name__)
+
+MAX_DRAFT_TOKENS = 16
+
+
+def model_file_version(model_path: Path) -> str:
+    """
+    Identify the current contents of a model file by its size and modification time.
+
+    Args:
+        model_path: Path of the GGUF file.
+
+    Returns:
+        "<size>:<mtime_ns>", or an empty string if the file does not exist.
+    """
+    try:
+        stat = model_path.stat()
+    except OSError:
+        return ''
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+class LlamaCppLoadedModel:
+    """
+    Loaded weights and llama.cpp context of one GGUF file.
+
+    Model profiles that differ only in sampling settings or prompt suffixes (e.g. the reasoning
+    and non-reasoning variants of Qwen3) point to the same file. They share one instance of this
+    class, so switching between them neither reloads the weights nor discards the context.
+    """
+
+    def __init__(
+        self,
+        model_folder_path: Path,
+        file_name: str,
+        speculative_decoding: SpeculativeDecodingMode = SpeculativeDecodingMode.NONE,
+        draft_model_file: str = '',
+        prompt_prefix_cache: Optional[PromptPrefixCache] = None,
+        tuning_profile_store: Optional[LlamaCppTuningProfileStore] = None,
+        memory_policy: Optional[MemoryPolicy] = None,
+        kv_cache_type: KvCacheType = KV_CACHE_TYPE,
+        flash_attention: bool = FLASH_ATTENTION,
+        max_threads: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize loaded model holder.
+
+        Args:
+            model_folder_path: Directory containing GGUF model files.
+            file_name: GGUF file of the model.
+            speculative_decoding: Speculative decoding mode the context is created for. Profiles
+                not using it disable drafting per request.
+            draft_model_file: GGUF file of the draft model for SpeculativeDecodingMode.DRAFT_MODEL.
+            prompt_prefix_cache: Optional cache of evaluated prompt-prefix states.
+            tuning_profile_store: Optional store of calibrated thread and batch parameters.
+            memory_policy: How the weights are kept in memory; None selects a policy from the
+                RAM available at load time.
+            kv_cache_type: Element type of the KV cache of the model and its draft model.
+            flash_attention: Whether llama.cpp uses flash attention.
+            max_threads: Optional cap on the generation and prompt processing threads, for
+                models loaded by several worker processes on the same machine.
+
+        Notes:
+            The model is not loaded immediately; loading occurs on first use or explicit call.
+        """
+        self._model_folder_path = model_folder_path
+        self._file_name = file_name
+        self._speculative_decoding = speculative_decoding
+        self._draft_model_file = draft_model_file
+        self._prompt_prefix_cache = prompt_prefix_cache
+        self._tuning_profile_store = tuning_profile_store
+        self._memory_policy = memory_policy
+        self._kv_cache = resolve_kv_cache_config(kv_cache_type, flash_attention)
+        self._max_threads = max_threads
+        self._model: Optional[Llama] = None
+        self._n_ctx = CONTEXT_TIERS[0]
+        self._load_options: Optional[Tuple[LlamaCppTuningProfile, MemoryPolicy]] = None
+        self._draft_model: Optional[TrackedDraftModel] = None
+        self._prompt_renderer: Optional[LlamaCppChatPromptRenderer] = None
+        self._lock = threading.RLock()
+
+        logger.debug(
+            "__init__: Initialized for file '%s' (speculative decoding: %s, KV cache: %s)",
+            file_name,
+            speculative_decoding.value,
+            self._kv_cache,
+        )
+
+    @property
+    def file_name(self) -> str:
+        """
+        Get the GGUF file name.
+
+        Returns:
+            File name of the model within the model folder.
+        """
+        return self._file_name
+
+    @property
+    def lock(self) -> threading.RLock:
+        """
+        Get the lock serializing loading, unloading and generation.
+
+        Returns:
+            Re-entrant lock; hold it while using model, draft_model or prompt_renderer.
+        """
+        return self._lock
+
+    @property
+    def model(self) -> Optional[Llama]:
+        """
+        Get the loaded llama.cpp model.
+
+        Returns:
+            Llama instance, or None if not loaded.
+        """
+        return self._model
+
+    @property
+    def draft_model(self) -> Optional[TrackedDraftModel]:
+        """
+        Get the draft model used for speculative decoding.
+
+        Returns:
+            Tracked draft model, or None if speculative decoding is disabled or unavailable.
+        """
+        return self._draft_model
+
+    @property
+    def prompt_renderer(self) -> Optional[LlamaCppChatPromptRenderer]:
+        """
+        Get the chat prompt renderer of the loaded model.
+
+        Returns:
+            Renderer, or None if not loaded.
+        """
+        return self._prompt_renderer
+
+    def is_loaded(self) -> bool:
+        """
+        Check if the model is currently loaded in memory.
+
+        Returns:
+            True if model is loaded and ready for inference, False otherwise.
+        """
+        return self._model is not None
+
+    def file_version(self) -> str:
+        """
+        Identify the current contents of the GGUF file.
+
+        Returns:
+            Version of the file, see model_file_version().
+        """
+        return model_file_version(self._model_folder_path / self._file_name)
+
+    def estimate_memory_bytes(self) -> int:
+        """
+        Estimate RAM used by the model weights and llama.cpp buffers.
+
+        Returns:
+            Size of the GGUF file (plus the draft model file, if one is paired) and, once loaded,
+            the estimated KV cache of the current context and the logits buffer kept for
+            speculative decoding.
+
+        Notes:
+            Compute buffers and the draft model's KV cache are not included.
+        """
+        total = self._file_size(self._file_name)
+        if self._speculative_decoding == SpeculativeDecodingMode.DRAFT_MODEL:
+            total += self._file_size(self._draft_model_file)
+
+        model = self._model
+        if model is not None:
+            total += estimate_kv_cache_bytes(model.metadata, model.n_ctx(), self._kv_cache.bytes_per_element)
+            if model.draft_model is not None:
+                total += model.n_ctx() * model.n_vocab() * 4  # float32 logits for every position
+        return total
+
+    def load(self, on_progress: Optional[LoadProgressCallback] = None) -> None:
+        """
+        Load model into memory if not already loaded.
+
+        Args:
+            on_progress: Optional callback receiving llama.cpp's loading progress of the target model.
+
+        Raises:
+            RuntimeError: If model loading fails due to file not found, hardware constraints, or other errors.
+
+        Notes:
+            Uses GPU acceleration for all layers. The weights are memory-mapped and, depending on
+            the memory policy, read once up front or locked in RAM; the process RSS and the share
+            of the model file resident in RAM are logged after loading.
+            The KV cache element types and flash attention follow the configured KV cache options.
+            Thread and batch parameters come from the calibrated tuning profile of the model,
+            or from a CPU-count based default if the model has not been calibrated; thread
+            counts are capped at max_threads if set.
+            The context starts at the smallest tier and is re-created with a larger tier
+            when a request does not fit (see ensure_context_capacity).
+            With speculative decoding enabled, llama.cpp keeps logits for every evaluated position,
+            which costs n_ctx * vocabulary_size * 4 bytes of address space.
+            A paired draft model is loaded alongside with the same context size; if it is missing
+            or its vocabulary differs from the target's, drafting is disabled with a warning.
+            Skips loading if model is already loaded. Concurrent callers (e.g. a request arriving
+            during a background preload) wait for the running load and then return.
+        """
+        with self._lock:
+            if self.is_loaded():
+                logger.debug("load: Model already loaded - skipping reload")
+                return
+
+            model_path = self._model_folder_path / self._file_name
+            logger.debug("load: Loading model from '%s'", model_path)
+
+            if self._tuning_profile_store is not None:
+                profile = self._tuning_profile_store.get_profile(self._file_name)
+            else:
+                profile = default_tuning_profile()
+            if self._max_threads is not None:
+                profile = dataclasses.replace(
+                    profile,
+                    n_threads=min(profile.n_threads, self._max_threads),
+                    n_threads_batch=min(profile.n_threads_batch, self._max_threads),
+                )
+            logger.debug("load: Using tuning profile %s", profile)
+
+            memory_policy = self._memory_policy or select_memory_policy(self.estimate_memory_bytes(), available_memory_bytes())
+            logger.info("load: Using memory policy '%s' for '%s'", memory_policy.value, self._file_name)
+
+            try:
+                with report_load_progress(on_progress):
+                    self._model, self._draft_model = self._create_models(profile, memory_policy)
+                self._load_options = (profile, memory_policy)
+                self._prompt_renderer = LlamaCppChatPromptRenderer(self._model)
+                self._verify_draft_model()
+                if memory_policy == MemoryPolicy.MMAP_PREFAULT:
+                    prefault_file(model_path)
+                logger.info(
+                    "load: Successfully loaded '%s' (n_ctx=%d, KV cache: %s)",
+                    self._file_name,
+                    self._model.n_ctx(),
+                    self._kv_cache,
+                )
+                for n_ctx, kv_bytes in describe_context_tiers(
+                    self._model.metadata,
+                    self._model.n_ctx_train(),
+                    self._kv_cache.bytes_per_element,
+                ):
+                    logger.info("load: Context tier n_ctx=%d needs ~%.1f MiB of KV cache", n_ctx, kv_bytes / (1024 * 1024))
+                self._log_resident_memory(model_path)
+            except Exception as e:
+                logger.error("load: Failed to load '%s'", self._file_name, exc_info=True)
+                self._draft_model = None
+                raise RuntimeError(f"Failed to load model: {str(e)}") from e
+
+    def unload(self) -> None:
+        """
+        Unload model from memory if loaded.
+
+        Notes:
+            Releases all resources associated with the model, including the draft model.
+            Safe to call even if no model is loaded. Waits for a running load or generation first.
+        """
+        with self._lock:
+            if not self.is_loaded():
+                logger.info("unload: No model loaded - nothing to unload")
+                return
+
+            logger.debug("unload: Unloading '%s'", self._file_name)
+            try:
+                del self._model
+                logger.info("unload: Model successfully unloaded")
+            except Exception:
+                logger.warning("unload: Failed to unload '%s'", self._file_name, exc_info=True)
+            finally:
+                self._model = None
+                self._prompt_renderer = None
+                self._draft_model = None
+
+    def ensure_context_capacity(self, required_tokens: int) -> None:
+        """
+        Re-create the model context if it is smaller than the tier fitting the request.
+
+        Args:
+            required_tokens: Prompt tokens plus the expected output budget.
+
+        Raises:
+            RuntimeError: If the larger context cannot be created; the current one is kept.
+
+        Notes:
+            The context only grows; a smaller request never shrinks it, so contexts are not
+            re-created back and forth. Llama() cannot change its context size, so the model (and
+            a paired draft model) is created again with the larger context and the same options.
+            The weights are memory-mapped and stay in the page cache, so growing mostly costs
+            the allocation of the new KV cache. The new model is created before the old one is
+            closed. The evaluated tokens are discarded.
+        """
+        with self._lock:
+            tier = select_context_tier(required_tokens, self._model.n_ctx_train())
+            if tier <= self._model.n_ctx():
+                return
+
+            logger.info(
+                "ensure_context_capacity: Request needs %d tokens - growing context from %d to %d",
+                required_tokens,
+                self._model.n_ctx(),
+                tier,
+            )
+            previous_n_ctx = self._n_ctx
+            self._n_ctx = tier
+            try:
+                model, draft_model = self._create_models(*self._load_options)
+            except Exception as e:
+                self._n_ctx = previous_n_ctx
+                raise RuntimeError(f"Failed to create context of {tier} tokens: {str(e)}") from e
+
+            previous_model, previous_draft_model = self._model, self._draft_model
+            self._model, self._draft_model = model, draft_model
+            self._prompt_renderer = LlamaCppChatPromptRenderer(model)
+            self._verify_draft_model()
+            if previous_draft_model is not None and isinstance(previous_draft_model.inner, SmallModelDraftModel):
+                previous_draft_model.inner.model.close()
+            previous_model.close()
+
+    def _create_models(
+        self,
+        profile: LlamaCppTuningProfile,
+        memory_policy: MemoryPolicy,
+    ) -> Tuple[Llama, Optional[TrackedDraftModel]]:
+        """
+        Create the llama.cpp model and its draft model with the current context size.
+
+        Args:
+            profile: Tuning profile providing thread and batch parameters.
+            memory_policy: How the weights are kept in memory.
+
+        Returns:
+            Model and tracked draft model, or None if speculative decoding is disabled or unavailable.
+
+        Raises:
+            Exception: If llama.cpp fails to load the model or create its context.
+        """
+        draft_model = self._create_draft_model(profile, memory_policy)
+        model = Llama(
+            model_path=str((self._model_folder_path / self._file_name).absolute()),
+            n_ctx=self._n_ctx,  # Context tier sized for recent requests
+            n_gpu_layers=-1,  # Use GPU for all layers
+            n_threads=profile.n_threads,  # Generation threads
+            n_threads_batch=profile.n_threads_batch,  # Prompt processing threads
+            n_batch=profile.n_batch,
+            n_ubatch=profile.n_ubatch,
+            use_mmap=True,
+            use_mlock=memory_policy == MemoryPolicy.MLOCK,  # Pin weights in RAM
+            type_k=GGML_TYPES[self._kv_cache.type_k],  # KV cache element types
+            type_v=GGML_TYPES[self._kv_cache.type_v],
+            flash_attn=self._kv_cache.flash_attention,
+            draft_model=draft_model,  # Speculative decoding, if enabled for the model
+            verbose=False,  # Suppress verbose output
+        )
+        return model, draft_model
+
+    def restore_prefix_state(self, prefix_tokens: List[int]) -> None:
+        """
+        Ensure the model context starts with the evaluated static prompt prefix.
+
+        Args:
+            prefix_tokens: Tokens of the static prompt prefix.
+
+        Notes:
+            Does nothing if the prefix is already the head of the current context; llama.cpp then
+            reuses it on its own. Otherwise, loads the cached state, or evaluates the prefix once
+            and stores the resulting state for subsequent requests. A cached state that cannot be
+            loaded is replaced by a freshly evaluated one.
+            Failures are logged and ignored; generation then evaluates the full prompt.
+        """
+        if self._prompt_prefix_cache is None or not prefix_tokens:
+            return
+
+        n_prefix = len(prefix_tokens)
+        if self._model.n_tokens >= n_prefix and self._model.input_ids[:n_prefix].tolist() == prefix_tokens:
+            logger.debug("restore_prefix_state: Prefix of %d tokens already in context", n_prefix)
+            return
+
+        model_path = self._model_folder_path / self._file_name
+        n_ctx = self._model.n_ctx()
+        try:
+            state = self._prompt_prefix_cache.get(model_path, n_ctx, self._kv_cache, prefix_tokens)
+            if state is not None:
+                try:
+                    self._model.load_state(state)
+                    logger.debug("restore_prefix_state: Restored cached prefix of %d tokens", n_prefix)
+                    return
+                except Exception:
+                    logger.warning(
+                        "restore_prefix_state: Cached prefix state does not fit the context - evaluating it again",
+                        exc_info=True,
+                    )
+
+            self._model.reset()
+            self._model.eval(prefix_tokens)
+            self._prompt_prefix_cache.put(model_path, n_ctx, self._kv_cache, prefix_tokens, self._model.save_state())
+            logger.debug("restore_prefix_state: Evaluated and cached prefix of %d tokens", n_prefix)
+        except Exception:
+            logger.warning(
+                "restore_prefix_state: Failed to restore prefix state - evaluating full prompt",
+                exc_info=True,
+            )
+            self._model.reset()
+
+    def _file_size(self, file_name: str) -> int:
+        """
+        Get the size of a file in the model folder.
+
+        Args:
+            file_name: Name of the model file.
+
+        Returns:
+            File size in bytes, or 0 if the name is empty or the file does not exist.
+        """
+        if not file_name:
+            return 0
+        try:
+            return (self._model_folder_path / file_name).stat().st_size
+        except OSError:
+            return 0
+
+    def _log_resident_memory(self, model_path: Path) -> None:
+        """
+        Log the process RSS and how much of the model file is resident in RAM.
+
+        Args:
+            model_path: Path of the loaded GGUF file.
+
+        Notes:
+            A low resident share under MMAP means weights are still paged in on first use.
+        """
+        model_bytes = self._file_size(self._file_name)
+        model_rss = mapped_file_rss_bytes(model_path)
+        logger.info(
+            "load: Process RSS %.1f MiB, model resident %.1f of %.1f MiB (%.0f%%)",
+            process_rss_bytes() / (1024 * 1024),
+            model_rss / (1024 * 1024),
+            model_bytes / (1024 * 1024),
+            model_rss / model_bytes * 100 if model_bytes else 0.0,
+        )
+
+    def _create_draft_model(self, profile: LlamaCppTuningProfile, memory_policy: MemoryPolicy) -> Optional[TrackedDraftModel]:
+        """
+        Create the draft model for the configured speculative decoding mode.
+
+        Args:
+            profile: Tuning profile of the target model; the draft model runs with the same
+                threads, since draft and target never evaluate at the same time.
+            memory_policy: Memory policy of the target model, applied to the draft model too.
+                The KV cache options of the target model apply to the draft model as well.
+
+        Returns:
+            Tracked draft model, or None if speculative decoding is disabled for the model
+            or the paired draft model file is not available.
+        """
+        if self._speculative_decoding == SpeculativeDecodingMode.PROMPT_LOOKUP:
+            logger.debug("_create_draft_model: Using prompt-lookup drafting")
+            return TrackedDraftModel(
+                LlamaPromptLookupDecoding(
+                    max_ngram_size=PROMPT_LOOKUP_MAX_NGRAM_SIZE,
+                    num_pred_tokens=MAX_DRAFT_TOKENS,
+                )
+            )
+
+        if self._speculative_decoding == SpeculativeDecodingMode.DRAFT_MODEL:
+            draft_path = self._model_folder_path / self._draft_model_file
+            if not self._draft_model_file or not draft_path.exists():
+                logger.warning(
+                    "_create_draft_model: Draft model '%s' not found - speculative decoding disabled",
+                    draft_path,
+                )
+                return None
+
+            logger.debug("_create_draft_model: Loading draft model from '%s'", draft_path)
+            try:
+                draft = Llama(
+                    model_path=str(draft_path.absolute()),
+                    n_ctx=self._n_ctx,  # Must hold everything the target evaluates
+                    n_gpu_layers=-1,
+                    n_threads=profile.n_threads,
+                    n_threads_batch=profile.n_threads_batch,
+                    n_batch=profile.n_batch,
+                    n_ubatch=profile.n_ubatch,
+                    use_mmap=True,
+                    use_mlock=memory_policy == MemoryPolicy.MLOCK,
+                    type_k=GGML_TYPES[self._kv_cache.type_k],
+                    type_v=GGML_TYPES[self._kv_cache.type_v],
+                    flash_attn=self._kv_cache.flash_attention,
+                    verbose=False,
+                )
+                if memory_policy == MemoryPolicy.MMAP_PREFAULT:
+                    prefault_file(draft_path)
+            except Exception:
+                logger.warning(
+                    "_create_draft_model: Failed to load draft model '%s' - speculative decoding disabled",
+                    draft_path,
+                    exc_info=True,
+                )
+                return None
+            return TrackedDraftModel(SmallModelDraftModel(draft, num_pred_tokens=MAX_DRAFT_TOKENS))
+
+        return None
+
+    def _verify_draft_model(self) -> None:
+        """
+        Disable a loaded draft model whose vocabulary does not match the target model.
+
+        Notes:
+            Drafted token ids are verified by the target as they are, so a draft model with a
+            different tokenizer would have nearly all its tokens rejected while still costing time.
+        """
+        if self._draft_model is None or not isinstance(self._draft_model.inner, SmallModelDraftModel):
+            return
+
+        compatible, reason = check_vocabulary_compatibility(self._model, self._draft_model.inner.model)
+        if compatible:
+            logger.info("_verify_draft_model: Using draft model '%s'", self._draft_model_file)
+            return
+
+        logger.warning(
+            "_verify_draft_model: Draft model '%s' is incompatible (%s) - speculative decoding disabled",
+            self._draft_model_file,
+            reason,
+        )
+        self._model.draft_model = None
+        self._draft_model = None
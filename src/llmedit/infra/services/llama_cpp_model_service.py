@@ -1,43 +1,50 @@
 import logging
-from pathlib import Path
-from typing import Optional, override
-
-from llama_cpp import (
-    ChatCompletionRequestMessage,
-    ChatCompletionRequestSystemMessage,
-    ChatCompletionRequestUserMessage,
-    Llama,
-)
-
-from llmedit.core.interfaces.llm_model.model_service import ModelService
-from llmedit.core.models.data_types import GenerationRequest, GenerationResponse
+import time
+from typing import List, Optional, override
+
+from llama_cpp import Llama, LlamaState, StoppingCriteriaList
+
+from llmedit.core.interfaces.llm_model.model_service import GenerationCancelledError, ModelService
+from llmedit.core.models.data_types import (CancellationToken, GenerationRequest, GenerationResponse, LoadProgressCallback,
+                                            TextDeltaCallback, VariantTextDeltaCallback)
 from llmedit.core.models.settings import ModelInformation
+from llmedit.infra.services.llama_cpp_chat_prompt_renderer import RenderedChatPrompt
+from llmedit.infra.services.llama_cpp_loaded_model import LlamaCppLoadedModel
+from llmedit.infra.services.llama_cpp_thinking import FORCED_THINK_CLOSE_TEXT, ThinkingTracker, prompt_opens_thinking, thinking_suppression_bias
+from llmedit.infra.services.prompt_prefix_cache import compact_state
+from llmedit.infra.services.repetition_detector import RepetitionDetector
 
 logger = logging.getLogger(__name__)
 
+MIN_OUTPUT_RESERVE_TOKENS = 1024
+
 
 class LlamaCppModelService(ModelService):
     """
     Implementation of ModelService for llama.cpp backend.
 
-    Manages the lifecycle of GGUF-format models using the llama.cpp library.
-    Handles model loading, unloading, and text generation with configurable parameters.
+    Represents one model profile (sampling settings, prompt suffixes, output limits) on top of
+    a LlamaCppLoadedModel holding the weights. Profiles sharing a GGUF file share the loaded
+    model, so loading, unloading and memory estimates apply to all of them.
     """
 
-    def __init__(self, model_folder_path: Path, model_information: ModelInformation) -> None:
+    def __init__(
+        self,
+        model_information: ModelInformation,
+        loaded_model: LlamaCppLoadedModel,
+    ) -> None:
         """
-        Initialize service with model location and configuration.
+        Initialize service with model profile and shared weights.
 
         Args:
-            model_folder_path: Directory containing GGUF model files.
             model_information: Configuration object containing model metadata and settings.
+            loaded_model: Loaded model of the profile's GGUF file, shared between profiles.
 
         Notes:
             The model is not loaded immediately; loading occurs on first use or explicit call.
         """
-        self._model_folder_path = model_folder_path
         self._model_information = model_information
-        self._model: Optional[Llama] = None
+        self._loaded_model = loaded_model
 
         logger.debug(
             "__init__: Initialized for model '%s' (file: '%s')",
@@ -63,6 +70,26 @@ class LlamaCppModelService(ModelService):
         )
         return self._model_information
 
+    @override
+    def get_model_version(self) -> str:
+        """
+        Identify the weights the model currently generates with.
+
+        Returns:
+            Size and modification time of the GGUF file.
+        """
+        return self._loaded_model.file_version()
+
+    @override
+    def estimate_memory_bytes(self) -> int:
+        """
+        Estimate RAM used by the shared model weights and llama.cpp buffers.
+
+        Returns:
+            Estimate of the loaded model, see LlamaCppLoadedModel.estimate_memory_bytes().
+        """
+        return self._loaded_model.estimate_memory_bytes()
+
     @override
     def is_model_loaded(self) -> bool:
         """
@@ -72,55 +99,28 @@ class LlamaCppModelService(ModelService):
             True if model is loaded and ready for inference, False otherwise.
 
         Notes:
-            Used to determine whether load_model() needs to be called before generation.
+            Also True if the weights were loaded for another profile sharing the file.
         """
-        loaded = self._model is not None
+        loaded = self._loaded_model.is_loaded()
         logger.debug("is_model_loaded: Model status: %s", "LOADED" if loaded else "UNLOADED")
         return loaded
 
     @override
-    def load_model(self) -> None:
+    def load_model(self, on_progress: Optional[LoadProgressCallback] = None) -> None:
         """
         Load model into memory if not already loaded.
 
+        Args:
+            on_progress: Optional callback receiving llama.cpp's loading progress.
+
         Raises:
             RuntimeError: If model loading fails due to file not found, hardware constraints, or other errors.
 
         Notes:
-            Uses GPU acceleration for all layers and locks model in RAM.
-            Skips loading if model is already loaded.
+            Delegates to the shared loaded model; nothing is loaded if another profile sharing
+            the file already loaded it. Concurrent callers wait for the running load.
         """
-        if self.is_model_loaded():
-            logger.debug("load_model: Model already loaded - skipping reload")
-            return
-
-        model_path = self._model_folder_path / self._model_information.fileName
-        logger.debug(
-            "load_model: Loading model '%s' from '%s'",
-            self._model_information.name,
-            model_path,
-        )
-
-        try:
-            self._model = Llama(
-                model_path=str(model_path.absolute()),
-                n_ctx=0,  # Context length from model
-                n_gpu_layers=-1,  # Use GPU for all layers
-                n_threads=8,  # Generation threads
-                use_mlock=True,  # Keep in RAM
-                verbose=False,  # Suppress verbose output
-            )
-            logger.info(
-                "load_model: Successfully loaded model '%s'",
-                self._model_information.name,
-            )
-        except Exception as e:
-            logger.error(
-                "load_model: Failed to load model '%s'",
-                self._model_information.name,
-                exc_info=True,
-            )
-            raise RuntimeError(f"Failed to load model: {str(e)}") from e
+        self._loaded_model.load(on_progress)
 
     @override
     def unload_model(self) -> None:
@@ -128,51 +128,67 @@ class LlamaCppModelService(ModelService):
         Unload model from memory if loaded.
 
         Notes:
-            Releases all resources associated with the model.
+            Unloads the shared weights, i.e. for all profiles using the same file.
             Safe to call even if no model is loaded.
         """
-        if not self.is_model_loaded():
-            logger.info("unload_model: No model loaded - nothing to unload")
-            return
+        self._loaded_model.unload()
 
-        logger.debug("unload_model: Unloading model '%s'", self._model_information.name)
-        try:
-            del self._model
-            self._model = None
-            logger.info("unload_model: Model successfully unloaded")
-        except Exception as e:
-            logger.warning(
-                "unload_model: Failed to unload model '%s'",
-                self._model_information.name,
-                exc_info=True,
-            )
-            self._model = None
+    @override
+    def max_parallel_requests(self) -> int:
+        """
+        Get how many requests the service can generate at the same time.
+
+        Returns:
+            Always 1.
+
+        Notes:
+            Profiles sharing the model file share one context, so generation is serialized.
+        """
+        return 1
 
     @override
-    def generate_response(self, request: GenerationRequest) -> GenerationResponse:
+    def generate_response(
+        self,
+        request: GenerationRequest,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> GenerationResponse:
         """
         Generate response using loaded model.
 
         Args:
             request: Contains system prompt, user prompt, and generation parameters.
+            on_text_delta: Optional callback receiving each generated text fragment.
+            cancellation_token: Optional token checked by a llama.cpp stopping criterion after
+                every generated token.
 
         Returns:
             GenerationResponse with the generated text content and metadata.
 
         Raises:
+            GenerationCancelledError: If the cancellation token was cancelled.
             RuntimeError: If generation fails due to model errors or invalid input.
 
         Notes:
-            Automatically loads the model if not already loaded.
-            Strips whitespace from the generated response.
+            Automatically loads the model if not already loaded. Holds the loaded model's lock, so
+            profiles sharing the model file never generate at the same time.
+            Always streams from llama.cpp so the first fragment is available as soon as it is decoded.
+            The static prompt prefix (system prompt, user turn header and task template header) is
+            restored from the prompt prefix cache when available, so only the differing suffix is evaluated.
+            The number of generated tokens is limited by the request's output budget, and generation
+            is aborted early if the output starts looping; both cases mark the response as truncated.
+            With speculative decoding enabled, up to request.draft_tokens tokens are drafted per step
+            and acceptance statistics are reported in the metadata; profiles without speculative
+            decoding request no draft tokens even if the shared model has a draft model.
+            Reasoning is limited to the profile's thinking budget: once spent, the think block is
+            closed and the model continues with the answer. Profiles with suppress_thinking ban
+            the think tags. Tokens spent thinking and answering are reported in the metadata.
+            If the prompt plus the output budget does not fit the current context, the context is
+            re-created with the smallest tier that fits.
+            A cancelled generation stops after the token being decoded; prompt evaluation runs to
+            its end first.
+            Strips whitespace from the accumulated response.
         """
-        if not self.is_model_loaded():
-            logger.info(
-                "generate_response: Model not loaded - loading '%s'",
-                self._model_information.name,
-            )
-            self.load_model()
-
         logger.debug(
             "generate_response: Starting generation - system_len=%d, user_len=%d, temp=%.2f, top_k=%d, top_p=%.2f, min_p=%.2f",
             len(request.system_prompt),
@@ -183,38 +199,386 @@ class LlamaCppModelService(ModelService):
             request.min_p,
         )
 
+        with self._loaded_model.lock:
+            if not self._loaded_model.is_loaded():
+                logger.info(
+                    "generate_response: Model not loaded - loading '%s'",
+                    self._model_information.name,
+                )
+                self._loaded_model.load()
+
+            return self._generate_response(request, on_text_delta, cancellation_token)
+
+    @override
+    def generate_variant_responses(
+        self,
+        requests: List[GenerationRequest],
+        on_text_delta: Optional[VariantTextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[GenerationResponse]:
+        """
+        Generate responses for several variants of one task from one shared prefill.
+
+        Args:
+            requests: One request per variant, typically sharing the system prompt and user text.
+            on_text_delta: Optional callback receiving the variant index and each text fragment.
+            cancellation_token: Optional token checked after every generated token.
+
+        Returns:
+            One GenerationResponse per request, in request order.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled.
+            RuntimeError: If generation fails for any variant.
+
+        Notes:
+            The longest token prefix common to all rendered prompts (e.g. system prompt, task
+            header and user text for translations into several languages) is evaluated once and
+            its state is copied back before each variant, so every variant only evaluates its own
+            suffix. The context is sized for the largest variant up front. The shared state is
+            kept in memory only for the duration of the call.
+        """
+        if not requests:
+            return []
+
+        with self._loaded_model.lock:
+            if not self._loaded_model.is_loaded():
+                logger.info(
+                    "generate_variant_responses: Model not loaded - loading '%s'",
+                    self._model_information.name,
+                )
+                self._loaded_model.load()
+
+            try:
+                renderer = self._loaded_model.prompt_renderer
+                rendered = [
+                    renderer.render(request.system_prompt, request.user_prompt, request.user_prompt_static_prefix)
+                    for request in requests
+                ]
+                max_tokens = [
+                    self._resolve_max_tokens(request, len(prompt.tokens) - len(prompt.prefix_tokens))
+                    for request, prompt in zip(requests, rendered)
+                ]
+                self._loaded_model.ensure_context_capacity(
+                    max(len(prompt.tokens) + tokens for prompt, tokens in zip(rendered, max_tokens))
+                )
+
+                shared_tokens = self._shared_prompt_tokens(rendered)
+                self._loaded_model.restore_prefix_state(rendered[0].prefix_tokens)
+                shared_state = self._evaluate_shared_prefix(shared_tokens)
+                logger.info(
+                    "generate_variant_responses: Generating %d variants from a shared prefix of %d tokens",
+                    len(requests),
+                    len(shared_tokens),
+                )
+
+                responses: List[GenerationResponse] = []
+                for index, (request, prompt, variant_max_tokens) in enumerate(zip(requests, rendered, max_tokens)):
+                    if index > 0:
+                        self._loaded_model.model.load_state(shared_state)
+                    variant_callback = None
+                    if on_text_delta is not None:
+                        variant_callback = lambda delta, variant=index: on_text_delta(variant, delta)
+                    response = self._stream_completion(
+                        request,
+                        prompt,
+                        variant_max_tokens,
+                        variant_callback,
+                        cancellation_token,
+                    )
+                    response.metadata["shared_prefix_tokens"] = str(len(shared_tokens))
+                    responses.append(response)
+                return responses
+
+            except GenerationCancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    "generate_variant_responses: Generation failed for model '%s'",
+                    self._model_information.name,
+                    exc_info=True,
+                )
+                raise RuntimeError(f"Failed to generate variant responses: {str(e)}") from e
+
+    def _generate_response(
+        self,
+        request: GenerationRequest,
+        on_text_delta: Optional[TextDeltaCallback],
+        cancellation_token: Optional[CancellationToken],
+    ) -> GenerationResponse:
+        """
+        Generate response; the caller must hold the loaded model's lock.
+
+        Args:
+            request: Contains system prompt, user prompt, and generation parameters.
+            on_text_delta: Optional callback receiving each generated text fragment.
+            cancellation_token: Optional token checked after every generated token.
+
+        Returns:
+            GenerationResponse with the generated text content and metadata.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled.
+            RuntimeError: If generation fails.
+        """
         try:
-            messages: list[ChatCompletionRequestMessage] = [
-                ChatCompletionRequestSystemMessage(role="system", content=request.system_prompt),
-                ChatCompletionRequestUserMessage(role="user", content=request.user_prompt),
-            ]
+            rendered = self._loaded_model.prompt_renderer.render(
+                request.system_prompt,
+                request.user_prompt,
+                request.user_prompt_static_prefix,
+            )
+            max_tokens = self._resolve_max_tokens(request, len(rendered.tokens) - len(rendered.prefix_tokens))
+            self._loaded_model.ensure_context_capacity(len(rendered.tokens) + max_tokens)
+            self._loaded_model.restore_prefix_state(rendered.prefix_tokens)
+            return self._stream_completion(request, rendered, max_tokens, on_text_delta, cancellation_token)
+        except GenerationCancelledError:
+            raise
+        except Exception as e:
+            logger.error(
+                "generate_response: Generation failed for model '%s'",
+                self._model_information.name,
+                exc_info=True,
+            )
+            raise RuntimeError(f"Failed to generate response: {str(e)}") from e
+
+    def _stream_completion(
+        self,
+        request: GenerationRequest,
+        rendered: RenderedChatPrompt,
+        max_tokens: int,
+        on_text_delta: Optional[TextDeltaCallback],
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> GenerationResponse:
+        """
+        Run a streamed completion on the current context and collect the response.
 
-            response = self._model.create_chat_completion(
-                messages=messages,
+        Args:
+            request: Request providing sampling parameters and the user input.
+            rendered: Rendered prompt of the request.
+            max_tokens: Maximum number of tokens to generate.
+            on_text_delta: Optional callback receiving each generated text fragment.
+            cancellation_token: Optional token checked by a stopping criterion after every
+                generated token.
+
+        Returns:
+            GenerationResponse with the generated text content and metadata.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled.
+
+        Notes:
+            llama.cpp reuses whatever prefix of the prompt the context already holds, so callers
+            prepare the context (cached prefix, shared fan-out prefix) before calling this.
+            When the thinking budget is spent, the stream is closed and a second completion
+            continues from the prompt, the reasoning so far and a closing </think> tag.
+            The caller must hold the loaded model's lock.
+        """
+        model = self._loaded_model.model
+        draft_model = self._loaded_model.draft_model
+        if draft_model is not None:
+            draft_model.begin(request.draft_tokens)
+
+        thinking_budget = self._model_information.thinking_budget
+        logit_bias = None
+        if self._model_information.suppress_thinking:
+            logit_bias = thinking_suppression_bias(model) or None
+            thinking = ThinkingTracker()
+        else:
+            thinking = ThinkingTracker(thinking_open=prompt_opens_thinking(model, rendered.tokens))
+
+        stopping_criteria = rendered.stopping_criteria
+        if cancellation_token is not None:
+            stopping_criteria = StoppingCriteriaList([
+                *(rendered.stopping_criteria or []),
+                lambda input_ids, logits: cancellation_token.is_cancelled(),
+            ])
+
+        repetition_detector = RepetitionDetector(reference_text=request.user_input_text)
+        fragments: list[str] = []
+        finish_reason = ""
+        first_chunk_time: Optional[float] = None
+        forced_think_close = False
+        prompt_tokens = rendered.tokens
+        while True:
+            if cancellation_token is not None and cancellation_token.is_cancelled():
+                logger.info("generate_response: Generation cancelled after %d fragments", len(fragments))
+                raise GenerationCancelledError("Generation cancelled")
+
+            # Tokens generated by earlier streams are part of the prompt of a continuation
+            generated_tokens = len(prompt_tokens) - len(rendered.tokens)
+            stream = model.create_completion(
+                prompt=prompt_tokens,
+                max_tokens=max_tokens - generated_tokens,
                 temperature=request.temperature,
                 top_k=request.top_k,
                 top_p=request.top_p,
                 min_p=request.min_p,
+                stop=rendered.stop,
+                stopping_criteria=stopping_criteria,
+                logit_bias=logit_bias,
+                seed=request.seed,
+                stream=True,
             )
 
-            generated_text = response["choices"][0]["message"]["content"].strip()
+            thinking_budget_spent = False
+            for chunk in stream:
+                if first_chunk_time is None:
+                    first_chunk_time = time.perf_counter()
+                choice = chunk["choices"][0]
+                delta = choice.get("text")
+                if delta:
+                    fragments.append(delta)
+                    if on_text_delta is not None:
+                        on_text_delta(delta)
+                    thinking.feed(delta)
+                    if repetition_detector.feed(delta):
+                        finish_reason = "repetition"
+                        stream.close()
+                        break
+                    if thinking_budget > 0 and thinking.is_thinking and thinking.thinking_fragments >= thinking_budget:
+                        thinking_budget_spent = True
+                        stream.close()
+                        break
+                if choice.get("finish_reason"):
+                    finish_reason = choice["finish_reason"]
+
+            if cancellation_token is not None and cancellation_token.is_cancelled():
+                continue
+            if not thinking_budget_spent:
+                break
+
+            # Close the think block and let the model continue from there; llama.cpp reuses the
+            # evaluated prompt and reasoning, so only the closing tag is evaluated
             logger.info(
-                "generate_response: Generated %d characters",
-                len(generated_text),
+                "generate_response: Thinking budget of %d tokens spent - closing the think block",
+                thinking_budget,
             )
+            forced_think_close = True
+            fragments.append(FORCED_THINK_CLOSE_TEXT)
+            if on_text_delta is not None:
+                on_text_delta(FORCED_THINK_CLOSE_TEXT)
+            thinking.feed(FORCED_THINK_CLOSE_TEXT)
+            repetition_detector.feed(FORCED_THINK_CLOSE_TEXT)
+            prompt_tokens = rendered.tokens + model.tokenize("".join(fragments).encode("utf-8"), add_bos=False, special=True)
+            # llama-cpp-python treats max_tokens <= 0 as unlimited, so never continue without budget
+            if len(prompt_tokens) - len(rendered.tokens) >= max_tokens:
+                finish_reason = "length"
+                break
+
+        decode_seconds = time.perf_counter() - first_chunk_time if first_chunk_time is not None else 0.0
+        generated_text = repetition_detector.trim("".join(fragments)).strip()
+        truncated = finish_reason in ("length", "repetition")
+        logger.info(
+            "generate_response: Generated %d characters in %d fragments (finish_reason=%s, max_tokens=%d)",
+            len(generated_text),
+            len(fragments),
+            finish_reason or "unknown",
+            max_tokens,
+        )
 
-            return GenerationResponse(
-                text_content=generated_text,
-                metadata={
-                    "model_name": self._model_information.name,
-                },
-                original_request=request,
+        metadata = {
+            "model_name": self._model_information.name,
+            "finish_reason": finish_reason,
+            "truncated": str(truncated).lower(),
+            "max_tokens": str(max_tokens),
+            "n_ctx": str(model.n_ctx()),
+            "completion_fragments": str(len(fragments)),
+            "decode_fragments_per_second": f"{len(fragments) / decode_seconds:.2f}" if decode_seconds > 0 else "0",
+            "thinking_tokens": str(self._count_tokens(thinking.thinking_text)),
+            "answer_tokens": str(self._count_tokens(thinking.answer_text)),
+            "thinking_forced_close": str(forced_think_close).lower(),
+        }
+        if draft_model is not None and request.draft_tokens > 0:
+            draft_stats = draft_model.stats()
+            metadata["draft_proposed_tokens"] = str(draft_stats.proposed_tokens)
+            metadata["draft_accepted_tokens"] = str(draft_stats.accepted_tokens)
+            metadata["draft_acceptance_rate"] = f"{draft_stats.acceptance_rate:.3f}"
+            logger.info(
+                "generate_response: Speculative decoding accepted %d of %d drafted tokens (%.1f%%), %s fragments/s",
+                draft_stats.accepted_tokens,
+                draft_stats.proposed_tokens,
+                draft_stats.acceptance_rate * 100,
+                metadata["decode_fragments_per_second"],
             )
 
-        except Exception as e:
-            logger.error(
-                "generate_response: Generation failed for model '%s'",
-                self._model_information.name,
-                exc_info=True,
-            )
-            raise RuntimeError(f"Failed to generate response: {str(e)}") from e
+        return GenerationResponse(
+            text_content=generated_text,
+            metadata=metadata,
+            original_request=request,
+        )
+
+    @staticmethod
+    def _shared_prompt_tokens(rendered: List[RenderedChatPrompt]) -> List[int]:
+        """
+        Get the token prefix common to all rendered prompts.
+
+        Args:
+            rendered: Rendered prompts of all variants.
+
+        Returns:
+            Longest common token prefix, shortened so every prompt keeps at least one token of
+            its own to evaluate (needed to produce logits after restoring the shared state).
+        """
+        shared_length = min(len(prompt.tokens) for prompt in rendered) - 1
+        for prompt in rendered[1:]:
+            shared_length = min(shared_length, Llama.longest_token_prefix(rendered[0].tokens, prompt.tokens))
+        return rendered[0].tokens[:max(shared_length, 0)]
+
+    def _evaluate_shared_prefix(self, shared_tokens: List[int]) -> LlamaState:
+        """
+        Evaluate the shared prefix on top of the current context and capture the state.
+
+        Args:
+            shared_tokens: Token prefix common to all variants.
+
+        Returns:
+            Compact state of the context holding exactly the shared prefix.
+
+        Notes:
+            Tokens the context already holds (e.g. the restored static prefix) are not evaluated again.
+        """
+        model = self._loaded_model.model
+        reused = Llama.longest_token_prefix(model.input_ids[:model.n_tokens].tolist(), shared_tokens)
+        model.n_tokens = reused
+        if reused < len(shared_tokens):
+            model.eval(shared_tokens[reused:])
+        return compact_state(model.save_state())
+
+    def _count_tokens(self, text: str) -> int:
+        """
+        Count the tokens of generated text.
+
+        Args:
+            text: Text produced by the model.
+
+        Returns:
+            Number of tokens; 0 for empty text.
+        """
+        if not text:
+            return 0
+        return len(self._loaded_model.model.tokenize(text.encode("utf-8"), add_bos=False, special=True))
+
+    def _resolve_max_tokens(self, request: GenerationRequest, prompt_input_tokens: int) -> int:
+        """
+        Compute the maximum number of tokens to generate for a request.
+
+        Args:
+            request: Generation request carrying the user input and output budget.
+            prompt_input_tokens: Number of prompt tokens after the static prefix, used when the
+                request carries neither the input token count nor the raw user input.
+
+        Returns:
+            Token limit from the request's output budget, or an input-sized fallback of at least
+            MIN_OUTPUT_RESERVE_TOKENS; never more than the model's configured output length.
+        """
+        output_length = self._model_information.output_length
+        if request.input_tokens is not None:
+            input_tokens = request.input_tokens
+        elif request.user_input_text:
+            input_tokens = len(self._loaded_model.model.tokenize(request.user_input_text.encode("utf-8"), add_bos=False))
+        else:
+            input_tokens = prompt_input_tokens
+
+        if request.output_budget is not None:
+            return request.output_budget.resolve(input_tokens, output_length)
+        return min(output_length, max(MIN_OUTPUT_RESERVE_TOKENS, input_tokens))
@@ -0,0 +1,237 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, override
+
+from llmedit.core.interfaces.llm_model.model_service import GenerationCancelledError, ModelService
+from llmedit.core.models.data_types import (CancellationToken, GenerationRequest, GenerationResponse, LoadProgressCallback,
+                                            TextDeltaCallback, VariantTextDeltaCallback)
+from llmedit.core.models.settings import ModelInformation
+from llmedit.infra.services.llama_cpp_worker_pool import LlamaCppWorkerPool
+
+logger = logging.getLogger(__name__)
+
+
+class LlamaCppPoolModelService(ModelService):
+    """
+    Implementation of ModelService that generates with a pool of llama.cpp worker processes.
+
+    Represents one model profile on top of a LlamaCppWorkerPool, the same way LlamaCppModelService
+    sits on top of a loaded model. The model lives in the worker processes only, so a crash in
+    llama.cpp does not take down the application. Requests from several threads generate in
+    parallel, one per worker; profiles sharing a GGUF file share the pool.
+    """
+
+    def __init__(
+        self,
+        model_information: ModelInformation,
+        worker_pool: LlamaCppWorkerPool,
+    ) -> None:
+        """
+        Initialize service with model profile and shared worker pool.
+
+        Args:
+            model_information: Configuration object containing model metadata and settings.
+            worker_pool: Worker pool of the profile's GGUF file, shared between profiles.
+
+        Notes:
+            The workers are not started immediately; they start on first use or explicit load.
+        """
+        self._model_information = model_information
+        self._worker_pool = worker_pool
+
+        logger.debug(
+            "__init__: Initialized for model '%s' (file: '%s', %d workers)",
+            self._model_information.name,
+            self._model_information.fileName,
+            worker_pool.worker_count,
+        )
+
+    @override
+    def get_model_information(self) -> ModelInformation:
+        """
+        Retrieve model configuration details.
+
+        Returns:
+            ModelInformation object containing the model's metadata and generation settings.
+        """
+        return self._model_information
+
+    @override
+    def get_model_version(self) -> str:
+        """
+        Identify the weights the model currently generates with.
+
+        Returns:
+            Size and modification time of the GGUF file the workers load.
+        """
+        return self._worker_pool.file_version()
+
+    @override
+    def estimate_memory_bytes(self) -> int:
+        """
+        Estimate RAM used by all workers together.
+
+        Returns:
+            Estimate of the worker pool, see LlamaCppWorkerPool.estimate_memory_bytes().
+        """
+        return self._worker_pool.estimate_memory_bytes()
+
+    @override
+    def is_model_loaded(self) -> bool:
+        """
+        Check if the workers are running and have loaded the model.
+
+        Returns:
+            True if the worker pool is running, False otherwise.
+        """
+        loaded = self._worker_pool.is_running()
+        logger.debug("is_model_loaded: Model status: %s", "LOADED" if loaded else "UNLOADED")
+        return loaded
+
+    @override
+    def load_model(self, on_progress: Optional[LoadProgressCallback] = None) -> None:
+        """
+        Start the worker processes, each loading the model.
+
+        Args:
+            on_progress: Optional callback receiving llama.cpp's loading progress, averaged over
+                the workers.
+
+        Raises:
+            RuntimeError: If a worker fails to load the model.
+        """
+        self._worker_pool.start(on_progress)
+
+    @override
+    def unload_model(self) -> None:
+        """
+        Stop the worker processes, releasing the model in all of them.
+
+        Notes:
+            Stops the shared pool, i.e. for all profiles using the same file.
+        """
+        self._worker_pool.stop()
+
+    @override
+    def max_parallel_requests(self) -> int:
+        """
+        Get how many requests the service can generate at the same time.
+
+        Returns:
+            Number of worker processes.
+        """
+        return self._worker_pool.worker_count
+
+    @override
+    def generate_response(
+        self,
+        request: GenerationRequest,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> GenerationResponse:
+        """
+        Generate a response on the next idle worker.
+
+        Args:
+            request: Contains system prompt, user prompt, and generation parameters.
+            on_text_delta: Optional callback receiving each generated text fragment.
+            cancellation_token: Optional token; once cancelled, the worker is interrupted.
+
+        Returns:
+            GenerationResponse generated by the worker, see LlamaCppModelService.generate_response().
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled.
+            RuntimeError: If generation fails or the worker exits.
+
+        Notes:
+            Starts the workers if they are not running. Blocks while all workers are busy. A worker
+            that exits during generation is restarted by the pool; the request fails.
+        """
+        if not self._worker_pool.is_running():
+            logger.info("generate_response: Workers not running - starting them for '%s'", self._model_information.name)
+            self._worker_pool.start()
+
+        try:
+            return self._worker_pool.generate(
+                self._model_information,
+                request,
+                on_text_delta,
+                cancellation_token.is_cancelled if cancellation_token is not None else None,
+            )
+        except GenerationCancelledError:
+            raise
+        except Exception as e:
+            logger.error(
+                "generate_response: Generation failed for model '%s'",
+                self._model_information.name,
+                exc_info=True,
+            )
+            raise RuntimeError(f"Failed to generate response: {str(e)}") from e
+
+    @override
+    def generate_variant_responses(
+        self,
+        requests: List[GenerationRequest],
+        on_text_delta: Optional[VariantTextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[GenerationResponse]:
+        """
+        Generate responses for several variants of one task in parallel on the workers.
+
+        Args:
+            requests: One request per variant.
+            on_text_delta: Optional callback receiving the variant index and each text fragment.
+            cancellation_token: Optional token; once cancelled, all workers of this call are interrupted.
+
+        Returns:
+            One GenerationResponse per request, in request order.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled.
+            RuntimeError: If generation fails for any variant.
+
+        Notes:
+            With a single worker, the variants are sent to it as one job, so the shared prompt
+            part is evaluated once. With more workers, each variant is a separate request, so the
+            shared prompt part is evaluated once per worker rather than once per job; the prompt
+            prefix cache of each worker still covers the system prompt and task header. Fragments
+            of different variants then interleave and the callback is invoked from the worker
+            threads of this call.
+        """
+        if not requests:
+            return []
+
+        if self._worker_pool.worker_count == 1:
+            if not self._worker_pool.is_running():
+                self._worker_pool.start()
+            try:
+                return self._worker_pool.generate_variants(
+                    self._model_information,
+                    requests,
+                    on_text_delta,
+                    cancellation_token.is_cancelled if cancellation_token is not None else None,
+                )
+            except GenerationCancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    "generate_variant_responses: Generation failed for model '%s'",
+                    self._model_information.name,
+                    exc_info=True,
+                )
+                raise RuntimeError(f"Failed to generate variant responses: {str(e)}") from e
+
+        def generate_variant(index: int) -> GenerationResponse:
+            variant_callback = None
+            if on_text_delta is not None:
+                variant_callback = lambda delta: on_text_delta(index, delta)
+            return self.generate_response(requests[index], variant_callback, cancellation_token)
+
+        logger.info(
+            "generate_variant_responses: Generating %d variants on %d workers",
+            len(requests),
+            self._worker_pool.worker_count,
+        )
+        with ThreadPoolExecutor(max_workers=min(len(requests), self._worker_pool.worker_count)) as executor:
+            return list(executor.map(generate_variant, range(len(requests))))
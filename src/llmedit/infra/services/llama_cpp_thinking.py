@@ -0,0 +1,177 @@
+import logging
+from typing import Dict, List, Optional
+
+from llama_cpp import Llama
+
+logger = logging.getLogger(__name__)
+
+THINK_OPEN_TAG = "<think>"
+THINK_CLOSE_TAG = "</think>"
+FORCED_THINK_CLOSE_TEXT = "\n" + THINK_CLOSE_TAG + "\n\n"
+PROMPT_TAIL_TOKENS = 8
+
+
+class ThinkingTracker:
+    """
+    Online splitter of generated text into the reasoning block and the answer.
+
+    Fed with generated text fragments, it follows the first <think>...</think> block at the
+    start of the output and counts the fragments generated inside it, so the caller can end
+    the block once the thinking budget is spent. Text before the block may only be whitespace;
+    a <think> tag appearing later in the answer is treated as answer text.
+    """
+
+    def __init__(self, thinking_open: bool = False) -> None:
+        """
+        Initialize tracker.
+
+        Args:
+            thinking_open: True if the prompt already ends with an opening <think> tag, so the
+                output starts inside the reasoning block.
+        """
+        self._fragments: List[str] = []
+        self._length = 0
+        # Text before the reasoning block is known to start, and the end of the text fed so
+        # far, long enough to find a closing tag split across fragments
+        self._head: Optional[str] = None if thinking_open else ""
+        self._tail = ""
+        self._thinking_start = 0 if thinking_open else -1
+        self._thinking_end = -1
+        self._answer_start = -1
+        self._thinking_fragments = 0
+        self._answer_only = False
+
+    @property
+    def is_thinking(self) -> bool:
+        """
+        Check whether the output is currently inside the reasoning block.
+
+        Returns:
+            True after the opening tag and before the closing tag.
+        """
+        return self._thinking_start >= 0 and self._thinking_end < 0
+
+    @property
+    def thinking_fragments(self) -> int:
+        """
+        Get the number of fragments generated inside the reasoning block.
+
+        Returns:
+            Fragment count; streamed fragments correspond to single tokens in almost all cases.
+        """
+        return self._thinking_fragments
+
+    @property
+    def thinking_text(self) -> str:
+        """
+        Get the content of the reasoning block without the tags.
+
+        Returns:
+            Reasoning text so far; empty if the model did not reason.
+        """
+        if self._thinking_start < 0:
+            return ""
+        end = self._thinking_end if self._thinking_end >= 0 else self._length
+        return self._text()[self._thinking_start:end]
+
+    @property
+    def answer_text(self) -> str:
+        """
+        Get the generated text outside the reasoning block.
+
+        Returns:
+            Everything after the closing tag, or the whole output if the model did not reason.
+        """
+        if self._thinking_start < 0:
+            return self._text()
+        if self._answer_start < 0:
+            return ""
+        return self._text()[self._answer_start:]
+
+    def feed(self, fragment: str) -> None:
+        """
+        Append a generated fragment and update the reasoning block boundaries.
+
+        Args:
+            fragment: Newly generated text.
+
+        Notes:
+            Tags split across fragments are found, since the search covers the last characters
+            of the previous text. Each call takes time proportional to the fragment only.
+        """
+        search_text = self._tail + fragment
+        search_offset = self._length - len(self._tail)
+        self._fragments.append(fragment)
+        self._length += len(fragment)
+        self._tail = search_text[-(len(THINK_CLOSE_TAG) - 1):]
+
+        if self._thinking_start < 0:
+            if self._answer_only:
+                return
+            self._head += fragment
+            stripped = self._head.lstrip()
+            if not stripped.startswith(THINK_OPEN_TAG):
+                # Keep waiting while the output could still become the opening tag
+                self._answer_only = not THINK_OPEN_TAG.startswith(stripped)
+                if self._answer_only:
+                    self._head = None
+                return
+            self._thinking_start = len(self._head) - len(stripped) + len(THINK_OPEN_TAG)
+            self._head = None
+
+        if self._thinking_end < 0:
+            close_at = search_text.find(THINK_CLOSE_TAG, max(0, self._thinking_start - search_offset))
+            if close_at < 0:
+                self._thinking_fragments += 1
+                return
+            self._thinking_end = search_offset + close_at
+            self._answer_start = self._thinking_end + len(THINK_CLOSE_TAG)
+
+    def _text(self) -> str:
+        """
+        Get the whole text fed so far.
+
+        Returns:
+            Concatenated fragments; they are joined once and kept joined for later calls.
+        """
+        if len(self._fragments) > 1:
+            self._fragments = ["".join(self._fragments)]
+        return self._fragments[0] if self._fragments else ""
+
+
+def prompt_opens_thinking(model: Llama, prompt_tokens: List[int]) -> bool:
+    """
+    Check whether a rendered prompt ends inside a reasoning block.
+
+    Args:
+        model: Loaded model used for detokenization.
+        prompt_tokens: Rendered prompt tokens.
+
+    Returns:
+        True if the generation prompt of the chat template opens a <think> block that the model
+        is expected to continue (as the DeepSeek-R1 templates do).
+    """
+    tail = model.detokenize(prompt_tokens[-PROMPT_TAIL_TOKENS:], special=True).decode("utf-8", errors="ignore")
+    return tail.rfind(THINK_OPEN_TAG) > tail.rfind(THINK_CLOSE_TAG)
+
+
+def thinking_suppression_bias(model: Llama) -> Dict[int, float]:
+    """
+    Build a logit bias that keeps the model from opening a reasoning block.
+
+    Args:
+        model: Loaded model whose vocabulary is searched for the think tags.
+
+    Returns:
+        Bias banning the <think> and </think> tokens, or an empty dict if the vocabulary has no
+        single-token think tags (the tags then cannot be banned without banning ordinary text).
+    """
+    bias: Dict[int, float] = { }
+    for tag in (THINK_OPEN_TAG, THINK_CLOSE_TAG):
+        tokens = model.tokenize(tag.encode("utf-8"), add_bos=False, special=True)
+        if len(tokens) == 1:
+            bias[tokens[0]] = float("-inf")
+
+    if not bias:
+        logger.debug("thinking_suppression_bias: Model has no single-token think tags - nothing to suppress")
+    return bias
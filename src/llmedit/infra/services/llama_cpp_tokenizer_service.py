@@ -0,0 +1,153 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple, override
+
+from llmedit.config.predefined_gguf_models import PREDEFINED_GGUF_MODELS
+from llmedit.core.interfaces.llm_model.tokenizer_service import TokenizerService
+from llmedit.core.interfaces.settings.settings_service import SettingsService
+from llmedit.core.models.data_types import GenerationRequest
+from llmedit.core.models.enums.llm_provider_type import LlmProviderType
+from llmedit.infra.services.gguf_model_catalog import GgufModelCatalog
+from llmedit.infra.services.llama_cpp_chat_prompt_renderer import LlamaCppChatPromptRenderer
+from llmedit.infra.services.llama_cpp_vocabulary import LlamaCppVocabulary
+
+logger = logging.getLogger(__name__)
+
+
+class LlamaCppTokenizerService(TokenizerService):
+    """
+    Implementation of TokenizerService using the vocabularies of the GGUF model files.
+
+    Loads the vocabulary of each model file without the weights and keeps it while the file is
+    unchanged. Requests are rendered with the file's chat template, so counts match
+    what llama.cpp evaluates. Counts are unavailable for Ollama models, whose tokenizer lives in
+    the Ollama server.
+    """
+
+    def __init__(
+        self,
+        settings_service: SettingsService,
+        model_folder_path: Path,
+        model_catalog: Optional[GgufModelCatalog] = None,
+    ) -> None:
+        """
+        Initialize tokenizer service.
+
+        Args:
+            settings_service: Service providing the currently selected provider and model.
+            model_folder_path: Directory where GGUF model files are stored.
+            model_catalog: Optional catalog of the model directory, used to resolve models that
+                are not predefined; without it only predefined models are counted.
+        """
+        super().__init__(settings_service)
+        self._model_folder_path = model_folder_path
+        self._model_catalog = model_catalog
+        self._vocabularies: Dict[
+            str,
+            Tuple[int, int, Optional[Tuple[LlamaCppVocabulary, LlamaCppChatPromptRenderer]]],
+        ] = { }
+        self._lock = threading.Lock()
+
+        logger.debug("__init__: Initialized with model folder '%s'", model_folder_path)
+
+    @override
+    def count_text_tokens(self, text: str) -> Optional[int]:
+        """
+        Count the tokens of plain text for the selected model.
+
+        Args:
+            text: Text to count, e.g. the content of the input area.
+
+        Returns:
+            Number of tokens, or None if the selected model is not a downloaded llama.cpp model.
+
+        Notes:
+            Special token markup in the text is counted as plain text, as it is for user input.
+        """
+        vocabulary = self._get_vocabulary()
+        if vocabulary is None:
+            return None
+        if not text:
+            return 0
+        return len(vocabulary[0].tokenize(text.encode("utf-8"), add_bos=False))
+
+    @override
+    def count_request_tokens(self, request: GenerationRequest) -> Optional[int]:
+        """
+        Count the tokens of a request's prompt as the selected model will receive it.
+
+        Args:
+            request: Generation request whose system and user prompts are rendered.
+
+        Returns:
+            Number of prompt tokens, or None if the selected model is not a downloaded llama.cpp model.
+        """
+        vocabulary = self._get_vocabulary()
+        if vocabulary is None:
+            return None
+        rendered = vocabulary[1].render(request.system_prompt, request.user_prompt, request.user_prompt_static_prefix)
+        return len(rendered.tokens)
+
+    @override
+    def get_context_limit(self) -> Optional[int]:
+        """
+        Get the largest context the selected model supports.
+
+        Returns:
+            Trained context length of the model file, or None if the selected model is not a
+            downloaded llama.cpp model.
+        """
+        vocabulary = self._get_vocabulary()
+        if vocabulary is None:
+            return None
+        return vocabulary[0].n_ctx_train()
+
+    def _get_vocabulary(self) -> Optional[Tuple[LlamaCppVocabulary, LlamaCppChatPromptRenderer]]:
+        """
+        Get the vocabulary and prompt renderer of the selected model, loading them on first use.
+
+        Returns:
+            Vocabulary and renderer, or None if the selected model is not a downloaded llama.cpp
+            model or its vocabulary cannot be read.
+
+        Notes:
+            Vocabularies are cached per file size and modification time: a file whose vocabulary
+            failed to load (e.g. an incomplete download) is retried once the file changes.
+        """
+        if self._settings_service.get_llm_provider() != LlmProviderType.LLAMA_CPP:
+            return None
+
+        model = self._settings_service.get_llm_model()
+        if model is None:
+            return None
+
+        if self._model_catalog is not None:
+            model_info = self._model_catalog.find_model_information(model.name)
+        else:
+            model_info = next((info for info in PREDEFINED_GGUF_MODELS if info.name == model.name), None)
+        if model_info is None or not model_info.fileName:
+            return None
+        file_name = model_info.fileName
+
+        with self._lock:
+            model_path = self._model_folder_path / file_name
+            try:
+                stat = model_path.stat()
+            except OSError:
+                logger.debug("_get_vocabulary: Model file '%s' not downloaded", file_name)
+                return None
+
+            cached = self._vocabularies.get(file_name)
+            if cached is not None and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                return cached[2]
+
+            try:
+                vocabulary = LlamaCppVocabulary(model_path)
+                entry = (vocabulary, LlamaCppChatPromptRenderer(vocabulary))
+            except Exception:
+                logger.warning("_get_vocabulary: Token counting unavailable for '%s'", file_name, exc_info=True)
+                entry = None
+
+            self._vocabularies[file_name] = (stat.st_size, stat.st_mtime_ns, entry)
+            return entry
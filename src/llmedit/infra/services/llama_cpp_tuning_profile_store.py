@@ -0,0 +1,167 @@
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_N_BATCH = 512
+DEFAULT_N_UBATCH = 512
+
+
+def available_cpu_count() -> int:
+    """
+    Return the number of logical CPUs usable by this process.
+
+    Returns:
+        CPU count honoring the process affinity mask where the platform supports it.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+@dataclass(frozen=True)
+class LlamaCppTuningProfile:
+    """
+    Immutable data class holding llama.cpp threading and batching parameters for one model.
+
+    Throughput fields are the values measured during calibration; they are zero for the
+    built-in heuristic profile.
+    """
+    n_threads: int
+    n_threads_batch: int
+    n_batch: int
+    n_ubatch: int
+    cpu_count: int
+    prefill_tokens_per_second: float = 0.0
+    decode_tokens_per_second: float = 0.0
+
+
+def default_tuning_profile() -> LlamaCppTuningProfile:
+    """
+    Build a heuristic profile for machines that have not been calibrated.
+
+    Returns:
+        Profile using half of the logical CPUs for decoding and all of them for prompt prefill.
+
+    Notes:
+        Decoding is memory-bandwidth bound and usually peaks around the physical core count,
+        which is approximated as half of the logical CPUs. Prefill is compute bound and scales
+        with all available CPUs.
+    """
+    cpu_count = available_cpu_count()
+    return LlamaCppTuningProfile(
+        n_threads=max(1, cpu_count // 2),
+        n_threads_batch=cpu_count,
+        n_batch=DEFAULT_N_BATCH,
+        n_ubatch=DEFAULT_N_UBATCH,
+        cpu_count=cpu_count,
+    )
+
+
+class LlamaCppTuningProfileStore:
+    """
+    JSON-file store of calibrated llama.cpp tuning profiles, keyed by model file name.
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        """
+        Initialize store backed by the given JSON file.
+
+        Args:
+            file_path: Location of the profiles file. Created on first save.
+        """
+        self._file_path = file_path
+        self._lock = threading.Lock()
+
+        logger.debug("__init__: Initialized tuning profile store at '%s'", self._file_path)
+
+    @property
+    def file_path(self) -> Path:
+        """
+        Get the location of the profiles file.
+
+        Returns:
+            Path of the JSON file, which may not exist yet.
+        """
+        return self._file_path
+
+    def get_profile(self, model_file: str) -> LlamaCppTuningProfile:
+        """
+        Get the profile to use for a model.
+
+        Args:
+            model_file: GGUF file name of the model.
+
+        Returns:
+            The calibrated profile, or the heuristic default if the model was not calibrated
+            on this machine.
+
+        Notes:
+            A stored profile is ignored if it was measured with a different CPU count.
+        """
+        stored = self._read_profiles().get(model_file)
+        if stored is None:
+            logger.debug("get_profile: No calibrated profile for '%s' - using default", model_file)
+            return default_tuning_profile()
+
+        if stored.cpu_count != available_cpu_count():
+            logger.info(
+                "get_profile: Profile for '%s' was calibrated with %d CPUs, now %d - using default",
+                model_file,
+                stored.cpu_count,
+                available_cpu_count(),
+            )
+            return default_tuning_profile()
+
+        logger.debug("get_profile: Using calibrated profile for '%s': %s", model_file, stored)
+        return stored
+
+    def save_profile(self, model_file: str, profile: LlamaCppTuningProfile) -> None:
+        """
+        Persist the profile for a model.
+
+        Args:
+            model_file: GGUF file name of the model.
+            profile: Calibrated profile.
+
+        Raises:
+            RuntimeError: If the profiles file cannot be written.
+        """
+        with self._lock:
+            profiles = self._read_profiles()
+            profiles[model_file] = profile
+            try:
+                self._file_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self._file_path.with_suffix(".tmp")
+                temp_path.write_text(
+                    json.dumps({ name: asdict(value) for name, value in profiles.items() }, indent=2),
+                    encoding="utf-8",
+                )
+                os.replace(temp_path, self._file_path)
+            except Exception as e:
+                logger.error("save_profile: Failed to write '%s'", self._file_path, exc_info=True)
+                raise RuntimeError(f"Failed to save tuning profile: {str(e)}") from e
+
+        logger.info("save_profile: Saved profile for '%s': %s", model_file, profile)
+
+    def _read_profiles(self) -> Dict[str, LlamaCppTuningProfile]:
+        """
+        Read all stored profiles.
+
+        Returns:
+            Mapping of model file name to profile. Empty if the file is missing or invalid.
+        """
+        if not self._file_path.exists():
+            return {}
+
+        try:
+            raw: Dict[str, dict] = json.loads(self._file_path.read_text(encoding="utf-8"))
+            return { name: LlamaCppTuningProfile(**values) for name, values in raw.items() }
+        except Exception:
+            logger.warning("_read_profiles: Ignoring unreadable profiles file '%s'", self._file_path, exc_info=True)
+            return {}
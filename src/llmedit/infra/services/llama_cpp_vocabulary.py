@@ -0,0 +1,135 @@
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import llama_cpp
+from llama_cpp._internals import LlamaModel
+
+logger = logging.getLogger(__name__)
+
+_backend_lock = threading.Lock()
+_backend_initialized = False
+
+
+class LlamaCppVocabulary:
+    """
+    Tokenizer and metadata of a GGUF file, loaded without the model weights.
+
+    Loads the file with llama.cpp's vocab_only option, which reads the header and vocabulary
+    in a fraction of a second and a few megabytes of RAM. Exposes the subset of the Llama API
+    used for tokenizing and chat template rendering, so it can stand in for a loaded model there.
+
+    Notes:
+        Llama(vocab_only=True) cannot be used, since it still creates an inference context,
+        which needs the weights; the model wrapper underneath it is used directly instead.
+    """
+
+    def __init__(self, model_path: Path) -> None:
+        """
+        Load the vocabulary of a GGUF file.
+
+        Args:
+            model_path: Path of the GGUF file.
+
+        Raises:
+            RuntimeError: If the file cannot be read.
+        """
+        _ensure_backend_initialized()
+
+        params = llama_cpp.llama_model_default_params()
+        params.vocab_only = True
+        try:
+            self._model = LlamaModel(path_model=str(model_path.absolute()), params=params, verbose=False)
+        except Exception as e:
+            logger.error("__init__: Failed to load vocabulary of '%s'", model_path, exc_info=True)
+            raise RuntimeError(f"Failed to load vocabulary: {str(e)}") from e
+
+        self._metadata = self._model.metadata()
+        logger.debug(
+            "__init__: Loaded vocabulary of '%s' (%d tokens, n_ctx_train=%d)",
+            model_path.name,
+            self._model.n_vocab(),
+            self._model.n_ctx_train(),
+        )
+
+    @property
+    def metadata(self) -> Dict[str, str]:
+        """
+        Get the GGUF key/value metadata.
+
+        Returns:
+            Metadata as exposed by Llama.metadata.
+        """
+        return self._metadata
+
+    def tokenize(self, text: bytes, add_bos: bool = True, special: bool = False) -> List[int]:
+        """
+        Tokenize text.
+
+        Args:
+            text: UTF-8 encoded text.
+            add_bos: Whether to prepend the BOS token.
+            special: Whether special token markup in the text is parsed into special tokens.
+
+        Returns:
+            List of token ids.
+        """
+        return self._model.tokenize(text, add_bos, special)
+
+    def detokenize(self, tokens: List[int], special: bool = False) -> bytes:
+        """
+        Convert tokens back to text.
+
+        Args:
+            tokens: Token ids.
+            special: Whether special tokens are rendered as text.
+
+        Returns:
+            UTF-8 encoded text.
+        """
+        return self._model.detokenize(tokens, special=special)
+
+    def token_bos(self) -> int:
+        """
+        Get the BOS token id.
+
+        Returns:
+            Token id, or -1 if the model defines none.
+        """
+        return self._model.token_bos()
+
+    def token_eos(self) -> int:
+        """
+        Get the EOS token id.
+
+        Returns:
+            Token id, or -1 if the model defines none.
+        """
+        return self._model.token_eos()
+
+    def n_ctx_train(self) -> int:
+        """
+        Get the context length the model was trained with.
+
+        Returns:
+            Context length in tokens.
+        """
+        return self._model.n_ctx_train()
+
+    def close(self) -> None:
+        """
+        Release the vocabulary.
+        """
+        self._model.close()
+
+
+def _ensure_backend_initialized() -> None:
+    """
+    Initialize the llama.cpp backend once per process, as Llama does on first use.
+    """
+    global _backend_initialized
+    with _backend_lock:
+        if not _backend_initialized:
+            llama_cpp.llama_backend_init()
+            _backend_initialized = True
@@ -0,0 +1,653 @@
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from llmedit.core.interfaces.llm_model.model_service import GenerationCancelledError
+from llmedit.core.models.data_types import (CancellationToken, GenerationRequest, GenerationResponse, LoadProgressCallback,
+                                            TextDeltaCallback, VariantTextDeltaCallback)
+from llmedit.core.models.enums.kv_cache_type import KvCacheType
+from llmedit.core.models.enums.memory_policy import MemoryPolicy
+from llmedit.core.models.enums.speculative_decoding_mode import SpeculativeDecodingMode
+from llmedit.core.models.settings import ModelInformation
+from llmedit.infra.services.llama_cpp_loaded_model import LlamaCppLoadedModel, model_file_version
+from llmedit.infra.services.llama_cpp_model_service import LlamaCppModelService
+from llmedit.infra.services.llama_cpp_tuning_profile_store import LlamaCppTuningProfileStore
+from llmedit.infra.services.prompt_prefix_cache import PromptPrefixCache
+from llmedit.infra.services.prompt_state_snapshot_store import PromptStateSnapshotStore
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_READY = "ready"
+MESSAGE_PROGRESS = "progress"
+MESSAGE_GENERATE = "generate"
+MESSAGE_GENERATE_VARIANTS = "generate_variants"
+MESSAGE_DELTA = "delta"
+MESSAGE_DONE = "done"
+MESSAGE_ERROR = "error"
+MESSAGE_INTERRUPTED = "interrupted"
+MESSAGE_STOP = "stop"
+
+WORKER_STOP_TIMEOUT_SECONDS = 10.0
+IDLE_WORKER_POLL_SECONDS = 1.0
+CANCEL_POLL_SECONDS = 0.05
+"""How often a caller waiting for a worker checks whether its generation was cancelled."""
+WORKER_INTERRUPT_GRACE_SECONDS = 1.0
+"""How long an interrupted worker may take to stop before it is killed and restarted."""
+LOAD_PROGRESS_STEP = 0.01
+"""Smallest advance of a worker's loading progress that is reported to the parent."""
+
+
+@dataclass(frozen=True)
+class LlamaCppWorkerSpec:
+    """
+    Immutable data class describing how a worker process loads its model.
+
+    Mirrors the options of LlamaCppLoadedModel; the stores are passed by location, since each
+    worker process opens its own. n_threads caps the threads of each worker.
+    """
+    model_folder_path: Path
+    file_name: str
+    speculative_decoding: SpeculativeDecodingMode
+    draft_model_file: str
+    memory_policy: Optional[MemoryPolicy]
+    kv_cache_type: KvCacheType
+    flash_attention: bool
+    n_threads: int
+    tuning_profile_file: Optional[Path] = None
+    prompt_cache_directory: Optional[Path] = None
+    prompt_cache_capacity_bytes: int = 0
+    log_level: int = logging.WARNING
+
+
+@dataclass
+class _Worker:
+    """
+    Parent-side handle of one worker process.
+
+    interrupt is set by the parent to make the worker abandon its current generation.
+    load_progress is the last loading progress the worker reported, between 0.0 and 1.0.
+    """
+    index: int
+    process: Any
+    connection: Connection
+    interrupt: Any
+    memory_bytes: int = 0
+    load_progress: float = 0.0
+
+
+class LlamaCppWorkerPool:
+    """
+    Pool of worker processes that each load one GGUF file and generate independently.
+
+    One llama.cpp context generates one sequence at a time and does not use all cores of a large
+    machine, so requests that do not depend on each other (chunks of a document, variants of a
+    task) are spread over several processes. Requests are handed to the next idle worker;
+    callers block until their response is complete and receive the streamed fragments on their
+    own thread.
+
+    Notes:
+        Workers are started with the spawn method, so they do not inherit Qt or llama.cpp state
+        from the application process, and a crash in native code only takes down the worker.
+        The pool supervises its workers: a worker that exits is replaced by a new one that
+        reloads the model, while the request it was serving fails. Model profiles sharing the
+        file share the pool; each request carries its profile. Messages are pickled tuples of a
+        short kind and a payload sent over one pipe per worker.
+    """
+
+    def __init__(self, spec: LlamaCppWorkerSpec, worker_count: int) -> None:
+        """
+        Initialize pool; no process is started yet.
+
+        Args:
+            spec: How each worker loads the model.
+            worker_count: Number of worker processes.
+        """
+        self._spec = spec
+        self._worker_count = worker_count
+        self._workers: List[_Worker] = []
+        self._idle: queue.Queue = queue.Queue()
+        self._restarting = 0
+        self._generation = 0
+        self._lock = threading.RLock()
+
+        logger.debug(
+            "__init__: Initialized pool of %d workers for '%s' (%d threads each)",
+            worker_count,
+            spec.file_name,
+            spec.n_threads,
+        )
+
+    @property
+    def worker_count(self) -> int:
+        """
+        Get the number of worker processes the pool runs.
+
+        Returns:
+            Configured number of workers.
+        """
+        return self._worker_count
+
+    def is_running(self) -> bool:
+        """
+        Check if the workers are started and have loaded the model.
+
+        Returns:
+            True if at least one worker is available or being restarted, False otherwise.
+        """
+        return bool(self._workers) or self._restarting > 0
+
+    def file_version(self) -> str:
+        """
+        Identify the current contents of the GGUF file the workers load.
+
+        Returns:
+            Version of the file, see model_file_version().
+        """
+        return model_file_version(self._spec.model_folder_path / self._spec.file_name)
+
+    def estimate_memory_bytes(self) -> int:
+        """
+        Estimate RAM used by all workers together.
+
+        Returns:
+            Size of the weights, counted once since the workers map the same file, plus the
+            context buffers each worker reported after loading.
+        """
+        weights_bytes = self._weights_bytes()
+        return weights_bytes + sum(max(0, worker.memory_bytes - weights_bytes) for worker in self._workers)
+
+    def start(self, on_progress: Optional[LoadProgressCallback] = None) -> None:
+        """
+        Start the worker processes and wait until each has loaded the model.
+
+        Args:
+            on_progress: Optional callback receiving the loading progress of the workers,
+                averaged over all workers, between 0.0 and 1.0.
+
+        Raises:
+            RuntimeError: If a worker fails to start or to load the model; all workers are stopped.
+
+        Notes:
+            Workers load concurrently and forward llama.cpp's loading progress over their pipes.
+            Does nothing if the pool is already running.
+        """
+        with self._lock:
+            if self._workers or self._restarting:
+                logger.debug("start: Pool already running - skipping start")
+                return
+
+            workers: List[_Worker] = []
+            try:
+                for index in range(self._worker_count):
+                    workers.append(self._spawn_worker(index))
+
+                loading = { worker.connection: worker for worker in workers }
+                while loading:
+                    for connection in multiprocessing.connection.wait(list(loading)):
+                        if self._receive_load_message(loading[connection]):
+                            del loading[connection]
+                    if on_progress is not None:
+                        on_progress(sum(worker.load_progress for worker in workers) / len(workers))
+            except Exception as e:
+                logger.error("start: Failed to start workers for '%s'", self._spec.file_name, exc_info=True)
+                self._stop_workers(workers)
+                raise RuntimeError(f"Failed to start inference workers: {str(e)}") from e
+
+            self._workers = workers
+            self._idle = queue.Queue()
+            for worker in workers:
+                self._idle.put(worker)
+
+            logger.info(
+                "start: %d workers loaded '%s' (%d threads each, ~%.1f GiB in total)",
+                len(workers),
+                self._spec.file_name,
+                self._spec.n_threads,
+                self.estimate_memory_bytes() / (1024 ** 3),
+            )
+
+    def stop(self) -> None:
+        """
+        Stop all worker processes.
+
+        Notes:
+            Workers finish their current message; workers that do not exit in time are terminated.
+            Workers being restarted are stopped once they are ready. Safe to call if the pool is
+            not running.
+        """
+        with self._lock:
+            workers, self._workers = self._workers, []
+            self._idle = queue.Queue()
+            self._restarting = 0
+            self._generation += 1
+        self._stop_workers(workers)
+
+    def generate(
+        self,
+        model_information: ModelInformation,
+        request: GenerationRequest,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> GenerationResponse:
+        """
+        Generate a response on the next idle worker.
+
+        Args:
+            model_information: Profile the worker generates with.
+            request: Generation request.
+            on_text_delta: Optional callback receiving the streamed fragments on the calling thread.
+            is_cancelled: Optional predicate polled while waiting for the worker; once it returns
+                True, the generation is interrupted.
+
+        Returns:
+            Response generated by the worker.
+
+        Raises:
+            GenerationCancelledError: If the generation was cancelled.
+            RuntimeError: If the pool is not running, the generation fails, or the worker exits.
+
+        Notes:
+            Blocks until a worker is idle. A cancelled worker stops at its next generated token;
+            if it does not stop within WORKER_INTERRUPT_GRACE_SECONDS (e.g. while evaluating a
+            long prompt), it is killed and restarted. A worker whose process exits is restarted.
+        """
+        return self._exchange((MESSAGE_GENERATE, (model_information, request)), on_text_delta, is_cancelled)
+
+    def generate_variants(
+        self,
+        model_information: ModelInformation,
+        requests: List[GenerationRequest],
+        on_text_delta: Optional[VariantTextDeltaCallback] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> List[GenerationResponse]:
+        """
+        Generate several variants of one task one after another on the next idle worker.
+
+        Args:
+            model_information: Profile the worker generates with.
+            requests: One request per variant.
+            on_text_delta: Optional callback receiving the variant index and each fragment.
+            is_cancelled: Optional predicate, see generate().
+
+        Returns:
+            One response per request, in request order.
+
+        Raises:
+            GenerationCancelledError: If the generation was cancelled.
+            RuntimeError: If the pool is not running, the generation fails, or the worker exits.
+
+        Notes:
+            The worker uses LlamaCppModelService.generate_variant_responses(), so the prompt part
+            shared by the variants is evaluated once.
+        """
+        on_delta = None
+        if on_text_delta is not None:
+            on_delta = lambda payload: on_text_delta(*payload)
+        return self._exchange((MESSAGE_GENERATE_VARIANTS, (model_information, requests)), on_delta, is_cancelled)
+
+    def _exchange(
+        self,
+        message: Tuple[str, Any],
+        on_delta: Optional[Callable[[Any], None]],
+        is_cancelled: Optional[Callable[[], bool]],
+    ) -> Any:
+        """
+        Send a generation message to the next idle worker and wait for its result.
+
+        Args:
+            message: MESSAGE_GENERATE or MESSAGE_GENERATE_VARIANTS message.
+            on_delta: Optional callback receiving the payload of every MESSAGE_DELTA.
+            is_cancelled: Optional predicate polled while waiting for the worker.
+
+        Returns:
+            Payload of the MESSAGE_DONE reply.
+
+        Raises:
+            GenerationCancelledError: If the generation was cancelled, also while waiting for an
+                idle worker or if the worker finished after being interrupted.
+            RuntimeError: If the generation fails or the worker exits.
+        """
+        worker = self._acquire_worker(is_cancelled)
+        healthy = True
+        try:
+            worker.interrupt.clear()
+            worker.connection.send(message)
+            interrupted_at: Optional[float] = None
+            while True:
+                if interrupted_at is None and is_cancelled is not None and is_cancelled():
+                    logger.info("_exchange: Interrupting worker %d", worker.index)
+                    worker.interrupt.set()
+                    interrupted_at = time.monotonic()
+
+                if not worker.connection.poll(CANCEL_POLL_SECONDS):
+                    if interrupted_at is not None and time.monotonic() - interrupted_at > WORKER_INTERRUPT_GRACE_SECONDS:
+                        logger.warning("_exchange: Worker %d did not stop in time - killing it", worker.index)
+                        healthy = False
+                        worker.process.kill()
+                        raise GenerationCancelledError("Generation cancelled")
+                    continue
+
+                kind, payload = worker.connection.recv()
+                if kind == MESSAGE_DELTA:
+                    if on_delta is not None and interrupted_at is None:
+                        on_delta(payload)
+                elif kind == MESSAGE_DONE:
+                    if interrupted_at is not None:
+                        # Finished before it saw the interrupt; the caller asked for no result
+                        raise GenerationCancelledError("Generation cancelled")
+                    return payload
+                elif kind == MESSAGE_INTERRUPTED:
+                    raise GenerationCancelledError("Generation cancelled")
+                else:
+                    raise RuntimeError(payload)
+        except (EOFError, OSError) as e:
+            healthy = False
+            logger.error("_exchange: Worker %d exited during generation", worker.index, exc_info=True)
+            raise RuntimeError(f"Inference worker {worker.index} exited: {str(e)}") from e
+        finally:
+            self._release_worker(worker, healthy)
+
+    def _acquire_worker(self, is_cancelled: Optional[Callable[[], bool]] = None) -> _Worker:
+        """
+        Take the next idle worker, waiting for one if all are busy.
+
+        Args:
+            is_cancelled: Optional predicate polled while waiting; once it returns True, the
+                caller stops waiting.
+
+        Returns:
+            Idle worker, now reserved for the caller.
+
+        Raises:
+            GenerationCancelledError: If is_cancelled returned True before a worker was idle.
+            RuntimeError: If the pool has no workers left and none is restarting.
+        """
+        while True:
+            if is_cancelled is not None and is_cancelled():
+                logger.info("_acquire_worker: Cancelled while waiting for an idle worker")
+                raise GenerationCancelledError("Generation cancelled")
+            with self._lock:
+                if not self._workers and not self._restarting:
+                    raise RuntimeError("Inference workers are not running")
+                idle = self._idle
+            try:
+                return idle.get(timeout=CANCEL_POLL_SECONDS if is_cancelled is not None else IDLE_WORKER_POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+    def _release_worker(self, worker: _Worker, healthy: bool) -> None:
+        """
+        Return a worker to the pool, or replace it if its process exited or was killed.
+
+        Args:
+            worker: Worker reserved by _acquire_worker.
+            healthy: Whether the worker can take further requests.
+
+        Notes:
+            The replacement loads the model on a background thread and joins the idle workers
+            once it is ready; callers waiting for a worker meanwhile wait for it.
+        """
+        with self._lock:
+            if worker not in self._workers:
+                return
+            if healthy:
+                self._idle.put(worker)
+                return
+            self._workers.remove(worker)
+            self._restarting += 1
+            generation = self._generation
+
+        logger.warning("_release_worker: Restarting worker %d", worker.index)
+        self._stop_workers([worker])
+        threading.Thread(
+            target=self._restart_worker,
+            args=(worker.index, generation),
+            name=f"llama-cpp-worker-{worker.index}-restart",
+            daemon=True,
+        ).start()
+
+    def _restart_worker(self, index: int, generation: int) -> None:
+        """
+        Start a replacement worker and add it to the pool once it has loaded the model.
+
+        Args:
+            index: Index of the replaced worker.
+            generation: Value of the stop counter when the restart was requested.
+
+        Notes:
+            If the replacement fails to load, the pool continues with fewer workers. If the pool
+            was stopped meanwhile, the replacement is stopped too.
+        """
+        worker: Optional[_Worker] = None
+        try:
+            worker = self._spawn_worker(index)
+            self._await_ready(worker)
+        except Exception:
+            logger.error("_restart_worker: Worker %d failed to reload the model", index, exc_info=True)
+            if worker is not None:
+                self._stop_workers([worker])
+            worker = None
+
+        with self._lock:
+            current = generation == self._generation
+            if current:
+                self._restarting -= 1
+                if worker is not None:
+                    self._workers.append(worker)
+                    self._idle.put(worker)
+        if worker is None:
+            return
+        if not current:
+            self._stop_workers([worker])
+            return
+        logger.info("_restart_worker: Worker %d restarted", index)
+
+    def _spawn_worker(self, index: int) -> _Worker:
+        """
+        Start a worker process without waiting for it to load the model.
+
+        Args:
+            index: Index of the worker, used in its process name.
+
+        Returns:
+            Handle of the started worker.
+        """
+        context = multiprocessing.get_context("spawn")
+        parent_connection, child_connection = context.Pipe()
+        interrupt = context.Event()
+        process = context.Process(
+            target=run_worker,
+            args=(self._spec, child_connection, interrupt),
+            name=f"llama-cpp-worker-{index}",
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        return _Worker(index=index, process=process, connection=parent_connection, interrupt=interrupt)
+
+    def _await_ready(self, worker: _Worker) -> None:
+        """
+        Wait until a worker has loaded the model.
+
+        Args:
+            worker: Started worker.
+
+        Raises:
+            RuntimeError: If the worker reports a loading error.
+            EOFError: If the worker exits before it is ready.
+        """
+        while not self._receive_load_message(worker):
+            pass
+
+    @staticmethod
+    def _receive_load_message(worker: _Worker) -> bool:
+        """
+        Receive one message of a loading worker.
+
+        Args:
+            worker: Started worker.
+
+        Returns:
+            True once the worker has loaded the model; False after a progress message.
+
+        Raises:
+            RuntimeError: If the worker reports a loading error.
+            EOFError: If the worker exits before it is ready.
+        """
+        kind, payload = worker.connection.recv()
+        if kind == MESSAGE_PROGRESS:
+            worker.load_progress = payload
+            return False
+        if kind != MESSAGE_READY:
+            raise RuntimeError(payload)
+        worker.memory_bytes = payload
+        worker.load_progress = 1.0
+        return True
+
+    def _weights_bytes(self) -> int:
+        """
+        Get the size of the model files every worker maps.
+
+        Returns:
+            Size of the GGUF file plus the draft model file, if one is paired; 0 for missing files.
+        """
+        file_names = [self._spec.file_name]
+        if self._spec.speculative_decoding == SpeculativeDecodingMode.DRAFT_MODEL and self._spec.draft_model_file:
+            file_names.append(self._spec.draft_model_file)
+
+        total = 0
+        for file_name in file_names:
+            path = self._spec.model_folder_path / file_name
+            if path.exists():
+                total += path.stat().st_size
+        return total
+
+    @staticmethod
+    def _stop_workers(workers: List[_Worker]) -> None:
+        """
+        Ask worker processes to exit and wait for them, terminating those that do not.
+
+        Args:
+            workers: Workers to stop.
+        """
+        for worker in workers:
+            try:
+                worker.connection.send((MESSAGE_STOP, None))
+            except (OSError, ValueError):
+                pass
+
+        for worker in workers:
+            worker.process.join(WORKER_STOP_TIMEOUT_SECONDS)
+            if worker.process.is_alive():
+                logger.warning("_stop_workers: Worker %d did not exit - terminating", worker.index)
+                worker.process.terminate()
+                worker.process.join()
+            worker.connection.close()
+
+
+def run_worker(spec: LlamaCppWorkerSpec, connection: Connection, interrupt: Any) -> None:
+    """
+    Entry point of a worker process: load the model and serve generation requests.
+
+    Args:
+        spec: How to load the model.
+        connection: Pipe to the parent process.
+        interrupt: Event the parent sets to interrupt the current generation.
+
+    Notes:
+        Sends (MESSAGE_PROGRESS, fraction) while loading, whenever llama.cpp's loading progress
+        advanced by LOAD_PROGRESS_STEP, then (MESSAGE_READY, estimated memory bytes) after
+        loading, or (MESSAGE_ERROR, message) if loading fails. Each (MESSAGE_GENERATE, (model information, request)) message is answered
+        with any number of MESSAGE_DELTA messages followed by MESSAGE_DONE, MESSAGE_INTERRUPTED
+        or MESSAGE_ERROR. MESSAGE_GENERATE_VARIANTS carries a list of requests instead; its deltas
+        are (variant index, fragment) pairs and its result is the list of responses. The interrupt
+        event backs the cancellation token of every generation, so llama.cpp checks it after every
+        generated token.
+        Exits on MESSAGE_STOP or when the parent closes the pipe.
+    """
+    logging.basicConfig(level=spec.log_level, format="%(processName)s %(name)s: %(message)s")
+
+    prompt_prefix_cache = None
+    if spec.prompt_cache_directory is not None:
+        prompt_prefix_cache = PromptPrefixCache(
+            capacity_bytes=spec.prompt_cache_capacity_bytes,
+            snapshot_store=PromptStateSnapshotStore(directory=spec.prompt_cache_directory),
+        )
+
+    loaded_model = LlamaCppLoadedModel(
+        model_folder_path=spec.model_folder_path,
+        file_name=spec.file_name,
+        speculative_decoding=spec.speculative_decoding,
+        draft_model_file=spec.draft_model_file,
+        prompt_prefix_cache=prompt_prefix_cache,
+        tuning_profile_store=LlamaCppTuningProfileStore(spec.tuning_profile_file) if spec.tuning_profile_file else None,
+        memory_policy=spec.memory_policy,
+        kv_cache_type=spec.kv_cache_type,
+        flash_attention=spec.flash_attention,
+        max_threads=spec.n_threads,
+    )
+
+    reported_progress = 0.0
+
+    def send_progress(progress: float) -> None:
+        nonlocal reported_progress
+        if progress - reported_progress >= LOAD_PROGRESS_STEP or (progress >= 1.0 > reported_progress):
+            reported_progress = progress
+            connection.send((MESSAGE_PROGRESS, progress))
+
+    try:
+        loaded_model.load(on_progress=send_progress)
+    except Exception as e:
+        connection.send((MESSAGE_ERROR, str(e)))
+        connection.close()
+        return
+    connection.send((MESSAGE_READY, loaded_model.estimate_memory_bytes()))
+
+    def send_delta(delta: Any) -> None:
+        connection.send((MESSAGE_DELTA, delta))
+
+    def send_variant_delta(index: int, delta: str) -> None:
+        send_delta((index, delta))
+
+    cancellation_token = CancellationToken(interrupt)
+    services: Dict[str, LlamaCppModelService] = { }
+    try:
+        while True:
+            try:
+                kind, payload = connection.recv()
+            except EOFError:
+                break
+            if kind == MESSAGE_STOP:
+                break
+
+            model_information, request = payload
+            service = services.get(model_information.name)
+            if service is None:
+                service = LlamaCppModelService(model_information=model_information, loaded_model=loaded_model)
+                services[model_information.name] = service
+
+            message: Tuple[str, Any]
+            try:
+                if kind == MESSAGE_GENERATE_VARIANTS:
+                    message = (
+                        MESSAGE_DONE,
+                        service.generate_variant_responses(request, send_variant_delta, cancellation_token),
+                    )
+                else:
+                    message = (MESSAGE_DONE, service.generate_response(request, send_delta, cancellation_token))
+            except GenerationCancelledError:
+                logger.info("run_worker: Generation interrupted")
+                message = (MESSAGE_INTERRUPTED, None)
+            except Exception as e:
+                logger.error("run_worker: Generation failed", exc_info=True)
+                message = (MESSAGE_ERROR, f"Failed to generate response: {str(e)}")
+            connection.send(message)
+    finally:
+        loaded_model.unload()
+        connection.close()
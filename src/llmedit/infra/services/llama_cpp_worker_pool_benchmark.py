@@ -0,0 +1,187 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from llmedit.config.kv_cache import FLASH_ATTENTION, KV_CACHE_TYPE
+from llmedit.core.models.data_types import GenerationRequest, GenerationResponse, OutputBudget
+from llmedit.core.models.enums.speculative_decoding_mode import SpeculativeDecodingMode
+from llmedit.core.models.settings import ModelInformation
+from llmedit.infra.services.llama_cpp_kv_cache_benchmark import BENCHMARK_CORPUS
+from llmedit.infra.services.llama_cpp_tuning_profile_store import available_cpu_count
+from llmedit.infra.services.llama_cpp_worker_pool import LlamaCppWorkerPool, LlamaCppWorkerSpec
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_POOL_REQUESTS = 8
+BENCHMARK_POOL_DECODE_TOKENS = 128
+BENCHMARK_SYSTEM_PROMPT = "Proofread the text you are given. Return only the corrected text."
+
+
+@dataclass(frozen=True)
+class WorkerPoolBenchmarkResult:
+    """
+    Immutable data class with the measurements for one worker count.
+
+    tokens_per_second is the number of generated tokens of all requests divided by the wall time
+    from submitting the first request to receiving the last response; error is set if the worker
+    count could not be measured.
+    """
+    worker_count: int
+    threads_per_worker: int
+    load_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    generated_tokens: int = 0
+    tokens_per_second: float = 0.0
+    error: str = ''
+
+
+class LlamaCppWorkerPoolBenchmark:
+    """
+    Measures the throughput of llama.cpp worker pools of increasing size on independent requests.
+
+    Every worker count runs the same batch of requests, each proofreading a different sentence
+    of a fixed corpus with greedy decoding and a fixed output length, so the results show how
+    throughput scales with the number of workers on the local machine.
+    """
+
+    def __init__(self, model_folder_path: Path, model_information: ModelInformation) -> None:
+        """
+        Initialize benchmark.
+
+        Args:
+            model_folder_path: Directory where GGUF model files are stored.
+            model_information: Profile whose file, prompt formatting and KV cache options are used.
+        """
+        self._model_folder_path = model_folder_path
+        self._model_information = model_information
+
+    @staticmethod
+    def worker_counts() -> List[int]:
+        """
+        List the worker counts to measure.
+
+        Returns:
+            Powers of two from 1 up to half the CPU count, since a worker needs at least two
+            threads to be useful.
+        """
+        counts = [1]
+        while counts[-1] * 2 <= max(1, available_cpu_count() // 2):
+            counts.append(counts[-1] * 2)
+        return counts
+
+    def run(self, worker_counts: Optional[Sequence[int]] = None) -> List[WorkerPoolBenchmarkResult]:
+        """
+        Measure all worker counts.
+
+        Args:
+            worker_counts: Worker counts to measure; all of worker_counts() if not given.
+
+        Returns:
+            One result per worker count, in order. Counts that fail (e.g. out of memory) are
+            reported with an error instead of failing the run.
+        """
+        requests = self._requests()
+        results: List[WorkerPoolBenchmarkResult] = []
+        for worker_count in worker_counts or self.worker_counts():
+            threads_per_worker = max(1, available_cpu_count() // worker_count)
+            logger.info("run: Measuring %d workers with %d threads each", worker_count, threads_per_worker)
+            try:
+                result = self._measure(worker_count, threads_per_worker, requests)
+            except Exception as e:
+                logger.warning("run: Failed to measure %d workers", worker_count, exc_info=True)
+                results.append(WorkerPoolBenchmarkResult(worker_count, threads_per_worker, error=str(e)))
+                continue
+
+            logger.info(
+                "run: %d workers - %d tokens in %.1f s, %.1f tok/s",
+                worker_count,
+                result.generated_tokens,
+                result.elapsed_seconds,
+                result.tokens_per_second,
+            )
+            results.append(result)
+        return results
+
+    def _measure(
+        self,
+        worker_count: int,
+        threads_per_worker: int,
+        requests: List[GenerationRequest],
+    ) -> WorkerPoolBenchmarkResult:
+        """
+        Start a pool of the given size and run the request batch on it.
+
+        Args:
+            worker_count: Number of worker processes.
+            threads_per_worker: Threads each worker may use.
+            requests: Requests to run.
+
+        Returns:
+            Measurements of this worker count.
+        """
+        model_info = self._model_information
+        pool = LlamaCppWorkerPool(
+            spec=LlamaCppWorkerSpec(
+                model_folder_path=self._model_folder_path,
+                file_name=model_info.fileName,
+                speculative_decoding=SpeculativeDecodingMode.NONE,
+                draft_model_file='',
+                memory_policy=model_info.memory_policy,
+                kv_cache_type=model_info.kv_cache_type or KV_CACHE_TYPE,
+                flash_attention=model_info.flash_attention if model_info.flash_attention is not None else FLASH_ATTENTION,
+                n_threads=threads_per_worker,
+            ),
+            worker_count=worker_count,
+        )
+        try:
+            started = time.perf_counter()
+            pool.start()
+            load_seconds = time.perf_counter() - started
+
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=worker_count) as executor:
+                responses: List[GenerationResponse] = list(
+                    executor.map(lambda request: pool.generate(model_info, request), requests)
+                )
+            elapsed = time.perf_counter() - started
+
+            generated_tokens = sum(
+                int(response.metadata.get("thinking_tokens", "0")) + int(response.metadata.get("answer_tokens", "0"))
+                for response in responses
+            )
+            return WorkerPoolBenchmarkResult(
+                worker_count=worker_count,
+                threads_per_worker=threads_per_worker,
+                load_seconds=load_seconds,
+                elapsed_seconds=elapsed,
+                generated_tokens=generated_tokens,
+                tokens_per_second=generated_tokens / elapsed if elapsed > 0 else 0.0,
+            )
+        finally:
+            pool.stop()
+
+    def _requests(self) -> List[GenerationRequest]:
+        """
+        Build the request batch.
+
+        Returns:
+            BENCHMARK_POOL_REQUESTS greedy requests, each proofreading one sentence of the corpus.
+        """
+        sentences = [sentence.strip() + "." for sentence in BENCHMARK_CORPUS.split(". ") if sentence.strip()]
+        model_info = self._model_information
+        return [
+            GenerationRequest(
+                system_prompt=model_info.system_prompt_prefix + BENCHMARK_SYSTEM_PROMPT,
+                user_prompt="\n".join([model_info.user_prompt_prefix, sentences[index % len(sentences)], model_info.user_prompt_suffix]),
+                temperature=0.0,
+                top_k=model_info.top_k,
+                top_p=model_info.top_p,
+                min_p=model_info.min_p,
+                user_input_text=sentences[index % len(sentences)],
+                output_budget=OutputBudget(input_ratio=0.0, min_tokens=BENCHMARK_POOL_DECODE_TOKENS),
+            )
+            for index in range(BENCHMARK_POOL_REQUESTS)
+        ]
@@ -1,14 +1,19 @@
 import logging
-from typing import override
+import math
+from typing import List, Optional, override
 
 import ollama
 
-from llmedit.core.interfaces.llm_model.model_service import ModelService
-from llmedit.core.models.data_types import GenerationRequest, GenerationResponse
+from llmedit.core.interfaces.llm_model.model_service import GenerationCancelledError, ModelService
+from llmedit.core.models.data_types import (CancellationToken, GenerationRequest, GenerationResponse, LoadProgressCallback,
+                                            TextDeltaCallback, VariantTextDeltaCallback)
 from llmedit.core.models.settings import ModelInformation
+from llmedit.infra.services.repetition_detector import RepetitionDetector
 
 logger = logging.getLogger(__name__)
 
+ESTIMATED_CHARS_PER_TOKEN = 4
+
 
 class OllamaModelService(ModelService):
     """
@@ -52,6 +57,26 @@ class OllamaModelService(ModelService):
         )
         return self._model_information
 
+    @override
+    def get_model_version(self) -> str:
+        """
+        Identify the weights the model currently generates with.
+
+        Returns:
+            Always empty, since Ollama manages the model files itself.
+        """
+        return ''
+
+    @override
+    def estimate_memory_bytes(self) -> int:
+        """
+        Estimate RAM used by the model in this process.
+
+        Returns:
+            Always 0, since Ollama hosts the model in its own process.
+        """
+        return 0
+
     @override
     def is_model_loaded(self) -> bool:
         """
@@ -90,10 +115,13 @@ class OllamaModelService(ModelService):
             return False
 
     @override
-    def load_model(self) -> None:
+    def load_model(self, on_progress: Optional[LoadProgressCallback] = None) -> None:
         """
         No-op for Ollama (models managed externally).
 
+        Args:
+            on_progress: Ignored; Ollama does not report loading progress.
+
         Notes:
             Model loading is handled by the Ollama service.
             This method exists to satisfy the ModelService interface but does nothing.
@@ -116,22 +144,47 @@ class OllamaModelService(ModelService):
         )
 
     @override
-    def generate_response(self, request: GenerationRequest) -> GenerationResponse:
+    def max_parallel_requests(self) -> int:
+        """
+        Get how many requests the service can generate at the same time.
+
+        Returns:
+            Always 1.
+
+        Notes:
+            Requests are sent one after another; the Ollama server decides about its own parallelism.
+        """
+        return 1
+
+    @override
+    def generate_response(
+        self,
+        request: GenerationRequest,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> GenerationResponse:
         """
         Generate response using Ollama API.
 
         Args:
             request: Contains system prompt, user prompt, and generation parameters.
+            on_text_delta: Optional callback receiving each generated text fragment.
+            cancellation_token: Optional token checked after every streamed fragment.
 
         Returns:
             GenerationResponse with the generated text content and metadata.
 
         Raises:
+            GenerationCancelledError: If the cancellation token was cancelled.
             RuntimeError: If generation fails due to connection issues or invalid input.
 
         Notes:
-            Uses ollama.chat() to generate responses with the specified model.
-            Strips whitespace from the generated response.
+            Uses ollama.chat() in streaming mode so fragments are forwarded as soon as they arrive.
+            The output length is limited by the request's output budget; the input token count is
+            estimated from the character count, since Ollama does not expose its tokenizer.
+            Generation is aborted early if the output starts looping. On cancellation the stream is
+            closed, which drops the HTTP connection and makes the server stop generating.
+            Strips whitespace from the accumulated response.
         """
         logger.debug(
             "generate_response: Starting generation for model '%s' - system_len=%d, user_len=%d, temp=%.2f",
@@ -147,30 +200,64 @@ class OllamaModelService(ModelService):
                 { "role": "user", "content": request.user_prompt }
             ]
 
-            response = ollama.chat(
+            options: dict[str, float | int] = { "temperature": request.temperature }
+            if request.seed is not None:
+                options["seed"] = request.seed
+            max_tokens = self._resolve_max_tokens(request)
+            if max_tokens is not None:
+                options["num_predict"] = max_tokens
+
+            stream = ollama.chat(
                 model=self._model_information.name,
                 messages=messages,
-                options={ "temperature": request.temperature },
+                options=options,
+                stream=True,
             )
 
-            generated_text = response["message"]["content"].strip()
+            repetition_detector = RepetitionDetector(reference_text=request.user_input_text)
+            fragments: list[str] = []
+            finish_reason = ""
+            for chunk in stream:
+                if cancellation_token is not None and cancellation_token.is_cancelled():
+                    stream.close()
+                    logger.info("generate_response: Generation cancelled after %d fragments", len(fragments))
+                    raise GenerationCancelledError("Generation cancelled")
+                delta = chunk["message"]["content"]
+                if delta:
+                    fragments.append(delta)
+                    if on_text_delta is not None:
+                        on_text_delta(delta)
+                    if repetition_detector.feed(delta):
+                        finish_reason = "repetition"
+                        stream.close()
+                        break
+                if chunk.get("done"):
+                    finish_reason = chunk.get("done_reason") or ""
+
+            generated_text = repetition_detector.trim("".join(fragments)).strip()
+            truncated = finish_reason in ("length", "repetition")
             char_count = len(generated_text)
 
             logger.info(
-                "generate_response: Generated %d characters for model '%s'",
+                "generate_response: Generated %d characters for model '%s' (finish_reason=%s)",
                 char_count,
                 self._model_information.name,
+                finish_reason or "unknown",
             )
 
             return GenerationResponse(
                 text_content=generated_text,
                 metadata={
                     "model_name": self._model_information.name,
-                    "character_count": char_count
+                    "character_count": char_count,
+                    "finish_reason": finish_reason,
+                    "truncated": str(truncated).lower(),
                 },
                 original_request=request,
             )
 
+        except GenerationCancelledError:
+            raise
         except Exception as e:
             logger.error(
                 "generate_response: Generation failed for model '%s'",
@@ -178,3 +265,59 @@ class OllamaModelService(ModelService):
                 exc_info=True,
             )
             raise RuntimeError(f"Failed to generate response: {str(e)}") from e
+
+    @override
+    def generate_variant_responses(
+        self,
+        requests: List[GenerationRequest],
+        on_text_delta: Optional[VariantTextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[GenerationResponse]:
+        """
+        Generate responses for several variants of one task.
+
+        Args:
+            requests: One request per variant.
+            on_text_delta: Optional callback receiving the variant index and each text fragment.
+            cancellation_token: Optional token checked after every streamed fragment.
+
+        Returns:
+            One GenerationResponse per request, in request order.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled.
+            RuntimeError: If generation fails for any variant.
+
+        Notes:
+            Runs the requests one after another; the Ollama server reuses the cached prompt
+            prefix between consecutive requests on its own.
+        """
+        responses: List[GenerationResponse] = []
+        for index, request in enumerate(requests):
+            variant_callback = None
+            if on_text_delta is not None:
+                variant_callback = lambda delta, variant=index: on_text_delta(variant, delta)
+            responses.append(self.generate_response(request, variant_callback, cancellation_token))
+        return responses
+
+    def _resolve_max_tokens(self, request: GenerationRequest) -> Optional[int]:
+        """
+        Compute the maximum number of tokens to generate for a request.
+
+        Args:
+            request: Generation request carrying the user input and output budget.
+
+        Returns:
+            Token limit from the request's output budget, or None to let Ollama decide.
+
+        Notes:
+            Unless the request carries the exact input token count, it is estimated as
+            ESTIMATED_CHARS_PER_TOKEN characters per token.
+        """
+        if request.output_budget is None:
+            return None
+
+        input_tokens = request.input_tokens
+        if input_tokens is None:
+            input_tokens = math.ceil(len(request.user_input_text) / ESTIMATED_CHARS_PER_TOKEN)
+        return request.output_budget.resolve(input_tokens, self._model_information.output_length)
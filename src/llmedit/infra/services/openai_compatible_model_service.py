@@ -0,0 +1,379 @@
+import json
+import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, override
+
+from llmedit.core.interfaces.llm_model.model_service import GenerationCancelledError, ModelService
+from llmedit.core.models.data_types import (CancellationToken, GenerationRequest, GenerationResponse, LoadProgressCallback,
+                                            TextDeltaCallback, VariantTextDeltaCallback)
+from llmedit.core.models.settings import ModelInformation
+from llmedit.infra.services.http_connection_pool import HttpConnectionPool
+from llmedit.infra.services.repetition_detector import RepetitionDetector
+
+logger = logging.getLogger(__name__)
+
+ESTIMATED_CHARS_PER_TOKEN = 4
+MODELS_PATH = "/v1/models"
+CHAT_COMPLETIONS_PATH = "/v1/chat/completions"
+STREAM_DATA_PREFIX = "data:"
+STREAM_DONE = "[DONE]"
+
+
+def list_server_models(connection_pool: HttpConnectionPool) -> List[str]:
+    """
+    List the models an OpenAI-compatible server serves.
+
+    Args:
+        connection_pool: Connections to the server.
+
+    Returns:
+        Model ids reported by /v1/models, in server order.
+
+    Raises:
+        RuntimeError: If the server answers with an error.
+        OSError: If the server cannot be reached.
+    """
+    with connection_pool.request("GET", MODELS_PATH) as response:
+        payload = json.loads(response.read())
+    return [model["id"] for model in payload.get("data", [])]
+
+
+class OpenAiCompatibleModelService(ModelService):
+    """
+    Implementation of ModelService for an OpenAI-compatible chat server such as llama-server.
+
+    The model is loaded and batched by the server; requests go through a pool of keep-alive
+    connections and are streamed. Several requests may run at once, up to the number of pooled
+    connections, so the server can batch the chunks of a document or the variants of a task.
+    """
+
+    def __init__(self, model_information: ModelInformation, connection_pool: HttpConnectionPool) -> None:
+        """
+        Initialize service with model configuration and the server's connection pool.
+
+        Args:
+            model_information: Configuration object containing model name and settings.
+            connection_pool: Keep-alive connections to the server, shared between models.
+
+        Notes:
+            The model name must match a model id reported by the server.
+        """
+        self._model_information = model_information
+        self._connection_pool = connection_pool
+        logger.debug(
+            "__init__: Initialized for model '%s' at '%s'",
+            self._model_information.name,
+            self._connection_pool.base_url,
+        )
+
+    @override
+    def get_model_information(self) -> ModelInformation:
+        """
+        Retrieve model configuration details.
+
+        Returns:
+            ModelInformation object containing the model's metadata and settings.
+        """
+        return self._model_information
+
+    @override
+    def get_model_version(self) -> str:
+        """
+        Identify the weights the model currently generates with.
+
+        Returns:
+            Always empty, since the server manages the model files itself.
+        """
+        return ''
+
+    @override
+    def estimate_memory_bytes(self) -> int:
+        """
+        Estimate RAM used by the model in this process.
+
+        Returns:
+            Always 0, since the server hosts the model in its own process.
+        """
+        return 0
+
+    @override
+    def is_model_loaded(self) -> bool:
+        """
+        Check if the server serves the model.
+
+        Returns:
+            True if the model is listed by the server, False otherwise or if the server cannot be reached.
+        """
+        try:
+            is_available = self._model_information.name in list_server_models(self._connection_pool)
+        except Exception:
+            logger.warning("is_model_loaded: Failed to list server models", exc_info=True)
+            return False
+
+        logger.debug(
+            "is_model_loaded: Model '%s' availability: %s",
+            self._model_information.name,
+            "AVAILABLE" if is_available else "NOT AVAILABLE",
+        )
+        return is_available
+
+    @override
+    def load_model(self, on_progress: Optional[LoadProgressCallback] = None) -> None:
+        """
+        No-op (models managed by the server).
+
+        Args:
+            on_progress: Ignored; the server does not report loading progress.
+        """
+        logger.debug("load_model: No-op for OpenAI-compatible server (model loading handled externally)")
+
+    @override
+    def unload_model(self) -> None:
+        """
+        No-op (models managed by the server).
+        """
+        logger.debug("unload_model: No-op for OpenAI-compatible server (model unloading handled externally)")
+
+    @override
+    def max_parallel_requests(self) -> int:
+        """
+        Get how many requests the service can generate at the same time.
+
+        Returns:
+            Number of pooled connections to the server.
+        """
+        return self._connection_pool.max_connections
+
+    @override
+    def generate_response(
+        self,
+        request: GenerationRequest,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> GenerationResponse:
+        """
+        Generate response using the server's streaming chat completions API.
+
+        Args:
+            request: Contains system prompt, user prompt, and generation parameters.
+            on_text_delta: Optional callback receiving each generated text fragment.
+            cancellation_token: Optional token checked after every streamed event.
+
+        Returns:
+            GenerationResponse with the generated text content and metadata.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled.
+            RuntimeError: If generation fails due to connection issues or server errors.
+
+        Notes:
+            The output length is limited by the request's output budget. Reasoning that the
+            server streams separately (reasoning_content) is wrapped in think tags, so it is
+            shown while streaming and removed by the sanitizer like inline reasoning. Generation
+            is aborted early if the output starts looping. Aborting or cancelling closes the
+            connection, which makes the server stop generating. Blocks while all connections
+            are in use. Strips whitespace from the accumulated response.
+        """
+        logger.debug(
+            "generate_response: Starting generation for model '%s' - system_len=%d, user_len=%d, temp=%.2f",
+            self._model_information.name,
+            len(request.system_prompt),
+            len(request.user_prompt),
+            request.temperature,
+        )
+
+        try:
+            body = self._build_request_body(request)
+            repetition_detector = RepetitionDetector(reference_text=request.user_input_text)
+            fragments: list[str] = []
+            finish_reason = ""
+            usage: Dict[str, Any] = { }
+            thinking = False
+
+            def emit(text: str) -> bool:
+                # Every emitted fragment is fed, so repetition offsets match the joined fragments
+                fragments.append(text)
+                if on_text_delta is not None:
+                    on_text_delta(text)
+                return repetition_detector.feed(text)
+
+            with self._connection_pool.request("POST", CHAT_COMPLETIONS_PATH, body) as response:
+                for raw_line in response:
+                    if cancellation_token is not None and cancellation_token.is_cancelled():
+                        logger.info("generate_response: Generation cancelled after %d fragments", len(fragments))
+                        raise GenerationCancelledError("Generation cancelled")
+
+                    line = raw_line.decode("utf-8").strip()
+                    if not line.startswith(STREAM_DATA_PREFIX):
+                        continue
+                    data = line[len(STREAM_DATA_PREFIX):].strip()
+                    if data == STREAM_DONE:
+                        response.read()
+                        break
+
+                    event = json.loads(data)
+                    usage = event.get("usage") or usage
+                    if not event.get("choices"):
+                        continue
+                    choice = event["choices"][0]
+                    delta = choice.get("delta") or { }
+
+                    reasoning = delta.get("reasoning_content")
+                    if reasoning:
+                        if not thinking:
+                            thinking = True
+                            emit("<think>")
+                        if emit(reasoning):
+                            finish_reason = "repetition"
+                            break
+
+                    content = delta.get("content")
+                    if content:
+                        if thinking:
+                            thinking = False
+                            emit("</think>")
+                        if emit(content):
+                            finish_reason = "repetition"
+                            break
+
+                    if choice.get("finish_reason"):
+                        finish_reason = choice["finish_reason"]
+
+            generated_text = repetition_detector.trim("".join(fragments))
+            if thinking:
+                # Closed after trimming, so reasoning cut short is still removed by the sanitizer
+                generated_text += "</think>"
+                if on_text_delta is not None:
+                    on_text_delta("</think>")
+            generated_text = generated_text.strip()
+            truncated = finish_reason in ("length", "repetition")
+            logger.info(
+                "generate_response: Generated %d characters for model '%s' (finish_reason=%s)",
+                len(generated_text),
+                self._model_information.name,
+                finish_reason or "unknown",
+            )
+
+            metadata = {
+                "model_name": self._model_information.name,
+                "character_count": str(len(generated_text)),
+                "finish_reason": finish_reason,
+                "truncated": str(truncated).lower(),
+            }
+            if "max_tokens" in body:
+                metadata["max_tokens"] = str(body["max_tokens"])
+            if usage:
+                metadata["prompt_tokens"] = str(usage.get("prompt_tokens", 0))
+                metadata["answer_tokens"] = str(usage.get("completion_tokens", 0))
+
+            return GenerationResponse(
+                text_content=generated_text,
+                metadata=metadata,
+                original_request=request,
+            )
+
+        except GenerationCancelledError:
+            raise
+        except Exception as e:
+            logger.error(
+                "generate_response: Generation failed for model '%s'",
+                self._model_information.name,
+                exc_info=True,
+            )
+            raise RuntimeError(f"Failed to generate response: {str(e)}") from e
+
+    @override
+    def generate_variant_responses(
+        self,
+        requests: List[GenerationRequest],
+        on_text_delta: Optional[VariantTextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[GenerationResponse]:
+        """
+        Generate responses for several variants of one task as concurrent requests.
+
+        Args:
+            requests: One request per variant.
+            on_text_delta: Optional callback receiving the variant index and each text fragment.
+            cancellation_token: Optional token checked after every streamed event.
+
+        Returns:
+            One GenerationResponse per request, in request order.
+
+        Raises:
+            GenerationCancelledError: If the cancellation token was cancelled.
+            RuntimeError: If generation fails for any variant.
+
+        Notes:
+            The server batches the concurrent requests and reuses the cached prompt prefix
+            between them. Fragments of different variants interleave and the callback is invoked
+            from the worker threads of this call.
+        """
+        if not requests:
+            return []
+
+        def generate_variant(index: int) -> GenerationResponse:
+            variant_callback = None
+            if on_text_delta is not None:
+                variant_callback = lambda delta: on_text_delta(index, delta)
+            return self.generate_response(requests[index], variant_callback, cancellation_token)
+
+        with ThreadPoolExecutor(max_workers=min(len(requests), self._connection_pool.max_connections)) as executor:
+            return list(executor.map(generate_variant, range(len(requests))))
+
+    def _build_request_body(self, request: GenerationRequest) -> Dict[str, Any]:
+        """
+        Build the chat completions request body.
+
+        Args:
+            request: Generation request.
+
+        Returns:
+            JSON body asking for a streamed completion with the request's sampling parameters.
+
+        Notes:
+            top_k, min_p and cache_prompt are llama-server extensions; other servers ignore them.
+        """
+        body: Dict[str, Any] = {
+            "model": self._model_information.name,
+            "messages": [
+                { "role": "system", "content": request.system_prompt },
+                { "role": "user", "content": request.user_prompt },
+            ],
+            "stream": True,
+            "stream_options": { "include_usage": True },
+            "temperature": request.temperature,
+            "top_p": request.top_p,
+            "top_k": request.top_k,
+            "min_p": request.min_p,
+            "cache_prompt": True,
+        }
+        if request.seed is not None:
+            body["seed"] = request.seed
+        max_tokens = self._resolve_max_tokens(request)
+        if max_tokens is not None:
+            body["max_tokens"] = max_tokens
+        return body
+
+    def _resolve_max_tokens(self, request: GenerationRequest) -> Optional[int]:
+        """
+        Compute the maximum number of tokens to generate for a request.
+
+        Args:
+            request: Generation request carrying the user input and output budget.
+
+        Returns:
+            Token limit from the request's output budget, or None to let the server decide.
+
+        Notes:
+            Unless the request carries the exact input token count, it is estimated as
+            ESTIMATED_CHARS_PER_TOKEN characters per token.
+        """
+        if request.output_budget is None:
+            return None
+
+        input_tokens = request.input_tokens
+        if input_tokens is None:
+            input_tokens = math.ceil(len(request.user_input_text) / ESTIMATED_CHARS_PER_TOKEN)
+        return request.output_budget.resolve(input_tokens, self._model_information.output_length)
@@ -0,0 +1,267 @@
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+from llama_cpp import LlamaState
+
+from llmedit.infra.services.llama_cpp_kv_cache import KvCacheConfig
+from llmedit.infra.services.prompt_state_snapshot_store import PromptStateSnapshotStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PREFIX_CACHE_CAPACITY_BYTES = 512 * 1024 * 1024
+
+PrefixCacheKey = Tuple[str, int, str, Tuple[int, ...]]
+
+
+def compact_state(state: LlamaState) -> LlamaState:
+    """
+    Return a copy of the state with the logits buffer reduced to one row.
+
+    Args:
+        state: Full state returned by Llama.save_state().
+
+    Returns:
+        State suitable for Llama.load_state(), which broadcasts the single row.
+
+    Notes:
+        Only valid for states that are resumed by evaluating at least one more token, since the
+        logits of the last evaluated position are not kept.
+    """
+    n_vocab = state.scores.shape[1] if state.scores.ndim == 2 else 0
+    return LlamaState(
+        input_ids=state.input_ids,
+        scores=np.zeros((1, n_vocab), dtype=np.single),
+        n_tokens=state.n_tokens,
+        llama_state=state.llama_state,
+        llama_state_size=state.llama_state_size,
+        seed=state.seed,
+    )
+
+
+class PromptPrefixCache:
+    """
+    Bounded LRU cache of evaluated llama.cpp prompt-prefix states.
+
+    Stores the context state captured right after evaluating a static prompt prefix (system prompt
+    and user turn header), so subsequent requests only need to evaluate the part of the prompt
+    that actually differs. Entries are keyed by model file, context size, KV cache options and the
+    exact prefix tokens.
+    An optional snapshot store backs the in-memory entries on disk for warm starts.
+    """
+
+    def __init__(
+        self,
+        capacity_bytes: int = DEFAULT_PREFIX_CACHE_CAPACITY_BYTES,
+        snapshot_store: Optional[PromptStateSnapshotStore] = None,
+    ) -> None:
+        """
+        Initialize empty cache with a memory budget.
+
+        Args:
+            capacity_bytes: Maximum total size of stored states. Least recently used entries
+                are evicted when a new entry would exceed this budget.
+            snapshot_store: Optional on-disk store consulted on memory misses and written on put.
+        """
+        self._capacity_bytes = capacity_bytes
+        self._snapshot_store = snapshot_store
+        self._entries: OrderedDict[PrefixCacheKey, LlamaState] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+        logger.debug("__init__: Initialized prompt prefix cache with capacity %d bytes", capacity_bytes)
+
+    @property
+    def size_bytes(self) -> int:
+        """
+        Get the total size of all stored states.
+
+        Returns:
+            Number of bytes currently held by the cache.
+        """
+        return self._size_bytes
+
+    @property
+    def capacity_bytes(self) -> int:
+        """
+        Get the memory budget of the cache.
+
+        Returns:
+            Maximum total size of stored states in bytes.
+        """
+        return self._capacity_bytes
+
+    @property
+    def snapshot_store(self) -> Optional[PromptStateSnapshotStore]:
+        """
+        Get the on-disk store backing the cache.
+
+        Returns:
+            Snapshot store, or None if states are only kept in memory.
+        """
+        return self._snapshot_store
+
+    def get(
+        self,
+        model_path: Path,
+        n_ctx: int,
+        kv_cache: KvCacheConfig,
+        prefix_tokens: Sequence[int],
+    ) -> Optional[LlamaState]:
+        """
+        Look up the state for a model and prefix.
+
+        Args:
+            model_path: Path of the GGUF file the state was produced with.
+            n_ctx: Context size of the model instance the state is restored into.
+            kv_cache: KV cache options of the model instance the state is restored into.
+            prefix_tokens: Exact prefix token sequence.
+
+        Returns:
+            Stored LlamaState, or None if not cached. A hit marks the entry as most recently used.
+
+        Notes:
+            On a memory miss the snapshot store is consulted and a found state is kept in memory.
+        """
+        key = self._make_key(model_path, n_ctx, kv_cache, prefix_tokens)
+        with self._lock:
+            state = self._entries.get(key)
+            if state is not None:
+                self._entries.move_to_end(key)
+
+        if state is not None:
+            logger.debug("get: Hit for '%s' (%d prefix tokens)", model_path.name, len(prefix_tokens))
+            return state
+
+        if self._snapshot_store is not None:
+            state = self._snapshot_store.load(model_path, n_ctx, kv_cache, prefix_tokens)
+            if state is not None:
+                logger.debug("get: Snapshot hit for '%s' (%d prefix tokens)", model_path.name, len(prefix_tokens))
+                self._store_in_memory(key, state)
+                return state
+
+        logger.debug("get: Miss for '%s' (%d prefix tokens)", model_path.name, len(prefix_tokens))
+        return None
+
+    def put(
+        self,
+        model_path: Path,
+        n_ctx: int,
+        kv_cache: KvCacheConfig,
+        prefix_tokens: Sequence[int],
+        state: LlamaState,
+    ) -> None:
+        """
+        Store the state for a model and prefix, replacing a stored state with the same key.
+
+        Args:
+            model_path: Path of the GGUF file the state was produced with.
+            n_ctx: Context size of the model instance the state was captured from.
+            kv_cache: KV cache options of the model instance the state was captured from.
+            prefix_tokens: Exact prefix token sequence the state was evaluated from.
+            state: State captured with Llama.save_state() right after evaluating the prefix.
+
+        Notes:
+            The logits buffer of the state is replaced with a single zero row before storing;
+            sampling happens inside the llama.cpp sampler, so only the KV data is needed to resume.
+            States larger than the whole budget are not kept in memory.
+            The state is also written to the snapshot store, if configured.
+        """
+        compacted_state = compact_state(state)
+        self._store_in_memory(self._make_key(model_path, n_ctx, kv_cache, prefix_tokens), compacted_state)
+
+        if self._snapshot_store is not None:
+            self._snapshot_store.save(model_path, n_ctx, kv_cache, prefix_tokens, compacted_state)
+
+    def clear(self) -> None:
+        """
+        Remove all states held in memory.
+
+        Notes:
+            Snapshots on disk are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+        logger.debug("clear: Prompt prefix cache cleared")
+
+    def _store_in_memory(self, key: PrefixCacheKey, state: LlamaState) -> None:
+        """
+        Insert a compact state into the LRU, evicting old entries to fit the budget.
+
+        Args:
+            key: Cache key of the state.
+            state: Compact state to store.
+        """
+        entry_size = self._state_size(state)
+        if entry_size > self._capacity_bytes:
+            logger.warning(
+                "_store_in_memory: State of %d bytes exceeds cache capacity of %d bytes - not caching",
+                entry_size,
+                self._capacity_bytes,
+            )
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= self._state_size(previous)
+
+            while self._entries and self._size_bytes + entry_size > self._capacity_bytes:
+                evicted_key, evicted_state = self._entries.popitem(last=False)
+                self._size_bytes -= self._state_size(evicted_state)
+                logger.debug(
+                    "_store_in_memory: Evicted state for '%s' (n_ctx=%d, %d prefix tokens)",
+                    evicted_key[0],
+                    evicted_key[1],
+                    len(evicted_key[3]),
+                )
+
+            self._entries[key] = state
+            self._size_bytes += entry_size
+
+        logger.debug(
+            "_store_in_memory: Stored state for '%s' (n_ctx=%d, %d prefix tokens, %d bytes, total %d bytes)",
+            key[0],
+            key[1],
+            len(key[3]),
+            entry_size,
+            self._size_bytes,
+        )
+
+    @staticmethod
+    def _make_key(
+        model_path: Path,
+        n_ctx: int,
+        kv_cache: KvCacheConfig,
+        prefix_tokens: Sequence[int],
+    ) -> PrefixCacheKey:
+        """
+        Build the lookup key for a model and prefix.
+
+        Args:
+            model_path: Path of the GGUF file.
+            n_ctx: Context size of the model instance.
+            kv_cache: KV cache options of the model instance.
+            prefix_tokens: Prefix token sequence.
+
+        Returns:
+            Hashable cache key.
+        """
+        return str(model_path), n_ctx, str(kv_cache), tuple(prefix_tokens)
+
+    @staticmethod
+    def _state_size(state: LlamaState) -> int:
+        """
+        Estimate memory held by a state.
+
+        Args:
+            state: Stored state.
+
+        Returns:
+            Approximate size in bytes.
+        """
+        return len(state.llama_state) + state.input_ids.nbytes + state.scores.nbytes
@@ -0,0 +1,259 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import llama_cpp
+import numpy as np
+from llama_cpp import LlamaState
+
+from llmedit.infra.services.llama_cpp_kv_cache import KvCacheConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_STORE_CAPACITY_BYTES = 4 * 1024 * 1024 * 1024
+SNAPSHOT_FILE_SUFFIX = ".npz"
+FINGERPRINT_SAMPLE_BYTES = 1024 * 1024
+
+
+class PromptStateSnapshotStore:
+    """
+    Size-capped on-disk store of evaluated llama.cpp prompt-prefix states.
+
+    Persists prefix states across application restarts so the first request after launch
+    does not pay the full prefill cost. Each snapshot is keyed by a fingerprint of the model
+    file, the llama.cpp bindings version, the context size, the KV cache options and a hash of the
+    prefix tokens.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        capacity_bytes: int = DEFAULT_SNAPSHOT_STORE_CAPACITY_BYTES,
+    ) -> None:
+        """
+        Initialize store in the given directory.
+
+        Args:
+            directory: Directory where snapshot files are kept. Created if missing.
+            capacity_bytes: Maximum total size of snapshot files. Least recently used
+                snapshots are deleted when the budget is exceeded.
+        """
+        self._directory = directory
+        self._capacity_bytes = capacity_bytes
+        self._fingerprints: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+        logger.debug(
+            "__init__: Initialized snapshot store at '%s' with capacity %d bytes",
+            self._directory,
+            capacity_bytes,
+        )
+
+    @property
+    def directory(self) -> Path:
+        """
+        Get the directory holding the snapshot files.
+
+        Returns:
+            Snapshot directory.
+        """
+        return self._directory
+
+    def load(
+        self,
+        model_path: Path,
+        n_ctx: int,
+        kv_cache: KvCacheConfig,
+        prefix_tokens: Sequence[int],
+    ) -> Optional[LlamaState]:
+        """
+        Load the snapshot for a model and prefix.
+
+        Args:
+            model_path: Path of the GGUF file the state was produced with.
+            n_ctx: Context size of the model instance the state is restored into.
+            kv_cache: KV cache options of the model instance the state is restored into.
+            prefix_tokens: Exact prefix token sequence.
+
+        Returns:
+            Restored LlamaState, or None if no valid snapshot exists.
+
+        Notes:
+            Unreadable snapshots are deleted. A successful load refreshes the file's access
+            time used for eviction.
+        """
+        snapshot_path = self._snapshot_path(model_path, n_ctx, kv_cache, prefix_tokens)
+        if not snapshot_path.exists():
+            logger.debug("load: No snapshot for '%s' (%d prefix tokens)", model_path.name, len(prefix_tokens))
+            return None
+
+        try:
+            with np.load(snapshot_path, allow_pickle=False) as data:
+                n_tokens = int(data["n_tokens"])
+                stored_ids = data["input_ids"]
+                stored_n_ctx = int(data["n_ctx"])
+                if (n_tokens != len(prefix_tokens) or stored_n_ctx != n_ctx
+                        or stored_ids.tolist() != list(prefix_tokens)):
+                    logger.warning("load: Snapshot '%s' does not match prefix - discarding", snapshot_path.name)
+                    snapshot_path.unlink(missing_ok=True)
+                    return None
+
+                input_ids = np.zeros((stored_n_ctx,), dtype=np.intc)
+                input_ids[:n_tokens] = stored_ids
+                llama_state = data["llama_state"].tobytes()
+                state = LlamaState(
+                    input_ids=input_ids,
+                    scores=np.zeros((1, int(data["n_vocab"])), dtype=np.single),
+                    n_tokens=n_tokens,
+                    llama_state=llama_state,
+                    llama_state_size=len(llama_state),
+                    seed=int(data["seed"]),
+                )
+            os.utime(snapshot_path)
+        except Exception:
+            logger.warning("load: Failed to read snapshot '%s' - discarding", snapshot_path.name, exc_info=True)
+            snapshot_path.unlink(missing_ok=True)
+            return None
+
+        logger.debug("load: Loaded snapshot '%s' (%d prefix tokens)", snapshot_path.name, n_tokens)
+        return state
+
+    def save(
+        self,
+        model_path: Path,
+        n_ctx: int,
+        kv_cache: KvCacheConfig,
+        prefix_tokens: Sequence[int],
+        state: LlamaState,
+    ) -> None:
+        """
+        Persist the snapshot for a model and prefix.
+
+        Args:
+            model_path: Path of the GGUF file the state was produced with.
+            n_ctx: Context size of the model instance the state was captured from.
+            kv_cache: KV cache options of the model instance the state was captured from.
+            prefix_tokens: Exact prefix token sequence the state was evaluated from.
+            state: State captured right after evaluating the prefix.
+
+        Notes:
+            The file is written to a temporary name and atomically renamed, so a crash never
+            leaves a partially written snapshot behind. Errors are logged and ignored.
+        """
+        snapshot_path = self._snapshot_path(model_path, n_ctx, kv_cache, prefix_tokens)
+        n_tokens = state.n_tokens
+        temp_path: Optional[Path] = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=self._directory,
+                suffix=".tmp",
+                delete=False,
+            ) as temp_file:
+                temp_path = Path(temp_file.name)
+                np.savez(
+                    temp_file,
+                    input_ids=state.input_ids[:n_tokens],
+                    n_tokens=np.int64(n_tokens),
+                    n_ctx=np.int64(n_ctx),
+                    n_vocab=np.int64(state.scores.shape[-1]),
+                    seed=np.int64(state.seed),
+                    llama_state=np.frombuffer(state.llama_state, dtype=np.uint8),
+                )
+            os.replace(temp_path, snapshot_path)
+        except Exception:
+            logger.warning("save: Failed to write snapshot '%s'", snapshot_path.name, exc_info=True)
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+            return
+
+        logger.debug("save: Stored snapshot '%s' (%d prefix tokens)", snapshot_path.name, n_tokens)
+        self._evict()
+
+    def _evict(self) -> None:
+        """
+        Delete least recently used snapshots until the store fits its capacity.
+        """
+        with self._lock:
+            snapshots = []
+            for path in self._directory.glob(f"*{SNAPSHOT_FILE_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                snapshots.append((stat.st_mtime, stat.st_size, path))
+
+            total_size = sum(size for _, size, _ in snapshots)
+            for _, size, path in sorted(snapshots, key=lambda item: item[0]):
+                if total_size <= self._capacity_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total_size -= size
+                logger.debug("_evict: Deleted snapshot '%s' (%d bytes)", path.name, size)
+
+    def _snapshot_path(
+        self,
+        model_path: Path,
+        n_ctx: int,
+        kv_cache: KvCacheConfig,
+        prefix_tokens: Sequence[int],
+    ) -> Path:
+        """
+        Build the snapshot file path for a model and prefix.
+
+        Args:
+            model_path: Path of the GGUF file.
+            n_ctx: Context size of the model instance.
+            kv_cache: KV cache options of the model instance.
+            prefix_tokens: Prefix token sequence.
+
+        Returns:
+            Path inside the store directory.
+        """
+        prefix_hash = hashlib.sha256(np.asarray(prefix_tokens, dtype=np.int32).tobytes()).hexdigest()
+        key = "|".join([
+            self._model_fingerprint(model_path),
+            llama_cpp.__version__,
+            str(n_ctx),
+            str(kv_cache),
+            prefix_hash,
+        ])
+        return self._directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}{SNAPSHOT_FILE_SUFFIX}"
+
+    def _model_fingerprint(self, model_path: Path) -> str:
+        """
+        Compute a content fingerprint of a model file.
+
+        Args:
+            model_path: Path of the GGUF file.
+
+        Returns:
+            Hex digest identifying the file contents.
+
+        Notes:
+            Hashes the file size together with its first and last megabyte instead of the whole
+            multi-gigabyte file. Results are memoized per path, size and modification time.
+        """
+        stat = model_path.stat()
+        memo_key = (str(model_path), stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            fingerprint = self._fingerprints.get(memo_key)
+        if fingerprint is not None:
+            return fingerprint
+
+        digest = hashlib.sha256(str(stat.st_size).encode("utf-8"))
+        with open(model_path, "rb") as model_file:
+            digest.update(model_file.read(FINGERPRINT_SAMPLE_BYTES))
+            if stat.st_size > FINGERPRINT_SAMPLE_BYTES:
+                model_file.seek(max(stat.st_size - FINGERPRINT_SAMPLE_BYTES, FINGERPRINT_SAMPLE_BYTES))
+                digest.update(model_file.read(FINGERPRINT_SAMPLE_BYTES))
+        fingerprint = digest.hexdigest()
+
+        with self._lock:
+            self._fingerprints[memo_key] = fingerprint
+        logger.debug("_model_fingerprint: Fingerprint for '%s' is %s", model_path.name, fingerprint[:12])
+        return fingerprint
@@ -0,0 +1,109 @@
+import logging
+import math
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+MIN_PERIOD = 1
+MAX_PERIOD = 256
+MIN_REPEATS = 4
+MIN_REPEATED_SPAN = 320
+MAX_WINDOW = max(MAX_PERIOD * MIN_REPEATS, MIN_REPEATED_SPAN + MAX_PERIOD)
+
+
+class RepetitionDetector:
+    """
+    Online detector of degenerate, looping model output.
+
+    Fed with generated text fragments, it reports when the tail of the output consists of the
+    same block of text repeated back to back, e.g. a sentence or table row the model keeps
+    emitting. The block may be from MIN_PERIOD to MAX_PERIOD characters long and must repeat
+    at least MIN_REPEATS times and span at least MIN_REPEATED_SPAN characters.
+    """
+
+    def __init__(self, reference_text: str = "") -> None:
+        """
+        Initialize detector.
+
+        Args:
+            reference_text: User input the output is derived from. Repetition that already
+                occurs in the input (e.g. repeated lines the user wants proofread) is not
+                treated as degenerate.
+        """
+        self._reference_text = reference_text
+        # Only the last MAX_WINDOW characters are kept; _length counts everything fed so far
+        self._tail = ""
+        self._length = 0
+        self._repetition_start: Optional[int] = None
+        self._period = 0
+
+    @property
+    def repetition_detected(self) -> bool:
+        """
+        Check whether a runaway repetition was detected.
+
+        Returns:
+            True once feed() has reported a repetition.
+        """
+        return self._repetition_start is not None
+
+    def feed(self, fragment: str) -> bool:
+        """
+        Append a generated fragment and check the output tail for repetition.
+
+        Args:
+            fragment: Newly generated text.
+
+        Returns:
+            True if the output is looping and generation should be aborted.
+        """
+        if self._repetition_start is not None:
+            return True
+
+        tail = (self._tail + fragment)[-MAX_WINDOW:]
+        self._tail = tail
+        self._length += len(fragment)
+        for period in range(MIN_PERIOD, min(MAX_PERIOD, len(tail) // MIN_REPEATS) + 1):
+            if tail[-1] != tail[-1 - period]:
+                continue
+
+            repeats = max(MIN_REPEATS, math.ceil(MIN_REPEATED_SPAN / period))
+            span = period * repeats
+            if span > len(tail):
+                continue
+
+            # The window repeats with this period iff it equals itself shifted by one period
+            window = tail[-span:]
+            if window[:-period] != window[period:]:
+                continue
+
+            block = window[-period:]
+            if self._reference_text and block * MIN_REPEATS in self._reference_text:
+                # Longer periods would only find multiples of the same block
+                return False
+
+            self._repetition_start = self._length - span
+            self._period = period
+            logger.warning(
+                "feed: Repetition detected - block of %d chars repeated %d times at offset %d",
+                period,
+                repeats,
+                self._repetition_start,
+            )
+            return True
+
+        return False
+
+    def trim(self, text: str) -> str:
+        """
+        Cut the repeated tail from the generated text, keeping one occurrence of the block.
+
+        Args:
+            text: Complete generated text that was fed to the detector.
+
+        Returns:
+            Text without the runaway repetition, or the unchanged text if none was detected.
+        """
+        if self._repetition_start is None:
+            return text
+        return text[:self._repetition_start + self._period]
@@ -0,0 +1,282 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, override
+
+from llmedit.config.response_cache import RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_MEMORY_ENTRIES
+from llmedit.core.interfaces.processing.response_cache import ResponseCache
+from llmedit.core.models.data_types import GenerationRequest, GenerationResponse
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    text_content TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+TOUCH_FLUSH_ENTRIES = 64
+"""Number of pending recency updates after which they are written without waiting for the next put."""
+
+
+class SqliteResponseCache(ResponseCache):
+    """
+    Two-tier response cache: an in-memory LRU in front of a size-capped SQLite store.
+
+    Recently used responses are answered from memory; all others from the SQLite file, which
+    keeps them across application restarts. When the stored responses exceed the size limit,
+    the least recently used ones are deleted. Hits only record their time in memory; the
+    recency of stored entries is written in batches, at the latest before the next eviction.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        memory_entries: int = RESPONSE_CACHE_MEMORY_ENTRIES,
+        max_bytes: int = RESPONSE_CACHE_MAX_BYTES,
+    ) -> None:
+        """
+        Initialize cache backed by the given SQLite file.
+
+        Args:
+            file_path: Location of the database. Created on first use.
+            memory_entries: Number of responses kept in memory.
+            max_bytes: Maximum total size of the stored responses.
+
+        Notes:
+            The database is opened lazily. If it cannot be opened, the cache works in memory only.
+        """
+        self._file_path = file_path
+        self._memory_entries = memory_entries
+        self._max_bytes = max_bytes
+        self._memory: OrderedDict[str, Tuple[str, Dict[str, str]]] = OrderedDict()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_failed = False
+        self._stored_bytes = 0
+        self._pending_touches: Dict[str, float] = { }
+        self._lock = threading.Lock()
+
+        logger.debug("__init__: Initialized response cache at '%s'", self._file_path)
+
+    @override
+    def get(self, key: str, request: GenerationRequest) -> Optional[GenerationResponse]:
+        """
+        Look up a cached response, in memory first, then in the SQLite store.
+
+        Args:
+            key: Digest of the request.
+            request: The request the key was computed from.
+
+        Returns:
+            The cached response, or None if the key is not cached.
+
+        Notes:
+            A hit refreshes the entry's recency in both tiers; the stored recency is updated
+            lazily, see _touch.
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            else:
+                entry = self._load(key)
+                if entry is None:
+                    return None
+                self._remember(key, entry)
+            self._touch(key)
+
+        text_content, metadata = entry
+        return GenerationResponse(text_content=text_content, original_request=request, metadata=dict(metadata))
+
+    @override
+    def put(self, key: str, response: GenerationResponse) -> None:
+        """
+        Store a response in both tiers.
+
+        Args:
+            key: Digest of the response's request.
+            response: Generated response.
+
+        Notes:
+            Evicts the least recently used stored responses beyond the size limit.
+        """
+        entry = (response.text_content, dict(response.metadata))
+        with self._lock:
+            self._remember(key, entry)
+            self._store(key, entry)
+
+    def _remember(self, key: str, entry: Tuple[str, Dict[str, str]]) -> None:
+        """
+        Put an entry into the memory tier, dropping the least recently used beyond its capacity.
+
+        Args:
+            key: Digest of the request.
+            entry: Response text and metadata.
+        """
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._memory_entries:
+            self._memory.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        Read an entry from the SQLite store.
+
+        Args:
+            key: Digest of the request.
+
+        Returns:
+            Response text and metadata, or None if not stored or the store is unavailable.
+        """
+        connection = self._get_connection()
+        if connection is None:
+            return None
+
+        try:
+            row = connection.execute(
+                "SELECT text_content, metadata FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            return row[0], json.loads(row[1])
+        except Exception:
+            logger.warning("_load: Failed to read cached response", exc_info=True)
+            return None
+
+    def _touch(self, key: str) -> None:
+        """
+        Record a hit, so the stored entry is protected from eviction.
+
+        Args:
+            key: Digest of the request.
+
+        Notes:
+            Hits are kept in memory and written with the next put, which evicts by recency, or
+            once TOUCH_FLUSH_ENTRIES are pending. Hits pending when the application exits are lost,
+            which only makes their entries look older.
+        """
+        self._pending_touches[key] = time.time()
+        if len(self._pending_touches) < TOUCH_FLUSH_ENTRIES:
+            return
+
+        connection = self._get_connection()
+        if connection is None:
+            self._pending_touches.clear()
+            return
+
+        try:
+            self._write_touches(connection)
+            connection.commit()
+        except Exception:
+            logger.warning("_touch: Failed to update cached responses", exc_info=True)
+            connection.rollback()
+
+    def _write_touches(self, connection: sqlite3.Connection) -> None:
+        """
+        Write the pending hits to the store, without committing.
+
+        Args:
+            connection: Open database connection.
+        """
+        touches, self._pending_touches = self._pending_touches, { }
+        connection.executemany(
+            "UPDATE responses SET last_used = ? WHERE key = ?",
+            [(last_used, key) for key, last_used in touches.items()],
+        )
+
+    def _store(self, key: str, entry: Tuple[str, Dict[str, str]]) -> None:
+        """
+        Write an entry to the SQLite store and evict beyond the size limit.
+
+        Args:
+            key: Digest of the request.
+            entry: Response text and metadata.
+
+        Notes:
+            Pending hits are written first, so eviction sees the current recency. The total size
+            of the stored responses is kept in memory instead of summing the table on every put.
+        """
+        connection = self._get_connection()
+        if connection is None:
+            return
+
+        text_content, metadata = entry
+        metadata_json = json.dumps(metadata)
+        size = len(key) + len(text_content.encode("utf-8")) + len(metadata_json)
+        try:
+            self._write_touches(connection)
+            replaced = connection.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, text_content, metadata, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, text_content, metadata_json, size, time.time()),
+            )
+            total_bytes = self._stored_bytes + size - (replaced[0] if replaced else 0)
+            if total_bytes > self._max_bytes:
+                evicted = 0
+                for evicted_key, evicted_size in connection.execute(
+                    "SELECT key, size FROM responses ORDER BY last_used"
+                ).fetchall():
+                    if total_bytes <= self._max_bytes:
+                        break
+                    connection.execute("DELETE FROM responses WHERE key = ?", (evicted_key,))
+                    total_bytes -= evicted_size
+                    evicted += 1
+                logger.debug("_store: Evicted %d responses (%d bytes stored)", evicted, total_bytes)
+            connection.commit()
+            self._stored_bytes = total_bytes
+        except Exception:
+            logger.warning("_store: Failed to store response", exc_info=True)
+            try:
+                connection.rollback()
+                self._stored_bytes = self._sum_stored_bytes(connection)
+            except Exception:
+                logger.warning("_store: Failed to recover the stored size", exc_info=True)
+
+    def _get_connection(self) -> Optional[sqlite3.Connection]:
+        """
+        Get the database connection, opening the database on first use.
+
+        Returns:
+            Connection, or None if the database cannot be opened.
+
+        Notes:
+            Must be called with the lock held; the connection is shared by all threads. The
+            total size of the stored responses is read once when the database is opened.
+        """
+        if self._connection is not None or self._connection_failed:
+            return self._connection
+
+        try:
+            self._file_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._file_path, check_same_thread=False)
+            connection.executescript(SCHEMA)
+            self._stored_bytes = self._sum_stored_bytes(connection)
+            self._connection = connection
+            logger.info("_get_connection: Opened response cache '%s'", self._file_path)
+        except Exception:
+            logger.warning("_get_connection: Response cache unavailable - using memory only", exc_info=True)
+            self._connection_failed = True
+        return self._connection
+
+    @staticmethod
+    def _sum_stored_bytes(connection: sqlite3.Connection) -> int:
+        """
+        Sum the sizes of all stored responses.
+
+        Args:
+            connection: Open database connection.
+
+        Returns:
+            Total size in bytes.
+        """
+        return connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
@@ -0,0 +1,158 @@
+import logging
+import os
+from pathlib import Path
+from typing import Dict
+
+from llmedit.core.models.enums.memory_policy import MemoryPolicy
+
+logger = logging.getLogger(__name__)
+
+MEMINFO_PATH = Path("/proc/meminfo")
+SELF_STATUS_PATH = Path("/proc/self/status")
+SELF_SMAPS_PATH = Path("/proc/self/smaps")
+
+MLOCK_RAM_FACTOR = 2.0
+PREFAULT_RAM_FACTOR = 1.2
+PREFAULT_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def read_meminfo() -> Dict[str, int]:
+    """
+    Read system memory counters.
+
+    Returns:
+        Mapping of /proc/meminfo keys (e.g. "MemAvailable") to bytes; empty if unavailable.
+    """
+    values: Dict[str, int] = { }
+    try:
+        with MEMINFO_PATH.open("r", encoding="ascii") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                fields = rest.split()
+                if fields and fields[0].isdigit():
+                    values[key] = int(fields[0]) * (1024 if len(fields) > 1 and fields[1] == "kB" else 1)
+    except OSError:
+        logger.debug("read_meminfo: %s not readable", MEMINFO_PATH)
+    return values
+
+
+def available_memory_bytes() -> int:
+    """
+    Get the RAM available for new allocations without swapping.
+
+    Returns:
+        MemAvailable in bytes, or 0 if unknown.
+    """
+    return read_meminfo().get("MemAvailable", 0)
+
+
+def available_memory_share_bytes(fraction: float, fallback_bytes: int) -> int:
+    """
+    Get a share of the RAM available for new allocations.
+
+    Args:
+        fraction: Share of the available RAM.
+        fallback_bytes: Budget returned if the available RAM is unknown.
+
+    Returns:
+        fraction times MemAvailable in bytes, or fallback_bytes if unknown.
+    """
+    available_bytes = available_memory_bytes()
+    if available_bytes <= 0:
+        logger.debug("available_memory_share_bytes: Available memory unknown - using %d bytes", fallback_bytes)
+        return fallback_bytes
+    return int(available_bytes * fraction)
+
+
+def process_rss_bytes() -> int:
+    """
+    Get the resident set size of this process.
+
+    Returns:
+        VmRSS in bytes, or 0 if unknown.
+    """
+    try:
+        with SELF_STATUS_PATH.open("r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        logger.debug("process_rss_bytes: %s not readable", SELF_STATUS_PATH)
+    return 0
+
+
+def mapped_file_rss_bytes(file_path: Path) -> int:
+    """
+    Get how much of a memory-mapped file is resident in this process.
+
+    Args:
+        file_path: Path of the mapped file.
+
+    Returns:
+        Sum of the Rss of all mappings of the file in bytes, or 0 if unknown or not mapped.
+    """
+    target = str(file_path.resolve())
+    total = 0
+    in_target = False
+    try:
+        with SELF_SMAPS_PATH.open("r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                fields = line.split()
+                if not fields:
+                    continue
+                if not fields[0].endswith(":"):
+                    # Mapping header: address perms offset dev inode [path]
+                    in_target = len(fields) >= 6 and " ".join(fields[5:]) == target
+                elif in_target and fields[0] == "Rss:":
+                    total += int(fields[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        logger.debug("mapped_file_rss_bytes: %s not readable", SELF_SMAPS_PATH)
+        return 0
+    return total
+
+
+def select_memory_policy(model_bytes: int, available_bytes: int) -> MemoryPolicy:
+    """
+    Select a memory policy for a model from the RAM available.
+
+    Args:
+        model_bytes: Size of the model file(s).
+        available_bytes: RAM available for new allocations; 0 if unknown.
+
+    Returns:
+        MLOCK if the model fits more than MLOCK_RAM_FACTOR times, MMAP_PREFAULT if it fits
+        PREFAULT_RAM_FACTOR times, MMAP otherwise or if the available RAM is unknown.
+
+    Notes:
+        Pinning or prefaulting a model that barely fits would push other memory into swap; with
+        lazy mapping the OS can drop unused weight pages instead.
+    """
+    if available_bytes <= 0 or model_bytes <= 0:
+        return MemoryPolicy.MMAP
+    if available_bytes >= model_bytes * MLOCK_RAM_FACTOR:
+        return MemoryPolicy.MLOCK
+    if available_bytes >= model_bytes * PREFAULT_RAM_FACTOR:
+        return MemoryPolicy.MMAP_PREFAULT
+    return MemoryPolicy.MMAP
+
+
+def prefault_file(file_path: Path) -> None:
+    """
+    Read a file once so its pages are in the page cache.
+
+    Args:
+        file_path: File to read, typically a memory-mapped model.
+
+    Notes:
+        Pages of a memory-mapped file are shared with the page cache, so later accesses through
+        the mapping no longer wait for the disk. Errors are logged and ignored.
+    """
+    try:
+        with file_path.open("rb", buffering=0) as f:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            buffer = bytearray(PREFAULT_CHUNK_BYTES)
+            while f.readinto(buffer):
+                pass
+    except OSError:
+        logger.warning("prefault_file: Failed to prefault '%s'", file_path, exc_info=True)
@@ -57,8 +57,8 @@ def start_application() -> None:
 
     Notes:
         Configures logging, creates the application context, sets up the UI with
-        stylesheet, and starts the Qt event loop. Handles startup exceptions and
-        performs proper shutdown.
+        stylesheet, starts preloading the selected model and starts the Qt event loop.
+        Handles startup exceptions and performs proper shutdown.
     """
     try:
         configure_logger(log_level=logging.DEBUG)
@@ -75,6 +75,8 @@ def start_application() -> None:
 
         window = MainWindow(ctx=ctx)
         window.show()
+        ctx.model_directory_watcher.start()
+        ctx.model_preloader.preload()
         sys.exit(app.exec())
     except Exception as e:
         logger.error(f"Application failed to start: {e}", exc_info=True)
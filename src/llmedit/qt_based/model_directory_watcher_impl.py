@@ -0,0 +1,209 @@
+import logging
+from abc import ABCMeta
+from typing import Callable, List, Optional, override
+
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from llmedit.core.interfaces.llm_model.model_directory_watcher import ModelDirectoryWatcher
+from llmedit.infra.services.gguf_model_catalog import GgufModelCatalog
+
+logger = logging.getLogger(__name__)
+
+RESCAN_DELAY_MS = 500
+
+
+class _RescanRunnable(QRunnable):
+    """
+    Runnable rescanning the model catalog on a pool thread.
+    """
+
+    def __init__(self, watcher: "ModelDirectoryWatcherImpl"):
+        """
+        Initialize the runnable.
+
+        Args:
+            watcher: Watcher whose catalog is rescanned and whose signal is emitted.
+        """
+        super().__init__()
+        self._watcher = watcher
+        self.setAutoDelete(True)
+
+    def run(self):
+        """
+        Rescan the catalog and report the outcome.
+
+        Notes:
+            Always emits the finished signal exactly once, even on error; the list of incomplete
+            files is None if the rescan failed.
+        """
+        changed = False
+        incomplete_files: Optional[List[str]] = None
+        try:
+            model_catalog = self._watcher.model_catalog
+            changed = model_catalog.rescan()
+            incomplete_files = [str(path) for path in model_catalog.incomplete_file_paths()]
+        except Exception as e:
+            logger.error("_RescanRunnable.run: Failed to rescan model directory: %s", str(e), exc_info=True)
+        finally:
+            self._watcher.rescan_finished.emit(changed, incomplete_files)
+
+
+class _MetaQObjectABC(type(QObject), ABCMeta):
+    """
+    Metaclass combining QObject and ABCMeta.
+
+    Allows ModelDirectoryWatcherImpl to inherit from both QObject (for Qt signals)
+    and ABC (for abstract base class functionality).
+    """
+    pass
+
+
+class ModelDirectoryWatcherImpl(ModelDirectoryWatcher, QObject, metaclass=_MetaQObjectABC):
+    """
+    Concrete implementation of ModelDirectoryWatcher using a QFileSystemWatcher.
+
+    Watches the model directory for added, removed and renamed files, and the files that are
+    still incomplete for growth, and rescans the catalog once changes have settled for
+    RESCAN_DELAY_MS, so a download in progress triggers a single rescan when it finishes.
+    Rescans run one at a time on their own pool, since reading new GGUF headers can take a
+    while on slow disks.
+    """
+
+    models_changed = pyqtSignal()
+    rescan_finished = pyqtSignal(bool, object)
+
+    def __init__(self, model_catalog: GgufModelCatalog):
+        """
+        Initialize watcher; nothing is watched until start() is called.
+
+        Args:
+            model_catalog: Catalog of the model directory to keep up to date.
+
+        Notes:
+            The file system watcher and the rescan timer are created in start(), since they need
+            the Qt event loop of a running application. Creates a single-threaded pool used only
+            for rescanning.
+        """
+        super().__init__()
+        QObject.__init__(self)
+
+        self._model_catalog = model_catalog
+        self._watcher: Optional[QFileSystemWatcher] = None
+        self._rescan_timer: Optional[QTimer] = None
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(1)
+        self._rescan_running = False
+        self._rescan_requested = False
+
+        self.rescan_finished.connect(self._on_rescan_finished)
+        logger.debug("ModelDirectoryWatcherImpl: Initialized")
+
+    @property
+    def model_catalog(self) -> GgufModelCatalog:
+        """
+        Get the catalog kept up to date.
+
+        Returns:
+            The watched GgufModelCatalog.
+        """
+        return self._model_catalog
+
+    @override
+    def start(self) -> None:
+        """
+        Scan the model directory and start watching it.
+
+        Notes:
+            Must be called on the UI thread after the application was created. The initial scan
+            runs in the background; models_changed is emitted once it found models.
+        """
+        if self._watcher is not None:
+            return
+
+        self._rescan_timer = QTimer(self)
+        self._rescan_timer.setSingleShot(True)
+        self._rescan_timer.setInterval(RESCAN_DELAY_MS)
+        self._rescan_timer.timeout.connect(self._rescan)
+
+        directory = str(self._model_catalog.model_folder_path)
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_path_changed)
+        self._watcher.fileChanged.connect(self._on_path_changed)
+        if not self._watcher.addPath(directory):
+            logger.warning("start: Failed to watch model directory '%s'", directory)
+
+        logger.info("start: Watching model directory '%s'", directory)
+        self._rescan()
+
+    @override
+    def subscribe_models_changed(self, listener: Callable[[], None]) -> None:
+        """
+        Subscribe to changes of the model list.
+
+        Args:
+            listener: Callback invoked on the UI thread after the catalog changed.
+        """
+        logger.debug(
+            "subscribe_models_changed: New listener registered (%s)",
+            getattr(listener, '__qualname__', str(listener)),
+        )
+        self.models_changed.connect(listener)
+
+    def _on_path_changed(self, path: str) -> None:
+        """
+        Schedule a rescan after a watched path changed.
+
+        Args:
+            path: Changed directory or file.
+
+        Notes:
+            Restarts the delay on every change, so bursts of changes cause one rescan.
+        """
+        logger.debug("_on_path_changed: '%s' changed - rescanning in %d ms", path, RESCAN_DELAY_MS)
+        self._rescan_timer.start()
+
+    def _rescan(self) -> None:
+        """
+        Start rescanning the catalog in the background.
+
+        Notes:
+            Must be called on the UI thread. If a rescan is already running, another one follows
+            it, so changes made during the running rescan are not missed.
+        """
+        if self._rescan_running:
+            logger.debug("_rescan: Rescan in progress - rescanning again afterwards")
+            self._rescan_requested = True
+            return
+
+        self._rescan_running = True
+        self._pool.start(_RescanRunnable(self))
+
+    def _on_rescan_finished(self, changed: bool, incomplete_file_list: Optional[List[str]]) -> None:
+        """
+        Handle the end of a background rescan on the UI thread.
+
+        Args:
+            changed: True if the list of models changed.
+            incomplete_file_list: Paths of the incomplete files to watch, or None if the rescan failed.
+
+        Notes:
+            Updates the watched incomplete files, notifies listeners of a changed model list, and
+            starts the next rescan if changes arrived while scanning.
+        """
+        self._rescan_running = False
+        if self._rescan_requested:
+            self._rescan_requested = False
+            self._rescan()
+
+        if incomplete_file_list is None:
+            return
+
+        watched_files = set(self._watcher.files())
+        incomplete_files = set(incomplete_file_list)
+        if watched_files - incomplete_files:
+            self._watcher.removePaths(list(watched_files - incomplete_files))
+        if incomplete_files - watched_files:
+            self._watcher.addPaths(list(incomplete_files - watched_files))
+
+        if changed:
+            self.models_changed.emit()
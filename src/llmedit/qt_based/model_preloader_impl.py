@@ -0,0 +1,213 @@
+import logging
+from abc import ABCMeta
+from typing import Callable, override
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from llmedit.core.interfaces.llm_model.model_preloader import ModelPreloader
+from llmedit.core.interfaces.llm_model.model_service_provider import ModelServiceProvider
+from llmedit.core.interfaces.settings.settings_service import SettingsService
+from llmedit.core.models.enums.model_load_state import ModelLoadState
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_STEP = 0.01
+
+
+class _PreloadRunnable(QRunnable):
+    """
+    Runnable loading the currently selected model on a pool thread.
+    """
+
+    def __init__(self, preloader: "ModelPreloaderImpl"):
+        """
+        Initialize the runnable.
+
+        Args:
+            preloader: Preloader whose provider is used and whose signals are emitted.
+        """
+        super().__init__()
+        self._preloader = preloader
+        self._last_progress = -1.0
+        self.setAutoDelete(True)
+
+    def run(self):
+        """
+        Load the model and report the outcome.
+
+        Notes:
+            Always emits the finished signal exactly once, even on error.
+        """
+        error_message = ""
+        try:
+            model_service = self._preloader.model_service_provider.get_model_service()
+            model_service.load_model(on_progress=self._on_progress)
+        except Exception as e:
+            logger.warning("_PreloadRunnable.run: Preloading model failed: %s", str(e), exc_info=True)
+            error_message = str(e) or type(e).__name__
+        finally:
+            self._preloader.load_finished.emit(error_message)
+
+    def _on_progress(self, progress: float) -> None:
+        """
+        Forward loading progress, throttled to PROGRESS_STEP increments.
+
+        Args:
+            progress: Loading progress between 0.0 and 1.0.
+        """
+        if progress - self._last_progress >= PROGRESS_STEP or progress >= 1.0:
+            self._last_progress = progress
+            self._preloader.progress_changed.emit(progress)
+
+
+class _MetaQObjectABC(type(QObject), ABCMeta):
+    """
+    Metaclass combining QObject and ABCMeta.
+
+    Allows ModelPreloaderImpl to inherit from both QObject (for Qt signals)
+    and ABC (for abstract base class functionality).
+    """
+    pass
+
+
+class ModelPreloaderImpl(ModelPreloader, QObject, metaclass=_MetaQObjectABC):
+    """
+    Concrete implementation of ModelPreloader using a dedicated Qt thread pool.
+
+    Loads run one at a time on their own pool, so they neither block the UI thread nor occupy
+    the task pool. Requests processed during a load wait inside ModelService.load_model().
+    """
+
+    load_finished = pyqtSignal(str)
+    progress_changed = pyqtSignal(float)
+    _state_changed = pyqtSignal(object, str)
+
+    def __init__(self, settings_service: SettingsService, model_service_provider: ModelServiceProvider):
+        """
+        Initialize preloader.
+
+        Args:
+            settings_service: Service providing the current model selection.
+            model_service_provider: Provider of the model service to load.
+
+        Notes:
+            Creates a single-threaded pool used only for loading.
+        """
+        super().__init__()
+        QObject.__init__(self)
+
+        self._settings_service = settings_service
+        self._model_service_provider = model_service_provider
+        self._pool = QThreadPool()
+        self._pool.setMaxThreadCount(1)
+        self._state = ModelLoadState.NOT_LOADED
+        self._running = False
+        self._reload_requested = False
+
+        self.load_finished.connect(self._on_load_finished)
+        logger.debug("ModelPreloaderImpl: Initialized")
+
+    @property
+    def model_service_provider(self) -> ModelServiceProvider:
+        """
+        Get the provider of the model service to load.
+
+        Returns:
+            The configured ModelServiceProvider.
+        """
+        return self._model_service_provider
+
+    @override
+    def preload(self) -> None:
+        """
+        Start loading the currently selected model in the background.
+
+        Notes:
+            Must be called on the UI thread. Does nothing but reset the state if no model is selected.
+        """
+        model = self._settings_service.get_llm_model()
+        if model is None or not model.id or not model.id.strip():
+            logger.debug("preload: No model selected - nothing to preload")
+            self._set_state(ModelLoadState.NOT_LOADED)
+            return
+
+        if self._running:
+            logger.debug("preload: Load in progress - reloading '%s' afterwards", model.name)
+            self._reload_requested = True
+            return
+
+        logger.info("preload: Preloading model '%s'", model.name)
+        self._running = True
+        self._set_state(ModelLoadState.LOADING)
+        self._pool.start(_PreloadRunnable(self))
+
+    @override
+    def get_state(self) -> ModelLoadState:
+        """
+        Get the loading state of the most recently preloaded model.
+
+        Returns:
+            Current ModelLoadState.
+        """
+        return self._state
+
+    @override
+    def subscribe_state_changed(self, listener: Callable[[ModelLoadState, str], None]) -> None:
+        """
+        Subscribe to loading state changes.
+
+        Args:
+            listener: Callback invoked on the UI thread with the new state and an error message.
+        """
+        logger.debug(
+            "subscribe_state_changed: New listener registered (%s)",
+            getattr(listener, '__qualname__', str(listener)),
+        )
+        self._state_changed.connect(listener)
+
+    @override
+    def subscribe_progress(self, listener: Callable[[float], None]) -> None:
+        """
+        Subscribe to loading progress updates.
+
+        Args:
+            listener: Callback invoked on the UI thread with the progress between 0.0 and 1.0.
+        """
+        logger.debug(
+            "subscribe_progress: New listener registered (%s)",
+            getattr(listener, '__qualname__', str(listener)),
+        )
+        self.progress_changed.connect(listener)
+
+    def _on_load_finished(self, error_message: str) -> None:
+        """
+        Handle the end of a background load on the UI thread.
+
+        Args:
+            error_message: Error of the failed load, or empty on success.
+
+        Notes:
+            Starts the next load if the selection changed while loading.
+        """
+        self._running = False
+        if self._reload_requested:
+            self._reload_requested = False
+            self.preload()
+            return
+
+        if error_message:
+            self._set_state(ModelLoadState.FAILED, error_message)
+        else:
+            self._set_state(ModelLoadState.LOADED)
+
+    def _set_state(self, state: ModelLoadState, error_message: str = "") -> None:
+        """
+        Update the state and notify subscribers.
+
+        Args:
+            state: New loading state.
+            error_message: Error message for the FAILED state.
+        """
+        logger.debug("_set_state: Model load state %s -> %s", self._state.value, state.value)
+        self._state = state
+        self._state_changed.emit(state, error_message)
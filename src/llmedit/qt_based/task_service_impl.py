@@ -174,7 +174,8 @@ class TaskServiceImpl(TaskService, QObject, metaclass=_MetaQObjectABC):
             True if the task was found and canceled, False otherwise.
 
         Notes:
-            Running tasks are marked for cancellation (but may complete anyway).
+            Running tasks are marked for cancellation and their cancellation token is cancelled,
+            so work that checks the token stops early; the task still finishes with a result.
             Queued tasks are removed from the callback registry.
         """
         if task_id in self._running:
@@ -183,6 +184,7 @@ class TaskServiceImpl(TaskService, QObject, metaclass=_MetaQObjectABC):
                 task_id,
             )
             self._canceled.add(task_id)
+            self._running[task_id].task_input.cancellation_token.cancel()
             return True
         elif task_id in self._per_task_callbacks:
             logger.warning(
@@ -199,8 +201,8 @@ class TaskServiceImpl(TaskService, QObject, metaclass=_MetaQObjectABC):
         Cancel all currently running and queued tasks.
 
         Notes:
-            Marks all running tasks as canceled and clears the callback registry.
-            No individual task completion signals will be emitted for canceled tasks.
+            Marks all running tasks as canceled, cancels their cancellation tokens and clears the
+            callback registry. No individual task completion signals will be emitted for canceled tasks.
         """
         count = len(self._running) + len(self._per_task_callbacks)
         if count > 0:
@@ -208,8 +210,9 @@ class TaskServiceImpl(TaskService, QObject, metaclass=_MetaQObjectABC):
                 "cancel_all_tasks: Canceling %d active and queued tasks",
                 count,
             )
-        for tid in list(self._running.keys()):
+        for tid, runnable in list(self._running.items()):
             self._canceled.add(tid)
+            runnable.task_input.cancellation_token.cancel()
         self._per_task_callbacks.clear()
 
     @override
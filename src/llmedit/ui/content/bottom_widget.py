@@ -1,8 +1,8 @@
 import logging
 from typing import Optional
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import (QHBoxLayout, QLabel, QSizePolicy, QWidget)
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import (QHBoxLayout, QLabel, QPushButton, QSizePolicy, QWidget)
 
 logger = logging.getLogger(__name__)
 
@@ -11,10 +11,13 @@ class BottomBarWidget(QWidget):
     """
     Status bar widget displaying application state information at the bottom of the window.
 
-    Shows current provider, model, task status, and initialization status in a horizontal layout.
+    Shows current provider, model, model loading status, task status, and initialization status
+    in a horizontal layout, with a button to cancel the running task next to the task status.
     Designed to provide real-time feedback about the application's operational state.
     """
 
+    cancel_clicked = pyqtSignal()
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         """
         Initialize the bottom status bar widget.
@@ -26,18 +29,24 @@ class BottomBarWidget(QWidget):
             Exception: If widget initialization fails due to layout or UI setup errors.
 
         Notes:
-            Creates four status labels and arranges them in a horizontal layout with stretching.
+            Creates five status labels and a hidden cancel button and arranges them in a
+            horizontal layout with stretching.
         """
         super().__init__(parent)
         logger.debug("__init__: Initializing bottom status bar")
 
         self._provider_label = QLabel("Provider: ")
         self._model_label = QLabel("Model: ")
+        self._model_load_status_label = QLabel("")
         self._task_status_label = QLabel("Tasks: ")
         self._initialization_status_label = QLabel("")
-        label_count = 4
+        label_count = 5
         logger.debug("_setup_ui: Created %d status labels", label_count)
 
+        self._cancel_button = QPushButton("Cancel")
+        self._cancel_button.setVisible(False)
+        self._cancel_button.clicked.connect(self.cancel_clicked)
+
         try:
             self._configure_layout()
             logger.debug("__init__: Bottom status bar initialized with %d status elements", self.layout().count())
@@ -52,7 +61,9 @@ class BottomBarWidget(QWidget):
         self._initialization_status_label.setObjectName("bottomBarInitializationStatus")
         self._provider_label.setObjectName("bottomBarProviderStatus")
         self._model_label.setObjectName("bottomBarModelStatus")
+        self._model_load_status_label.setObjectName("bottomBarModelLoadStatus")
         self._task_status_label.setObjectName("bottomBarTaskStatus")
+        self._cancel_button.setObjectName("bottomBarCancelButton")
         self._initialization_status_label.setObjectName("bottomBarInitializationStatusLabel")
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
 
@@ -75,7 +86,9 @@ class BottomBarWidget(QWidget):
 
             layout.addWidget(self._provider_label)
             layout.addWidget(self._model_label)
+            layout.addWidget(self._model_load_status_label)
             layout.addWidget(self._task_status_label)
+            layout.addWidget(self._cancel_button)
             layout.addWidget(self._initialization_status_label)
             layout.addStretch()
 
@@ -139,6 +152,27 @@ class BottomBarWidget(QWidget):
                 exc_info=True,
             )
 
+    def set_model_load_status(self, status: str) -> None:
+        """
+        Update the model loading status display.
+
+        Args:
+            status: Text describing the loading state (e.g., "Loading model... 42%").
+
+        Notes:
+            Updates the model load status label with the provided text; empty hides the status.
+        """
+        try:
+            logger.debug("set_model_load_status: Setting model load status to '%s'", status)
+            self._model_load_status_label.setText(status)
+        except Exception as e:
+            logger.error(
+                "set_model_load_status: Failed to set model load status to '%s': %s",
+                status,
+                str(e),
+                exc_info=True,
+            )
+
     def set_background_task_status(self, status: str) -> None:
         """
         Update the background task status display.
@@ -160,6 +194,23 @@ class BottomBarWidget(QWidget):
                 exc_info=True,
             )
 
+    def set_cancel_visible(self, visible: bool) -> None:
+        """
+        Show or hide the button cancelling the running task.
+
+        Args:
+            visible: True while a task is running, False otherwise.
+        """
+        try:
+            logger.debug("set_cancel_visible: Setting cancel button visible to %s", visible)
+            self._cancel_button.setVisible(visible)
+        except Exception as e:
+            logger.error(
+                "set_cancel_visible: Failed to set cancel button visibility: %s",
+                str(e),
+                exc_info=True,
+            )
+
     def set_initialization_status(self, status: str) -> None:
         """
         Update the initialization status display.
@@ -1,13 +1,15 @@
+import dataclasses
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from PyQt6 import QtWidgets
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QRunnable, Qt, QThreadPool, pyqtSignal
 from PyQt6.QtWidgets import (QMessageBox, QSizePolicy, QVBoxLayout, QWidget)
 
 from llmedit.config.application_prompts import PROMPT_PARAM_INPUT_LANGUAGE, PROMPT_PARAM_OUTPUT_LANGUAGE, PROMPT_PARAM_USER_TEXT
 from llmedit.context import AppContext
-from llmedit.core.models.data_types import ProcessingContext, TaskInput, TaskResult
+from llmedit.core.interfaces.processing.text_processing_service import TextProcessingService
+from llmedit.core.models.data_types import CancellationToken, ProcessingContext, TaskInput, TaskResult
 from llmedit.ui.base_widget import BaseWidget
 from llmedit.ui.content.tab_widgets.action_controls_widget import ActionEvent
 from llmedit.ui.content.tab_widgets.action_tabs_widget import ActionTabsWidget
@@ -16,6 +18,55 @@ from llmedit.ui.content.text_widgets.text_interaction_areas_widget import TextIn
 logger = logging.getLogger(__name__)
 
 
+class _PreflightRunnable(QRunnable):
+    """
+    Runnable checking on a pool thread whether the requests of an action fit the selected model.
+    """
+
+    def __init__(
+        self,
+        widget: "CentralWidget",
+        text_processing_service: TextProcessingService,
+        action: ActionEvent,
+        processing_contexts: List[ProcessingContext],
+    ):
+        """
+        Initialize the runnable.
+
+        Args:
+            widget: Widget whose signal receives the result.
+            text_processing_service: Service checking the requests.
+            action: The action event the requests were built for.
+            processing_contexts: Requests to check; one per variant for variant actions.
+        """
+        super().__init__()
+        self._widget = widget
+        self._text_processing_service = text_processing_service
+        self._action = action
+        self._processing_contexts = processing_contexts
+        self.setAutoDelete(True)
+
+    def run(self):
+        """
+        Run the check and post the result to the UI thread.
+
+        Notes:
+            Stops at the first request that does not fit. Emits the finished signal exactly
+            once, even on error.
+        """
+        fits, error_message = False, ""
+        try:
+            for processing_context in self._processing_contexts:
+                fits, error_message = self._text_processing_service.preflight(processing_context)
+                if not fits:
+                    break
+        except Exception as e:
+            logger.error("_PreflightRunnable.run: Failed to check request: %s", str(e), exc_info=True)
+            fits, error_message = False, f"Failed to check the input length: {str(e)}"
+        finally:
+            self._widget.preflight_finished.emit(self._action, self._processing_contexts, fits, error_message)
+
+
 class CentralWidget(BaseWidget):
     """
     Central application widget combining text input/output areas with action tabs.
@@ -25,6 +76,11 @@ class CentralWidget(BaseWidget):
     to result display.
     """
 
+    text_delta_received = pyqtSignal(str)
+    variant_text_delta_received = pyqtSignal(int, str)
+    partial_result_received = pyqtSignal(str)
+    preflight_finished = pyqtSignal(object, object, bool, str)
+
     def __init__(self, ctx: AppContext, parent: Optional[QWidget] = None) -> None:
         """
         Initialize the central widget.
@@ -58,6 +114,13 @@ class CentralWidget(BaseWidget):
                 QSizePolicy.Policy.Expanding,
             )
             self._tabs.action_button_clicked.connect(self._on_action_btn_clicked)
+            self.text_delta_received.connect(self._on_text_delta_received)
+            self.variant_text_delta_received.connect(self._on_variant_text_delta_received)
+            self.partial_result_received.connect(self.set_output_text)
+            self._preflight_pool = QThreadPool(self)
+            self._preflight_pool.setMaxThreadCount(1)
+            self._preflight_running = False
+            self.preflight_finished.connect(self._on_preflight_finished)
 
             logger.debug(
                 "__init__: Central widget initialized with %d text areas and %d tabs",
@@ -107,11 +170,16 @@ class CentralWidget(BaseWidget):
             action: The action event containing prompt and parameter information.
 
         Notes:
-            Validates system readiness and input text before submitting task.
-            Shows appropriate warnings if conditions are not met.
-            Submits processing task via task service with closure that builds context.
+            Validates system readiness and input text, then checks on a background thread that
+            the request fits the selected model, since counting its tokens may have to read the
+            model's vocabulary or wait for a running task. _on_preflight_finished submits the task.
+            Shows appropriate warnings if conditions are not met. Clicks during a check are ignored.
         """
         try:
+            if self._preflight_running:
+                logger.debug("_on_action_btn_clicked: Action skipped - request check in progress")
+                return
+
             logger.debug(
                 "_on_action_btn_clicked: Button '%s' clicked (prompt: '%s')",
                 action.action_id,
@@ -148,52 +216,84 @@ class CentralWidget(BaseWidget):
                 return
 
             logger.debug(
-                "_on_action_btn_clicked: Preparing task '%s' execution",
+                "_on_action_btn_clicked: Checking request of task '%s'",
                 action.action_id,
             )
+            self._preflight_running = True
+            self._preflight_pool.start(
+                _PreflightRunnable(
+                    self,
+                    self._ctx.text_processing_service,
+                    action,
+                    self._build_processing_contexts(action),
+                )
+            )
+        except Exception as e:
+            self._preflight_running = False
+            logger.error(
+                "_on_action_btn_clicked: Failed to handle action button click: %s",
+                str(e),
+                exc_info=True,
+            )
+
+    def _on_preflight_finished(
+        self,
+        action: ActionEvent,
+        process_ctxs: List[ProcessingContext],
+        fits: bool,
+        error_message: str,
+    ) -> None:
+        """
+        Submit the task of an action once its requests were checked.
+
+        Args:
+            action: The action event the requests were built for.
+            process_ctxs: The checked requests; one per variant for variant actions.
+            fits: Whether the requests fit the selected model.
+            error_message: Reason a request does not fit.
+
+        Notes:
+            Shows a warning instead if a request does not fit. Submits processing task via
+            task service with closure processing the checked request; variant actions are
+            submitted as one fan-out task, see _submit_variants_task.
+        """
+        self._preflight_running = False
+        try:
+            if not fits:
+                logger.debug(
+                    "_on_preflight_finished: Action skipped - %s",
+                    error_message,
+                )
+                self._show_warning_message("Input too long", error_message)
+                return
+
+            if self._ctx.task_service.is_busy():
+                logger.debug("_on_preflight_finished: Action skipped - task in progress")
+                return
+
+            if action.variant_prompts:
+                self._submit_variants_task(action, process_ctxs)
+                return
+
+            process_ctx = process_ctxs[0]
+            cancellation_token = CancellationToken()
 
             def closure() -> str:
                 try:
                     logger.debug(
-                        "_on_action_btn_clicked.closure: Executing task '%s'",
+                        "_on_preflight_finished.closure: Executing task '%s'",
                         action.action_id,
                     )
 
-                    prompt_parameters = {
-                        PROMPT_PARAM_USER_TEXT: self._text_widget.input_text(),
-                    }
-
-                    if action.input_dropdown_item:
-                        input_lang = action.input_dropdown_item()
-                        logger.debug(
-                            "_on_action_btn_clicked.closure: Using input language '%s'",
-                            input_lang,
-                        )
-                        prompt_parameters[PROMPT_PARAM_INPUT_LANGUAGE] = input_lang
-
-                    if action.output_dropdown_item:
-                        output_lang = action.output_dropdown_item()
-                        logger.debug(
-                            "_on_action_btn_clicked.closure: Using output language '%s'",
-                            output_lang,
-                        )
-                        prompt_parameters[PROMPT_PARAM_OUTPUT_LANGUAGE] = output_lang
-
-                    process_ctx = ProcessingContext(
-                        user_prompt_id=action.prompt.id,
-                        prompt_parameters=prompt_parameters,
+                    return self._ctx.text_processing_service.process(
+                        process_ctx,
+                        on_text_delta=self.text_delta_received.emit,
+                        on_chunk_finished=lambda index, count, text: self.partial_result_received.emit(text),
+                        cancellation_token=cancellation_token,
                     )
-
-                    logger.debug(
-                        "_on_action_btn_clicked.closure: Processing context created - prompt_id=%s, params_count=%d",
-                        process_ctx.user_prompt_id,
-                        len(process_ctx.prompt_parameters),
-                    )
-
-                    return self._ctx.text_processing_service.process(process_ctx)
                 except Exception as e:
                     logger.error(
-                        "_on_action_btn_clicked.closure: Task execution failed: %s",
+                        "_on_preflight_finished.closure: Task execution failed: %s",
                         str(e),
                         exc_info=True,
                     )
@@ -203,20 +303,128 @@ class CentralWidget(BaseWidget):
                 id=action.action_id,
                 task_func=closure,
                 on_task_finished=self._on_task_finished,
+                cancellation_token=cancellation_token,
             )
 
             logger.debug(
-                "_on_action_btn_clicked: Submitting task '%s' to task service",
+                "_on_preflight_finished: Submitting task '%s' to task service",
                 action.action_id,
             )
+            self.set_output_text("")
             self._ctx.task_service.submit_task(task)
         except Exception as e:
             logger.error(
-                "_on_action_btn_clicked: Failed to handle action button click: %s",
+                "_on_preflight_finished: Failed to submit task: %s",
                 str(e),
                 exc_info=True,
             )
 
+    def _submit_variants_task(self, action: ActionEvent, process_ctxs: List[ProcessingContext]) -> None:
+        """
+        Submit one task generating all variants of a variant action.
+
+        Args:
+            action: The variant action event.
+            process_ctxs: One checked request per variant prompt.
+
+        Notes:
+            Shows one output tab per variant; streamed fragments go to the tab of their variant
+            and the sanitized results replace them once the task finishes.
+        """
+        cancellation_token = CancellationToken()
+
+        def closure() -> List[str]:
+            try:
+                logger.debug(
+                    "_submit_variants_task.closure: Executing task '%s' with %d variants",
+                    action.action_id,
+                    len(process_ctxs),
+                )
+
+                return self._ctx.text_processing_service.process_variants(
+                    process_ctxs,
+                    on_text_delta=self.variant_text_delta_received.emit,
+                    cancellation_token=cancellation_token,
+                )
+            except Exception as e:
+                logger.error(
+                    "_submit_variants_task.closure: Task execution failed: %s",
+                    str(e),
+                    exc_info=True,
+                )
+                raise
+
+        task = TaskInput(
+            id=action.action_id,
+            task_func=closure,
+            on_task_finished=self._on_variants_task_finished,
+            cancellation_token=cancellation_token,
+        )
+
+        logger.debug(
+            "_submit_variants_task: Submitting task '%s' to task service",
+            action.action_id,
+        )
+        self._text_widget.show_variant_outputs([prompt.name for prompt in action.variant_prompts])
+        self._ctx.task_service.submit_task(task)
+
+    def _build_processing_contexts(self, action: ActionEvent) -> List[ProcessingContext]:
+        """
+        Build the processing contexts of an action from the current input.
+
+        Args:
+            action: The action event containing prompt and parameter information.
+
+        Returns:
+            One context per variant prompt for variant actions, otherwise the action's context.
+        """
+        process_ctx = self._build_processing_context(action)
+        if not action.variant_prompts:
+            return [process_ctx]
+        return [dataclasses.replace(process_ctx, user_prompt_id=prompt.id) for prompt in action.variant_prompts]
+
+    def _build_processing_context(self, action: ActionEvent) -> ProcessingContext:
+        """
+        Build the processing context for an action from the current input.
+
+        Args:
+            action: The action event containing prompt and parameter information.
+
+        Returns:
+            ProcessingContext with the input text and the selected languages, if the action has any.
+        """
+        prompt_parameters = {
+            PROMPT_PARAM_USER_TEXT: self._text_widget.input_text(),
+        }
+
+        if action.input_dropdown_item:
+            input_lang = action.input_dropdown_item()
+            logger.debug(
+                "_build_processing_context: Using input language '%s'",
+                input_lang,
+            )
+            prompt_parameters[PROMPT_PARAM_INPUT_LANGUAGE] = input_lang
+
+        if action.output_dropdown_item:
+            output_lang = action.output_dropdown_item()
+            logger.debug(
+                "_build_processing_context: Using output language '%s'",
+                output_lang,
+            )
+            prompt_parameters[PROMPT_PARAM_OUTPUT_LANGUAGE] = output_lang
+
+        process_ctx = ProcessingContext(
+            user_prompt_id=action.prompt.id,
+            prompt_parameters=prompt_parameters,
+        )
+
+        logger.debug(
+            "_build_processing_context: Processing context created - prompt_id=%s, params_count=%d",
+            process_ctx.user_prompt_id,
+            len(process_ctx.prompt_parameters),
+        )
+        return process_ctx
+
     @staticmethod
     def _show_warning_message(title: str, message: str) -> None:
         """
@@ -285,6 +493,86 @@ class CentralWidget(BaseWidget):
                 exc_info=True,
             )
 
+    def _on_variants_task_finished(self, task_result: TaskResult) -> None:
+        """
+        Handle completion of a variants task.
+
+        Args:
+            task_result: The result of the completed task; its content is the text per variant.
+
+        Notes:
+            Replaces the streamed text of each variant tab with its sanitized result, or shows
+            an error dialog on failure.
+        """
+        try:
+            if task_result.has_error:
+                logger.error(
+                    "_on_variants_task_finished: Task '%s' failed with error: %s",
+                    task_result.id,
+                    task_result.error_message,
+                    exc_info=task_result.exception,
+                )
+
+                self._show_error_message(
+                    "Task Execution Failed",
+                    f"Failed to execute task: {task_result.error_message}",
+                )
+            else:
+                results = task_result.task_result_content or []
+                logger.debug(
+                    "_on_variants_task_finished: Task '%s' completed with %d variants",
+                    task_result.id,
+                    len(results),
+                )
+                for index, result in enumerate(results):
+                    self._text_widget.set_variant_output_text(index, result)
+        except Exception as e:
+            logger.error(
+                "_on_variants_task_finished: Failed to handle task completion: %s",
+                str(e),
+                exc_info=True,
+            )
+
+    def _on_text_delta_received(self, delta: str) -> None:
+        """
+        Append a streamed text fragment to the output area.
+
+        Args:
+            delta: Raw text fragment produced by the model.
+
+        Notes:
+            Emitted from the worker thread and delivered on the GUI thread through a queued connection.
+            The final sanitized result replaces the streamed text once the task finishes.
+        """
+        try:
+            self._text_widget.append_output_text(delta)
+        except Exception as e:
+            logger.error(
+                "_on_text_delta_received: Failed to append streamed text: %s",
+                str(e),
+                exc_info=True,
+            )
+
+    def _on_variant_text_delta_received(self, index: int, delta: str) -> None:
+        """
+        Append a streamed text fragment to the output tab of its variant.
+
+        Args:
+            index: Variant index.
+            delta: Raw text fragment produced by the model.
+
+        Notes:
+            Emitted from the worker thread and delivered on the GUI thread through a queued connection.
+        """
+        try:
+            self._text_widget.append_variant_output_text(index, delta)
+        except Exception as e:
+            logger.error(
+                "_on_variant_text_delta_received: Failed to append streamed text: %s",
+                str(e),
+                exc_info=True,
+            )
+
     @staticmethod
     def _show_error_message(title: str, message: str) -> None:
         """
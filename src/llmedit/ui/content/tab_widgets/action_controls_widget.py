@@ -1,6 +1,6 @@
 import logging
 from dataclasses import dataclass
-from typing import Callable as CallableType, Dict, List, Optional
+from typing import Callable as CallableType, Dict, List, Optional, Tuple
 
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
@@ -27,12 +27,14 @@ class ActionEvent:
     Immutable data class representing a button click event in the action controls.
 
     Carries the action ID, associated prompt, and optional callbacks for retrieving
-    dropdown values at event time.
+    dropdown values at event time. Actions comparing variants carry one prompt per variant
+    in variant_prompts; their prompt is the first variant.
     """
     action_id: str
     prompt: Prompt
     input_dropdown_item: Optional[CallableType[[], str]] = None
     output_dropdown_item: Optional[CallableType[[], str]] = None
+    variant_prompts: Tuple[Prompt, ...] = ()
 
 
 class ActionControlsWidget(BaseWidget):
@@ -51,6 +53,7 @@ class ActionControlsWidget(BaseWidget):
         prompts: List[Prompt],
         input_dropdown_items: Optional[List[str]] = None,
         output_dropdown_items: Optional[List[str]] = None,
+        variant_action: Optional[Tuple[str, str, List[Prompt]]] = None,
         parent=None,
     ):
         """
@@ -61,6 +64,8 @@ class ActionControlsWidget(BaseWidget):
             prompts: List of prompts to create action buttons for.
             input_dropdown_items: Optional list of items for input dropdown.
             output_dropdown_items: Optional list of items for output dropdown.
+            variant_action: Optional (action ID, button text, prompts) of an action comparing
+                the outputs of several prompts; adds a button after the prompt buttons.
             parent: Optional parent widget.
 
         Notes:
@@ -151,6 +156,25 @@ class ActionControlsWidget(BaseWidget):
             )
             btn.clicked.connect(lambda checked, e=event: self.button_clicked.emit(e))
             self._buttons[prompt.id] = btn
+        if variant_action:
+            action_id, button_text, variant_prompts = variant_action
+            logger.debug("__init__: Creating variant action button for %d prompts", len(variant_prompts))
+            btn = QPushButton(button_text)
+            btn.setToolTip("Generates " + ", ".join(prompt.name for prompt in variant_prompts) + " side by side.")
+            btn.setSizePolicy(
+                QSizePolicy.Policy.Expanding,
+                QSizePolicy.Policy.Fixed,
+            )
+            btn.setProperty("action_id", action_id)
+            event = ActionEvent(
+                action_id=action_id,
+                prompt=variant_prompts[0],
+                input_dropdown_item=self.input_dropdown_value,
+                output_dropdown_item=self.output_dropdown_value,
+                variant_prompts=tuple(variant_prompts),
+            )
+            btn.clicked.connect(lambda checked, e=event: self.button_clicked.emit(e))
+            self._buttons[action_id] = btn
         self.setObjectName("actionControlsWidget")
         self._scroll_area.setObjectName("actionControlsWidgetScrollArea")
         if self._input_dropdown:
@@ -4,12 +4,15 @@ from typing import Optional
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (QSizePolicy, QTabWidget, QWidget)
 
+from llmedit.config.application_prompts import TONE_VARIANT_PROMPT_IDS
 from llmedit.context import AppContext
 from llmedit.core.models.enums.prompt_category import PromptCategory
 from llmedit.ui.content.tab_widgets.action_controls_widget import ActionControlsWidget, ActionEvent
 
 logger = logging.getLogger(__name__)
 
+ID_ACTION_COMPARE_TONES = 'action_compare_tones'
+
 
 class ActionTabsWidget(QTabWidget):
     """
@@ -34,7 +37,8 @@ class ActionTabsWidget(QTabWidget):
 
         Notes:
             Creates three tabs: Proofreading, Formatting, and Translating.
-            Translation tab includes input/output language dropdowns.
+            Translation tab includes input/output language dropdowns. The proofreading tab
+            includes a Compare Tones action generating the TONE_VARIANT_PROMPT_IDS prompts together.
             Automatically subscribes to task service busy state to disable during processing.
         """
         super().__init__(parent)
@@ -43,6 +47,7 @@ class ActionTabsWidget(QTabWidget):
             proofreading_prompts = ctx.prompt_service.get_prompts_by_category(PromptCategory.PROOFREAD)
             formatting_prompts = ctx.prompt_service.get_prompts_by_category(PromptCategory.FORMAT)
             translation_prompts = ctx.prompt_service.get_prompts_by_category(PromptCategory.TRANSLATE)
+            tone_prompts = [ctx.prompt_service.get_prompt(prompt_id) for prompt_id in TONE_VARIANT_PROMPT_IDS]
 
             logger.debug(
                 "__init__: Initializing with %d proofreading, %d formatting, and %d translation prompts",
@@ -59,6 +64,7 @@ class ActionTabsWidget(QTabWidget):
             self._proofreading_tab = ActionControlsWidget(
                 ctx=ctx,
                 prompts=proofreading_prompts,
+                variant_action=(ID_ACTION_COMPARE_TONES, "Compare Tones", tone_prompts),
             )
             self._format_tab = ActionControlsWidget(
                 ctx=ctx,
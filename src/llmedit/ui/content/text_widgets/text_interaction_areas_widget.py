@@ -1,12 +1,14 @@
 import logging
-from typing import Optional
+from typing import List, Optional
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QRunnable, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QTextCursor
 from PyQt6.QtWidgets import (
     QApplication,
     QHBoxLayout,
     QLabel,
     QSizePolicy,
+    QTabWidget,
     QTextEdit,
     QToolButton,
     QVBoxLayout,
@@ -14,10 +16,61 @@ from PyQt6.QtWidgets import (
 )
 
 from llmedit.context import AppContext
+from llmedit.core.interfaces.llm_model.tokenizer_service import TokenizerService
 from llmedit.ui.base_widget import BaseWidget
 
 logger = logging.getLogger(__name__)
 
+TOKEN_COUNT_DELAY_MS = 300
+"""Pause in typing after which the input token count is updated."""
+
+
+class _TokenCountRunnable(QRunnable):
+    """
+    Runnable counting the input tokens on a pool thread.
+    """
+
+    def __init__(
+        self,
+        widget: "TextInteractionAreasWidget",
+        tokenizer_service: TokenizerService,
+        text: str,
+        request_id: int,
+    ):
+        """
+        Initialize the runnable.
+
+        Args:
+            widget: Widget whose signal receives the result.
+            tokenizer_service: Tokenizer of the selected model.
+            text: Input text to count.
+            request_id: Number of the count request, used to drop outdated results.
+        """
+        super().__init__()
+        self._widget = widget
+        self._tokenizer_service = tokenizer_service
+        self._text = text
+        self._request_id = request_id
+        self.setAutoDelete(True)
+
+    def run(self):
+        """
+        Count the tokens and post the result to the UI thread.
+
+        Notes:
+            Emits the finished signal exactly once; with a None count if counting failed.
+        """
+        token_count = None
+        context_limit = None
+        try:
+            token_count = self._tokenizer_service.count_text_tokens(self._text)
+            if token_count is not None:
+                context_limit = self._tokenizer_service.get_context_limit()
+        except Exception as e:
+            logger.error("_TokenCountRunnable.run: Failed to count input tokens: %s", str(e), exc_info=True)
+        finally:
+            self._widget.token_count_finished.emit(self._request_id, token_count, context_limit)
+
 
 class TextInteractionAreasWidget(BaseWidget):
     """
@@ -26,9 +79,13 @@ class TextInteractionAreasWidget(BaseWidget):
     Features include:
     - Input area with paste button to import text from clipboard
     - Output area with copy button to export text to clipboard
+    - One output tab per variant when several variants of a task are compared
+    - Live token count of the input for the selected model
     - Responsive layout with labeled sections
     """
 
+    token_count_finished = pyqtSignal(int, object, object)
+
     def __init__(self, ctx: AppContext, parent: Optional[QWidget] = None) -> None:
         """
         Initialize the text interaction widget.
@@ -72,6 +129,18 @@ class TextInteractionAreasWidget(BaseWidget):
             )
             logger.debug("__init__: Input text area initialized")
 
+            self._token_count_label = QLabel("")
+            self._token_count_timer = QTimer(self)
+            self._token_count_timer.setSingleShot(True)
+            self._token_count_timer.setInterval(TOKEN_COUNT_DELAY_MS)
+            self._token_count_timer.timeout.connect(self._update_token_count)
+            self._input_text.textChanged.connect(self._token_count_timer.start)
+            self._token_count_pool = QThreadPool(self)
+            self._token_count_pool.setMaxThreadCount(1)
+            self._token_count_request_id = 0
+            self.token_count_finished.connect(self._on_token_count_finished)
+            logger.debug("__init__: Token count label initialized")
+
             self._output_header = QLabel("Output")
             self._output_header.setStyleSheet("font-weight: bold;")
 
@@ -89,6 +158,15 @@ class TextInteractionAreasWidget(BaseWidget):
             )
             logger.debug("__init__: Output text area initialized (read-only)")
 
+            self._variant_tabs = QTabWidget()
+            self._variant_tabs.setSizePolicy(
+                QSizePolicy.Policy.Expanding,
+                QSizePolicy.Policy.Expanding,
+            )
+            self._variant_tabs.hide()
+            self._variant_texts: List[QTextEdit] = []
+            logger.debug("__init__: Variant output tabs initialized (hidden)")
+
             layout = QHBoxLayout(self)
             layout.setContentsMargins(8, 8, 8, 8)
             layout.setSpacing(8)
@@ -98,6 +176,7 @@ class TextInteractionAreasWidget(BaseWidget):
                 self._paste_button,
                 self._input_text,
                 self._clear_button,
+                self._token_count_label,
             )
             layout.addLayout(input_layout)
 
@@ -106,6 +185,7 @@ class TextInteractionAreasWidget(BaseWidget):
                 self._copy_button,
                 self._output_text,
             )
+            output_layout.addWidget(self._variant_tabs)
             layout.addLayout(output_layout)
 
             logger.debug(
@@ -123,8 +203,10 @@ class TextInteractionAreasWidget(BaseWidget):
         self.setObjectName("textInteractionAreasWidget")
         self._input_header.setObjectName("textInteractionAreaHeader")
         self._input_text.setObjectName("textInteractionAreaInputText")
+        self._token_count_label.setObjectName("textInteractionAreaTokenCount")
         self._output_header.setObjectName("textInteractionAreaHeader")
         self._output_text.setObjectName("textInteractionAreaOutputText")
+        self._variant_tabs.setObjectName("textInteractionAreaVariantTabs")
         self._clear_button.setObjectName("textInteractionAreaClearButton")
         self._paste_button.setObjectName("textInteractionAreaPasteButton")
         self._copy_button.setObjectName("textInteractionAreaCopyButton")
@@ -135,6 +217,7 @@ class TextInteractionAreasWidget(BaseWidget):
                                action_button: QToolButton,
                                text_area: QTextEdit,
                                clear_button: Optional[QToolButton] = None,
+                               info_label: Optional[QLabel] = None,
                                ) -> QVBoxLayout:
         """
         Create a labeled section with header, action button, and text area.
@@ -144,6 +227,7 @@ class TextInteractionAreasWidget(BaseWidget):
             clear_button: Button for clearing text.
             action_button: Button for clipboard operations.
             text_area: QTextEdit for text input/output.
+            info_label: Optional label shown next to the header (e.g. the token count).
 
         Returns:
             QVBoxLayout containing the assembled section.
@@ -160,6 +244,8 @@ class TextInteractionAreasWidget(BaseWidget):
 
             header_layout = QHBoxLayout()
             header_layout.addWidget(header)
+            if info_label:
+                header_layout.addWidget(info_label)
             header_layout.addStretch()
             if clear_button:
                 header_layout.addWidget(clear_button)
@@ -181,6 +267,66 @@ class TextInteractionAreasWidget(BaseWidget):
             )
             raise
 
+    def on_settings_updated(self) -> None:
+        """
+        Recount the input tokens for the newly selected model.
+        """
+        self._update_token_count()
+
+    def _update_token_count(self) -> None:
+        """
+        Start counting the input tokens with the selected model's tokenizer.
+
+        Notes:
+            Runs after a short pause in typing. Counting runs on a background thread, since the
+            first count for a model reads its vocabulary from the GGUF file and the tokenizer may
+            be busy with a running task; the result is shown by _on_token_count_finished.
+        """
+        try:
+            self._token_count_request_id += 1
+            self._token_count_pool.start(
+                _TokenCountRunnable(
+                    self,
+                    self._ctx.tokenizer_service,
+                    self.input_text(),
+                    self._token_count_request_id,
+                )
+            )
+        except Exception as e:
+            logger.error(
+                "_update_token_count: Failed to start counting input tokens: %s",
+                str(e),
+                exc_info=True,
+            )
+
+    def _on_token_count_finished(self, request_id: int, token_count: Optional[int], context_limit: Optional[int]) -> None:
+        """
+        Show the result of a token count.
+
+        Args:
+            request_id: Number of the count request.
+            token_count: Number of input tokens, or None if no tokenizer is available.
+            context_limit: Largest context of the selected model, or None if unknown.
+
+        Notes:
+            Results of outdated requests are dropped. The label is empty if the selected model
+            has no tokenizer available (e.g. Ollama models or models not yet downloaded).
+        """
+        if request_id != self._token_count_request_id:
+            return
+
+        if token_count is None:
+            self._token_count_label.setText("")
+            self._token_count_label.setToolTip("")
+            return
+
+        self._token_count_label.setText(f"{token_count:,} tokens")
+        self._token_count_label.setToolTip(
+            f"The selected model supports up to {context_limit:,} tokens of prompt and answer"
+            if context_limit else ""
+        )
+        logger.debug("_on_token_count_finished: Input has %d tokens", token_count)
+
     def _clear_input(self) -> None:
         """
         Clear the input text area.
@@ -299,13 +445,16 @@ class TextInteractionAreasWidget(BaseWidget):
             text: The text to display in the output QTextEdit.
 
         Notes:
-            Replaces all existing content. Logs the character count.
+            Replaces all existing content and hides the variant outputs, if shown. Logs the
+            character count.
         """
         try:
             logger.debug(
                 "set_output_text: Setting %d characters in output area",
                 len(text),
             )
+            self._variant_tabs.hide()
+            self._output_text.show()
             self._output_text.setPlainText(text)
         except Exception as e:
             logger.error(
@@ -314,18 +463,132 @@ class TextInteractionAreasWidget(BaseWidget):
                 exc_info=True,
             )
 
+    def append_output_text(self, text: str) -> None:
+        """
+        Append text to the end of the output area.
+
+        Args:
+            text: The text fragment to append.
+
+        Notes:
+            Used for streamed generation output. Inserts plain text at the end of the document
+            without adding paragraph breaks and keeps the view scrolled to the latest text.
+        """
+        try:
+            self._append_text(self._output_text, text)
+        except Exception as e:
+            logger.error(
+                "append_output_text: Failed to append output text: %s",
+                str(e),
+                exc_info=True,
+            )
+
+    def show_variant_outputs(self, variant_names: List[str]) -> None:
+        """
+        Replace the output area with one empty output tab per variant.
+
+        Args:
+            variant_names: Tab titles, in variant order.
+
+        Notes:
+            The tabs stay shown until set_output_text is called; the Copy button copies the
+            text of the selected tab.
+        """
+        try:
+            logger.debug(
+                "show_variant_outputs: Showing %d variant outputs",
+                len(variant_names),
+            )
+            self._variant_tabs.clear()
+            self._variant_texts = []
+            for name in variant_names:
+                variant_text = QTextEdit()
+                variant_text.setAcceptRichText(False)
+                variant_text.setObjectName("textInteractionAreaOutputText")
+                self._variant_tabs.addTab(variant_text, name)
+                self._variant_texts.append(variant_text)
+            self._output_text.hide()
+            self._variant_tabs.show()
+        except Exception as e:
+            logger.error(
+                "show_variant_outputs: Failed to show variant outputs: %s",
+                str(e),
+                exc_info=True,
+            )
+
+    def set_variant_output_text(self, index: int, text: str) -> None:
+        """
+        Set the text of a variant output tab.
+
+        Args:
+            index: Variant index, as passed to show_variant_outputs.
+            text: The text to display.
+        """
+        try:
+            logger.debug(
+                "set_variant_output_text: Setting %d characters in variant output %d",
+                len(text),
+                index,
+            )
+            self._variant_texts[index].setPlainText(text)
+        except Exception as e:
+            logger.error(
+                "set_variant_output_text: Failed to set variant output text: %s",
+                str(e),
+                exc_info=True,
+            )
+
+    def append_variant_output_text(self, index: int, text: str) -> None:
+        """
+        Append text to the end of a variant output tab.
+
+        Args:
+            index: Variant index, as passed to show_variant_outputs.
+            text: The text fragment to append.
+
+        Notes:
+            Used for streamed generation output, like append_output_text.
+        """
+        try:
+            self._append_text(self._variant_texts[index], text)
+        except Exception as e:
+            logger.error(
+                "append_variant_output_text: Failed to append variant output text: %s",
+                str(e),
+                exc_info=True,
+            )
+
+    @staticmethod
+    def _append_text(text_area: QTextEdit, text: str) -> None:
+        """
+        Append plain text to the end of a text area and keep it scrolled to the latest text.
+
+        Args:
+            text_area: Text area to append to.
+            text: The text fragment to append.
+        """
+        cursor = text_area.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+        text_area.setTextCursor(cursor)
+        text_area.ensureCursorVisible()
+
     def output_text(self) -> str:
         """
         Get the current text from the output area.
 
         Returns:
-            The plain text content of the output QTextEdit.
+            The plain text content of the output QTextEdit, or of the selected variant output
+            tab while variants are shown.
 
         Notes:
             Returns empty string if retrieval fails.
         """
         try:
-            text = self._output_text.toPlainText()
+            if not self._variant_tabs.isHidden() and self._variant_texts:
+                text = self._variant_texts[self._variant_tabs.currentIndex()].toPlainText()
+            else:
+                text = self._output_text.toPlainText()
             logger.debug(
                 "output_text: Returning %d characters from output area",
                 len(text),
@@ -359,6 +622,7 @@ class TextInteractionAreasWidget(BaseWidget):
 
             self._input_text.setEnabled(enabled)
             self._output_text.setEnabled(enabled)
+            self._variant_tabs.setEnabled(enabled)
             self._paste_button.setEnabled(enabled)
             self._copy_button.setEnabled(enabled)
         except Exception as e:
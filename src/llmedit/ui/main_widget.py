@@ -4,6 +4,7 @@ from typing import Optional
 from PyQt6.QtWidgets import (QDialog, QSizePolicy, QVBoxLayout, QWidget)
 from PyQt6.QtCore import Qt
 from llmedit.context import AppContext
+from llmedit.core.models.enums.model_load_state import ModelLoadState
 from llmedit.ui.base_widget import BaseWidget
 from llmedit.ui.content.bottom_widget import BottomBarWidget
 from llmedit.ui.content.central_widget import CentralWidget
@@ -62,7 +63,12 @@ class MainWidget(BaseWidget):
         )
 
         self._top_widget.settings_clicked.connect(self._on_settings_clicked)
-        logger.debug("__init__: Connected settings clicked signal")
+        self._bottom_widget.cancel_clicked.connect(self._on_cancel_clicked)
+        logger.debug("__init__: Connected settings and cancel clicked signals")
+
+        self._ctx.model_preloader.subscribe_state_changed(self.on_model_load_state_changed)
+        self._ctx.model_preloader.subscribe_progress(self.on_model_load_progress)
+        logger.debug("__init__: Subscribed to model loading state and progress")
 
         self.on_widget_initialization_complete()
         logger.debug(
@@ -103,6 +109,23 @@ class MainWidget(BaseWidget):
             if settings_dialog:
                 settings_dialog.deleteLater()
 
+    def _on_cancel_clicked(self) -> None:
+        """
+        Handle cancel button click by cancelling the running tasks.
+
+        Notes:
+            Generation stops at the next token; the output area keeps the text streamed so far.
+        """
+        logger.debug("_on_cancel_clicked: Cancelling running tasks")
+        try:
+            self._ctx.task_service.cancel_all_tasks()
+        except Exception as e:
+            logger.error(
+                "_on_cancel_clicked: Failed to cancel running tasks: %s",
+                str(e),
+                exc_info=True,
+            )
+
     def on_settings_updated(self) -> None:
         """
         Handle settings update events from the application context.
@@ -128,6 +151,50 @@ class MainWidget(BaseWidget):
                 exc_info=True,
             )
 
+    def on_model_load_state_changed(self, state: ModelLoadState, error_message: str) -> None:
+        """
+        Handle changes in the background model loading state.
+
+        Args:
+            state: New loading state of the selected model.
+            error_message: Error of a failed load, empty otherwise.
+
+        Notes:
+            Updates the bottom bar model load status message accordingly.
+        """
+        try:
+            logger.debug("on_model_load_state_changed: Model load state changed to %s", state.value)
+
+            if state == ModelLoadState.LOADING:
+                self._bottom_widget.set_model_load_status("Loading model...")
+            elif state == ModelLoadState.LOADED:
+                self._bottom_widget.set_model_load_status("Model loaded")
+            elif state == ModelLoadState.FAILED:
+                logger.warning("on_model_load_state_changed: Model load failed: %s", error_message)
+                self._bottom_widget.set_model_load_status("Model load failed")
+            else:
+                self._bottom_widget.set_model_load_status("")
+        except Exception as e:
+            logger.error(
+                "on_model_load_state_changed: Failed to update model load status display: %s",
+                str(e),
+                exc_info=True,
+            )
+
+    def on_model_load_progress(self, progress: float) -> None:
+        """
+        Handle model loading progress updates.
+
+        Args:
+            progress: Loading progress between 0.0 and 1.0.
+
+        Notes:
+            Only shown while the model is loading; late updates are ignored.
+        """
+        if self._ctx.model_preloader.get_state() != ModelLoadState.LOADING:
+            return
+        self._bottom_widget.set_model_load_status(f"Loading model... {int(progress * 100)}%")
+
     def on_system_ready_changed(self, is_ready: bool) -> None:
         """
         Handle changes in system readiness state.
@@ -164,7 +231,8 @@ class MainWidget(BaseWidget):
             enabled: True to enable widgets, False to disable.
 
         Notes:
-            Updates the bottom bar task status message to reflect processing state.
+            Updates the bottom bar task status message to reflect processing state and shows
+            the cancel button while tasks are running.
         """
         try:
             state = "ENABLED" if enabled else "DISABLED"
@@ -177,6 +245,7 @@ class MainWidget(BaseWidget):
                 self._bottom_widget.set_background_task_status("")
             else:
                 self._bottom_widget.set_background_task_status("Running tasks...")
+            self._bottom_widget.set_cancel_visible(not enabled)
         except Exception as e:
             logger.error(
                 "on_widgets_enabled_changed: Failed to update widget enabled state display: %s",
@@ -71,6 +71,7 @@ class SettingsDialog(QDialog):
                 self.model_combo.setEditText(self._state.llm_model_name)
 
         self.provider_combo.currentIndexChanged.connect(self._on_provider_changed)
+        app_context.model_directory_watcher.subscribe_models_changed(self._on_models_changed)
 
         self.temp_check = QCheckBox("Enable custom temperature")
         self.temp_check.setChecked(self._state.llm_temperature_enabled)
@@ -127,14 +128,40 @@ class SettingsDialog(QDialog):
         Notes:
             Clears and repopulates the model combo box.
             Includes an empty option at the top.
+            Model details are shown as tooltips; unavailable models (e.g. incomplete downloads)
+            are listed but cannot be selected.
             Called when provider changes or dialog initializes.
         """
         self.model_combo.clear()
         models = self._settings_service.get_llm_models_for_selected_provider()
         for m in models:
             self.model_combo.addItem(m.name, m.name)
+            index = self.model_combo.count() - 1
+            if m.details:
+                self.model_combo.setItemData(index, m.details, Qt.ItemDataRole.ToolTipRole)
+            if not m.is_available:
+                self.model_combo.model().item(index).setEnabled(False)
         self.model_combo.insertItem(0, "", None)
 
+    def _on_models_changed(self):
+        """
+        Handle changes of the local model directory while the dialog is open.
+
+        Notes:
+            Reloads the model list if the llama.cpp provider is selected, keeping the entered
+            model name.
+        """
+        if self.provider_combo.currentData() != LlmProviderType.LLAMA_CPP:
+            return
+
+        model_name = self.model_combo.currentText()
+        self._reload_models()
+        idx = self.model_combo.findText(model_name)
+        if idx >= 0:
+            self.model_combo.setCurrentIndex(idx)
+        else:
+            self.model_combo.setEditText(model_name)
+
     def _on_provider_changed(self):
         """
         Handle LLM provider selection changes.
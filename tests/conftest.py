@@ -0,0 +1,23 @@
+import threading
+from typing import Iterator
+
+import pytest
+
+from tests.stub_http_server import StubServer
+
+SERVER_POLL_SECONDS = 0.05
+
+
+@pytest.fixture
+def stub_server() -> Iterator[StubServer]:
+    """
+    Provide a running StubServer, shut down after the test.
+    """
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, args=(SERVER_POLL_SECONDS,), daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
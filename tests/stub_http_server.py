@@ -0,0 +1,120 @@
+import json
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+StubRoute = Callable[["StubRequestHandler"], None]
+
+
+@dataclass(frozen=True)
+class RecordedRequest:
+    """
+    Immutable data class holding a request received by the stub server.
+
+    client_port identifies the client connection the request arrived on.
+    """
+    method: str
+    path: str
+    client_port: int
+    body: Any
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Local HTTP/1.1 server answering requests with scripted routes and recording what it received.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        """
+        Initialize server on a free local port; it is not serving until started.
+        """
+        super().__init__(("127.0.0.1", 0), StubRequestHandler)
+        self.routes: Dict[Tuple[str, str], StubRoute] = { }
+        self.requests: List[RecordedRequest] = []
+        self.client_disconnected = threading.Event()
+
+    @property
+    def base_url(self) -> str:
+        """
+        Get the server URL.
+
+        Returns:
+            URL of the form http://127.0.0.1:<port>.
+        """
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """
+    Request handler dispatching to the routes of the StubServer.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server: StubServer
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def send_json(self, status: int, payload: Any) -> None:
+        """
+        Send a JSON response with a Content-Length, keeping the connection open.
+
+        Args:
+            status: HTTP status code.
+            payload: JSON-serializable body.
+        """
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_events(self, events: Iterable[Union[Dict[str, Any], str]], interval_seconds: float = 0.0) -> None:
+        """
+        Stream server-sent events with chunked transfer encoding.
+
+        Args:
+            events: Payloads sent as "data:" events; strings are sent verbatim, e.g. comments
+                or "data: [DONE]\\n\\n".
+            interval_seconds: Pause after each event.
+
+        Notes:
+            If the client closes the connection, the server's client_disconnected event is set.
+        """
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for event in events:
+                text = event if isinstance(event, str) else f"data: {json.dumps(event)}\n\n"
+                data = text.encode("utf-8")
+                self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                if interval_seconds > 0:
+                    time.sleep(interval_seconds)
+            self.wfile.write(b"0\r\n\r\n")
+        except OSError:
+            self.server.client_disconnected.set()
+            self.close_connection = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _handle(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length)) if length else None
+        self.server.requests.append(RecordedRequest(method, self.path, self.client_address[1], body))
+
+        route = self.server.routes.get((method, self.path))
+        if route is None:
+            self.send_json(404, { "error": f"No route for {method} {self.path}" })
+            return
+        route(self)
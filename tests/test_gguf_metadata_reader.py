@@ -0,0 +1,144 @@
+import struct
+from pathlib import Path
+from typing import Any, List, Sequence, Tuple
+
+import pytest
+
+from llmedit.infra.services.gguf_metadata_reader import GGUF_DEFAULT_ALIGNMENT, read_gguf_metadata
+
+VALUE_TYPE_UINT32 = 4
+VALUE_TYPE_STRING = 8
+VALUE_TYPE_ARRAY = 9
+GGML_TYPE_F32 = 0
+GGML_TYPE_Q4_K = 12
+FILE_TYPE_Q4_K_M = 15
+
+CHAT_TEMPLATE = "{% for message in messages %}{{ message.content }}{% endfor %}"
+
+
+def gguf_string(value: str) -> bytes:
+    data = value.encode("utf-8")
+    return struct.pack("<Q", len(data)) + data
+
+
+def gguf_value(value_type: int, value: Any) -> bytes:
+    if value_type == VALUE_TYPE_STRING:
+        return gguf_string(value)
+    if value_type == VALUE_TYPE_UINT32:
+        return struct.pack("<I", value)
+    if value_type == VALUE_TYPE_ARRAY:
+        element_type, elements = value
+        return struct.pack("<IQ", element_type, len(elements)) + b"".join(
+            gguf_value(element_type, element) for element in elements
+        )
+    raise ValueError(f"Unsupported value type {value_type}")
+
+
+def build_header(
+    values: Sequence[Tuple[str, int, Any]],
+    tensors: Sequence[Tuple[str, Sequence[int], int, int]],
+) -> bytes:
+    """
+    Build a GGUF v3 header.
+
+    Args:
+        values: (key, value type, value) metadata entries.
+        tensors: (name, dimensions, ggml type, data offset) tensor infos.
+    """
+    header = b"GGUF" + struct.pack("<IQQ", 3, len(tensors), len(values))
+    for key, value_type, value in values:
+        header += gguf_string(key) + struct.pack("<I", value_type) + gguf_value(value_type, value)
+    for name, dimensions, ggml_type, offset in tensors:
+        header += gguf_string(name) + struct.pack("<I", len(dimensions))
+        header += b"".join(struct.pack("<Q", dimension) for dimension in dimensions)
+        header += struct.pack("<IQ", ggml_type, offset)
+    return header
+
+
+# 64 * 2 F32 elements take 512 bytes, followed by one Q4_K block of 256 elements in 144 bytes
+TENSORS: List[Tuple[str, Sequence[int], int, int]] = [
+    ("token_embd.weight", [64, 2], GGML_TYPE_F32, 0),
+    ("output.weight", [256], GGML_TYPE_Q4_K, 512),
+]
+TENSOR_DATA_BYTES = 512 + 144
+
+VALUES: List[Tuple[str, int, Any]] = [
+    ("general.architecture", VALUE_TYPE_STRING, "llama"),
+    ("general.name", VALUE_TYPE_STRING, "Tiny Llama"),
+    ("general.file_type", VALUE_TYPE_UINT32, FILE_TYPE_Q4_K_M),
+    ("llama.context_length", VALUE_TYPE_UINT32, 4096),
+    ("tokenizer.ggml.tokens", VALUE_TYPE_ARRAY, (VALUE_TYPE_STRING, ["<s>", "</s>", "hello", "world"] * 100)),
+    ("tokenizer.ggml.token_type", VALUE_TYPE_ARRAY, (VALUE_TYPE_UINT32, [1] * 400)),
+    ("tokenizer.chat_template", VALUE_TYPE_STRING, CHAT_TEMPLATE),
+]
+
+
+def write_model(path: Path, data_bytes: int = TENSOR_DATA_BYTES) -> int:
+    """
+    Write a GGUF file whose tensor data is cut to data_bytes.
+
+    Returns:
+        Size of the complete file.
+    """
+    header = build_header(VALUES, TENSORS)
+    data_offset = -(-len(header) // GGUF_DEFAULT_ALIGNMENT) * GGUF_DEFAULT_ALIGNMENT
+    path.write_bytes(header + bytes(data_offset - len(header)) + bytes(data_bytes))
+    return data_offset + TENSOR_DATA_BYTES
+
+
+def test_metadata_is_read_from_the_header(tmp_path: Path):
+    model_path = tmp_path / "tiny.gguf"
+    complete_size = write_model(model_path)
+
+    metadata = read_gguf_metadata(model_path)
+
+    assert metadata.architecture == "llama"
+    assert metadata.name == "Tiny Llama"
+    assert metadata.context_length == 4096
+    assert metadata.quantization == "Q4_K_M"
+    assert metadata.chat_template == CHAT_TEMPLATE
+    assert metadata.tensor_count == 2
+    assert metadata.parameter_count == 64 * 2 + 256
+    assert metadata.file_size == complete_size
+    assert metadata.expected_file_size == complete_size
+    assert metadata.is_complete
+
+
+def test_file_with_missing_tensor_data_is_incomplete(tmp_path: Path):
+    model_path = tmp_path / "partial.gguf"
+    complete_size = write_model(model_path, data_bytes=100)
+
+    metadata = read_gguf_metadata(model_path)
+
+    assert metadata.expected_file_size == complete_size
+    assert metadata.file_size < complete_size
+    assert not metadata.is_complete
+
+
+def test_unknown_tensor_type_leaves_the_size_unknown(tmp_path: Path):
+    model_path = tmp_path / "unknown_type.gguf"
+    model_path.write_bytes(build_header(VALUES, [("weight", [32], 9999, 0)]))
+
+    metadata = read_gguf_metadata(model_path)
+
+    assert metadata.expected_file_size == 0
+    assert metadata.is_complete
+
+
+def test_other_files_are_rejected(tmp_path: Path):
+    model_path = tmp_path / "not_a_model.gguf"
+    model_path.write_bytes(b"PK\x03\x04 definitely not gguf")
+
+    with pytest.raises(ValueError, match="Not a GGUF file"):
+        read_gguf_metadata(model_path)
+
+
+@pytest.mark.parametrize("header_bytes", [10, 40, 200, 2000])
+def test_cut_off_header_is_rejected(tmp_path: Path, header_bytes: int):
+    model_path = tmp_path / "cut.gguf"
+    header = build_header(VALUES, TENSORS)
+    assert header_bytes < len(header)
+    model_path.write_bytes(header[:header_bytes])
+
+    with pytest.raises(ValueError, match="truncated"):
+        read_gguf_metadata(model_path)
@@ -0,0 +1,135 @@
+import json
+import time
+
+import pytest
+
+from llmedit.infra.services.http_connection_pool import HttpConnectionPool
+from tests.stub_http_server import StubRequestHandler, StubServer
+
+
+@pytest.fixture
+def pool(stub_server: StubServer):
+    connection_pool = HttpConnectionPool(stub_server.base_url, max_connections=2, timeout_seconds=5)
+    yield connection_pool
+    connection_pool.close()
+
+
+def test_request_returns_response_body(stub_server: StubServer, pool: HttpConnectionPool):
+    stub_server.routes[("GET", "/v1/models")] = lambda handler: handler.send_json(200, { "data": [] })
+
+    with pool.request("GET", "/v1/models") as response:
+        payload = json.loads(response.read())
+
+    assert payload == { "data": [] }
+
+
+def test_request_sends_json_body_and_headers(stub_server: StubServer):
+    stub_server.routes[("POST", "/echo")] = lambda handler: handler.send_json(200, dict(handler.headers))
+    pool = HttpConnectionPool(stub_server.base_url, 1, 5, headers={ "Authorization": "Bearer secret" })
+
+    with pool.request("POST", "/echo", { "value": 1 }) as response:
+        headers = json.loads(response.read())
+    pool.close()
+
+    assert stub_server.requests[0].body == { "value": 1 }
+    assert headers["Authorization"] == "Bearer secret"
+    assert headers["Content-Type"] == "application/json"
+
+
+def test_path_prefix_of_base_url_is_prepended(stub_server: StubServer):
+    stub_server.routes[("GET", "/api/v1/models")] = lambda handler: handler.send_json(200, { })
+    pool = HttpConnectionPool(stub_server.base_url + "/api/", 1, 5)
+
+    with pool.request("GET", "/v1/models") as response:
+        response.read()
+    pool.close()
+
+    assert stub_server.requests[0].path == "/api/v1/models"
+
+
+def test_completed_responses_reuse_the_connection(stub_server: StubServer, pool: HttpConnectionPool):
+    stub_server.routes[("GET", "/ping")] = lambda handler: handler.send_json(200, { })
+
+    for _ in range(3):
+        with pool.request("GET", "/ping") as response:
+            response.read()
+
+    assert len({ request.client_port for request in stub_server.requests }) == 1
+
+
+def test_stale_keep_alive_connection_is_retried_on_a_new_connection(stub_server: StubServer, pool: HttpConnectionPool):
+    def respond_and_drop_connection(handler: StubRequestHandler) -> None:
+        # Keep-alive as far as the client can tell, but closed right after the response
+        handler.send_json(200, { "request": len(stub_server.requests) })
+        handler.close_connection = True
+
+    stub_server.routes[("GET", "/ping")] = respond_and_drop_connection
+
+    with pool.request("GET", "/ping") as response:
+        first = json.loads(response.read())
+    with pool.request("GET", "/ping") as response:
+        second = json.loads(response.read())
+
+    assert first == { "request": 1 }
+    assert second["request"] >= 2
+    assert len({ request.client_port for request in stub_server.requests }) == 2
+
+
+def test_read_timeout_on_a_reused_connection_is_not_retried(stub_server: StubServer):
+    def respond_slowly(handler: StubRequestHandler) -> None:
+        if len(stub_server.requests) > 1:
+            time.sleep(1)
+        try:
+            handler.send_json(200, { })
+        except OSError:
+            handler.close_connection = True
+
+    stub_server.routes[("POST", "/v1/chat/completions")] = respond_slowly
+    pool = HttpConnectionPool(stub_server.base_url, 1, timeout_seconds=0.3)
+    with pool.request("POST", "/v1/chat/completions", { }) as response:
+        response.read()
+
+    with pytest.raises(TimeoutError):
+        with pool.request("POST", "/v1/chat/completions", { }):
+            pass
+    pool.close()
+
+    assert len(stub_server.requests) == 2
+
+
+def test_unread_response_closes_the_connection(stub_server: StubServer, pool: HttpConnectionPool):
+    stub_server.routes[("GET", "/stream")] = lambda handler: handler.send_events(
+        ({ "index": index } for index in range(1000)),
+        interval_seconds=0.001,
+    )
+
+    with pool.request("GET", "/stream") as response:
+        response.readline()
+
+    assert stub_server.client_disconnected.wait(5)
+
+
+def test_non_2xx_status_raises_with_the_error_body(stub_server: StubServer, pool: HttpConnectionPool):
+    stub_server.routes[("GET", "/fail")] = lambda handler: handler.send_json(503, { "error": "model is loading" })
+
+    with pytest.raises(RuntimeError, match="HTTP 503") as error:
+        with pool.request("GET", "/fail"):
+            pytest.fail("The body must not be entered on an error status")
+
+    assert "model is loading" in str(error.value)
+
+
+def test_unreachable_server_raises_os_error(stub_server: StubServer):
+    url = stub_server.base_url
+    stub_server.shutdown()
+    stub_server.server_close()
+    pool = HttpConnectionPool(url, 1, 5)
+
+    with pytest.raises(OSError):
+        with pool.request("GET", "/v1/models"):
+            pass
+
+
+def test_unsupported_scheme_is_rejected():
+    with pytest.raises(ValueError):
+        HttpConnectionPool("ftp://127.0.0.1", 1, 5)
@@ -0,0 +1,204 @@
+import threading
+from typing import List, Optional, Set, Tuple
+from unittest import mock
+
+import pytest
+
+from llmedit.application.services.app_prompt_service import AppPromptService
+from llmedit.application.services.paragraph_text_chunking_service import ParagraphTextChunkingService
+from llmedit.application.services.reasoning_text_sanitization_service import ReasoningTextSanitizationService
+from llmedit.application.services.text_processing_service_base import TextProcessingServiceBase
+from llmedit.config.application_prompts import ID_PROMPT_PROOFREAD_BASE, PROMPT_PARAM_USER_TEXT
+from llmedit.core.interfaces.llm_model.model_service import ModelService
+from llmedit.core.interfaces.llm_model.model_service_provider import ModelServiceProvider
+from llmedit.core.interfaces.settings.settings_service import SettingsService
+from llmedit.core.models.data_types import (CancellationToken, GenerationRequest, GenerationResponse, LoadProgressCallback,
+                                            ProcessingContext, TextDeltaCallback, VariantTextDeltaCallback)
+from llmedit.core.models.settings import ModelInformation
+from llmedit.infra.services.in_memory_paragraph_result_store import InMemoryParagraphResultStore
+
+
+class UppercaseModelService(ModelService):
+    """
+    Model service answering every request with its user input in upper case.
+
+    Responses to inputs containing one of truncated_inputs are marked truncated.
+    """
+
+    def __init__(self, parallel_requests: int) -> None:
+        self.parallel_requests = parallel_requests
+        self.model_version = "1:1"
+        self.truncated_inputs: Set[str] = set()
+        self.inputs: List[str] = []
+        self._lock = threading.Lock()
+
+    def is_model_loaded(self) -> bool:
+        return True
+
+    def load_model(self, on_progress: Optional[LoadProgressCallback] = None) -> None:
+        pass
+
+    def unload_model(self) -> None:
+        pass
+
+    def get_model_information(self) -> ModelInformation:
+        return ModelInformation(name="Uppercase", fileName="uppercase.gguf")
+
+    def get_model_version(self) -> str:
+        return self.model_version
+
+    def estimate_memory_bytes(self) -> int:
+        return 0
+
+    def max_parallel_requests(self) -> int:
+        return self.parallel_requests
+
+    def generate_response(
+        self,
+        request: GenerationRequest,
+        on_text_delta: Optional[TextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> GenerationResponse:
+        with self._lock:
+            self.inputs.append(request.user_input_text)
+        text = request.user_input_text.upper()
+        if on_text_delta is not None:
+            on_text_delta(text)
+        truncated = any(truncated_input in request.user_input_text for truncated_input in self.truncated_inputs)
+        return GenerationResponse(
+            text_content=text,
+            original_request=request,
+            metadata={ "truncated": str(truncated).lower() },
+        )
+
+    def generate_variant_responses(
+        self,
+        requests: List[GenerationRequest],
+        on_text_delta: Optional[VariantTextDeltaCallback] = None,
+        cancellation_token: Optional[CancellationToken] = None,
+    ) -> List[GenerationResponse]:
+        return [self.generate_response(request) for request in requests]
+
+
+class FixedModelServiceProvider(ModelServiceProvider):
+    """
+    Provider always returning the same model service.
+    """
+
+    def __init__(self, settings_service: SettingsService, model_service: ModelService) -> None:
+        super().__init__(settings_service)
+        self._model_service = model_service
+
+    def get_model_service(self) -> ModelService:
+        return self._model_service
+
+
+def make_context(text: str) -> ProcessingContext:
+    return ProcessingContext(user_prompt_id=ID_PROMPT_PROOFREAD_BASE, prompt_parameters={ PROMPT_PARAM_USER_TEXT: text })
+
+
+def make_text(paragraphs: List[str]) -> str:
+    return "\n\n".join(paragraphs)
+
+
+@pytest.fixture(params=[1, 3], ids=["sequential", "parallel"])
+def services(request: pytest.FixtureRequest) -> Tuple[TextProcessingServiceBase, UppercaseModelService]:
+    settings_service = mock.create_autospec(SettingsService, instance=True)
+    settings_service.get_llm_temperature_enabled.return_value = False
+    model_service = UppercaseModelService(parallel_requests=request.param)
+    text_processing_service = TextProcessingServiceBase(
+        settings_service=settings_service,
+        sanitizer_service=ReasoningTextSanitizationService(),
+        model_service_provider=FixedModelServiceProvider(settings_service, model_service),
+        prompt_service=AppPromptService(),
+        chunking_service=ParagraphTextChunkingService(),
+        paragraph_result_store=InMemoryParagraphResultStore(),
+    )
+    return text_processing_service, model_service
+
+
+PARAGRAPHS = [f"Paragraph {index} has a few words in it." for index in range(8)]
+
+
+def test_first_run_reassembles_all_paragraphs(services):
+    text_processing_service, model_service = services
+    text = make_text(PARAGRAPHS)
+
+    result = text_processing_service.process(make_context(text))
+
+    assert result == text.upper()
+    assert "".join(model_service.inputs).count("Paragraph") == len(PARAGRAPHS)
+
+
+def test_only_changed_paragraphs_are_generated_again(services):
+    text_processing_service, model_service = services
+    text_processing_service.process(make_context(make_text(PARAGRAPHS)))
+    model_service.inputs.clear()
+    edited = list(PARAGRAPHS)
+    edited[3] = "Paragraph three was edited."
+    edited[6] = "Six was edited too."
+    chunks_finished: List[Tuple[int, int]] = []
+
+    result = text_processing_service.process(
+        make_context(make_text(edited)),
+        on_chunk_finished=lambda index, count, _: chunks_finished.append((index, count)),
+    )
+
+    assert result == make_text(edited).upper()
+    assert sorted(model_service.inputs) == ["Paragraph three was edited.", "Six was edited too."]
+    assert sorted(chunks_finished) == [(index, len(edited)) for index in range(len(edited))]
+
+
+def test_streamed_fragments_cover_reused_and_generated_paragraphs(services):
+    text_processing_service, model_service = services
+    if model_service.parallel_requests > 1:
+        pytest.skip("Fragments of parallel chunks interleave")
+    text_processing_service.process(make_context(make_text(PARAGRAPHS)))
+    edited = list(PARAGRAPHS)
+    edited[0] = "A new opening paragraph."
+    deltas: List[str] = []
+
+    result = text_processing_service.process(make_context(make_text(edited)), on_text_delta=deltas.append)
+
+    assert "".join(deltas) == result == make_text(edited).upper()
+
+
+def test_unchanged_text_is_answered_without_generating(services):
+    text_processing_service, model_service = services
+    text = make_text(PARAGRAPHS)
+    text_processing_service.process(make_context(text))
+    model_service.inputs.clear()
+
+    result = text_processing_service.process(make_context(text))
+
+    assert result == text.upper()
+    assert model_service.inputs == []
+
+
+def test_truncated_results_are_not_reused(services):
+    text_processing_service, model_service = services
+    text_processing_service.process(make_context(make_text(PARAGRAPHS)))
+    edited = list(PARAGRAPHS)
+    edited[2] = "Paragraph two was edited."
+    edited[5] = "Five was edited and cut off."
+    model_service.truncated_inputs.add(edited[5])
+    text_processing_service.process(make_context(make_text(edited)))
+    model_service.inputs.clear()
+    model_service.truncated_inputs.clear()
+
+    result = text_processing_service.process(make_context(make_text(edited)))
+
+    assert result == make_text(edited).upper()
+    assert model_service.inputs == [edited[5]]
+
+
+def test_replaced_model_weights_invalidate_stored_results(services):
+    text_processing_service, model_service = services
+    text = make_text(PARAGRAPHS)
+    text_processing_service.process(make_context(text))
+    model_service.inputs.clear()
+    model_service.model_version = "2:2"
+
+    text_processing_service.process(make_context(text))
+
+    assert "".join(model_service.inputs).count("Paragraph") == len(PARAGRAPHS)
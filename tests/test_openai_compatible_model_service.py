@@ -0,0 +1,232 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from llmedit.core.interfaces.llm_model.model_service import GenerationCancelledError
+from llmedit.core.models.data_types import CancellationToken, GenerationRequest, OutputBudget
+from llmedit.core.models.enums.llm_provider_type import LlmProviderType
+from llmedit.core.models.settings import ModelInformation
+from llmedit.infra.services.http_connection_pool import HttpConnectionPool
+from llmedit.infra.services.openai_compatible_model_service import (CHAT_COMPLETIONS_PATH, MODELS_PATH,
+                                                                    OpenAiCompatibleModelService, list_server_models)
+from tests.stub_http_server import StubRequestHandler, StubServer
+
+MODEL_NAME = "test-model"
+
+
+def content_event(content: str, finish_reason: Optional[str] = None) -> Dict[str, Any]:
+    return { "choices": [{ "index": 0, "delta": { "content": content }, "finish_reason": finish_reason }] }
+
+
+def reasoning_event(reasoning: str) -> Dict[str, Any]:
+    return { "choices": [{ "index": 0, "delta": { "reasoning_content": reasoning }, "finish_reason": None }] }
+
+
+def usage_event(prompt_tokens: int, completion_tokens: int) -> Dict[str, Any]:
+    return { "choices": [], "usage": { "prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens } }
+
+
+def make_request(user_input_text: str = "Some text", **kwargs: Any) -> GenerationRequest:
+    return GenerationRequest(
+        system_prompt="You are a proofreader.",
+        user_prompt=f"Proofread: {user_input_text}",
+        temperature=0.0,
+        top_k=40,
+        top_p=0.95,
+        min_p=0.05,
+        user_input_text=user_input_text,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def pool(stub_server: StubServer):
+    connection_pool = HttpConnectionPool(stub_server.base_url, max_connections=2, timeout_seconds=5)
+    yield connection_pool
+    connection_pool.close()
+
+
+@pytest.fixture
+def service(pool: HttpConnectionPool) -> OpenAiCompatibleModelService:
+    model_information = ModelInformation(name=MODEL_NAME, provider=LlmProviderType.LLAMA_SERVER, output_length=512)
+    return OpenAiCompatibleModelService(model_information, pool)
+
+
+def stream(stub_server: StubServer, events: List[Any]) -> None:
+    stub_server.routes[("POST", CHAT_COMPLETIONS_PATH)] = lambda handler: handler.send_events(events)
+
+
+def test_streamed_content_is_joined_and_reported(stub_server: StubServer, service: OpenAiCompatibleModelService):
+    stream(stub_server, [
+        ": keep-alive\n\n",
+        content_event("Hello"),
+        content_event(", "),
+        content_event("world. ", finish_reason="stop"),
+        usage_event(prompt_tokens=12, completion_tokens=4),
+        "data: [DONE]\n\n",
+    ])
+    deltas: List[str] = []
+
+    response = service.generate_response(make_request(), on_text_delta=deltas.append)
+
+    assert response.text_content == "Hello, world."
+    assert deltas == ["Hello", ", ", "world. "]
+    assert response.metadata["finish_reason"] == "stop"
+    assert response.metadata["truncated"] == "false"
+    assert response.metadata["prompt_tokens"] == "12"
+    assert response.metadata["answer_tokens"] == "4"
+
+
+def test_request_body_carries_model_prompts_and_budget(stub_server: StubServer, service: OpenAiCompatibleModelService):
+    stream(stub_server, [content_event("Done", finish_reason="stop"), "data: [DONE]\n\n"])
+    request = make_request(output_budget=OutputBudget(input_ratio=2.0, min_tokens=64), input_tokens=100, seed=7)
+
+    response = service.generate_response(request)
+
+    body = stub_server.requests[0].body
+    assert body["model"] == MODEL_NAME
+    assert body["stream"] is True
+    assert body["messages"] == [
+        { "role": "system", "content": request.system_prompt },
+        { "role": "user", "content": request.user_prompt },
+    ]
+    assert body["seed"] == 7
+    assert body["max_tokens"] == 200
+    assert response.metadata["max_tokens"] == "200"
+
+
+def test_reasoning_content_is_wrapped_in_think_tags(stub_server: StubServer, service: OpenAiCompatibleModelService):
+    stream(stub_server, [
+        reasoning_event("Check the "),
+        reasoning_event("spelling."),
+        content_event("Fixed text.", finish_reason="stop"),
+        "data: [DONE]\n\n",
+    ])
+    deltas: List[str] = []
+
+    response = service.generate_response(make_request(), on_text_delta=deltas.append)
+
+    assert response.text_content == "<think>Check the spelling.</think>Fixed text."
+    assert "".join(deltas) == response.text_content
+
+
+def test_reasoning_without_answer_is_closed(stub_server: StubServer, service: OpenAiCompatibleModelService):
+    stream(stub_server, [reasoning_event("Still thinking"), "data: [DONE]\n\n"])
+
+    response = service.generate_response(make_request())
+
+    assert response.text_content == "<think>Still thinking</think>"
+
+
+def test_length_finish_marks_the_response_truncated(stub_server: StubServer, service: OpenAiCompatibleModelService):
+    stream(stub_server, [content_event("Cut off", finish_reason="length"), "data: [DONE]\n\n"])
+
+    response = service.generate_response(make_request())
+
+    assert response.metadata["finish_reason"] == "length"
+    assert response.metadata["truncated"] == "true"
+
+
+def test_looping_output_is_aborted_and_trimmed(stub_server: StubServer, service: OpenAiCompatibleModelService):
+    block = "The same sentence again. "
+    stub_server.routes[("POST", CHAT_COMPLETIONS_PATH)] = lambda handler: handler.send_events(
+        [content_event("Intro. ")] + [content_event(block) for _ in range(200)] + ["data: [DONE]\n\n"]
+    )
+
+    response = service.generate_response(make_request())
+
+    assert response.metadata["finish_reason"] == "repetition"
+    assert response.metadata["truncated"] == "true"
+    assert response.text_content == "Intro. " + block.strip()
+
+
+def test_sequential_generations_reuse_the_connection(stub_server: StubServer, service: OpenAiCompatibleModelService):
+    stream(stub_server, [content_event("Done", finish_reason="stop"), "data: [DONE]\n\n"])
+
+    service.generate_response(make_request())
+    service.generate_response(make_request())
+
+    assert len({ request.client_port for request in stub_server.requests }) == 1
+
+
+def test_stale_connection_is_retried(stub_server: StubServer, service: OpenAiCompatibleModelService):
+    def stream_and_drop_connection(handler: StubRequestHandler) -> None:
+        handler.send_events([content_event("Done", finish_reason="stop"), "data: [DONE]\n\n"])
+        handler.close_connection = True
+
+    stub_server.routes[("POST", CHAT_COMPLETIONS_PATH)] = stream_and_drop_connection
+
+    first = service.generate_response(make_request())
+    second = service.generate_response(make_request())
+
+    assert first.text_content == second.text_content == "Done"
+    assert len({ request.client_port for request in stub_server.requests }) == 2
+
+
+def test_cancellation_closes_the_connection(stub_server: StubServer, service: OpenAiCompatibleModelService):
+    stub_server.routes[("POST", CHAT_COMPLETIONS_PATH)] = lambda handler: handler.send_events(
+        (content_event(f"word{index} ") for index in range(100000)),
+        interval_seconds=0.001,
+    )
+    token = CancellationToken()
+
+    def cancel_after_first_fragment(_: str) -> None:
+        token.cancel()
+
+    with pytest.raises(GenerationCancelledError):
+        service.generate_response(make_request(), on_text_delta=cancel_after_first_fragment, cancellation_token=token)
+
+    assert stub_server.client_disconnected.wait(5)
+
+
+def test_error_status_raises_runtime_error(stub_server: StubServer, service: OpenAiCompatibleModelService):
+    stub_server.routes[("POST", CHAT_COMPLETIONS_PATH)] = lambda handler: handler.send_json(
+        500,
+        { "error": { "message": "context size exceeded" } },
+    )
+
+    with pytest.raises(RuntimeError, match="HTTP 500.*context size exceeded"):
+        service.generate_response(make_request())
+
+
+def test_variant_responses_keep_request_order(stub_server: StubServer, service: OpenAiCompatibleModelService):
+    def echo_user_text(handler: StubRequestHandler) -> None:
+        user_prompt = handler.server.requests[-1].body["messages"][1]["content"]
+        handler.send_events([content_event(user_prompt, finish_reason="stop"), "data: [DONE]\n\n"])
+
+    stub_server.routes[("POST", CHAT_COMPLETIONS_PATH)] = echo_user_text
+    lock = threading.Lock()
+    deltas: List[int] = []
+
+    def record_variant(index: int, _: str) -> None:
+        with lock:
+            deltas.append(index)
+
+    responses = service.generate_variant_responses(
+        [make_request("first"), make_request("second"), make_request("third")],
+        on_text_delta=record_variant,
+    )
+
+    assert [response.text_content for response in responses] == [
+        "Proofread: first",
+        "Proofread: second",
+        "Proofread: third",
+    ]
+    assert sorted(deltas) == [0, 1, 2]
+
+
+def test_model_availability_uses_the_model_list(stub_server: StubServer, pool: HttpConnectionPool, service: OpenAiCompatibleModelService):
+    stub_server.routes[("GET", MODELS_PATH)] = lambda handler: handler.send_json(
+        200,
+        { "object": "list", "data": [{ "id": "other-model" }, { "id": MODEL_NAME }] },
+    )
+
+    assert list_server_models(pool) == ["other-model", MODEL_NAME]
+    assert service.is_model_loaded()
+
+
+def test_model_is_unavailable_when_the_server_fails(stub_server: StubServer, service: OpenAiCompatibleModelService):
+    stub_server.routes[("GET", MODELS_PATH)] = lambda handler: handler.send_json(503, { "error": "loading" })
+
+    assert not service.is_model_loaded()
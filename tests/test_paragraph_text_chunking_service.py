@@ -0,0 +1,58 @@
+from llmedit.application.services.paragraph_text_chunking_service import ParagraphTextChunkingService
+
+
+def count_words(text: str) -> int:
+    return len(text.split())
+
+
+def test_paragraphs_are_split_at_blank_lines():
+    text = "First paragraph.\nStill first.\n\nSecond paragraph.\n\n\nThird paragraph."
+
+    paragraphs = ParagraphTextChunkingService().split_paragraphs(text, 0, count_words)
+
+    assert [paragraph.text for paragraph in paragraphs] == [
+        "First paragraph.\nStill first.",
+        "Second paragraph.",
+        "Third paragraph.",
+    ]
+
+
+def test_separators_reassemble_the_original_text():
+    text = "One.\n\nTwo.\n  \n\t\nThree.\n\n"
+
+    paragraphs = ParagraphTextChunkingService().split_paragraphs(text, 0, count_words)
+
+    assert paragraphs[0].separator == ""
+    assert "".join(paragraph.separator + paragraph.text for paragraph in paragraphs) == text.rstrip()
+
+
+def test_blank_text_has_no_paragraphs():
+    service = ParagraphTextChunkingService()
+
+    assert service.split_paragraphs("", 10, count_words) == []
+    assert service.split_paragraphs(" \n\n \n", 10, count_words) == []
+
+
+def test_context_holds_the_last_sentences_of_the_previous_paragraph():
+    text = "Alpha one two. Beta three four. Gamma five six.\n\nNext paragraph."
+
+    paragraphs = ParagraphTextChunkingService().split_paragraphs(text, 6, count_words)
+
+    assert paragraphs[0].context == ""
+    assert paragraphs[1].context == "Beta three four. Gamma five six."
+
+
+def test_context_falls_back_to_words_for_a_long_sentence():
+    text = "This single sentence is far longer than the context allows\n\nNext."
+
+    paragraphs = ParagraphTextChunkingService().split_paragraphs(text, 3, count_words)
+
+    assert paragraphs[1].context == "the context allows"
+
+
+def test_zero_overlap_attaches_no_context():
+    text = "First.\n\nSecond.\n\nThird."
+
+    paragraphs = ParagraphTextChunkingService().split_paragraphs(text, 0, count_words)
+
+    assert all(paragraph.context == "" for paragraph in paragraphs)
@@ -0,0 +1,115 @@
+from typing import List
+
+from llmedit.infra.services.repetition_detector import MAX_WINDOW, MIN_REPEATED_SPAN, RepetitionDetector
+
+
+def feed_in_fragments(detector: RepetitionDetector, text: str, size: int = 3) -> str:
+    """
+    Feed text in fragments until the detector reports a repetition.
+
+    Returns:
+        The text fed so far, as a caller would have accumulated it.
+    """
+    fragments: List[str] = []
+    for start in range(0, len(text), size):
+        fragments.append(text[start:start + size])
+        if detector.feed(fragments[-1]):
+            break
+    return "".join(fragments)
+
+
+def assert_one_block_kept(trimmed: str, text: str, head: str, block: str) -> None:
+    """
+    Check that trimming kept the text before the loop plus one occurrence of the block.
+
+    Notes:
+        The kept occurrence starts where the detected window starts, so it may be a rotation of
+        the block, and the window may reach into the head where it ends like the block.
+    """
+    assert trimmed == text[:len(trimmed)]
+    assert len(head) < len(trimmed) < len(head) + 2 * len(block)
+    assert trimmed[-len(block):] in block * 2
+
+
+def test_ordinary_text_is_not_reported():
+    detector = RepetitionDetector()
+    text = " ".join(f"Sentence number {index} says something different." for index in range(100))
+
+    fed = feed_in_fragments(detector, text)
+
+    assert fed == text
+    assert not detector.repetition_detected
+    assert detector.trim(text) == text
+
+
+def test_repeated_block_is_detected_and_trimmed_to_one_occurrence():
+    detector = RepetitionDetector()
+    block = "| row | value |\n"
+    text = "Intro line.\n" + block * 100
+
+    fed = feed_in_fragments(detector, text)
+
+    assert detector.repetition_detected
+    assert len(fed) < len(text)
+    assert_one_block_kept(detector.trim(fed), text, "Intro line.\n", block)
+
+
+def test_trim_offset_is_correct_after_a_long_prefix():
+    detector = RepetitionDetector()
+    prefix = "".join(f"Unique sentence {index}. " for index in range(MAX_WINDOW))
+    block = "Again and again. "
+    text = prefix + block * 100
+
+    fed = feed_in_fragments(detector, text, size=5)
+
+    assert len(prefix) > 10 * MAX_WINDOW
+    assert_one_block_kept(detector.trim(fed), text, prefix, block)
+
+
+def test_single_character_run_is_detected():
+    detector = RepetitionDetector()
+
+    fed = feed_in_fragments(detector, "Answer: " + "!" * (MIN_REPEATED_SPAN * 2), size=1)
+
+    assert detector.repetition_detected
+    assert detector.trim(fed) == "Answer: !"
+
+
+def test_short_repetition_is_tolerated():
+    detector = RepetitionDetector()
+    text = "Intro. " + "Yes. " * 5 + "Done."
+
+    fed = feed_in_fragments(detector, text)
+
+    assert fed == text
+    assert not detector.repetition_detected
+
+
+def test_repetition_present_in_the_reference_text_is_tolerated():
+    block = "Line to proofread.\n"
+    detector = RepetitionDetector(reference_text=block * 40)
+
+    fed = feed_in_fragments(detector, block * 40)
+
+    assert fed == block * 40
+    assert not detector.repetition_detected
+
+
+def test_feed_keeps_reporting_after_detection():
+    detector = RepetitionDetector()
+    feed_in_fragments(detector, "ab" * MIN_REPEATED_SPAN)
+
+    assert detector.feed("anything else")
+
+
+def test_repetition_within_one_fragment_is_detected():
+    detector = RepetitionDetector()
+    block = "Table row repeated. "
+    text = "Intro. " + block * 50
+
+    assert not detector.feed("Intro. ")
+    assert detector.feed(block * 50)
+
+    trimmed = detector.trim(text)
+    assert trimmed == text[:len(trimmed)]
+    assert len(trimmed) <= len(text) - MIN_REPEATED_SPAN + len(block)
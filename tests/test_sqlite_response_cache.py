@@ -0,0 +1,137 @@
+import itertools
+import sqlite3
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from llmedit.core.models.data_types import GenerationRequest, GenerationResponse
+from llmedit.infra.services import sqlite_response_cache
+from llmedit.infra.services.sqlite_response_cache import SqliteResponseCache
+
+REQUEST = GenerationRequest(
+    system_prompt="System",
+    user_prompt="User",
+    temperature=0.0,
+    top_k=40,
+    top_p=0.95,
+    min_p=0.05,
+)
+
+
+def make_response(text: str) -> GenerationResponse:
+    return GenerationResponse(text_content=text, original_request=REQUEST, metadata={ "finish_reason": "stop" })
+
+
+@pytest.fixture(autouse=True)
+def monotonic_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Distinct timestamps make the least recently used entry unambiguous
+    ticks = itertools.count(1)
+    monkeypatch.setattr(sqlite_response_cache, "time", SimpleNamespace(time=lambda: float(next(ticks))))
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> Path:
+    return tmp_path / "cache" / "responses.sqlite"
+
+
+def test_stored_response_is_returned_for_the_new_request(cache_path: Path):
+    cache = SqliteResponseCache(cache_path)
+    cache.put("key", make_response("Cached text"))
+    request = GenerationRequest(system_prompt="Other", user_prompt="Request", temperature=0.0, top_k=1, top_p=1.0, min_p=0.0)
+
+    response = cache.get("key", request)
+
+    assert response.text_content == "Cached text"
+    assert response.metadata == { "finish_reason": "stop" }
+    assert response.original_request is request
+
+
+def test_unknown_key_is_a_miss(cache_path: Path):
+    cache = SqliteResponseCache(cache_path)
+
+    assert cache.get("missing", REQUEST) is None
+
+
+def test_responses_persist_across_instances(cache_path: Path):
+    SqliteResponseCache(cache_path).put("key", make_response("Persistent"))
+
+    response = SqliteResponseCache(cache_path).get("key", REQUEST)
+
+    assert response.text_content == "Persistent"
+
+
+def test_entries_beyond_the_memory_tier_are_read_from_the_store(cache_path: Path):
+    cache = SqliteResponseCache(cache_path, memory_entries=1)
+    cache.put("first", make_response("One"))
+    cache.put("second", make_response("Two"))
+
+    assert cache.get("first", REQUEST).text_content == "One"
+    assert cache.get("second", REQUEST).text_content == "Two"
+
+
+def test_least_recently_used_responses_are_evicted_beyond_the_size_limit(cache_path: Path):
+    text = "x" * 1000
+    cache = SqliteResponseCache(cache_path, memory_entries=1, max_bytes=2500)
+    cache.put("first", make_response(text))
+    cache.put("second", make_response(text))
+    cache.put("third", make_response(text))
+
+    reopened = SqliteResponseCache(cache_path, memory_entries=1)
+    assert reopened.get("first", REQUEST) is None
+    assert reopened.get("second", REQUEST) is not None
+    assert reopened.get("third", REQUEST) is not None
+
+
+def test_hits_protect_entries_from_eviction(cache_path: Path):
+    text = "x" * 1000
+    cache = SqliteResponseCache(cache_path, memory_entries=4, max_bytes=2500)
+    cache.put("first", make_response(text))
+    cache.put("second", make_response(text))
+    assert cache.get("first", REQUEST) is not None
+    cache.put("third", make_response(text))
+
+    reopened = SqliteResponseCache(cache_path, memory_entries=1)
+    assert reopened.get("first", REQUEST) is not None
+    assert reopened.get("second", REQUEST) is None
+
+
+def test_memory_hits_do_not_write_to_the_store(cache_path: Path):
+    cache = SqliteResponseCache(cache_path)
+    cache.put("key", make_response("Cached text"))
+    with sqlite3.connect(cache_path) as connection:
+        stored_last_used = connection.execute("SELECT last_used FROM responses").fetchone()[0]
+
+    for _ in range(sqlite_response_cache.TOUCH_FLUSH_ENTRIES - 1):
+        assert cache.get("key", REQUEST) is not None
+
+    with sqlite3.connect(cache_path) as connection:
+        assert connection.execute("SELECT last_used FROM responses").fetchone()[0] == stored_last_used
+
+
+def test_size_limit_counts_responses_stored_by_an_earlier_instance(cache_path: Path):
+    text = "x" * 1000
+    earlier = SqliteResponseCache(cache_path, memory_entries=1, max_bytes=2500)
+    earlier.put("first", make_response(text))
+    earlier.put("second", make_response(text))
+
+    cache = SqliteResponseCache(cache_path, memory_entries=1, max_bytes=2500)
+    cache.put("third", make_response(text))
+    cache.put("third", make_response(text))
+
+    reopened = SqliteResponseCache(cache_path, memory_entries=1)
+    assert reopened.get("first", REQUEST) is None
+    assert reopened.get("second", REQUEST) is not None
+    assert reopened.get("third", REQUEST) is not None
+
+
+def test_unavailable_database_falls_back_to_memory(tmp_path: Path):
+    # A directory where the database file should be cannot be opened as a database
+    cache_path = tmp_path / "responses.sqlite"
+    cache_path.mkdir()
+    cache = SqliteResponseCache(cache_path)
+
+    cache.put("key", make_response("In memory"))
+
+    assert cache.get("key", REQUEST).text_content == "In memory"
+    assert cache.get("missing", REQUEST) is None